@@ -0,0 +1,173 @@
+"""add score set search projections table
+
+Revision ID: 5a9d3f7c2e81
+Revises: b3c7e1f9a2d4
+Create Date: 2026-02-23 09:41:12.904516
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5a9d3f7c2e81"
+down_revision = "b3c7e1f9a2d4"
+branch_labels = None
+depends_on = None
+
+# The joins from a score set (aliased as s) to each of the related tables whose values are projected.
+TARGET_TAXONOMIES = (
+    "target_genes tg JOIN target_sequences ts ON ts.id = tg.target_sequence_id "
+    "JOIN taxonomies tx ON tx.id = ts.taxonomy_id"
+)
+TARGET_ACCESSIONS = "target_genes tg JOIN target_accessions ta ON ta.id = tg.accession_id"
+PUBLICATIONS = (
+    "scoreset_publication_identifiers sp JOIN publication_identifiers p ON p.id = sp.publication_identifier_id"
+)
+
+
+def array_of(joins: str, value: str, condition: str, order: str) -> str:
+    """Collect the non-empty values of a column of a score set's related rows into an array."""
+    return f"ARRAY(SELECT {value} FROM {joins} WHERE {condition} AND NULLIF({value}, '') IS NOT NULL ORDER BY {order})"
+
+
+# The values of the search projection of each published score set (aliased as s, with its experiment aliased as e),
+# as of this revision.
+PROJECTION_VALUES = {
+    "score_set_id": "s.id",
+    "experiment_title": "e.title",
+    "published_date": "s.published_date",
+    "target_names": array_of("target_genes tg", "tg.name", "tg.scoreset_id = s.id", "tg.id"),
+    "target_categories": array_of("target_genes tg", "tg.category", "tg.scoreset_id = s.id", "tg.id"),
+    "target_organism_names": array_of(TARGET_TAXONOMIES, "tx.organism_name", "tg.scoreset_id = s.id", "tg.id"),
+    "target_accessions": array_of(TARGET_ACCESSIONS, "ta.accession", "tg.scoreset_id = s.id", "tg.id"),
+    "publication_identifiers": array_of(PUBLICATIONS, "p.identifier", "sp.scoreset_id = s.id", "p.id"),
+    "publication_db_names": array_of(PUBLICATIONS, "p.db_name", "sp.scoreset_id = s.id", "p.id"),
+    "publication_journals": array_of(PUBLICATIONS, "p.publication_journal", "sp.scoreset_id = s.id", "p.id"),
+    "publication_author_names": array_of(
+        f"{PUBLICATIONS} CROSS JOIN LATERAL jsonb_array_elements("
+        "CASE WHEN jsonb_typeof(p.authors) = 'array' THEN p.authors ELSE '[]'::jsonb END) "
+        "WITH ORDINALITY AS author(value, position)",
+        "author.value ->> 'name'",
+        "sp.scoreset_id = s.id",
+        "p.id, author.position",
+    ),
+    "keywords": array_of(
+        "experiment_controlled_keywords ek JOIN controlled_keywords k ON k.id = ek.controlled_keyword_id",
+        "k.label",
+        "ek.experiment_id = e.id",
+        "k.id",
+    ),
+}
+
+
+def upgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table(
+        "score_set_search_projections",
+        sa.Column("score_set_id", sa.Integer(), nullable=False),
+        sa.Column("experiment_title", sa.String(), nullable=False),
+        sa.Column("published_date", sa.Date(), nullable=False),
+        sa.Column("target_names", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("target_categories", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("target_organism_names", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("target_accessions", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("publication_identifiers", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("publication_db_names", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("publication_journals", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("publication_author_names", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("keywords", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("modification_date", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(["score_set_id"], ["scoresets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("score_set_id"),
+    )
+    op.create_index(
+        "ix_score_set_search_projections_target_names",
+        "score_set_search_projections",
+        ["target_names"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_score_set_search_projections_target_categories",
+        "score_set_search_projections",
+        ["target_categories"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_score_set_search_projections_target_organism_names",
+        "score_set_search_projections",
+        ["target_organism_names"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_score_set_search_projections_target_accessions",
+        "score_set_search_projections",
+        ["target_accessions"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_score_set_search_projections_publication_identifiers",
+        "score_set_search_projections",
+        ["publication_identifiers"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_score_set_search_projections_publication_db_names",
+        "score_set_search_projections",
+        ["publication_db_names"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_score_set_search_projections_publication_journals",
+        "score_set_search_projections",
+        ["publication_journals"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_score_set_search_projections_publication_author_names",
+        "score_set_search_projections",
+        ["publication_author_names"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_score_set_search_projections_keywords",
+        "score_set_search_projections",
+        ["keywords"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    # ### end Alembic commands ###
+
+    op.execute(
+        f"""
+        INSERT INTO score_set_search_projections ({", ".join(PROJECTION_VALUES)}, modification_date)
+        SELECT {", ".join(PROJECTION_VALUES.values())}, CURRENT_DATE
+        FROM scoresets s JOIN experiments e ON e.id = s.experiment_id
+        WHERE NOT s.private AND s.published_date IS NOT NULL
+        """
+    )
+
+
+def downgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_index("ix_score_set_search_projections_keywords", table_name="score_set_search_projections")
+    op.drop_index("ix_score_set_search_projections_publication_author_names", table_name="score_set_search_projections")
+    op.drop_index("ix_score_set_search_projections_publication_journals", table_name="score_set_search_projections")
+    op.drop_index("ix_score_set_search_projections_publication_db_names", table_name="score_set_search_projections")
+    op.drop_index("ix_score_set_search_projections_publication_identifiers", table_name="score_set_search_projections")
+    op.drop_index("ix_score_set_search_projections_target_accessions", table_name="score_set_search_projections")
+    op.drop_index("ix_score_set_search_projections_target_organism_names", table_name="score_set_search_projections")
+    op.drop_index("ix_score_set_search_projections_target_categories", table_name="score_set_search_projections")
+    op.drop_index("ix_score_set_search_projections_target_names", table_name="score_set_search_projections")
+    op.drop_table("score_set_search_projections")
+    # ### end Alembic commands ###
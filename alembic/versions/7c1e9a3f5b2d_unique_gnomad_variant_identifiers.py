@@ -0,0 +1,53 @@
+"""unique gnomad variant identifiers
+
+Revision ID: 7c1e9a3f5b2d
+Revises: 2b6f4c8e1d9a
+Create Date: 2026-01-19 15:02:37.604118
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7c1e9a3f5b2d"
+down_revision = "2b6f4c8e1d9a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Collapse any duplicated gnomAD variants onto the most recently created record before adding the constraint.
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE gnomad_variant_duplicates ON COMMIT DROP AS
+        SELECT id, first_value(id) OVER (PARTITION BY db_name, db_identifier, db_version ORDER BY id DESC) AS keep_id
+        FROM gnomad_variants
+        """
+    )
+    op.execute("DELETE FROM gnomad_variant_duplicates WHERE id = keep_id")
+    op.execute(
+        """
+        INSERT INTO gnomad_variants_mapped_variants (mapped_variant_id, gnomad_variant_id)
+        SELECT assoc.mapped_variant_id, duplicates.keep_id
+        FROM gnomad_variants_mapped_variants AS assoc
+        JOIN gnomad_variant_duplicates AS duplicates ON duplicates.id = assoc.gnomad_variant_id
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM gnomad_variants_mapped_variants
+        WHERE gnomad_variant_id IN (SELECT id FROM gnomad_variant_duplicates)
+        """
+    )
+    op.execute("DELETE FROM gnomad_variants WHERE id IN (SELECT id FROM gnomad_variant_duplicates)")
+
+    op.create_unique_constraint(
+        "uq_gnomad_variants_db_name_db_identifier_db_version",
+        "gnomad_variants",
+        ["db_name", "db_identifier", "db_version"],
+    )
+
+
+def downgrade():
+    op.drop_constraint("uq_gnomad_variants_db_name_db_identifier_db_version", "gnomad_variants", type_="unique")
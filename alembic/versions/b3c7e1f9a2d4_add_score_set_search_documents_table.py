@@ -0,0 +1,141 @@
+"""add score set search documents table
+
+Revision ID: b3c7e1f9a2d4
+Revises: 6f2d8b4a1e37
+Create Date: 2026-02-16 10:27:44.318062
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b3c7e1f9a2d4"
+down_revision = "6f2d8b4a1e37"
+branch_labels = None
+depends_on = None
+
+# The joins from a score set (aliased as s) to each of the related tables whose text is searchable.
+TARGET_GENES = "target_genes tg"
+TARGET_TAXONOMIES = (
+    "target_genes tg JOIN target_sequences ts ON ts.id = tg.target_sequence_id "
+    "JOIN taxonomies tx ON tx.id = ts.taxonomy_id"
+)
+TARGET_ACCESSIONS = "target_genes tg JOIN target_accessions ta ON ta.id = tg.accession_id"
+PUBLICATIONS = (
+    "scoreset_publication_identifiers sp JOIN publication_identifiers p ON p.id = sp.publication_identifier_id"
+)
+
+
+def target_offsets(db: str) -> str:
+    return (
+        f"target_genes tg JOIN {db}_offsets o ON o.target_gene_id = tg.id "
+        f"JOIN {db}_identifiers i ON i.id = o.identifier_id"
+    )
+
+
+def aggregated(joins: str, value: str, score_set_id_column: str, order: str) -> str:
+    """Aggregate the non-empty values of a column of a score set's related rows, one per line."""
+    return (
+        f"(SELECT string_agg(NULLIF({value}, ''), E'\\n' ORDER BY {order}) FROM {joins} "
+        f"WHERE {score_set_id_column} = s.id)"
+    )
+
+
+def lines(*values: str) -> str:
+    return "concat_ws(E'\\n', " + ", ".join(values) + ")"
+
+
+# The searchable text of each score set, keyed by its full text search weight, as of this revision.
+WEIGHTED_TEXT = {
+    "A": lines(
+        "NULLIF(s.urn, '')",
+        "NULLIF(s.title, '')",
+        aggregated(TARGET_GENES, "tg.name", "tg.scoreset_id", "tg.id"),
+    ),
+    "B": lines(
+        "NULLIF(s.short_description, '')",
+        aggregated(TARGET_GENES, "tg.category", "tg.scoreset_id", "tg.id"),
+        aggregated(TARGET_TAXONOMIES, "tx.organism_name", "tg.scoreset_id", "tg.id"),
+        aggregated(TARGET_TAXONOMIES, "tx.common_name", "tg.scoreset_id", "tg.id"),
+        aggregated(TARGET_ACCESSIONS, "ta.assembly", "tg.scoreset_id", "tg.id"),
+        *(
+            aggregated(target_offsets(db), "i.identifier", "tg.scoreset_id", "tg.id")
+            for db in ("uniprot", "refseq", "ensembl")
+        ),
+        aggregated(
+            "scoreset_doi_identifiers sd JOIN doi_identifiers d ON d.id = sd.doi_identifier_id",
+            "d.identifier",
+            "sd.scoreset_id",
+            "d.id",
+        ),
+        *(
+            aggregated(PUBLICATIONS, f"p.{column}", "sp.scoreset_id", "p.id")
+            for column in ("identifier", "doi", "title", "publication_journal")
+        ),
+        aggregated(
+            f"{PUBLICATIONS} CROSS JOIN LATERAL jsonb_array_elements("
+            "CASE WHEN jsonb_typeof(p.authors) = 'array' THEN p.authors ELSE '[]'::jsonb END) author",
+            "author ->> 'name'",
+            "sp.scoreset_id",
+            "p.id",
+        ),
+    ),
+    "C": lines(
+        "NULLIF(s.abstract_text, '')",
+        aggregated(PUBLICATIONS, "p.abstract", "sp.scoreset_id", "p.id"),
+    ),
+}
+
+
+def upgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table(
+        "score_set_search_documents",
+        sa.Column("score_set_id", sa.Integer(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("document", postgresql.TSVECTOR(), nullable=False),
+        sa.Column("modification_date", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(["score_set_id"], ["scoresets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("score_set_id"),
+    )
+    op.create_index(
+        "ix_score_set_search_documents_document",
+        "score_set_search_documents",
+        ["document"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    # ### end Alembic commands ###
+
+    # Partial matches of search text are served by a trigram index on the plain text of each search document.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_score_set_search_documents_text_trgm "
+        "ON score_set_search_documents USING gin (text gin_trgm_ops)"
+    )
+
+    weighted_text = ", ".join(f"{text} AS {weight.lower()}" for weight, text in WEIGHTED_TEXT.items())
+    op.execute(
+        f"""
+        INSERT INTO score_set_search_documents (score_set_id, text, document, modification_date)
+        SELECT
+            id,
+            concat_ws(E'\\n', NULLIF(a, ''), NULLIF(b, ''), NULLIF(c, '')),
+            setweight(to_tsvector('english', a), 'A')
+                || setweight(to_tsvector('english', b), 'B')
+                || setweight(to_tsvector('english', c), 'C'),
+            CURRENT_DATE
+        FROM (SELECT s.id, {weighted_text} FROM scoresets s) AS weighted_text
+        """
+    )
+
+
+def downgrade():
+    op.drop_index("ix_score_set_search_documents_text_trgm", table_name="score_set_search_documents")
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_index("ix_score_set_search_documents_document", table_name="score_set_search_documents")
+    op.drop_table("score_set_search_documents")
+    # ### end Alembic commands ###
@@ -1,7 +1,11 @@
 import os
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, MutableMapping, Optional
 
-from cdot.hgvs.dataproviders import SeqFetcher, ChainedSeqFetcher, FastaSeqFetcher, RESTDataProvider
+import requests
+from cdot.hgvs.dataproviders import AbstractJSONDataProvider, ChainedSeqFetcher, FastaSeqFetcher, SeqFetcher
+from requests.adapters import HTTPAdapter
 
 from mavedb.lib.mapping import VRSMap
 
@@ -12,14 +16,209 @@ GENOMIC_FASTA_FILES = [
 
 DCD_MAP_URL = os.environ.get("DCD_MAPPING_URL", "http://dcd-mapping:8000")
 CDOT_URL = os.environ.get("CDOT_URL", "http://cdot-rest:8000")
+# The number of pooled connections kept open to the cdot REST service, and the number of cdot transcript and gene
+# responses cached by the shared data provider.
+CDOT_POOL_SIZE = int(os.environ.get("CDOT_POOL_SIZE", 10))
+CDOT_RESPONSE_CACHE_SIZE = int(os.environ.get("CDOT_RESPONSE_CACHE_SIZE", 10000))
+# The number of seconds to wait for the cdot REST service to accept a connection or send a response.
+CDOT_TIMEOUT = float(os.environ.get("CDOT_TIMEOUT", 30))
+
+_MISSING = object()
+
+
+class BoundedResponseCache(MutableMapping[Hashable, Any]):
+    """
+    A thread-safe mapping which holds at most `maxsize` entries, evicting the least recently used entry once full.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._entries[key]
+            self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            del self._entries[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LazySeqFetcher:
+    """
+    A sequence fetcher which builds the fetcher it wraps on first use. Opening a genomic FASTA file reads its index, so
+    processes which never fetch from it never pay for opening it.
+
+    pysam FASTA handles may not be used concurrently, so fetches are serialized.
+    """
+
+    def __init__(self, factory: Callable[[], Any], source: str):
+        self.source = source
+        self._factory = factory
+        self._seqfetcher: Optional[Any] = None
+        self._hdp: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> Any:
+        if self._seqfetcher is None:
+            self._seqfetcher = self._factory()
+            if self._hdp is not None:
+                self._seqfetcher.set_data_provider(self._hdp)
+
+        return self._seqfetcher
+
+    def set_data_provider(self, hdp: Any) -> None:
+        with self._lock:
+            self._hdp = hdp
+            if self._seqfetcher is not None:
+                self._seqfetcher.set_data_provider(hdp)
+
+    def fetch_seq(self, ac: str, start_i: Optional[int] = None, end_i: Optional[int] = None) -> str:
+        with self._lock:
+            return self._open().fetch_seq(ac, start_i=start_i, end_i=end_i)
+
+
+def pooled_session(pool_size: int = CDOT_POOL_SIZE) -> requests.Session:
+    """
+    Create a requests session which keeps up to `pool_size` connections open to each host it sends requests to.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class PooledRESTDataProvider(AbstractJSONDataProvider):
+    """
+    A cdot REST data provider which sends its requests through a given requests session and holds a bounded cache of
+    transcript and gene responses, so that a single instance can be shared by every request and job in a process.
+
+    cdot's RESTDataProvider opens a new connection for each request and offers no way to provide a session, so this
+    provider implements the abstract interface of cdot's JSON data providers against the cdot REST API itself.
+    """
+
+    def __init__(
+        self,
+        url: str = CDOT_URL,
+        session: Optional[requests.Session] = None,
+        cache_size: int = CDOT_RESPONSE_CACHE_SIZE,
+        timeout: float = CDOT_TIMEOUT,
+        mode=None,
+        cache=None,
+        seqfetcher=None,
+    ):
+        super().__init__(mode=mode, cache=cache, seqfetcher=seqfetcher)
+        self.url = url
+        self.session = session if session is not None else pooled_session()
+        self.timeout = timeout
+        self.transcripts = BoundedResponseCache(cache_size)
+        self.genes = BoundedResponseCache(cache_size)
+
+    def get_json(self, path: str) -> Optional[Any]:
+        """
+        Fetch a JSON resource from the cdot REST API, or return None if the service does not have it.
+
+        Raises:
+            requests.HTTPError: If the service responds with an error other than not found, such as while it is
+                unavailable, so that the failure is not mistaken for, and cached as, a missing resource.
+            requests.Timeout: If the service does not respond within the provider's timeout.
+        """
+        url = self.url + path
+        response = self.session.get(url, timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        if "application/json" not in response.headers.get("Content-Type", ""):
+            raise ValueError(f"Non-json response received for '{url}' - are you behind a firewall?")
+
+        return response.json()
+
+    # Entries may be evicted between a membership test and a lookup, so cached responses are read in a single step.
+    # Transcripts and genes the service does not have are cached as None, as they are by RESTDataProvider. Other errors
+    # are raised by get_json, so nothing is cached for them and the next lookup asks the service again.
+    def _get_transcript(self, tx_ac):
+        transcript = self.transcripts.get(tx_ac, _MISSING)
+        if transcript is _MISSING:
+            transcript = self.get_json(f"/transcript/{tx_ac}")
+            self.transcripts[tx_ac] = transcript
+
+        return transcript
+
+    def _get_gene(self, gene):
+        gene_data = self.genes.get(gene, _MISSING)
+        if gene_data is _MISSING:
+            gene_data = self.get_json(f"/gene/{gene}")
+            self.genes[gene] = gene_data
+
+        return gene_data
+
+    def get_tx_for_gene(self, gene):
+        data = self.get_json(f"/transcripts/gene/{gene}")
+        return data["results"] if data else []
+
+    def get_tx_for_region(self, alt_ac, alt_aln_method, start_i, end_i):
+        self._check_alt_aln_method(alt_aln_method)
+        data = self.get_json(f"/transcripts/region/{alt_ac}/{alt_aln_method}/{start_i}/{end_i}")
+        return data["results"] if data else []
+
+
+_shared_cdot_rest: Optional[PooledRESTDataProvider] = None
+_shared_cdot_rest_lock = threading.Lock()
 
 
 def seqfetcher() -> ChainedSeqFetcher:
-    return ChainedSeqFetcher(SeqFetcher(), *[FastaSeqFetcher(file) for file in GENOMIC_FASTA_FILES])
+    return ChainedSeqFetcher(
+        SeqFetcher(), *[LazySeqFetcher(lambda file=file: FastaSeqFetcher(file), file) for file in GENOMIC_FASTA_FILES]
+    )
+
+
+def cdot_rest() -> PooledRESTDataProvider:
+    return PooledRESTDataProvider(url=CDOT_URL, session=pooled_session(CDOT_POOL_SIZE), seqfetcher=seqfetcher())
+
+
+def shared_cdot_rest() -> PooledRESTDataProvider:
+    """
+    Fetch the cdot data provider shared by this process, creating it on first use. A child process creates its own
+    provider rather than inheriting the connections and FASTA handles of its parent.
+    """
+    global _shared_cdot_rest
+
+    with _shared_cdot_rest_lock:
+        if _shared_cdot_rest is None:
+            _shared_cdot_rest = cdot_rest()
+
+        return _shared_cdot_rest
+
+
+def _reset_shared_cdot_rest() -> None:
+    global _shared_cdot_rest, _shared_cdot_rest_lock
+
+    _shared_cdot_rest = None
+    _shared_cdot_rest_lock = threading.Lock()
 
 
-def cdot_rest() -> RESTDataProvider:
-    return RESTDataProvider(url=CDOT_URL, seqfetcher=seqfetcher())
+os.register_at_fork(after_in_child=_reset_shared_cdot_rest)
 
 
 def vrs_mapper(url: Optional[str] = None) -> VRSMap:
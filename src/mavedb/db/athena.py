@@ -5,6 +5,8 @@ from sqlalchemy.engine import create_engine
 AWS_REGION_NAME = os.getenv("AWS_REGION_NAME", "us-west-2")
 ATHENA_SCHEMA_NAME = os.getenv("ATHENA_SCHEMA_NAME", "default")
 ATHENA_S3_STAGING_DIR = os.getenv("ATHENA_S3_STAGING_DIR")
+# Athena queries are long running, so queries are issued concurrently over a small pool of connections.
+ATHENA_POOL_SIZE = int(os.getenv("ATHENA_POOL_SIZE", 4))
 
 ATHENA_URL = "awsathena+rest://:@athena.{region_name}.amazonaws.com:443/{schema_name}?s3_staging_dir={s3_staging_dir}"
 
@@ -13,5 +15,7 @@ engine = create_engine(
         region_name=AWS_REGION_NAME,
         schema_name=ATHENA_SCHEMA_NAME,
         s3_staging_dir=ATHENA_S3_STAGING_DIR,
-    )
+    ),
+    pool_size=ATHENA_POOL_SIZE,
+    max_overflow=0,
 )
@@ -3,11 +3,11 @@ from typing import Any, AsyncGenerator, Generator
 
 from arq import ArqRedis, create_pool
 from biocommons.seqrepo import SeqRepo
-from cdot.hgvs.dataproviders import RESTDataProvider
 from sqlalchemy.orm import Session
 
-from mavedb.data_providers.services import cdot_rest
+from mavedb.data_providers.services import PooledRESTDataProvider, shared_cdot_rest
 from mavedb.db.session import SessionLocal
+from mavedb.lib.seqrepo import shared_seqrepo
 from mavedb.worker.settings import RedisWorkerSettings
 
 
@@ -28,10 +28,10 @@ async def get_worker() -> AsyncGenerator[ArqRedis, Any]:
         await redis.close()
 
 
-def hgvs_data_provider() -> RESTDataProvider:
-    return cdot_rest()
+def hgvs_data_provider() -> PooledRESTDataProvider:
+    return shared_cdot_rest()
 
 
 def get_seqrepo() -> SeqRepo:
     seqrepo_dir = os.environ.get("HGVS_SEQREPO_DIR", "/seqrepo")
-    return SeqRepo(seqrepo_dir)
+    return shared_seqrepo(seqrepo_dir)
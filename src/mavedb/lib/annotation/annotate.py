@@ -8,11 +8,12 @@ This module supports the construction of three main VA-Spec data structures base
     See: https://va-ga4gh.readthedocs.io/en/latest/modeling-foundations/data-structures.html#evidence-line-structure
 """
 
-from typing import Optional
+from typing import Optional, Union
 
 from ga4gh.va_spec.acmg_2015 import VariantPathogenicityEvidenceLine
 from ga4gh.va_spec.base.core import ExperimentalVariantFunctionalImpactStudyResult, Statement
 
+from mavedb.lib.annotation.context import AnnotationContext
 from mavedb.lib.annotation.evidence_line import acmg_evidence_line, functional_evidence_line
 from mavedb.lib.annotation.proposition import (
     mapped_variant_to_experimental_variant_clinical_impact_proposition,
@@ -27,37 +28,63 @@ from mavedb.lib.annotation.util import (
 from mavedb.models.mapped_variant import MappedVariant
 
 
-def variant_study_result(mapped_variant: MappedVariant) -> ExperimentalVariantFunctionalImpactStudyResult:
-    return mapped_variant_to_experimental_variant_impact_study_result(mapped_variant)
+def variant_study_result(
+    mapped_variant: MappedVariant, context: Optional[AnnotationContext] = None
+) -> ExperimentalVariantFunctionalImpactStudyResult:
+    return mapped_variant_to_experimental_variant_impact_study_result(mapped_variant, context)
 
 
-def variant_functional_impact_statement(mapped_variant: MappedVariant) -> Optional[Statement]:
-    if not can_annotate_variant_for_functional_statement(mapped_variant):
-        return None
-
+def _functional_impact_statement_from_study_result(
+    mapped_variant: MappedVariant,
+    study_result: ExperimentalVariantFunctionalImpactStudyResult,
+    context: AnnotationContext,
+) -> Statement:
     # TODO#494: Add support for multiple functional evidence lines. If a score set has multiple ranges
     #           associated with it, we should create one evidence line for each range.
-    study_result = mapped_variant_to_experimental_variant_impact_study_result(mapped_variant)
-    functional_evidence = functional_evidence_line(mapped_variant, [study_result])
-    functional_proposition = mapped_variant_to_experimental_variant_functional_impact_proposition(mapped_variant)
+    functional_evidence = functional_evidence_line(mapped_variant, [study_result], context)
+    functional_proposition = mapped_variant_to_experimental_variant_functional_impact_proposition(
+        mapped_variant, context
+    )
 
-    return mapped_variant_to_functional_statement(mapped_variant, functional_proposition, [functional_evidence])
+    return mapped_variant_to_functional_statement(
+        mapped_variant, functional_proposition, [functional_evidence], context
+    )
+
+
+def variant_functional_impact_statement(
+    mapped_variant: MappedVariant, context: Optional[AnnotationContext] = None
+) -> Optional[Statement]:
+    if context is None:
+        context = AnnotationContext(mapped_variant.variant.score_set)
+
+    if not can_annotate_variant_for_functional_statement(mapped_variant, context):
+        return None
+
+    study_result = mapped_variant_to_experimental_variant_impact_study_result(mapped_variant, context)
+    return _functional_impact_statement_from_study_result(mapped_variant, study_result, context)
 
 
 def variant_pathogenicity_evidence(
-    mapped_variant: MappedVariant,
+    mapped_variant: MappedVariant, context: Optional[AnnotationContext] = None
 ) -> Optional[VariantPathogenicityEvidenceLine]:
-    if not can_annotate_variant_for_pathogenicity_evidence(mapped_variant):
-        return None
+    if context is None:
+        context = AnnotationContext(mapped_variant.variant.score_set)
 
-    study_result = mapped_variant_to_experimental_variant_impact_study_result(mapped_variant)
-    functional_impact = variant_functional_impact_statement(mapped_variant)
+    if not can_annotate_variant_for_pathogenicity_evidence(mapped_variant, context):
+        return None
 
-    supporting_evidence = functional_impact if functional_impact else study_result
+    # The study result supports the functional impact statement when one can be made, and the evidence line directly
+    # otherwise. Either way, it only needs to be built once.
+    study_result = mapped_variant_to_experimental_variant_impact_study_result(mapped_variant, context)
+    supporting_evidence: Union[ExperimentalVariantFunctionalImpactStudyResult, Statement] = study_result
+    if can_annotate_variant_for_functional_statement(mapped_variant, context):
+        supporting_evidence = _functional_impact_statement_from_study_result(mapped_variant, study_result, context)
 
     # TODO#494: Add support for multiple clinical evidence lines. If a score set has multiple calibrations
     #           associated with it, we should create one evidence line for each calibration.
-    clinical_proposition = mapped_variant_to_experimental_variant_clinical_impact_proposition(mapped_variant)
-    clinical_evidence = acmg_evidence_line(mapped_variant, clinical_proposition, [supporting_evidence.model_dump()])
+    clinical_proposition = mapped_variant_to_experimental_variant_clinical_impact_proposition(mapped_variant, context)
+    clinical_evidence = acmg_evidence_line(
+        mapped_variant, clinical_proposition, [supporting_evidence.model_dump()], context
+    )
 
     return clinical_evidence
@@ -1,12 +1,15 @@
 import logging
 from enum import StrEnum
-from typing import Optional
+from typing import Optional, Sequence
 
+import numpy as np
 from ga4gh.va_spec.acmg_2015 import VariantPathogenicityEvidenceLine
 from ga4gh.va_spec.base.enums import StrengthOfEvidenceProvided
 
 from mavedb.models.enums.functional_classification import FunctionalClassification as FunctionalClassificationOptions
 from mavedb.models.mapped_variant import MappedVariant
+from mavedb.models.score_calibration import ScoreCalibration
+from mavedb.models.score_set import ScoreSet
 from mavedb.view_models.score_calibration import FunctionalClassification
 
 logger = logging.getLogger(__name__)
@@ -20,18 +23,202 @@ class ExperimentalVariantFunctionalImpactClassification(StrEnum):
     INDETERMINATE = "indeterminate"
 
 
-def functional_classification_of_variant(
-    mapped_variant: MappedVariant,
-) -> ExperimentalVariantFunctionalImpactClassification:
-    """Classify a variant's functional impact as normal, abnormal, or indeterminate.
+class CalibrationClassificationIndex:
+    """A compiled interval index over the functional ranges of a score calibration.
 
-    Uses the primary score calibration and its functional ranges.
-    Raises ValueError if required calibration or score is missing.
+    The finite bounds of the calibration's ranges split the real line into elementary segments: each bound itself and
+    the open intervals on either side of it. Containment in a range cannot change within a segment, so the range which
+    classifies each segment (the first range, in calibration order, which contains it) is resolved once, when the index
+    is built. Scores are classified in bulk by locating their segments with `numpy.searchsorted`.
+
+    Building the index validates each functional range once, so a score set can be classified with O(ranges) model
+    validation rather than O(variants x ranges). When variants are annotated in batches, `classify_batch` locates the
+    segments of every score in a batch at once, and the scores of the batch are then classified individually without
+    searching the index again.
     """
+
+    def __init__(self, functional_ranges: Sequence[FunctionalClassification]) -> None:
+        self.functional_ranges = list(functional_ranges)
+        self._batch_range_indices: dict[float, int] = {}
+
+        self.bounds = np.unique(
+            np.array(
+                [
+                    bound
+                    for functional_range in self.functional_ranges
+                    if functional_range.range
+                    for bound in functional_range.range
+                    if bound is not None
+                ],
+                dtype=float,
+            )
+        )
+
+        # Segment 2i + 1 is the bound at index i, and segment 2i is the open interval below it. Any score within an
+        # open interval represents it, so take the float adjacent to the bound above (or below, for the last interval).
+        representatives = []
+        for bound in self.bounds:
+            representatives.extend([np.nextafter(bound, -np.inf), bound])
+        representatives.append(np.nextafter(self.bounds[-1], np.inf) if self.bounds.size else 0.0)
+
+        self.segment_ranges = np.array(
+            [self._first_containing_range(representative) for representative in representatives], dtype=np.intp
+        )
+
+        # Outcomes are indexed by range, with the outcome of scores contained by no range appended at index -1.
+        self._functional_classifications = np.array(
+            [self._functional_classification_of_range(r) for r in self.functional_ranges]
+            + [ExperimentalVariantFunctionalImpactClassification.INDETERMINATE],
+            dtype=object,
+        )
+
+        pathogenicity_classifications = [self._pathogenicity_classification_of_range(r) for r in self.functional_ranges]
+        self._valid_pathogenicity_classifications = np.array(
+            [classification is not None for classification in pathogenicity_classifications] + [True], dtype=bool
+        )
+        self._criteria = np.array(
+            [classification[0] if classification else None for classification in pathogenicity_classifications]
+            + [VariantPathogenicityEvidenceLine.Criterion.PS3],
+            dtype=object,
+        )
+        self._evidence_strengths = np.array(
+            [classification[1] if classification else None for classification in pathogenicity_classifications]
+            + [None],
+            dtype=object,
+        )
+
+    @classmethod
+    def from_calibration(cls, calibration: ScoreCalibration) -> "CalibrationClassificationIndex":
+        # It's easier to reason with the view model objects for functional ranges than the JSONB fields in the raw database object.
+        return cls(
+            [
+                FunctionalClassification.model_validate(functional_range)
+                for functional_range in calibration.functional_classifications or []
+            ]
+        )
+
+    def _first_containing_range(self, score: float) -> int:
+        return next(
+            (
+                range_index
+                for range_index, functional_range in enumerate(self.functional_ranges)
+                if functional_range.is_contained_by_range(score)
+            ),
+            -1,
+        )
+
+    @staticmethod
+    def _functional_classification_of_range(
+        functional_range: FunctionalClassification,
+    ) -> ExperimentalVariantFunctionalImpactClassification:
+        if functional_range.functional_classification is FunctionalClassificationOptions.normal:
+            return ExperimentalVariantFunctionalImpactClassification.NORMAL
+        elif functional_range.functional_classification is FunctionalClassificationOptions.abnormal:
+            return ExperimentalVariantFunctionalImpactClassification.ABNORMAL
+        else:
+            return ExperimentalVariantFunctionalImpactClassification.INDETERMINATE
+
+    @staticmethod
+    def _pathogenicity_classification_of_range(
+        functional_range: FunctionalClassification,
+    ) -> Optional[tuple[VariantPathogenicityEvidenceLine.Criterion, Optional[StrengthOfEvidenceProvided]]]:
+        """The pathogenicity classification of scores in a range, or None if the range's classification is invalid."""
+        acmg_classification = functional_range.acmg_classification
+        if acmg_classification is None:
+            return (VariantPathogenicityEvidenceLine.Criterion.PS3, None)
+
+        # More of a type guard, as the ACMGClassification model enforces that criterion and evidence strength are
+        # mutually defined.
+        if (
+            acmg_classification.evidence_strength is None or acmg_classification.criterion is None
+        ):  # pragma: no cover - enforced by model validators in FunctionalClassification view model
+            return (VariantPathogenicityEvidenceLine.Criterion.PS3, None)
+
+        # TODO#540: Handle moderate+
+        if acmg_classification.evidence_strength.name not in StrengthOfEvidenceProvided._member_names_:
+            return None
+
+        if (
+            acmg_classification.criterion.name not in VariantPathogenicityEvidenceLine.Criterion._member_names_
+        ):  # pragma: no cover - enforced by model validators in FunctionalClassification view model
+            return None
+
+        return (
+            VariantPathogenicityEvidenceLine.Criterion[acmg_classification.criterion.name],
+            StrengthOfEvidenceProvided[acmg_classification.evidence_strength.name],
+        )
+
+    def range_indices(self, scores: Sequence[float]) -> np.ndarray:
+        """The index of the range which classifies each score, or -1 for scores which no range contains."""
+        scores = np.asarray(scores, dtype=float)
+        bound_indices = np.searchsorted(self.bounds, scores, side="left")
+        on_bound = self.bounds[np.minimum(bound_indices, self.bounds.size - 1)] == scores if self.bounds.size else False
+        range_indices = self.segment_ranges[2 * bound_indices + on_bound]
+
+        # No range may contain a non-finite score, since infinite bounds are always exclusive.
+        return np.where(np.isfinite(scores), range_indices, -1)
+
+    def classify_batch(self, scores: Sequence[float]) -> None:
+        """Locate the ranges of a batch of scores at once, replacing those of the previous batch."""
+        self._batch_range_indices = dict(zip(scores, self.range_indices(scores).tolist()))
+
+    def range_index(self, score: float) -> int:
+        """The index of the range which classifies a score, or -1 if no range contains it."""
+        range_index = self._batch_range_indices.get(score)
+        if range_index is None:
+            range_index = int(self.range_indices([score])[0])
+
+        return range_index
+
+    def functional_classification(self, score: float) -> ExperimentalVariantFunctionalImpactClassification:
+        """Classify the functional impact of a score as normal, abnormal, or indeterminate."""
+        return self._functional_classifications[self.range_index(score)]
+
+    def pathogenicity_classification(
+        self, score: float
+    ) -> tuple[VariantPathogenicityEvidenceLine.Criterion, Optional[StrengthOfEvidenceProvided]]:
+        """Classify the pathogenicity criterion and evidence strength of a score.
+
+        Raises ValueError if the score is contained in a range with an invalid evidence strength.
+        """
+        range_index = self.range_index(score)
+        if not self._valid_pathogenicity_classifications[range_index]:
+            raise ValueError("A score is contained in a clinical calibration range with an invalid evidence strength.")
+
+        return self._criteria[range_index], self._evidence_strengths[range_index]
+
+    def functional_classifications(self, scores: Sequence[float]) -> np.ndarray:
+        """Classify the functional impact of each score as normal, abnormal, or indeterminate."""
+        return self._functional_classifications[self.range_indices(scores)]
+
+    def pathogenicity_classifications(self, scores: Sequence[float]) -> tuple[np.ndarray, np.ndarray]:
+        """Classify the pathogenicity criterion and evidence strength of each score.
+
+        Raises ValueError if any score is contained in a range with an invalid evidence strength.
+        """
+        range_indices = self.range_indices(scores)
+        if not self._valid_pathogenicity_classifications[range_indices].all():
+            raise ValueError("A score is contained in a clinical calibration range with an invalid evidence strength.")
+
+        return self._criteria[range_indices], self._evidence_strengths[range_indices]
+
+
+def primary_calibration_classification_index(score_set: ScoreSet) -> Optional[CalibrationClassificationIndex]:
+    """Build the classification index of a score set's primary calibration, if it has one with functional ranges."""
+    # TODO#494: Support for multiple calibrations (all non-research use only).
+    primary_calibration = next((c for c in score_set.score_calibrations or [] if c.primary), None)
+    if not primary_calibration or not primary_calibration.functional_classifications:
+        return None
+
+    return CalibrationClassificationIndex.from_calibration(primary_calibration)
+
+
+def _primary_calibration_with_ranges(mapped_variant: MappedVariant, impact: str) -> ScoreCalibration:
+    """Find the primary calibration of a variant's score set. Raises ValueError if it is missing or has no ranges."""
     if not mapped_variant.variant.score_set.score_calibrations:
         raise ValueError(
             f"Variant {mapped_variant.variant.urn} does not have a score set with score calibrations."
-            " Unable to classify functional impact."
+            f" Unable to classify {impact}."
         )
 
     # TODO#494: Support for multiple calibrations (all non-research use only).
@@ -41,13 +228,32 @@ def functional_classification_of_variant(
     if not primary_calibration:
         raise ValueError(
             f"Variant {mapped_variant.variant.urn} does not have a primary score calibration."
-            " Unable to classify functional impact."
+            f" Unable to classify {impact}."
         )
 
     if not primary_calibration.functional_classifications:
         raise ValueError(
             f"Variant {mapped_variant.variant.urn} does not have ranges defined in its primary score calibration."
-            " Unable to classify functional impact."
+            f" Unable to classify {impact}."
+        )
+
+    return primary_calibration
+
+
+def functional_classification_of_variant(
+    mapped_variant: MappedVariant,
+    classification_index: Optional[CalibrationClassificationIndex] = None,
+) -> ExperimentalVariantFunctionalImpactClassification:
+    """Classify a variant's functional impact as normal, abnormal, or indeterminate.
+
+    Uses the primary score calibration and its functional ranges. When classifying many variants of the same score set,
+    pass the score set's `classification_index` so that the calibration need not be compiled for each variant. A given
+    index is assumed to belong to the primary calibration of the variant's score set.
+    Raises ValueError if required calibration or score is missing.
+    """
+    if classification_index is None:
+        classification_index = CalibrationClassificationIndex.from_calibration(
+            _primary_calibration_with_ranges(mapped_variant, "functional impact")
         )
 
     # This property of this column is guaranteed to be defined.
@@ -58,49 +264,23 @@ def functional_classification_of_variant(
             " Unable to classify functional impact."
         )
 
-    for functional_range in primary_calibration.functional_classifications:
-        # It's easier to reason with the view model objects for functional ranges than the JSONB fields in the raw database object.
-        functional_range_view = FunctionalClassification.model_validate(functional_range)
-
-        if functional_range_view.is_contained_by_range(functional_score):
-            if functional_range_view.functional_classification is FunctionalClassificationOptions.normal:
-                return ExperimentalVariantFunctionalImpactClassification.NORMAL
-            elif functional_range_view.functional_classification is FunctionalClassificationOptions.abnormal:
-                return ExperimentalVariantFunctionalImpactClassification.ABNORMAL
-            else:
-                return ExperimentalVariantFunctionalImpactClassification.INDETERMINATE
-
-    return ExperimentalVariantFunctionalImpactClassification.INDETERMINATE
+    return classification_index.functional_classification(functional_score)
 
 
 def pathogenicity_classification_of_variant(
     mapped_variant: MappedVariant,
+    classification_index: Optional[CalibrationClassificationIndex] = None,
 ) -> tuple[VariantPathogenicityEvidenceLine.Criterion, Optional[StrengthOfEvidenceProvided]]:
     """Classify a variant's pathogenicity and evidence strength using clinical calibration.
 
-    Uses the first clinical score calibration and its functional ranges.
+    Uses the first clinical score calibration and its functional ranges. When classifying many variants of the same
+    score set, pass the score set's `classification_index` so that the calibration need not be compiled for each
+    variant. A given index is assumed to belong to the primary calibration of the variant's score set.
     Raises ValueError if required calibration, score, or evidence strength is missing.
     """
-    if not mapped_variant.variant.score_set.score_calibrations:
-        raise ValueError(
-            f"Variant {mapped_variant.variant.urn} does not have a score set with score calibrations."
-            " Unable to classify clinical impact."
-        )
-
-    # TODO#494: Support multiple clinical calibrations.
-    score_calibrations = mapped_variant.variant.score_set.score_calibrations or []
-    primary_calibration = next((c for c in score_calibrations if c.primary), None)
-
-    if not primary_calibration:
-        raise ValueError(
-            f"Variant {mapped_variant.variant.urn} does not have a primary score calibration."
-            " Unable to classify clinical impact."
-        )
-
-    if not primary_calibration.functional_classifications:
-        raise ValueError(
-            f"Variant {mapped_variant.variant.urn} does not have ranges defined in its primary score calibration."
-            " Unable to classify clinical impact."
+    if classification_index is None:
+        classification_index = CalibrationClassificationIndex.from_calibration(
+            _primary_calibration_with_ranges(mapped_variant, "clinical impact")
         )
 
     # This property of this column is guaranteed to be defined.
@@ -111,44 +291,10 @@ def pathogenicity_classification_of_variant(
             " Unable to classify clinical impact."
         )
 
-    for pathogenicity_range in primary_calibration.functional_classifications:
-        # It's easier to reason with the view model objects for functional ranges than the JSONB fields in the raw database object.
-        pathogenicity_range_view = FunctionalClassification.model_validate(pathogenicity_range)
-
-        if pathogenicity_range_view.is_contained_by_range(functional_score):
-            if pathogenicity_range_view.acmg_classification is None:
-                return (VariantPathogenicityEvidenceLine.Criterion.PS3, None)
-
-            # More of a type guard, as the ACMGClassification model we construct above enforces that
-            # criterion and evidence strength are mutually defined.
-            if (
-                pathogenicity_range_view.acmg_classification.evidence_strength is None
-                or pathogenicity_range_view.acmg_classification.criterion is None
-            ):  # pragma: no cover - enforced by model validators in FunctionalClassification view model
-                return (VariantPathogenicityEvidenceLine.Criterion.PS3, None)
-
-            # TODO#540: Handle moderate+
-            if (
-                pathogenicity_range_view.acmg_classification.evidence_strength.name
-                not in StrengthOfEvidenceProvided._member_names_
-            ):
-                raise ValueError(
-                    f"Variant {mapped_variant.variant.urn} is contained in a clinical calibration range with an invalid evidence strength."
-                    " Unable to classify clinical impact."
-                )
-
-            if (
-                pathogenicity_range_view.acmg_classification.criterion.name
-                not in VariantPathogenicityEvidenceLine.Criterion._member_names_
-            ):  # pragma: no cover - enforced by model validators in FunctionalClassification view model
-                raise ValueError(
-                    f"Variant {mapped_variant.variant.urn} is contained in a clinical calibration range with an invalid criterion."
-                    " Unable to classify clinical impact."
-                )
-
-            return (
-                VariantPathogenicityEvidenceLine.Criterion[pathogenicity_range_view.acmg_classification.criterion.name],
-                StrengthOfEvidenceProvided[pathogenicity_range_view.acmg_classification.evidence_strength.name],
-            )
-
-    return (VariantPathogenicityEvidenceLine.Criterion.PS3, None)
+    try:
+        return classification_index.pathogenicity_classification(functional_score)
+    except ValueError:
+        raise ValueError(
+            f"Variant {mapped_variant.variant.urn} is contained in a clinical calibration range with an invalid evidence strength."
+            " Unable to classify clinical impact."
+        )
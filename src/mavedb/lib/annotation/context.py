@@ -0,0 +1,184 @@
+import logging
+from copy import copy
+from functools import cached_property
+from typing import Literal, Optional, Sequence
+
+from ga4gh.va_spec.acmg_2015 import VariantPathogenicityEvidenceLine
+from ga4gh.va_spec.base.core import Contribution, DataSet, Document, Method
+from ga4gh.va_spec.base.domain_entities import Condition
+
+from mavedb.lib.annotation.classification import (
+    CalibrationClassificationIndex,
+    primary_calibration_classification_index,
+)
+from mavedb.lib.annotation.condition import generic_disease_condition
+from mavedb.lib.annotation.contribution import (
+    excalibr_calibration_contribution,
+    mavedb_api_contribution,
+    mavedb_creator_contribution,
+    mavedb_modifier_contribution,
+    mavedb_vrs_contribution,
+)
+from mavedb.lib.annotation.dataset import score_set_to_data_set
+from mavedb.lib.annotation.document import experiment_to_document, score_set_to_document
+from mavedb.lib.annotation.method import (
+    excalibr_calibration_method,
+    publication_identifiers_to_method,
+    variant_interpretation_functional_guideline_method,
+)
+from mavedb.lib.annotation.util import score_set_has_required_calibrations_and_ranges_for_annotation
+from mavedb.lib.types.annotation import ResourceWithCreationModificationDates
+from mavedb.models.mapped_variant import MappedVariant
+from mavedb.models.score_set import ScoreSet
+from mavedb.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+class AnnotationContext:
+    """
+    The VA-Spec objects shared by the annotations of every variant in a score set.
+
+    The annotations of variants in the same score set share their agents, methods, documents, contributions and data
+    set descriptors, along with the compiled classification index of the score set's primary calibration. A context
+    builds each of these at most once, when it is first needed, so that annotating a variant only builds the objects
+    which are specific to that variant.
+
+    A context should only be used to annotate variants of the score set it was created for, and should not outlive the
+    request or job which created it. To annotate variants in another process, send it a `detached` copy of the context.
+    """
+
+    # The score set level objects built from the score set, which a detached context must have built in advance.
+    SCORE_SET_PROPERTIES = (
+        "classification_index",
+        "api_contribution",
+        "excalibr_calibration_contribution",
+        "experimental_protocol_method",
+        "functional_guideline_method",
+        "data_set",
+        "score_set_document",
+        "experiment_document",
+        "disease_condition",
+        "creator",
+        "modifier",
+    )
+
+    def __init__(self, score_set: ScoreSet) -> None:
+        self.score_set = score_set
+
+        self._required_calibrations: dict[str, bool] = {}
+        self._vrs_contributions: dict[tuple[Optional[str], Optional[str]], Contribution] = {}
+        self._creator_contributions: dict[tuple[str, Optional[str]], Contribution] = {}
+        self._modifier_contributions: dict[tuple[str, Optional[str]], Contribution] = {}
+        self._excalibr_calibration_methods: dict[Optional[VariantPathogenicityEvidenceLine.Criterion], Method] = {}
+
+    @cached_property
+    def classification_index(self) -> Optional[CalibrationClassificationIndex]:
+        return primary_calibration_classification_index(self.score_set)
+
+    @cached_property
+    def api_contribution(self) -> Contribution:
+        return mavedb_api_contribution()
+
+    @cached_property
+    def excalibr_calibration_contribution(self) -> Contribution:
+        return excalibr_calibration_contribution()
+
+    @cached_property
+    def experimental_protocol_method(self) -> Optional[Method]:
+        return publication_identifiers_to_method(self.score_set.publication_identifier_associations)
+
+    @cached_property
+    def functional_guideline_method(self) -> Method:
+        return variant_interpretation_functional_guideline_method()
+
+    @cached_property
+    def data_set(self) -> DataSet:
+        return score_set_to_data_set(self.score_set)
+
+    @cached_property
+    def score_set_document(self) -> Document:
+        return score_set_to_document(self.score_set)
+
+    @cached_property
+    def experiment_document(self) -> Document:
+        return experiment_to_document(self.score_set.experiment)
+
+    @cached_property
+    def disease_condition(self) -> Condition:
+        return generic_disease_condition()
+
+    @cached_property
+    def creator(self) -> User:
+        return self.score_set.created_by
+
+    @cached_property
+    def modifier(self) -> User:
+        return self.score_set.modified_by
+
+    def detached(self) -> "AnnotationContext":
+        """
+        Build every score set level object of this context, and return a copy of it which no longer refers to the score
+        set or to any other persistent object, so that it may be pickled and sent to another process.
+        """
+        for name in self.SCORE_SET_PROPERTIES:
+            getattr(self, name)
+        for annotation_type in ("pathogenicity", "functional"):
+            self.has_required_calibrations_for_annotation(annotation_type)
+
+        # Variants rebuilt in another process only need the URN of their score set, and contributions only need the
+        # usernames of its creator and modifier, so the copy refers to transient stand-ins for each of these.
+        detached = copy(self)
+        detached.score_set = ScoreSet(urn=self.score_set.urn)
+        detached.creator = User(username=self.creator.username)
+        detached.modifier = User(username=self.modifier.username)
+        return detached
+
+    def classify_batch(self, mapped_variants: Sequence[MappedVariant]) -> None:
+        """
+        Classify the scores of a batch of mapped variants with a single search of the classification index, so that
+        annotating each variant of the batch need not search the index on its own.
+        """
+        if self.classification_index is None:
+            return
+
+        scores = [
+            (mapped_variant.variant.data or {}).get("score_data", {}).get("score") for mapped_variant in mapped_variants
+        ]
+        self.classification_index.classify_batch([score for score in scores if score is not None])
+
+    def has_required_calibrations_for_annotation(self, annotation_type: Literal["pathogenicity", "functional"]) -> bool:
+        if annotation_type not in self._required_calibrations:
+            self._required_calibrations[annotation_type] = (
+                score_set_has_required_calibrations_and_ranges_for_annotation(self.score_set, annotation_type)
+            )
+
+        return self._required_calibrations[annotation_type]
+
+    def vrs_contribution(self, mapped_variant: MappedVariant) -> Contribution:
+        # Variants mapped by the same mapping job share a mapping version and date.
+        key = (mapped_variant.mapping_api_version, str(mapped_variant.mapped_date))
+        if key not in self._vrs_contributions:
+            self._vrs_contributions[key] = mavedb_vrs_contribution(mapped_variant)
+
+        return self._vrs_contributions[key]
+
+    def creator_contribution(self, created_resource: ResourceWithCreationModificationDates) -> Contribution:
+        key = (created_resource.__class__.__name__, str(created_resource.creation_date))
+        if key not in self._creator_contributions:
+            self._creator_contributions[key] = mavedb_creator_contribution(created_resource, self.creator)
+
+        return self._creator_contributions[key]
+
+    def modifier_contribution(self, modified_resource: ResourceWithCreationModificationDates) -> Contribution:
+        key = (modified_resource.__class__.__name__, str(modified_resource.modification_date))
+        if key not in self._modifier_contributions:
+            self._modifier_contributions[key] = mavedb_modifier_contribution(modified_resource, self.modifier)
+
+        return self._modifier_contributions[key]
+
+    def excalibr_calibration_method(self, criterion: Optional[VariantPathogenicityEvidenceLine.Criterion]) -> Method:
+        if criterion not in self._excalibr_calibration_methods:
+            self._excalibr_calibration_methods[criterion] = excalibr_calibration_method(criterion)
+
+        return self._excalibr_calibration_methods[criterion]
@@ -13,18 +13,7 @@ from ga4gh.va_spec.base.core import (
 from ga4gh.va_spec.base.enums import StrengthOfEvidenceProvided
 
 from mavedb.lib.annotation.classification import pathogenicity_classification_of_variant
-from mavedb.lib.annotation.contribution import (
-    excalibr_calibration_contribution,
-    mavedb_api_contribution,
-    mavedb_creator_contribution,
-    mavedb_modifier_contribution,
-    mavedb_vrs_contribution,
-)
-from mavedb.lib.annotation.document import score_set_to_document
-from mavedb.lib.annotation.method import (
-    excalibr_calibration_method,
-    publication_identifiers_to_method,
-)
+from mavedb.lib.annotation.context import AnnotationContext
 from mavedb.models.mapped_variant import MappedVariant
 
 
@@ -32,8 +21,14 @@ def acmg_evidence_line(
     mapped_variant: MappedVariant,
     proposition: VariantPathogenicityProposition,
     evidence: list[Union[StudyResult, EvidenceLineType, StatementType, iriReference]],
+    context: Optional[AnnotationContext] = None,
 ) -> Optional[VariantPathogenicityEvidenceLine]:
-    evidence_outcome, evidence_strength = pathogenicity_classification_of_variant(mapped_variant)
+    if context is None:
+        context = AnnotationContext(mapped_variant.variant.score_set)
+
+    evidence_outcome, evidence_strength = pathogenicity_classification_of_variant(
+        mapped_variant, context.classification_index
+    )
 
     if not evidence_strength:
         evidence_outcome_code = f"{evidence_outcome.value}_not_met"
@@ -59,7 +54,7 @@ def acmg_evidence_line(
 
     return VariantPathogenicityEvidenceLine(
         description=f"Pathogenicity evidence line {mapped_variant.variant.urn}.",
-        specifiedBy=excalibr_calibration_method(evidence_outcome),
+        specifiedBy=context.excalibr_calibration_method(evidence_outcome),
         evidenceOutcome={
             "primaryCoding": Coding(
                 code=evidence_outcome_code,
@@ -70,11 +65,11 @@ def acmg_evidence_line(
         strengthOfEvidenceProvided=strength_of_evidence,
         directionOfEvidenceProvided=direction_of_evidence,
         contributions=[
-            mavedb_api_contribution(),
-            mavedb_vrs_contribution(mapped_variant),
-            excalibr_calibration_contribution(),
-            mavedb_creator_contribution(mapped_variant.variant, mapped_variant.variant.score_set.created_by),
-            mavedb_modifier_contribution(mapped_variant.variant, mapped_variant.variant.score_set.modified_by),
+            context.api_contribution,
+            context.vrs_contribution(mapped_variant),
+            context.excalibr_calibration_contribution,
+            context.creator_contribution(mapped_variant.variant),
+            context.modifier_contribution(mapped_variant.variant),
         ],
         targetProposition=proposition,
         hasEvidenceItems=[evidence_item for evidence_item in evidence],
@@ -82,8 +77,13 @@ def acmg_evidence_line(
 
 
 def functional_evidence_line(
-    mapped_variant: MappedVariant, evidence: list[Union[StudyResult, EvidenceLineType, StatementType, iriReference]]
+    mapped_variant: MappedVariant,
+    evidence: list[Union[StudyResult, EvidenceLineType, StatementType, iriReference]],
+    context: Optional[AnnotationContext] = None,
 ) -> EvidenceLine:
+    if context is None:
+        context = AnnotationContext(mapped_variant.variant.score_set)
+
     return EvidenceLine(
         description=f"Functional evidence line for {mapped_variant.variant.urn}",
         # Pydantic validates the provided dictionary meets the expected structure of possible models, but
@@ -91,14 +91,12 @@ def functional_evidence_line(
         # of validation, so just ignore the error.
         hasEvidenceItems=[evidence_item.model_dump(exclude_none=True) for evidence_item in evidence],  # type: ignore
         directionOfEvidenceProvided="supports",
-        specifiedBy=publication_identifiers_to_method(
-            mapped_variant.variant.score_set.publication_identifier_associations
-        ),
+        specifiedBy=context.experimental_protocol_method,
         contributions=[
-            mavedb_api_contribution(),
-            mavedb_vrs_contribution(mapped_variant),
-            mavedb_creator_contribution(mapped_variant.variant, mapped_variant.variant.score_set.created_by),
-            mavedb_modifier_contribution(mapped_variant.variant, mapped_variant.variant.score_set.modified_by),
+            context.api_contribution,
+            context.vrs_contribution(mapped_variant),
+            context.creator_contribution(mapped_variant.variant),
+            context.modifier_contribution(mapped_variant.variant),
         ],
-        reportedIn=[score_set_to_document(mapped_variant.variant.score_set)],
+        reportedIn=[context.score_set_document],
     )
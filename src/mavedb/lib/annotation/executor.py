@@ -0,0 +1,138 @@
+"""
+Generate VA-Spec annotations for batches of mapped variants in a pool of worker processes.
+
+Building and serializing annotations is CPU bound, so generating the annotations of a large score set in the process
+serving a request starves every other request served by that process. When a pool is configured, batches of mapped
+variants are instead sent to the pool as plain dictionaries, along with a detached annotation context of their score
+set, and the annotated batches are yielded in the order their mapped variants were read. Since the pool is shared by
+every request, the number of batches a single request may have in flight at once is capped.
+"""
+
+import importlib
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, Optional
+
+from sqlalchemy.orm import configure_mappers
+
+import mavedb.models
+from mavedb.lib.annotation.context import AnnotationContext
+from mavedb.lib.annotation.store import generate_serialized_annotations
+from mavedb.models.enums.annotation_type import AnnotationType
+from mavedb.models.mapped_variant import MappedVariant
+from mavedb.models.score_set import ScoreSet
+from mavedb.models.variant import Variant
+
+logger = logging.getLogger(__name__)
+
+# The number of worker processes which generate annotations. If zero, annotations are generated in the serving process.
+ANNOTATION_EXECUTOR_PROCESSES = int(os.getenv("ANNOTATION_EXECUTOR_PROCESSES", 0))
+# The number of batches a single request may have submitted to the pool but not yet streamed.
+ANNOTATION_EXECUTOR_MAX_BATCHES_IN_FLIGHT = int(os.getenv("ANNOTATION_EXECUTOR_MAX_BATCHES_IN_FLIGHT", 2))
+
+AnnotatedBatch = list[tuple[Optional[str], Optional[str]]]
+
+_annotation_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def initialize_annotation_process() -> None:
+    """
+    Import and configure every model in a new annotation worker process. Annotation contexts are sent to worker
+    processes with transient model instances, which can't be unpickled until every model they may refer to is mapped.
+    """
+    for model_module in mavedb.models.__all__:
+        importlib.import_module(f"mavedb.models.{model_module}")
+
+    configure_mappers()
+
+
+def annotation_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Return the annotation process pool shared by every request in this process, creating it if necessary. Returns None
+    if annotations should be generated in the serving process.
+    """
+    global _annotation_process_pool
+
+    if ANNOTATION_EXECUTOR_PROCESSES <= 0:
+        return None
+
+    if _annotation_process_pool is None:
+        # Forking a process which may be running other threads is unsafe, so worker processes are spawned instead.
+        _annotation_process_pool = ProcessPoolExecutor(
+            max_workers=ANNOTATION_EXECUTOR_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initialize_annotation_process,
+        )
+
+    return _annotation_process_pool
+
+
+def mapped_variant_snapshot(mapped_variant: MappedVariant) -> dict[str, Any]:
+    """Copy the columns of a mapped variant and its variant which are used to build its annotations."""
+    return {
+        "id": mapped_variant.id,
+        "post_mapped": mapped_variant.post_mapped,
+        "mapped_date": mapped_variant.mapped_date,
+        "mapping_api_version": mapped_variant.mapping_api_version,
+        "clingen_allele_id": mapped_variant.clingen_allele_id,
+        "variant": {
+            "urn": mapped_variant.variant.urn,
+            "data": mapped_variant.variant.data,
+            "creation_date": mapped_variant.variant.creation_date,
+            "modification_date": mapped_variant.variant.modification_date,
+        },
+    }
+
+
+def mapped_variant_from_snapshot(snapshot: dict[str, Any], score_set: ScoreSet) -> MappedVariant:
+    """Rebuild a transient mapped variant of a score set, which is never added to a session, from its snapshot."""
+    variant = Variant(**snapshot["variant"], score_set=score_set)
+    return MappedVariant(**{key: value for key, value in snapshot.items() if key != "variant"}, variant=variant)
+
+
+def annotate_snapshots(
+    snapshots: list[dict[str, Any]], annotation_type: AnnotationType, context: AnnotationContext
+) -> AnnotatedBatch:
+    """
+    Generate the variant URNs and serialized annotations of a batch of mapped variant snapshots, using a detached
+    annotation context of their score set.
+    """
+    mapped_variants = [mapped_variant_from_snapshot(snapshot, context.score_set) for snapshot in snapshots]
+    return generate_serialized_annotations(mapped_variants, annotation_type, context)
+
+
+def annotate_batches_in_pool(
+    pool: Executor,
+    mapped_variant_batches: Iterable[list[MappedVariant]],
+    annotation_type: AnnotationType,
+    context: AnnotationContext,
+    max_batches_in_flight: int = ANNOTATION_EXECUTOR_MAX_BATCHES_IN_FLIGHT,
+) -> Iterator[AnnotatedBatch]:
+    """
+    Generate the variant URNs and serialized annotations of batches of mapped variants in a pool of worker processes,
+    yielding the annotated batches in the same order as the mapped variant batches.
+
+    At most `max_batches_in_flight` batches are submitted to the pool before the earliest of them is yielded, which
+    bounds both the share of the pool and the number of annotated batches held in memory by a single caller.
+    """
+    detached_context = context.detached()
+    pending: deque[Future[AnnotatedBatch]] = deque()
+
+    try:
+        for batch in mapped_variant_batches:
+            snapshots = [mapped_variant_snapshot(mapped_variant) for mapped_variant in batch]
+            pending.append(pool.submit(annotate_snapshots, snapshots, annotation_type, detached_context))
+
+            if len(pending) >= max(max_batches_in_flight, 1):
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+    finally:
+        # If the caller stops consuming batches, e.g. because a client disconnected, don't annotate the rest.
+        for future in pending:
+            future.cancel()
@@ -1,30 +1,39 @@
+from typing import Optional
+
 from ga4gh.va_spec.base.core import ExperimentalVariantFunctionalImpactProposition, VariantPathogenicityProposition
 from ga4gh.core.models import iriReference as IRI
 
 from mavedb.models.mapped_variant import MappedVariant
-from mavedb.lib.annotation.condition import generic_disease_condition
-from mavedb.lib.annotation.document import experiment_to_document
+from mavedb.lib.annotation.context import AnnotationContext
 from mavedb.lib.annotation.util import variation_from_mapped_variant
 
 
 def mapped_variant_to_experimental_variant_clinical_impact_proposition(
     mapped_variant: MappedVariant,
+    context: Optional[AnnotationContext] = None,
 ) -> VariantPathogenicityProposition:
+    if context is None:
+        context = AnnotationContext(mapped_variant.variant.score_set)
+
     return VariantPathogenicityProposition(
         description=f"Variant pathogenicity proposition for {mapped_variant.variant.urn}.",
         subjectVariant=variation_from_mapped_variant(mapped_variant),
         predicate="isCausalFor",
-        objectCondition=generic_disease_condition(),
+        objectCondition=context.disease_condition,
     )
 
 
 def mapped_variant_to_experimental_variant_functional_impact_proposition(
     mapped_variant: MappedVariant,
+    context: Optional[AnnotationContext] = None,
 ) -> ExperimentalVariantFunctionalImpactProposition:
+    if context is None:
+        context = AnnotationContext(mapped_variant.variant.score_set)
+
     return ExperimentalVariantFunctionalImpactProposition(
         description=f"Variant functional impact proposition for {mapped_variant.variant.urn}.",
         subjectVariant=variation_from_mapped_variant(mapped_variant),
         predicate="impactsFunctionOf",
         objectSequenceFeature=IRI(root="placeholder"),  # TODO: from post mapped target. This is dicey
-        experimentalContextQualifier=experiment_to_document(mapped_variant.variant.score_set.experiment),
+        experimentalContextQualifier=context.experiment_document,
     )
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Optional, Union
 from ga4gh.core.models import MappableConcept
 from ga4gh.va_spec.base.core import (
     Direction,
@@ -11,25 +11,23 @@ from ga4gh.va_spec.base.core import (
 )
 from ga4gh.core.models import Coding
 from mavedb.models.mapped_variant import MappedVariant
-from mavedb.lib.annotation.method import variant_interpretation_functional_guideline_method
 from mavedb.lib.annotation.classification import (
     functional_classification_of_variant,
     ExperimentalVariantFunctionalImpactClassification,
 )
-from mavedb.lib.annotation.contribution import (
-    mavedb_api_contribution,
-    mavedb_vrs_contribution,
-    mavedb_creator_contribution,
-    mavedb_modifier_contribution,
-)
+from mavedb.lib.annotation.context import AnnotationContext
 
 
 def mapped_variant_to_functional_statement(
     mapped_variant: MappedVariant,
     proposition: ExperimentalVariantFunctionalImpactProposition,
     evidence: list[Union[StudyResult, EvidenceLineType, StatementType, iriReference]],
+    context: Optional[AnnotationContext] = None,
 ) -> Statement:
-    classification = functional_classification_of_variant(mapped_variant)
+    if context is None:
+        context = AnnotationContext(mapped_variant.variant.score_set)
+
+    classification = functional_classification_of_variant(mapped_variant, context.classification_index)
 
     if classification == ExperimentalVariantFunctionalImpactClassification.NORMAL:
         direction = Direction.DISPUTES
@@ -40,12 +38,12 @@ def mapped_variant_to_functional_statement(
 
     return Statement(
         description=f"Variant functional impact statement for {mapped_variant.variant.urn}.",
-        specifiedBy=variant_interpretation_functional_guideline_method(),
+        specifiedBy=context.functional_guideline_method,
         contributions=[
-            mavedb_api_contribution(),
-            mavedb_vrs_contribution(mapped_variant),
-            mavedb_creator_contribution(mapped_variant.variant, mapped_variant.variant.score_set.created_by),
-            mavedb_modifier_contribution(mapped_variant.variant, mapped_variant.variant.score_set.modified_by),
+            context.api_contribution,
+            context.vrs_contribution(mapped_variant),
+            context.creator_contribution(mapped_variant.variant),
+            context.modifier_contribution(mapped_variant.variant),
         ],
         proposition=proposition,
         direction=direction,
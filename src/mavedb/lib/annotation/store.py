@@ -0,0 +1,239 @@
+"""
+A persisted store of the VA-Spec annotations served by the annotated variant endpoints.
+
+Annotations are generated for every current mapped variant of a score set by a worker job, and stored as the
+serialized JSON the endpoints would otherwise build on each request. Since annotations embed the URNs and metadata of
+their score set, its calibrations, and the ClinGen allele IDs of its variants, the stored annotations of a score set
+are deleted whenever any of these change: when the score set is updated or published, when its calibrations change,
+and when its variants are linked to ClinGen alleles. The endpoints fall back to generating annotations until the
+store has been repopulated.
+
+Invalidating and populating the store of a score set both take a transaction-level advisory lock on the score set, so
+population jobs of the same score set never overlap, and an invalidation waits for a running population to commit
+before deleting what it stored. Annotations generated from a score set which has since changed are therefore never
+left in the store.
+"""
+
+import logging
+import os
+from typing import Callable, Iterator, Optional, Sequence
+
+from arq import ArqRedis
+from pydantic import BaseModel
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from mavedb.lib.annotation.annotate import (
+    variant_functional_impact_statement,
+    variant_pathogenicity_evidence,
+    variant_study_result,
+)
+from mavedb.lib.annotation.context import AnnotationContext
+from mavedb.lib.annotation.exceptions import MappingDataDoesntExistException
+from mavedb.lib.exceptions import AnnotationStoreEnqueueError
+from mavedb.lib.logging.context import format_raised_exception_info_as_dict, logging_context, save_to_logging_context
+from mavedb.lib.score_sets import MAPPED_VARIANT_STREAM_BATCH_SIZE, current_mapped_variant_batches
+from mavedb.lib.serialization import model_to_json_bytes, value_to_json_bytes
+from mavedb.lib.slack import send_slack_error
+from mavedb.models.enums.annotation_type import AnnotationType
+from mavedb.models.mapped_variant import MappedVariant
+from mavedb.models.mapped_variant_annotation import MappedVariantAnnotation
+from mavedb.models.score_set import ScoreSet
+from mavedb.models.variant import Variant
+
+logger = logging.getLogger(__name__)
+
+ANNOTATION_STORE_ENABLED = os.getenv("ANNOTATION_STORE_ENABLED", "false").lower() == "true"
+
+# The first key of the advisory locks on the annotation stores of score sets, whose second key is the score set ID.
+ANNOTATION_STORE_LOCK_KEY = 0x414E4E4F
+
+ANNOTATION_FUNCTIONS: dict[AnnotationType, Callable[..., Optional[BaseModel]]] = {
+    AnnotationType.pathogenicity_evidence_line: variant_pathogenicity_evidence,
+    AnnotationType.functional_impact_statement: variant_functional_impact_statement,
+    AnnotationType.functional_study_result: variant_study_result,
+}
+
+
+def serialize_annotation(annotation: Optional[BaseModel]) -> Optional[str]:
+    if annotation is None:
+        return None
+
+    return model_to_json_bytes(annotation, exclude_none=True).decode()
+
+
+def annotation_ndjson_line(variant_urn: Optional[str], serialized_annotation: Optional[str]) -> bytes:
+    # Equivalent to rendering {"variant_urn": ..., "annotation": ...}, without parsing the serialized annotation.
+    annotation = serialized_annotation.encode() if serialized_annotation else b"null"
+    return b'{"variant_urn": %b, "annotation": %b}\n' % (value_to_json_bytes(variant_urn), annotation)
+
+
+def generate_serialized_annotation(
+    mapped_variant: MappedVariant, annotation_type: AnnotationType, context: AnnotationContext
+) -> Optional[str]:
+    try:
+        annotation = ANNOTATION_FUNCTIONS[annotation_type](mapped_variant, context)
+    except MappingDataDoesntExistException:
+        logger.debug(f"Mapping data does not exist for variant {mapped_variant.variant.urn}.")
+        annotation = None
+
+    return serialize_annotation(annotation)
+
+
+def generate_serialized_annotations(
+    mapped_variants: Sequence[MappedVariant], annotation_type: AnnotationType, context: AnnotationContext
+) -> list[tuple[Optional[str], Optional[str]]]:
+    """Generate the variant URNs and serialized annotations of a batch of mapped variants of the same score set."""
+    context.classify_batch(mapped_variants)
+    return [
+        (mapped_variant.variant.urn, generate_serialized_annotation(mapped_variant, annotation_type, context))
+        for mapped_variant in mapped_variants
+    ]
+
+
+def lock_annotation_store(db: Session, score_set_id: int) -> None:
+    """
+    Take the advisory lock on the annotation store of a score set, waiting for any other transaction holding it to end.
+    The lock is held until the current transaction ends.
+    """
+    db.execute(select(func.pg_advisory_xact_lock(ANNOTATION_STORE_LOCK_KEY, score_set_id)))
+
+
+def invalidate_annotation_store(db: Session, score_set_id: int) -> None:
+    """
+    Delete the stored annotations of every mapped variant of a score set. Locks the annotation store of the score set,
+    so a running population of it is committed, and then deleted, first.
+
+    The caller is responsible for committing the session.
+    """
+    lock_annotation_store(db, score_set_id)
+    db.execute(
+        delete(MappedVariantAnnotation)
+        .where(
+            MappedVariantAnnotation.mapped_variant_id.in_(
+                select(MappedVariant.id).join(MappedVariant.variant).where(Variant.score_set_id == score_set_id)
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def enqueue_annotation_store_population(
+    worker: ArqRedis, score_set_id: int, correlation_id: Optional[str]
+) -> Optional[str]:
+    """
+    Enqueue a job repopulating the annotation store of a score set, if the store is enabled. Callers should enqueue
+    the job once they have committed the invalidation of the stored annotations of the score set.
+
+    Annotations are generated on request until the store is populated, so a failure to enqueue the job is reported
+    rather than raised.
+
+    :return: The ID of the enqueued job, or None if no job was enqueued.
+    """
+    if not ANNOTATION_STORE_ENABLED:
+        logger.debug(msg="The annotation store is disabled, skipped population of the annotation store.")
+        return None
+
+    try:
+        job = await worker.enqueue_job("populate_annotation_store_for_score_set", correlation_id, score_set_id)
+        if job is None:
+            raise AnnotationStoreEnqueueError()
+
+    except Exception as e:
+        send_slack_error(e)
+        logger.error(
+            msg=f"Failed to enqueue an annotation store population job for score set {score_set_id}. Annotations for "
+            "this score set will be generated on request until the store is populated.",
+            extra={**logging_context(), **format_raised_exception_info_as_dict(e)},
+        )
+        return None
+
+    save_to_logging_context({"populate_annotation_store_job_id": job.job_id})
+    logger.info(msg="Enqueued annotation store population job.", extra=logging_context())
+    return job.job_id
+
+
+def populate_annotation_store(
+    db: Session, score_set: ScoreSet, batch_size: int = MAPPED_VARIANT_STREAM_BATCH_SIZE
+) -> int:
+    """
+    Replace the stored annotations of a score set with freshly generated annotations of each type for each of its
+    current mapped variants. Returns the number of stored annotations. The annotation store of the score set stays
+    locked until the caller's transaction ends.
+
+    The caller is responsible for committing the session.
+    """
+    invalidate_annotation_store(db, score_set.id)
+    # The score set may have changed while this population waited on the lock of its store.
+    db.refresh(score_set)
+
+    context = AnnotationContext(score_set)
+    num_annotations = 0
+    for batch in current_mapped_variant_batches(db, score_set, batch_size):
+        context.classify_batch(batch)
+        rows = [
+            {
+                "mapped_variant_id": mapped_variant.id,
+                "annotation_type": annotation_type,
+                "annotation": generate_serialized_annotation(mapped_variant, annotation_type, context),
+            }
+            for mapped_variant in batch
+            for annotation_type in AnnotationType
+        ]
+        db.execute(insert(MappedVariantAnnotation), rows)
+        num_annotations += len(rows)
+
+    return num_annotations
+
+
+def count_stored_annotations(db: Session, score_set: ScoreSet, annotation_type: AnnotationType) -> int:
+    return (
+        db.scalar(
+            select(func.count(MappedVariantAnnotation.id))
+            .join(MappedVariantAnnotation.mapped_variant)
+            .join(MappedVariant.variant)
+            .where(
+                Variant.score_set_id == score_set.id,
+                MappedVariant.current.is_(True),
+                MappedVariantAnnotation.annotation_type == annotation_type,
+            )
+        )
+        or 0
+    )
+
+
+def stored_annotation_batches(
+    db: Session,
+    score_set: ScoreSet,
+    annotation_type: AnnotationType,
+    batch_size: int = MAPPED_VARIANT_STREAM_BATCH_SIZE,
+) -> Iterator[list[tuple[Optional[str], Optional[str]]]]:
+    """
+    Yield the variant URNs and stored annotations of the current mapped variants of a score set, in batches ordered by
+    mapped variant ID. See `current_mapped_variant_batches`.
+    """
+    last_mapped_variant_id = 0
+    while True:
+        batch = db.execute(
+            select(MappedVariant.id, Variant.urn, MappedVariantAnnotation.annotation)
+            .join(MappedVariantAnnotation.mapped_variant)
+            .join(MappedVariant.variant)
+            .where(
+                Variant.score_set_id == score_set.id,
+                MappedVariant.current.is_(True),
+                MappedVariantAnnotation.annotation_type == annotation_type,
+                MappedVariant.id > last_mapped_variant_id,
+            )
+            .order_by(MappedVariant.id)
+            .limit(batch_size)
+        ).all()
+
+        if not batch:
+            return
+
+        yield [(variant_urn, annotation) for _, variant_urn, annotation in batch]
+
+        if len(batch) < batch_size:
+            return
+
+        last_mapped_variant_id = batch[-1].id
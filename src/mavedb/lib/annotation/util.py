@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import TYPE_CHECKING, Literal, Optional
 
 from ga4gh.core.models import Extension
 from ga4gh.vrs.models import (
@@ -13,8 +13,12 @@ from ga4gh.vrs.models import (
 
 from mavedb.lib.annotation.exceptions import MappingDataDoesntExistException
 from mavedb.models.mapped_variant import MappedVariant
+from mavedb.models.score_set import ScoreSet
 from mavedb.view_models.score_calibration import SavedScoreCalibration
 
+if TYPE_CHECKING:
+    from mavedb.lib.annotation.context import AnnotationContext
+
 
 def allele_from_mapped_variant_dictionary_result(allelic_mapping_results: dict) -> Allele:
     """
@@ -165,14 +169,14 @@ def _can_annotate_variant_base_assumptions(mapped_variant: MappedVariant) -> boo
     return True
 
 
-def _variant_score_calibrations_have_required_calibrations_and_ranges_for_annotation(
-    mapped_variant: MappedVariant, annotation_type: Literal["pathogenicity", "functional"]
+def score_set_has_required_calibrations_and_ranges_for_annotation(
+    score_set: ScoreSet, annotation_type: Literal["pathogenicity", "functional"]
 ) -> bool:
     """
-    Check if a mapped variant's score set contains any of the required calibrations for annotation.
+    Check if a score set contains any of the required calibrations for annotation.
 
     Args:
-        mapped_variant (MappedVariant): The mapped variant object containing the variant with score set data.
+        score_set (ScoreSet): The score set whose calibrations should be checked.
         annotation_type (Literal["pathogenicity", "functional"]): The type of annotation to check for.
             Must be either "pathogenicity" or "functional".
 
@@ -181,11 +185,11 @@ def _variant_score_calibrations_have_required_calibrations_and_ranges_for_annota
          range values/do not have range data.
               Returns True (implicitly) if at least one required kind exists and has a non-empty functional range.
     """
-    if mapped_variant.variant.score_set.score_calibrations is None:
+    if score_set.score_calibrations is None:
         return False
 
     # TODO#494: Support for multiple calibrations (all non-research use only).
-    primary_calibration = next((c for c in mapped_variant.variant.score_set.score_calibrations if c.primary), None)
+    primary_calibration = next((c for c in score_set.score_calibrations if c.primary), None)
     if not primary_calibration:
         return False
 
@@ -206,7 +210,29 @@ def _variant_score_calibrations_have_required_calibrations_and_ranges_for_annota
     return True
 
 
-def can_annotate_variant_for_pathogenicity_evidence(mapped_variant: MappedVariant) -> bool:
+def _variant_score_calibrations_have_required_calibrations_and_ranges_for_annotation(
+    mapped_variant: MappedVariant, annotation_type: Literal["pathogenicity", "functional"]
+) -> bool:
+    """
+    Check if a mapped variant's score set contains any of the required calibrations for annotation.
+
+    Args:
+        mapped_variant (MappedVariant): The mapped variant object containing the variant with score set data.
+        annotation_type (Literal["pathogenicity", "functional"]): The type of annotation to check for.
+            Must be either "pathogenicity" or "functional".
+
+    Returns:
+        bool: Whether the score set of the variant has the calibrations required for the annotation type. See
+            `score_set_has_required_calibrations_and_ranges_for_annotation`.
+    """
+    return score_set_has_required_calibrations_and_ranges_for_annotation(
+        mapped_variant.variant.score_set, annotation_type
+    )
+
+
+def can_annotate_variant_for_pathogenicity_evidence(
+    mapped_variant: MappedVariant, context: Optional["AnnotationContext"] = None
+) -> bool:
     """
     Determine if a mapped variant can be annotated for pathogenicity evidence.
 
@@ -217,6 +243,8 @@ def can_annotate_variant_for_pathogenicity_evidence(mapped_variant: MappedVarian
     Args:
         mapped_variant (MappedVariant): The mapped variant object to evaluate
             for pathogenicity evidence annotation eligibility.
+        context (Optional[AnnotationContext]): The annotation context of the variant's score set. When provided,
+            the calibration check is made once per score set rather than once per variant.
 
     Returns:
         bool: True if the variant can be annotated for pathogenicity evidence,
@@ -232,6 +260,8 @@ def can_annotate_variant_for_pathogenicity_evidence(mapped_variant: MappedVarian
     """
     if not _can_annotate_variant_base_assumptions(mapped_variant):
         return False
+    if context is not None:
+        return context.has_required_calibrations_for_annotation("pathogenicity")
     if not _variant_score_calibrations_have_required_calibrations_and_ranges_for_annotation(
         mapped_variant, "pathogenicity"
     ):
@@ -240,7 +270,9 @@ def can_annotate_variant_for_pathogenicity_evidence(mapped_variant: MappedVarian
     return True
 
 
-def can_annotate_variant_for_functional_statement(mapped_variant: MappedVariant) -> bool:
+def can_annotate_variant_for_functional_statement(
+    mapped_variant: MappedVariant, context: Optional["AnnotationContext"] = None
+) -> bool:
     """
     Determine if a mapped variant can be annotated for functional statements.
 
@@ -251,6 +283,8 @@ def can_annotate_variant_for_functional_statement(mapped_variant: MappedVariant)
     Args:
         mapped_variant (MappedVariant): The variant object to check for annotation
             eligibility, containing mapping information and score data.
+        context (Optional[AnnotationContext]): The annotation context of the variant's score set. When provided,
+            the calibration check is made once per score set rather than once per variant.
 
     Returns:
         bool: True if the variant can be annotated for functional statements,
@@ -263,6 +297,8 @@ def can_annotate_variant_for_functional_statement(mapped_variant: MappedVariant)
     """
     if not _can_annotate_variant_base_assumptions(mapped_variant):
         return False
+    if context is not None:
+        return context.has_required_calibrations_for_annotation("functional")
     if not _variant_score_calibrations_have_required_calibrations_and_ranges_for_annotation(
         mapped_variant, "functional"
     ):
@@ -14,6 +14,7 @@ from fastapi.security import (
 )
 from jose import jwt
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from mavedb import deps
 from mavedb.lib.logging.context import format_raised_exception_info_as_dict, logging_context, save_to_logging_context
@@ -123,6 +124,11 @@ async def get_access_token(
 async def get_current_user_data_from_api_key(
     db: Session = Depends(deps.get_db), access_token: str = Depends(get_access_token)
 ) -> Optional[UserData]:
+    # Looking up the key queries the database, so it is done in the threadpool rather than on the event loop.
+    return await run_in_threadpool(_user_data_from_api_key, db, access_token)
+
+
+def _user_data_from_api_key(db: Session, access_token: Optional[str]) -> Optional[UserData]:
     user = None
     roles: list[UserRole] = []
 
@@ -183,6 +189,14 @@ async def get_current_user(
         logger.info(msg="Failed to authenticate user; Username not present in token payload.", extra=logging_context())
         return None
 
+    # Finding or creating the user queries the database (and may call ORCID), so it is done in the threadpool rather
+    # than on the event loop.
+    return await run_in_threadpool(_user_data_from_token_payload, db, username, token_payload, x_active_roles)
+
+
+def _user_data_from_token_payload(
+    db: Session, username: str, token_payload: dict, x_active_roles: Optional[str]
+) -> Optional[UserData]:
     user = db.query(User).filter(User.username == username).one_or_none()
 
     # If there was a token payload, auth method must be JWT.
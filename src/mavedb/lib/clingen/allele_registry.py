@@ -1,11 +1,22 @@
 import logging
+from datetime import date
+
 import requests
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from mavedb.lib.utils import batched
+from mavedb.models.clingen_allele_registration import ClinGenAlleleRegistration
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 CLINGEN_API_URL = "https://reg.genome.network/allele"
 
+# Keep the number of bound parameters in a single registry cache statement well below the PostgreSQL limit.
+REGISTRY_CACHE_STATEMENT_SIZE = 10000
+
 
 def get_canonical_pa_ids(clingen_allele_id: str) -> list[str]:
     """ "Retrieve any canonical PA IDs from the ClinGen API for a given clingen allele ID."""
@@ -43,3 +54,45 @@ def get_matching_registered_ca_ids(clingen_pa_id: str) -> list[str]:
                 ca_ids.extend([allele["@id"].split("/")[-1] for allele in allele["matchingRegisteredTranscripts"]])
 
     return ca_ids
+
+
+def get_cached_allele_registrations(db: Session, hgvs_strings: list[str]) -> dict[str, str]:
+    """
+    Retrieve the ClinGen allele IDs of any HGVS strings which have previously been registered with the ClinGen Allele
+    Registry. HGVS strings which have not been registered are omitted from the result.
+    """
+    cached_registrations: dict[str, str] = {}
+    for chunk in batched(list(set(hgvs_strings)), REGISTRY_CACHE_STATEMENT_SIZE):
+        cached_registrations.update(
+            db.execute(
+                select(ClinGenAlleleRegistration.hgvs, ClinGenAlleleRegistration.clingen_allele_id).where(
+                    ClinGenAlleleRegistration.hgvs.in_(chunk)
+                )
+            )
+            .tuples()
+            .all()
+        )
+
+    logger.debug(f"Found {len(cached_registrations)} of {len(hgvs_strings)} HGVS strings in the allele registry cache.")
+    return cached_registrations
+
+
+def cache_allele_registrations(db: Session, registrations: dict[str, str]) -> None:
+    """
+    Merge a mapping of HGVS strings to ClinGen allele IDs into the allele registry cache, replacing the allele ID of
+    any HGVS string which is already cached. The caller is responsible for committing the session.
+    """
+    registration_rows = [
+        {"hgvs": hgvs, "clingen_allele_id": clingen_allele_id} for hgvs, clingen_allele_id in registrations.items()
+    ]
+
+    for chunk in batched(registration_rows, REGISTRY_CACHE_STATEMENT_SIZE // 2):
+        statement = insert(ClinGenAlleleRegistration).values(chunk)
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[ClinGenAlleleRegistration.hgvs],
+                set_={"clingen_allele_id": statement.excluded.clingen_allele_id, "modification_date": date.today()},
+            )
+        )
+
+    logger.debug(f"Cached {len(registration_rows)} allele registrations.")
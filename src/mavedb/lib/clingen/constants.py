@@ -8,6 +8,10 @@ GENBOREE_ACCOUNT_PASSWORD = os.getenv("GENBOREE_ACCOUNT_PASSWORD")
 CLIN_GEN_TENANT = os.getenv("CLIN_GEN_TENANT")
 
 CAR_SUBMISSION_ENDPOINT = os.getenv("CAR_SUBMISSION_ENDPOINT")
+DEFAULT_CAR_SUBMISSION_BATCH_SIZE = 1000
+CAR_SUBMISSION_MAX_WORKERS = 4
+CAR_SUBMISSION_RETRY_LIMIT = 3
+CAR_SUBMISSION_BACKOFF_IN_SECONDS = 5
 
 LDH_SUBMISSION_TYPE = "cg-ldh-ld-submission"
 LDH_ENTITY_NAME = "MaveDBMapping"
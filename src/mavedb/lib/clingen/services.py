@@ -9,7 +9,16 @@ from urllib import parse
 import requests
 from jose import jwt
 
-from mavedb.lib.clingen.constants import GENBOREE_ACCOUNT_NAME, GENBOREE_ACCOUNT_PASSWORD, LDH_MAVE_ACCESS_ENDPOINT
+from mavedb.lib.clingen.constants import (
+    CAR_SUBMISSION_BACKOFF_IN_SECONDS,
+    CAR_SUBMISSION_MAX_WORKERS,
+    CAR_SUBMISSION_RETRY_LIMIT,
+    DEFAULT_CAR_SUBMISSION_BATCH_SIZE,
+    GENBOREE_ACCOUNT_NAME,
+    GENBOREE_ACCOUNT_PASSWORD,
+    LDH_MAVE_ACCESS_ENDPOINT,
+)
+from mavedb.lib.concurrency import ContextThreadPoolExecutor
 from mavedb.lib.logging.context import format_raised_exception_info_as_dict, logging_context, save_to_logging_context
 from mavedb.lib.types.clingen import ClinGenAllele, ClinGenSubmissionError, LdhSubmission
 from mavedb.lib.utils import batched
@@ -34,16 +43,16 @@ class ClinGenAlleleRegistryService:
         construct_auth_url(url: str) -> str:
             Constructs an authenticated request URL for the provided URL using the Genboree account credentials.
 
-        dispatch_submissions(content_submissions: list[str]) -> dict[str, str]:
-            Dispatches a list of content submissions to the ClinGen Allele Registry API.
+        dispatch_submissions(content_submissions: list[str], batch_size: int = DEFAULT_CAR_SUBMISSION_BATCH_SIZE) -> list:
+            Dispatches a list of content submissions to the ClinGen Allele Registry API. Submissions are split into
+            chunks of `batch_size` HGVS strings which are dispatched in parallel and retried individually.
             Args:
                 content_submissions (list[str]): A list of HGVS strings to be submitted to the ClinGen Allele Registry.
+                batch_size (int): The number of HGVS strings submitted in each request.
             Returns:
-                dict[str, str]: A dictionary mapping HGVS strings to their corresponding ClinGen Allele Registry IDs (CAIDs).
-                The keys are the HGVS strings, and the values are the CAIDs assigned by the ClinGen Allele Registry.
-                If the submission fails, an empty dictionary is returned.
-            Raises:
-                requests.exceptions.RequestException: If an error occurs during the HTTP request to the ClinGen Allele Registry API.
+                list[Union[ClinGenAllele, ClinGenSubmissionError]]: The combined registry responses of every chunk
+                which was successfully dispatched. Chunks which fail after all retries contribute nothing, so if
+                every chunk fails an empty list is returned.
     """
 
     def __init__(self, url: str) -> None:
@@ -70,31 +79,86 @@ class ClinGenAlleleRegistryService:
         return url + "&gbLogin=" + GENBOREE_ACCOUNT_NAME + "&gbTime=" + gbTime + "&gbToken=" + token
 
     def dispatch_submissions(
-        self, content_submissions: list[str]
+        self, content_submissions: list[str], batch_size: int = DEFAULT_CAR_SUBMISSION_BATCH_SIZE
     ) -> list[Union[ClinGenAllele, ClinGenSubmissionError]]:
-        save_to_logging_context({"car_submission_count": len(content_submissions)})
+        submission_chunks = list(batched(content_submissions, batch_size))
+        save_to_logging_context(
+            {
+                "car_submission_count": len(content_submissions),
+                "car_submission_batch_size": batch_size,
+                "car_submission_batch_count": len(submission_chunks),
+            }
+        )
 
-        try:
-            logger.info(msg="Dispatching ClinGen Allele Registry submission...", extra=logging_context())
-            request_url = self.construct_auth_url(f"{self.url}/alleles?file=hgvs")
+        if not submission_chunks:
+            logger.info(msg="No ClinGen Allele Registry submissions to dispatch.", extra=logging_context())
+            return []
 
-            response = requests.put(
-                url=request_url,
-                data="\n".join(content_submissions),
-            )
-            response.raise_for_status()
+        logger.info(msg="Dispatching ClinGen Allele Registry submission...", extra=logging_context())
+        with ContextThreadPoolExecutor(max_workers=min(CAR_SUBMISSION_MAX_WORKERS, len(submission_chunks))) as executor:
+            chunk_responses = list(executor.map(self._dispatch_submission_chunk, submission_chunks))
 
-        except (requests.exceptions.RequestException, requests.exceptions.HTTPError) as exc:
-            save_to_logging_context(format_raised_exception_info_as_dict(exc))
-            logger.error(msg="Failed to dispatch CAR submission.", exc_info=exc, extra=logging_context())
-            return []
+        response_data: list[Union[ClinGenAllele, ClinGenSubmissionError]] = []
+        failed_chunks = 0
+        for chunk_response in chunk_responses:
+            if chunk_response is None:
+                failed_chunks += 1
+                continue
+
+            response_data.extend(chunk_response)
 
-        response_data: list[Union[ClinGenAllele, ClinGenSubmissionError]] = response.json()
-        save_to_logging_context({"car_submission_response_count": len(response_data)})
-        logger.info(msg="Successfully dispatched CAR submission.", extra=logging_context())
+        save_to_logging_context(
+            {"car_submission_response_count": len(response_data), "car_submission_failed_batch_count": failed_chunks}
+        )
+
+        if failed_chunks:
+            logger.error(
+                msg=f"Failed to dispatch {failed_chunks} of {len(submission_chunks)} CAR submission batches.",
+                extra=logging_context(),
+            )
+        else:
+            logger.info(msg="Successfully dispatched CAR submission.", extra=logging_context())
 
         return response_data
 
+    def _dispatch_submission_chunk(
+        self, content_submissions: list[str]
+    ) -> Optional[list[Union[ClinGenAllele, ClinGenSubmissionError]]]:
+        """
+        Dispatches a single chunk of HGVS strings to the ClinGen Allele Registry, retrying with exponential backoff.
+
+        Intended to be run on a worker thread, so this method only logs and does not write to the logging context.
+
+        Args:
+            content_submissions (list[str]): The HGVS strings to submit in a single request.
+
+        Returns:
+            Optional[list[Union[ClinGenAllele, ClinGenSubmissionError]]]: The registry response for this chunk, or
+            None if the chunk could not be dispatched within the retry limit.
+        """
+        for attempt in range(CAR_SUBMISSION_RETRY_LIMIT + 1):
+            try:
+                # The authentication token is time based, so it must be regenerated for each attempt.
+                request_url = self.construct_auth_url(f"{self.url}/alleles?file=hgvs")
+                response = requests.put(
+                    url=request_url,
+                    data="\n".join(content_submissions),
+                )
+                response.raise_for_status()
+                return response.json()
+
+            except (requests.exceptions.RequestException, requests.exceptions.HTTPError) as exc:
+                logger.warning(
+                    msg=f"Failed to dispatch CAR submission batch (attempt {attempt + 1} of {CAR_SUBMISSION_RETRY_LIMIT + 1}).",
+                    exc_info=exc,
+                    extra=logging_context(),
+                )
+
+                if attempt < CAR_SUBMISSION_RETRY_LIMIT:
+                    time.sleep(CAR_SUBMISSION_BACKOFF_IN_SECONDS * (2**attempt))
+
+        return None
+
 
 class ClinGenLdhService:
     """
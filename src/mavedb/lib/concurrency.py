@@ -0,0 +1,61 @@
+"""
+Helpers for keeping blocking work off the event loop.
+
+The database session is synchronous, so route handlers which use it are declared with `def` rather than `async def`,
+and FastAPI runs them in its threadpool. These helpers let such handlers call coroutine functions, and let coroutine
+functions such as worker jobs call blocking functions.
+
+Context variables, such as the logging context and the SQL statistics of the current request or job, follow work run
+with these helpers into the threadpool. Threads started by a plain `ThreadPoolExecutor` do not inherit them, so use
+`ContextThreadPoolExecutor` to fan work out over threads instead.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, TypeVar
+
+from anyio import from_thread, to_thread
+
+T = TypeVar("T")
+
+
+def run_coroutine_in_thread(async_fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a coroutine function to completion on a private event loop in the calling thread.
+
+    Use this for coroutine functions which do blocking work, such as querying the database, so that the work stays in
+    the threadpool. The coroutine must not use objects bound to the application's event loop.
+    """
+    return asyncio.run(async_fn(*args, **kwargs))
+
+
+def run_on_event_loop(async_fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a coroutine function on the application's event loop from a threadpool thread, and wait for its result.
+
+    Use this for coroutine functions which use objects bound to the application's event loop, such as the worker's
+    Redis connection or the request body.
+    """
+    return from_thread.run(partial(async_fn, *args, **kwargs))
+
+
+async def run_in_worker_thread(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking function in a worker thread, and wait for its result without blocking the event loop.
+
+    Use this for functions which spend most of their time waiting, such as on HTTP requests and retry backoffs, so
+    that other coroutines, such as concurrently running worker jobs, can make progress in the meantime.
+    """
+    return await to_thread.run_sync(partial(fn, *args, **kwargs))
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    A thread pool executor which runs each submitted function in a copy of the context it was submitted from, so that
+    the function sees the context variables of the submitting request or job.
+    """
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
@@ -202,3 +202,15 @@ class UniProtPollingEnqueueError(ValueError):
     """Raised when a UniProt ID polling job fails to be enqueued despite appearing as if it should have been"""
 
     pass
+
+
+class AnnotationStoreEnqueueError(ValueError):
+    """Raised when an annotation store job fails to be enqueued despite appearing as if it should have been"""
+
+    pass
+
+
+class SqlStatementBudgetExceededError(Exception):
+    """Raised when a request or job issues more SQL statements than an enforced statement budget allows"""
+
+    pass
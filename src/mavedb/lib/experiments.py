@@ -1,12 +1,12 @@
 import logging
 from typing import Optional
 
-from sqlalchemy import func, not_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import func, not_, or_, select
+from sqlalchemy.orm import Session, aliased
 
 from mavedb.lib.logging.context import logging_context, save_to_logging_context
 from mavedb.lib.permissions import Action
-from mavedb.lib.score_sets import find_superseded_score_set_tail
+from mavedb.lib.score_sets import find_superseded_score_set_tail, superseded_score_set_tails_query
 from mavedb.lib.types.authentication import UserData
 from mavedb.models.contributor import Contributor
 from mavedb.models.controlled_keyword import ControlledKeyword
@@ -131,6 +131,46 @@ def search_experiments(
     return items
 
 
+def enrich_experiments_with_num_score_sets(
+    db: Session, items: list[Experiment], user_data: Optional[UserData]
+) -> dict[int, experiment.Experiment]:
+    """
+    Validate and update the number of score sets in each of several experiments, resolving the superseding chains of all
+    of their score sets in a single query. The superseded score set is excluded.
+    Data structure: experiment{score_set_urns, num_score_sets}
+
+    :return: A dictionary mapping the ID of each experiment to its updated view model.
+    """
+    experiments = {item.id: item for item in items}
+    if not experiments:
+        return {}
+
+    tails = superseded_score_set_tails_query(
+        select(ScoreSet.id).where(ScoreSet.experiment_id.in_(experiments.keys())), user_data
+    ).subquery()
+    tail = aliased(ScoreSet)
+    tail_urns = db.execute(
+        select(ScoreSet.experiment_id, tail.urn)
+        .join(tails, tails.c.score_set_id == ScoreSet.id)
+        .join(tail, tail.id == tails.c.tail_id)
+        .where(tail.urn.isnot(None))
+    ).all()
+
+    filtered_score_set_urns: dict[int, set[str]] = {experiment_id: set() for experiment_id in experiments}
+    for experiment_id, urn in tail_urns:
+        filtered_score_set_urns[experiment_id].add(urn)
+
+    return {
+        experiment_id: experiment.Experiment.model_validate(item).copy(
+            update={
+                "num_score_sets": len(filtered_score_set_urns[experiment_id]),
+                "score_set_urns": sorted(filtered_score_set_urns[experiment_id]),
+            }
+        )
+        for experiment_id, item in experiments.items()
+    }
+
+
 def enrich_experiment_with_num_score_sets(
     item_update: Experiment, user_data: Optional[UserData]
 ) -> experiment.Experiment:
@@ -138,21 +178,24 @@ def enrich_experiment_with_num_score_sets(
     Validate and update the number of score set in experiment. The superseded score set is excluded.
     Data structure: experiment{score_set_urns, num_score_sets}
     """
-    filter_superseded_score_set_tails = [
-        find_superseded_score_set_tail(score_set, Action.READ, user_data) for score_set in item_update.score_sets
-    ]
-    filtered_score_set_urns = sorted(
-        {
-            score_set.urn
-            for score_set in filter_superseded_score_set_tails
-            if score_set is not None and score_set.urn is not None
-        }
-    )
+    db = Session.object_session(item_update)
+    if db is None:
+        filter_superseded_score_set_tails = [
+            find_superseded_score_set_tail(score_set, Action.READ, user_data) for score_set in item_update.score_sets
+        ]
+        filtered_score_set_urns = sorted(
+            {
+                score_set.urn
+                for score_set in filter_superseded_score_set_tails
+                if score_set is not None and score_set.urn is not None
+            }
+        )
 
-    updated_experiment = experiment.Experiment.model_validate(item_update).copy(
-        update={
-            "num_score_sets": len(filtered_score_set_urns),
-            "score_set_urns": filtered_score_set_urns,
-        }
-    )
-    return updated_experiment
+        return experiment.Experiment.model_validate(item_update).copy(
+            update={
+                "num_score_sets": len(filtered_score_set_urns),
+                "score_set_urns": filtered_score_set_urns,
+            }
+        )
+
+    return enrich_experiments_with_num_score_sets(db, [item_update], user_data)[item_update.id]
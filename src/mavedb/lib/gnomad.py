@@ -1,19 +1,49 @@
+import functools
 import os
 import re
 import logging
-from typing import Any, Sequence, Union
-
-from sqlalchemy import text, select, Row
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Optional, Sequence, Union
+
+from sqlalchemy import Integer, Row, delete, func, literal, select, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.orm import Session
 
+from mavedb.lib.concurrency import ContextThreadPoolExecutor
 from mavedb.lib.logging.context import logging_context, save_to_logging_context
 from mavedb.lib.utils import batched
-from mavedb.db.athena import engine as athena_engine
-from mavedb.models.gnomad_variant import GnomADVariant
+from mavedb.db.athena import ATHENA_POOL_SIZE, engine as athena_engine
+from mavedb.models.gnomad_caid_lookup import GNOMAD_CAID_LOOKUP_UNIQUE_CONSTRAINT, GnomADCaidLookup
+from mavedb.models.gnomad_variant import GNOMAD_VARIANT_UNIQUE_CONSTRAINT, GnomADVariant
+from mavedb.models.gnomad_variant_mapped_variant import gnomad_variants_mapped_variants_association_table
 from mavedb.models.mapped_variant import MappedVariant
 
 GNOMAD_DB_NAME = "gnomAD"
 GNOMAD_DATA_VERSION = os.getenv("GNOMAD_DATA_VERSION")
+GNOMAD_DATA_BACKEND = os.getenv("GNOMAD_DATA_BACKEND", "athena").lower()
+GNOMAD_PARQUET_DIRECTORY = os.getenv("GNOMAD_PARQUET_DIRECTORY")
+GNOMAD_VARIANT_COLUMNS = (
+    "locus.contig",
+    "locus.position",
+    "alleles",
+    "caid",
+    "joint.freq.all.ac",
+    "joint.freq.all.an",
+    "joint.fafmax.faf95_max_gen_anc",
+    "joint.fafmax.faf95_max",
+)
+# Athena has a maximum character limit of 262144 in queries. CAIDs are about 12 characters long on average + 4 for two
+# quotes, a comma and a space, so chunks of 260000/16=16250 CAIDs are guaranteed to remain under the character limit.
+GNOMAD_ATHENA_CHUNK_SIZE = 16250
+GNOMAD_CAID_LOOKUP_STATEMENT_SIZE = 10000
+# Each upserted gnomAD variant binds 10 parameters: its 8 values and its default creation and modification dates. Keep
+# the parameters of each upsert statement within the signed 16-bit limit some PostgreSQL drivers enforce.
+GNOMAD_VARIANT_UPSERT_PARAMETERS = 10
+GNOMAD_VARIANT_UPSERT_BATCH_SIZE = 32767 // GNOMAD_VARIANT_UPSERT_PARAMETERS
 logger = logging.getLogger(__name__)
 
 
@@ -66,17 +96,208 @@ def allele_list_from_list_like_string(alleles_string: str) -> list[str]:
     return alleles
 
 
-def gnomad_variant_data_for_caids(caids: Sequence[str]) -> Sequence[Row[Any]]:  # pragma: no cover
+def list_like_string_from_allele_list(alleles: Sequence[str]) -> str:
+    """
+    Convert a list of alleles into the list-like string representation returned by Athena. This is the inverse of
+    `allele_list_from_list_like_string`.
+
+    eg:
+    ["A", "T"] -> "[A, T]"
+    [] -> ""
+    """
+    if not alleles:
+        return ""
+
+    return f"[{', '.join(alleles)}]"
+
+
+class GnomADVariantDataSource(ABC):
+    """
+    A source of gnomAD variant data which may be queried by CAID.
+
+    Rows returned by a data source expose the gnomAD table columns listed in `GNOMAD_VARIANT_COLUMNS` as attributes
+    named after the column (e.g. `row.caid` or `getattr(row, "joint.freq.all.ac")`), irrespective of the backend
+    which produced them.
+    """
+
+    @abstractmethod
+    def variant_data_for_caids(self, caids: Sequence[str]) -> Sequence[Any]:
+        """
+        Fetches gnomAD variant rows for a list of CAIDs. CAIDs without a gnomAD variant are omitted from the result.
+        """
+
+
+class AthenaGnomADVariantDataSource(GnomADVariantDataSource):
+    """
+    Queries gnomAD variant data from the gnomAD table for the current data version in AWS Athena.
+
+    CAIDs are queried in chunks, which are executed concurrently over the Athena connection pool.
     """
-    Fetches variant rows from the gnomAD table for a list of CAIDs. Athena has a maximum character limit of 262144
-    in queries. CAIDs are about 12 characters long on average + 4 for two quotes, a comma and a space. Chunk our list
-    into chunks of 260000/16=16250 so we are guaranteed to remain under the character limit.
+
+    def _variant_data_for_caid_chunk(
+        self, table_name: str, chunk: Sequence[str]
+    ) -> Sequence[Row[Any]]:  # pragma: no cover
+        caid_str = ",".join(f"'{caid}'" for caid in chunk)
+        athena_query = f"""
+            SELECT
+                {", ".join(f'"{column}"' for column in GNOMAD_VARIANT_COLUMNS)}
+            FROM
+                {table_name}
+            WHERE
+                caid IN ({caid_str})
+        """
+
+        with athena_engine.connect() as athena_connection:
+            return athena_connection.execute(text(athena_query)).fetchall()
+
+    def variant_data_for_caids(self, caids: Sequence[str]) -> Sequence[Row[Any]]:  # pragma: no cover
+        """
+        Raises:
+            sqlalchemy.exc.SQLAlchemyError: If there is an error executing a query.
+        """
+        table_name = gnomad_table_name()
+        chunked_caids = list(batched(caids, GNOMAD_ATHENA_CHUNK_SIZE))
+        save_to_logging_context({"num_caids": len(caids), "num_chunks": len(chunked_caids)})
+        logger.debug(msg=f"Fetching gnomAD variants from Athena table {table_name}", extra=logging_context())
+
+        result_rows: list[Row[Any]] = []
+        with ContextThreadPoolExecutor(max_workers=ATHENA_POOL_SIZE) as executor:
+            chunk_results = executor.map(
+                lambda chunk: self._variant_data_for_caid_chunk(table_name, chunk), chunked_caids
+            )
+
+            for chunk_index, rows in enumerate(chunk_results):
+                result_rows.extend(rows)
+                logger.debug(f"Fetched {len(rows)} gnomAD variants from Athena (batch {chunk_index}).")
+
+        save_to_logging_context({"num_gnomad_variant_rows_fetched": len(result_rows)})
+        logger.debug(msg="Done fetching gnomAD variants from Athena", extra=logging_context())
+
+        return result_rows
+
+
+class ParquetGnomADVariantDataSource(GnomADVariantDataSource):
+    """
+    Queries gnomAD variant data from a local Parquet extract of the gnomAD table, which must be sorted by CAID.
+
+    Because the extract is sorted, the minimum and maximum CAID statistics of each row group describe disjoint key
+    ranges. A lookup binary searches the sorted requested CAIDs against these ranges so that only row groups which may
+    contain a requested CAID are read, then binary searches the CAID column of each of those row groups for matches.
+    Row group statistics are read once, when the extract is first queried.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._parquet_file: Optional[Any] = None
+        self._row_group_bounds: list[tuple[int, Optional[str], Optional[str]]] = []
+
+    def _open(self) -> Any:
+        if self._parquet_file is not None:
+            return self._parquet_file
+
+        # The Parquet backend is optional, so only require `pyarrow` once it is actually used.
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(self.path)
+        caid_column_index = parquet_file.schema_arrow.get_field_index("caid")
+
+        row_group_bounds = []
+        for row_group_index in range(parquet_file.metadata.num_row_groups):
+            statistics = parquet_file.metadata.row_group(row_group_index).column(caid_column_index).statistics
+
+            # Without statistics we cannot exclude a row group, so it must always be searched.
+            if statistics is None or not statistics.has_min_max:
+                row_group_bounds.append((row_group_index, None, None))
+            else:
+                row_group_bounds.append((row_group_index, statistics.min, statistics.max))
+
+        self._parquet_file = parquet_file
+        self._row_group_bounds = row_group_bounds
+        return parquet_file
+
+    def variant_data_for_caids(self, caids: Sequence[str]) -> Sequence[SimpleNamespace]:
+        parquet_file = self._open()
+        sorted_caids = sorted(set(caids))
+        save_to_logging_context({"num_caids": len(caids)})
+
+        result_rows: list[SimpleNamespace] = []
+        row_groups_read = 0
+        for row_group_index, min_caid, max_caid in self._row_group_bounds:
+            lower = bisect_left(sorted_caids, min_caid) if min_caid is not None else 0
+            upper = bisect_right(sorted_caids, max_caid) if max_caid is not None else len(sorted_caids)
+            if lower >= upper:
+                continue
+
+            row_group = parquet_file.read_row_group(row_group_index, columns=list(GNOMAD_VARIANT_COLUMNS))
+            row_groups_read += 1
+
+            # Compare CAIDs as Python strings. Fixed width NumPy string arrays would truncate requested CAIDs which
+            # are longer than every CAID in the row group, producing false matches.
+            row_group_caids = row_group.column("caid").to_pylist()
+            matching_indices = [
+                index
+                for caid in sorted_caids[lower:upper]
+                for index in range(bisect_left(row_group_caids, caid), bisect_right(row_group_caids, caid))
+            ]
+            if not matching_indices:
+                continue
+
+            for matching_row in row_group.take(matching_indices).to_pylist():
+                # Parquet stores alleles as a list, whereas Athena returns them in their list-like string form.
+                if isinstance(matching_row["alleles"], list):
+                    matching_row["alleles"] = list_like_string_from_allele_list(matching_row["alleles"])
+
+                result_rows.append(SimpleNamespace(**matching_row))
+
+        save_to_logging_context(
+            {"num_gnomad_variant_rows_fetched": len(result_rows), "num_parquet_row_groups_read": row_groups_read}
+        )
+        logger.debug(msg="Done fetching gnomAD variants from Parquet extract", extra=logging_context())
+        return result_rows
+
+
+def gnomad_parquet_extract_path() -> str:
+    """
+    The path of the Parquet extract for the current gnomAD data version.
+    """
+    if not GNOMAD_PARQUET_DIRECTORY:
+        raise ValueError("GNOMAD_PARQUET_DIRECTORY environment variable is not set.")
+
+    return os.path.join(GNOMAD_PARQUET_DIRECTORY, f"{gnomad_table_name()}.parquet")
+
+
+@functools.cache
+def _parquet_gnomad_variant_data_source(path: str) -> ParquetGnomADVariantDataSource:
+    return ParquetGnomADVariantDataSource(path)
+
+
+def gnomad_variant_data_source() -> GnomADVariantDataSource:
+    """
+    The gnomAD variant data source selected by the `GNOMAD_DATA_BACKEND` environment variable. Parquet data sources
+    are shared per extract, so that row group statistics are only read once per process.
+    """
+    if GNOMAD_DATA_BACKEND == "athena":
+        return AthenaGnomADVariantDataSource()
+    elif GNOMAD_DATA_BACKEND == "parquet":
+        return _parquet_gnomad_variant_data_source(gnomad_parquet_extract_path())
+
+    raise ValueError(f"Unsupported gnomAD data backend: {GNOMAD_DATA_BACKEND}")
+
+
+def gnomad_variant_data_for_caids(caids: Sequence[str], db: Optional[Session] = None) -> Sequence[Any]:
+    """
+    Fetches variant rows from the gnomAD table for a list of CAIDs, using the configured gnomAD variant data source.
+
+    If a database session is provided, the CAID lookups of the current gnomAD data version are cached in the database.
+    Only CAIDs which have not been looked up before are fetched from the data source, and the rows fetched for them
+    (or the absence of any row) are added to the cache. The caller is responsible for committing the session.
 
     Args:
         caids (list[str]): A list of CAIDs (Canonical Allele Identifiers) to query.
+        db (Optional[Session]): A database session used to cache CAID lookups.
 
     Returns:
-        Sequence[Row[Any]]: A sequence of database rows containing variant information for the specified CAIDs.
+        Sequence[Any]: A sequence of rows containing variant information for the specified CAIDs.
             Each row includes:
                 - locus.contig: Chromosome/contig name
                 - locus.position: Genomic position
@@ -86,150 +307,248 @@ def gnomad_variant_data_for_caids(caids: Sequence[str]) -> Sequence[Row[Any]]:
                 - joint.freq.all.an: Allele number across all samples
                 - joint.fafmax.faf95_max_gen_anc: Ancestry of maximum FAF (95% CI) across all populations
                 - joint.fafmax.faf95_max: Maximum FAF (95% CI) across all populations
+    """
+    if db is None:
+        return gnomad_variant_data_source().variant_data_for_caids(caids)
+
+    cached_rows = get_cached_gnomad_caid_lookups(db, caids)
+    uncached_caids = [caid for caid in dict.fromkeys(caids) if caid not in cached_rows]
+    save_to_logging_context(
+        {"num_cached_gnomad_caid_lookups": len(cached_rows), "num_uncached_gnomad_caid_lookups": len(uncached_caids)}
+    )
+
+    fetched_rows: Sequence[Any] = []
+    if uncached_caids:
+        fetched_rows = gnomad_variant_data_source().variant_data_for_caids(uncached_caids)
+
+        fetched_rows_by_caid: dict[str, list[dict[str, Any]]] = {caid: [] for caid in uncached_caids}
+        for row in fetched_rows:
+            fetched_rows_by_caid.setdefault(row.caid, []).append(
+                {column: json_safe_gnomad_value(getattr(row, column)) for column in GNOMAD_VARIANT_COLUMNS}
+            )
+
+        cache_gnomad_caid_lookups(db, fetched_rows_by_caid)
 
-    Raises:
-        sqlalchemy.exc.SQLAlchemyError: If there is an error executing the query.
+    return [SimpleNamespace(**cached_row) for rows in cached_rows.values() for cached_row in rows] + list(fetched_rows)
+
+
+def json_safe_gnomad_value(value: Any) -> Any:
     """
-    chunked_caids = batched(caids, 16250)
-    caid_strs = [",".join(f"'{caid}'" for caid in chunk) for chunk in chunked_caids]
-    save_to_logging_context({"num_caids": len(caids), "num_chunks": len(caid_strs)})
+    Convert a gnomAD column value into a JSON serializable value, so that it may be cached in a JSONB column. Athena
+    returns decimal columns as `Decimal` values and date columns as `date` or `datetime` values.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, date):
+        return value.isoformat()
 
-    with athena_engine.connect() as athena_connection:
-        logger.debug(msg="Connected to Athena", extra=logging_context())
+    return value
 
-        result_rows: list[Row[Any]] = []
-        for chunk_index, caid_str in enumerate(caid_strs):
-            athena_query = f"""
-                SELECT
-                    "locus.contig",
-                    "locus.position",
-                    "alleles",
-                    "caid",
-                    "joint.freq.all.ac",
-                    "joint.freq.all.an",
-                    "joint.fafmax.faf95_max_gen_anc",
-                    "joint.fafmax.faf95_max"
-                FROM
-                    {gnomad_table_name()}
-                WHERE
-                    caid IN ({caid_str})
-            """
-            logger.debug(
-                msg=f"Fetching gnomAD variants from Athena (batch {chunk_index}) with query:\n{athena_query}",
-                extra=logging_context(),
+
+def get_cached_gnomad_caid_lookups(db: Session, caids: Sequence[str]) -> dict[str, list[dict[str, Any]]]:
+    """
+    Retrieve the cached gnomAD variant rows of any CAIDs which have previously been looked up in the current gnomAD
+    data version. CAIDs which have not been looked up are omitted from the result, whereas CAIDs which were looked up
+    but have no gnomAD variant map to an empty list.
+    """
+    cached_lookups: dict[str, list[dict[str, Any]]] = {}
+    for chunk in batched(list(set(caids)), GNOMAD_CAID_LOOKUP_STATEMENT_SIZE):
+        cached_lookups.update(
+            db.execute(
+                select(GnomADCaidLookup.caid, GnomADCaidLookup.rows).where(
+                    GnomADCaidLookup.db_version == GNOMAD_DATA_VERSION, GnomADCaidLookup.caid.in_(chunk)
+                )
             )
+            .tuples()
+            .all()
+        )
 
-            result = athena_connection.execute(text(athena_query))
-            rows = result.fetchall()
-            result_rows.extend(rows)
+    logger.debug(f"Found {len(cached_lookups)} of {len(caids)} CAIDs in the gnomAD lookup cache.")
+    return cached_lookups
 
-            logger.debug(f"Fetched {len(rows)} gnomAD variants from Athena (batch {chunk_index}).")
 
-        save_to_logging_context({"num_gnomad_variant_rows_fetched": len(result_rows)})
-        logger.debug(msg="Done fetching gnomAD variants from Athena", extra=logging_context())
+def cache_gnomad_caid_lookups(db: Session, lookups: dict[str, list[dict[str, Any]]]) -> None:
+    """
+    Merge a mapping of CAIDs to the gnomAD variant rows found for them in the current gnomAD data version into the
+    gnomAD lookup cache, replacing the rows of any CAID which is already cached. The caller is responsible for
+    committing the session.
+    """
+    lookup_rows = [{"caid": caid, "db_version": GNOMAD_DATA_VERSION, "rows": rows} for caid, rows in lookups.items()]
+
+    for chunk in batched(lookup_rows, GNOMAD_CAID_LOOKUP_STATEMENT_SIZE // 2):
+        statement = insert(GnomADCaidLookup).values(chunk)
+        db.execute(
+            statement.on_conflict_do_update(
+                constraint=GNOMAD_CAID_LOOKUP_UNIQUE_CONSTRAINT,
+                set_={"rows": statement.excluded.rows, "modification_date": date.today()},
+            )
+        )
 
-    return result_rows
+    logger.debug(f"Cached {len(lookup_rows)} gnomAD CAID lookups.")
+
+
+def gnomad_variant_values_from_row(row: Any) -> dict[str, Any]:
+    """
+    Convert a gnomAD variant row (in the shape returned by `gnomad_variant_data_for_caids`) into the column values of a
+    `GnomADVariant` for the current gnomAD data version.
+    """
+    allele_count = int(row.__getattribute__("joint.freq.all.ac"))
+    allele_number = int(row.__getattribute__("joint.freq.all.an"))
+    faf95_max = row.__getattribute__("joint.fafmax.faf95_max")
+
+    return {
+        "db_name": GNOMAD_DB_NAME,
+        "db_identifier": gnomad_identifier(
+            row.__getattribute__("locus.contig"),
+            row.__getattribute__("locus.position"),
+            allele_list_from_list_like_string(row.__getattribute__("alleles")),
+        ),
+        "db_version": GNOMAD_DATA_VERSION,
+        "allele_count": allele_count,
+        "allele_number": allele_number,
+        "allele_frequency": float(allele_count) / float(allele_number),
+        "faf95_max": float(faf95_max) if faf95_max is not None else None,
+        "faf95_max_ancestry": row.__getattribute__("joint.fafmax.faf95_max_gen_anc"),
+    }
 
 
 def link_gnomad_variants_to_mapped_variants(
-    db: Session, gnomad_variant_data: Sequence[Row[Any]], only_current: bool = True
+    db: Session, gnomad_variant_data: Sequence[Any], only_current: bool = True
 ) -> int:
     """
     Links gnomAD variants to mapped variants in the database based on CAIDs. Note that this function does
     not commit this data to the database; it only prepares the relationships.
 
+    Linkage is performed in bulk: the mapped variants for every CAID are resolved in a single query, the gnomAD
+    variants are upserted, and any existing links between the resolved mapped variants and gnomAD variants of the
+    current data version are replaced with the new links in a single statement. There should only be one gnomAD variant
+    per mapped variant per gnomAD data version, since each gnomAD variant can only match to one CAID.
+
     Args:
-        caids (list[str]): A list of CAIDs to link with gnomAD variants.
+        db (Session): The database session.
+        gnomad_variant_data (Sequence[Any]): gnomAD variant rows, as returned by `gnomad_variant_data_for_caids`.
+        only_current (bool): Whether to only link current mapped variants.
+
+    Returns:
+        int: The number of links between mapped variants and gnomAD variants.
     """
     save_to_logging_context({"num_gnomad_variant_rows": len(gnomad_variant_data)})
     save_to_logging_context({"only_current": only_current})
     logger.debug(msg="Linking gnomAD variants to mapped variants", extra=logging_context())
 
-    linked_gnomad_variants = 0
-    for index, row in enumerate(gnomad_variant_data, start=1):
-        logger.info(
-            msg=f"Processing gnomAD variant row {index}/{len(gnomad_variant_data)}: {row.caid}", extra=logging_context()
-        )
+    # If a CAID appears in more than one row, the last row for that CAID is linked.
+    gnomad_variant_values_by_caid = {row.caid: gnomad_variant_values_from_row(row) for row in gnomad_variant_data}
 
-        mapped_variants_with_caids_query = select(MappedVariant).where(MappedVariant.clingen_allele_id == row.caid)
-        if only_current:
-            mapped_variants_with_caids_query = mapped_variants_with_caids_query.where(MappedVariant.current.is_(True))
-        mapped_variants_with_caids = db.scalars(mapped_variants_with_caids_query).all()
+    mapped_variants_with_caids_query = select(MappedVariant.id, MappedVariant.clingen_allele_id).where(
+        MappedVariant.clingen_allele_id.in_(list(gnomad_variant_values_by_caid.keys()))
+    )
+    if only_current:
+        mapped_variants_with_caids_query = mapped_variants_with_caids_query.where(MappedVariant.current.is_(True))
+    mapped_variants_with_caids = db.execute(mapped_variants_with_caids_query).tuples().all()
+
+    save_to_logging_context({"num_mapped_variants_with_gnomad_caids": len(mapped_variants_with_caids)})
+    if not mapped_variants_with_caids:
+        save_to_logging_context({"linked_gnomad_variants": 0})
+        logger.info(msg="No mapped variants matched the provided gnomAD variant CAIDs.", extra=logging_context())
+        return 0
+
+    # Only gnomAD variants which match at least one mapped variant are saved.
+    gnomad_variant_values = {
+        gnomad_variant_values_by_caid[caid]["db_identifier"]: gnomad_variant_values_by_caid[caid]
+        for caid in {caid for _, caid in mapped_variants_with_caids}
+    }
+    gnomad_variant_ids = upsert_gnomad_variants(db, list(gnomad_variant_values.values()))
+
+    links = [
+        (mapped_variant_id, gnomad_variant_ids[gnomad_variant_values_by_caid[caid]["db_identifier"]])
+        for mapped_variant_id, caid in mapped_variants_with_caids
+    ]
+    replace_gnomad_variant_links(db, links)
+
+    linked_gnomad_variants = len(links)
+    save_to_logging_context({"linked_gnomad_variants": linked_gnomad_variants})
+    logger.info(
+        msg=f"Linked a total of {linked_gnomad_variants} gnomAD variants to mapped variants.",
+        extra=logging_context(),
+    )
+    return linked_gnomad_variants
 
-        gnomad_identifier_for_variant = gnomad_identifier(
-            row.__getattribute__("locus.contig"),
-            row.__getattribute__("locus.position"),
-            allele_list_from_list_like_string(row.__getattribute__("alleles")),
-        )
-        allele_count = int(row.__getattribute__("joint.freq.all.ac"))
-        allele_number = int(row.__getattribute__("joint.freq.all.an"))
-        allele_frequency = float(allele_count) / float(allele_number)
-        faf95_max_ancestry = row.__getattribute__("joint.fafmax.faf95_max_gen_anc")
-        faf95_max = row.__getattribute__("joint.fafmax.faf95_max")
-
-        if faf95_max is not None:
-            faf95_max = float(faf95_max)
-
-        for mapped_variant in mapped_variants_with_caids:
-            # Remove any existing gnomAD variants for this mapped variant that match the current gnomAD data version to avoid data duplication.
-            # There should only be one gnomAD variant per mapped variant per gnomAD data version, since each gnomAD variant can only match to one
-            # CAID.
-            for linked_gnomad_variant in mapped_variant.gnomad_variants:
-                if linked_gnomad_variant.db_version == GNOMAD_DATA_VERSION:
-                    logger.debug(
-                        msg=f"Removing existing gnomAD variant {linked_gnomad_variant.db_identifier} from mapped variant {mapped_variant.id} ({mapped_variant.clingen_allele_id})",
-                        extra=logging_context(),
-                    )
-                    mapped_variant.gnomad_variants.remove(linked_gnomad_variant)
-
-            existing_gnomad_variant = db.scalar(
-                select(GnomADVariant).where(
-                    GnomADVariant.db_name == "gnomAD",
-                    GnomADVariant.db_identifier == gnomad_identifier_for_variant,
-                    GnomADVariant.db_version == GNOMAD_DATA_VERSION,
-                )
-            )
 
-            if existing_gnomad_variant is None:
-                logger.debug(
-                    msg=f"Creating new gnomAD variant for identifier {gnomad_identifier_for_variant}",
-                    extra=logging_context(),
-                )
-                gnomad_variant = GnomADVariant(
-                    db_name=GNOMAD_DB_NAME,
-                    db_identifier=gnomad_identifier_for_variant,
-                    db_version=GNOMAD_DATA_VERSION,
-                    allele_count=allele_count,
-                    allele_number=allele_number,
-                    allele_frequency=allele_frequency,  # type: ignore
-                    faf95_max_ancestry=faf95_max_ancestry,
-                    faf95_max=faf95_max,  # type: ignore
-                )
-            else:
-                logger.debug(
-                    msg=f"Found existing gnomAD variant for identifier {gnomad_identifier_for_variant}",
-                    extra=logging_context(),
-                )
-                gnomad_variant = existing_gnomad_variant
+def upsert_gnomad_variants(db: Session, gnomad_variant_values: list[dict[str, Any]]) -> dict[str, int]:
+    """
+    Inserts gnomAD variants, updating the allele frequency data of any gnomAD variant which already exists for the same
+    database name, identifier and version.
 
-            if gnomad_variant not in mapped_variant.gnomad_variants:
-                mapped_variant.gnomad_variants.append(gnomad_variant)
-                linked_gnomad_variants += 1
+    Args:
+        db (Session): The database session.
+        gnomad_variant_values (list[dict[str, Any]]): Column values of the gnomAD variants, each with a distinct
+            `db_identifier`.
 
-            db.add(gnomad_variant)
+    Returns:
+        dict[str, int]: A mapping from gnomAD identifier to the ID of the saved gnomAD variant.
+    """
+    gnomad_variant_ids: dict[str, int] = {}
+    for chunk in batched(gnomad_variant_values, GNOMAD_VARIANT_UPSERT_BATCH_SIZE):
+        statement = insert(GnomADVariant).values(chunk)
+        statement = statement.on_conflict_do_update(
+            constraint=GNOMAD_VARIANT_UNIQUE_CONSTRAINT,
+            set_={
+                "allele_count": statement.excluded.allele_count,
+                "allele_number": statement.excluded.allele_number,
+                "allele_frequency": statement.excluded.allele_frequency,
+                "faf95_max": statement.excluded.faf95_max,
+                "faf95_max_ancestry": statement.excluded.faf95_max_ancestry,
+                "modification_date": date.today(),
+            },
+        ).returning(GnomADVariant.db_identifier, GnomADVariant.id)
+
+        gnomad_variant_ids.update(db.execute(statement).tuples().all())
+
+    logger.debug(msg=f"Upserted {len(gnomad_variant_ids)} gnomAD variants.", extra=logging_context())
+    return gnomad_variant_ids
+
+
+def replace_gnomad_variant_links(db: Session, links: list[tuple[int, int]]) -> None:
+    """
+    Links mapped variants to gnomAD variants, removing any other link between those mapped variants and gnomAD
+    variants of the current data version.
 
-            logger.debug(
-                msg=f"Linked gnomAD variant {gnomad_variant.db_identifier} to mapped variant {mapped_variant.id} ({mapped_variant.clingen_allele_id})",
-                extra=logging_context(),
-            )
+    The removal of stale links and the insertion of new links are performed by a single statement.
 
-        logger.info(
-            f"Linked {len(mapped_variants_with_caids)} mapped variants with CAID {row.caid} to gnomAD variant {gnomad_identifier_for_variant}. ({index}/{len(gnomad_variant_data)})"
+    Args:
+        db (Session): The database session.
+        links (list[tuple[int, int]]): Pairs of mapped variant ID and gnomAD variant ID to link.
+    """
+    association = gnomad_variants_mapped_variants_association_table
+    mapped_variant_ids, gnomad_variant_ids = zip(*links) if links else ((), ())
+
+    linked = select(
+        func.unnest(literal(list(mapped_variant_ids), ARRAY(Integer))).label("mapped_variant_id"),
+        func.unnest(literal(list(gnomad_variant_ids), ARRAY(Integer))).label("gnomad_variant_id"),
+    ).cte("linked")
+
+    stale_links = (
+        delete(association)
+        .where(
+            association.c.gnomad_variant_id == GnomADVariant.id,
+            GnomADVariant.db_version == GNOMAD_DATA_VERSION,
+            association.c.mapped_variant_id.in_(select(linked.c.mapped_variant_id)),
+            tuple_(association.c.mapped_variant_id, association.c.gnomad_variant_id).not_in(
+                select(linked.c.mapped_variant_id, linked.c.gnomad_variant_id)
+            ),
         )
+        .cte("stale_links")
+    )
 
-    save_to_logging_context({"linked_gnomad_variants": linked_gnomad_variants})
-    logger.info(
-        msg=f"Linked a total of {linked_gnomad_variants} gnomAD variants to mapped variants.",
-        extra=logging_context(),
+    statement = (
+        insert(association)
+        .from_select(
+            [association.c.mapped_variant_id, association.c.gnomad_variant_id],
+            select(linked.c.mapped_variant_id, linked.c.gnomad_variant_id),
+        )
+        .on_conflict_do_nothing()
+        .add_cte(stale_links)
     )
-    return linked_gnomad_variants
+
+    db.execute(statement)
+    logger.debug(msg=f"Replaced gnomAD variant links for {len(links)} mapped variants.", extra=logging_context())
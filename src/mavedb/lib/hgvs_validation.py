@@ -0,0 +1,72 @@
+"""
+Validation of batches of HGVS variant strings against a data provider.
+
+Variants in a batch are parsed with a parser shared by the whole process and validated concurrently by a validator
+shared by the whole batch. Validating a variant mostly waits on the data provider to fetch transcripts and sequences,
+so threads let those requests overlap.
+"""
+
+import logging
+import os
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
+
+from hgvs.exceptions import HGVSError
+from hgvs.parser import Parser
+from hgvs.validator import Validator
+
+from mavedb.lib.concurrency import ContextThreadPoolExecutor
+from mavedb.view_models.hgvs import HgvsValidationResult
+
+logger = logging.getLogger(__name__)
+
+HGVS_VALIDATION_MAX_WORKERS = int(os.getenv("HGVS_VALIDATION_MAX_WORKERS", 8))
+HGVS_VALIDATION_BATCH_LIMIT = int(os.getenv("HGVS_VALIDATION_BATCH_LIMIT", 10000))
+
+
+@lru_cache(maxsize=None)
+def shared_hgvs_parser() -> Parser:
+    """
+    Fetch the HGVS parser shared by this process. Building a parser compiles the HGVS grammar, which is far more
+    expensive than parsing a variant with it.
+    """
+    return Parser()
+
+
+def validate_hgvs_variant(variant: str, validator: Validator) -> HgvsValidationResult:
+    """
+    Validate a single HGVS variant string, recording rather than raising any error raised while parsing or validating
+    it. Errors other than HGVS errors, such as a failure to reach the data provider, are recorded too, so that one
+    variant cannot abort the validation of the rest of its batch.
+    """
+    try:
+        valid = validator.validate(shared_hgvs_parser().parse(variant), strict=False)
+    except HGVSError as e:
+        return HgvsValidationResult(variant=variant, valid=False, error=str(e))
+    except Exception as e:
+        logger.warning(f"Unexpected error while validating HGVS variant {variant}.", exc_info=e)
+        return HgvsValidationResult(variant=variant, valid=False, error=str(e) or type(e).__name__)
+
+    return HgvsValidationResult(variant=variant, valid=valid, error=None)
+
+
+def validate_hgvs_variants(
+    variants: Iterable[str], hdp: Any, max_workers: int = HGVS_VALIDATION_MAX_WORKERS
+) -> Iterator[HgvsValidationResult]:
+    """
+    Validate HGVS variant strings concurrently, yielding a result for each variant in the order the variants were
+    given. Results are yielded as soon as they and every result before them are available. If the caller stops
+    iterating early, for instance because a streaming client disconnected, variants not yet validated are cancelled
+    rather than validated for nobody.
+
+    :param variants: The HGVS variant strings to validate.
+    :param hdp: The HGVS data provider to validate variants against.
+    :param max_workers: The number of variants which may be validated at once.
+    """
+    validator = Validator(hdp=hdp)
+
+    executor = ContextThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hgvs-validation")
+    try:
+        yield from executor.map(lambda variant: validate_hgvs_variant(variant, validator), variants)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -9,6 +9,7 @@ from starlette.responses import Response
 from mavedb import __version__
 from mavedb.lib.logging.context import logging_context, save_to_logging_context
 from mavedb.lib.logging.models import LogType, Source
+from mavedb.lib.logging.sql import SqlStatistics, sql_statistics_summary
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,10 @@ async def log_job(ctx: dict) -> None:
             },
         }
 
+    sql_statistics: Optional[SqlStatistics] = ctx.get("sql_statistics")
+    if sql_statistics is not None:
+        log_context = {**log_context, **sql_statistics.summary()}
+
     log_context = {
         **log_context,
         **{
@@ -66,6 +71,7 @@ def log_request(request: Request, response: Response, end: int) -> None:
     if start:
         save_to_logging_context({"duration_ns": end - start})
 
+    save_to_logging_context(sql_statistics_summary())
     save_to_logging_context({"canonical": True})
     if response.status_code < 400:
         logger.info(msg="Request completed.", extra=logging_context())
@@ -11,6 +11,7 @@ from starlette_context.middleware import RawContextMiddleware
 
 from mavedb import __project__, __version__
 from mavedb.lib.logging.models import Source
+from mavedb.lib.logging.sql import start_sql_statistics
 
 FRONTEND_URL = os.getenv("FRONTEND_URL", "")
 API_URL = os.getenv("API_URL", "")
@@ -43,6 +44,10 @@ class PopulatedRawContextMiddleware(RawContextMiddleware):
         ctx["application"] = __project__
         ctx["version"] = __version__
 
+        # Record the SQL statements issued while handling this request for its canonical log. The statistics are held
+        # in a context variable, so they follow the request into the threadpool.
+        start_sql_statistics()
+
         # Retain plugin functionality.
         plugin_ctx = {plugin.key: await plugin.process_request(request) for plugin in self.plugins}
 
@@ -68,6 +73,19 @@ def save_to_logging_context(ctx: dict) -> dict:
     return context.data
 
 
+def increment_logging_context_counter(key: str, amount: int = 1) -> int:
+    """
+    Increment a numeric counter in the logging context, creating it if it does not exist. Unlike
+    `save_to_logging_context`, repeated increments accumulate in a single value rather than a list.
+    """
+    if not context.exists():
+        logger.debug("Skipped incrementing context counter. Context does not exist.")
+        return 0
+
+    context[key] = context.get(key, 0) + amount
+    return context[key]
+
+
 def logging_context() -> dict:
     if not context.exists():
         logger.debug("Could not access logging context. Context does not exist.")
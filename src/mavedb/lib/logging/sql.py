@@ -0,0 +1,165 @@
+"""
+Per-request and per-job SQL statistics.
+
+Engine event hooks record every statement executed while a request or worker job is being handled: how many
+statements were issued, how long they took, the slowest of them, and statements which were issued many times over.
+The last usually indicates an N+1 query pattern, such as lazy loads made while serializing a list of objects.
+Statistics are added to the canonical request and job logs.
+
+A statement budget may be enforced, for instance in tests, by setting `SQL_STATEMENT_BUDGET` or by using
+`enforce_sql_statement_budget`. Once a request or job has issued as many statements as its budget allows, the next
+statement raises a `SqlStatementBudgetExceededError` rather than executing.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from mavedb.lib.exceptions import SqlStatementBudgetExceededError
+
+# Statements issued at least this many times in one request or job are reported as repeated.
+SQL_REPEATED_STATEMENT_THRESHOLD = int(os.getenv("SQL_REPEATED_STATEMENT_THRESHOLD", 10))
+SQL_REPORTED_REPEATED_STATEMENTS = 5
+SQL_REPORTED_STATEMENT_LENGTH = 500
+
+_sql_statement_budget: Optional[int] = int(os.getenv("SQL_STATEMENT_BUDGET", 0)) or None
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERAL = re.compile(r"%\(\w+\)s|%s|\$\d+|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_LITERAL_LIST = re.compile(r"\(\?(?:, \?)+\)")
+
+
+def statement_fingerprint(statement: str) -> str:
+    """
+    Reduce a SQL statement to a fingerprint shared by every execution of the same query, by replacing its parameters
+    and literals with placeholders and collapsing lists of them.
+
+    >>> statement_fingerprint("SELECT * FROM variants WHERE id IN (%(id_1_1)s, %(id_1_2)s) AND urn = 'x'")
+    'SELECT * FROM variants WHERE id IN (?) AND urn = ?'
+    """
+    fingerprint = _LITERAL.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _LITERAL_LIST.sub("(?)", fingerprint)
+
+
+class SqlStatistics:
+    """
+    Statistics of the SQL statements issued while handling a single request or job.
+    """
+
+    def __init__(self) -> None:
+        self.statement_count = 0
+        self.duration_ns = 0
+        self.slowest_statement: Optional[str] = None
+        self.slowest_statement_ns = 0
+        self.fingerprint_counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration_ns: int) -> None:
+        fingerprint = statement_fingerprint(statement)
+
+        with self._lock:
+            self.statement_count += 1
+            self.duration_ns += duration_ns
+            self.fingerprint_counts[fingerprint] += 1
+
+            if duration_ns >= self.slowest_statement_ns:
+                self.slowest_statement = fingerprint
+                self.slowest_statement_ns = duration_ns
+
+    def repeated_statements(self, threshold: int = SQL_REPEATED_STATEMENT_THRESHOLD) -> list[dict[str, Any]]:
+        """
+        List the statements issued at least `threshold` times, most repeated first.
+        """
+        return [
+            {"statement": fingerprint[:SQL_REPORTED_STATEMENT_LENGTH], "count": count}
+            for fingerprint, count in self.fingerprint_counts.most_common(SQL_REPORTED_REPEATED_STATEMENTS)
+            if count >= threshold
+        ]
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarize these statistics as logging context.
+        """
+        return {
+            "sql_statement_count": self.statement_count,
+            "sql_duration_ns": self.duration_ns,
+            "sql_slowest_statement": self.slowest_statement[:SQL_REPORTED_STATEMENT_LENGTH]
+            if self.slowest_statement
+            else None,
+            "sql_slowest_statement_ns": self.slowest_statement_ns,
+            "sql_repeated_statements": self.repeated_statements(),
+        }
+
+
+_current_sql_statistics: ContextVar[Optional[SqlStatistics]] = ContextVar("sql_statistics", default=None)
+
+
+def start_sql_statistics() -> SqlStatistics:
+    """
+    Begin recording the SQL statements issued in the current context, which is carried into tasks started from it and
+    into threads started with the helpers in mavedb.lib.concurrency. Statements issued from threads which do not
+    inherit the context, such as those of a plain `ThreadPoolExecutor`, are not recorded.
+    """
+    statistics = SqlStatistics()
+    _current_sql_statistics.set(statistics)
+    return statistics
+
+
+def current_sql_statistics() -> Optional[SqlStatistics]:
+    return _current_sql_statistics.get()
+
+
+def sql_statistics_summary() -> dict[str, Any]:
+    """
+    Summarize the SQL statements issued in the current context as logging context, or return nothing if none are
+    being recorded.
+    """
+    statistics = _current_sql_statistics.get()
+    return statistics.summary() if statistics is not None else {}
+
+
+@contextmanager
+def enforce_sql_statement_budget(budget: Optional[int]) -> Iterator[None]:
+    """
+    Enforce a budget on the number of SQL statements each request or job may issue, or lift it if the budget is None.
+    """
+    global _sql_statement_budget
+
+    previous_budget = _sql_statement_budget
+    _sql_statement_budget = budget
+    try:
+        yield
+    finally:
+        _sql_statement_budget = previous_budget
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    statistics = _current_sql_statistics.get()
+    if statistics is None:
+        return
+
+    if _sql_statement_budget is not None and statistics.statement_count >= _sql_statement_budget:
+        raise SqlStatementBudgetExceededError(
+            f"Exceeded the budget of {_sql_statement_budget} SQL statements with: {statement_fingerprint(statement)}"
+        )
+
+    conn.info.setdefault("sql_statement_start_ns", []).append(time.perf_counter_ns())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    statistics = _current_sql_statistics.get()
+    start_times = conn.info.get("sql_statement_start_ns")
+    if statistics is None or not start_times:
+        return
+
+    statistics.record(statement, time.perf_counter_ns() - start_times.pop())
@@ -7,6 +7,8 @@ to various entity types including ScoreSets, Experiments, Collections, etc.
 Main Functions:
     has_permission: Check if a user has permission for an action on an entity
     assert_permission: Assert permission or raise exception
+    permitted_filter: Build a SQL predicate which holds for the entities a user may access
+    prefetch_permission_relationships: Load the relationships permission checks read for many entities at once
 
 Usage:
     >>> from mavedb.lib.permissions import Action, has_permission, assert_permission
@@ -22,6 +24,7 @@ Usage:
 """
 
 from .actions import Action
-from .core import assert_permission, has_permission
+from .cache import prefetch_permission_relationships
+from .core import assert_permission, has_permission, permitted_filter
 
-__all__ = ["has_permission", "assert_permission", "Action"]
+__all__ = ["has_permission", "assert_permission", "permitted_filter", "prefetch_permission_relationships", "Action"]
@@ -0,0 +1,127 @@
+"""
+Request-scoped memoization of permission decisions.
+
+Each API request works within its own database session, so permission decisions are memoized in the session's `info`
+dictionary. The memo is discarded whenever the session flushes or rolls back, since either may change the state a
+decision was based on. Entities which are not persistent, or which have unflushed modifications, are never memoized.
+
+Hits and misses are counted in the canonical request log as `permission_cache_hits` and `permission_cache_misses`.
+"""
+
+from collections import defaultdict
+from typing import Any, Hashable, Iterable, Optional
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, selectinload
+
+from mavedb.lib.logging.context import increment_logging_context_counter
+from mavedb.lib.permissions.actions import Action
+from mavedb.lib.permissions.models import PermissionResponse
+from mavedb.lib.types.authentication import UserData
+from mavedb.lib.types.permissions import EntityType
+from mavedb.models.collection import Collection
+from mavedb.models.experiment import Experiment
+from mavedb.models.experiment_set import ExperimentSet
+from mavedb.models.score_calibration import ScoreCalibration
+from mavedb.models.score_set import ScoreSet
+
+PERMISSION_CACHE_INFO_KEY = "permission_cache"
+
+# The relationships read by each entity type's permission checks.
+PERMISSION_RELATIONSHIP_LOADERS: dict[type, Any] = {
+    Collection: selectinload(Collection.user_associations),
+    Experiment: selectinload(Experiment.contributors),
+    ExperimentSet: selectinload(ExperimentSet.contributors),
+    ScoreCalibration: selectinload(ScoreCalibration.score_set).selectinload(ScoreSet.contributors),
+    ScoreSet: selectinload(ScoreSet.contributors),
+}
+
+
+def _permission_cache_and_key(
+    user_data: Optional[UserData], entity: Any, action: Action
+) -> tuple[Optional[dict[Hashable, PermissionResponse]], Optional[Hashable]]:
+    state = inspect(entity, raiseerr=False)
+    if state is None or not state.persistent or state.modified or state.session is None:
+        return None, None
+
+    user_key = None
+    if user_data is not None:
+        user_key = (user_data.user.id, frozenset(user_data.active_roles))
+
+    cache = state.session.info.setdefault(PERMISSION_CACHE_INFO_KEY, {})
+    return cache, (user_key, type(entity), state.identity, action)
+
+
+def cached_permission(user_data: Optional[UserData], entity: Any, action: Action) -> Optional[PermissionResponse]:
+    """
+    Fetch a memoized permission decision for a user, entity and action.
+
+    Args:
+        user_data: The user's authentication data and roles. None for anonymous users.
+        entity: The entity whose permission decision is requested.
+        action: The action to be performed on the entity.
+
+    Returns:
+        Optional[PermissionResponse]: The memoized decision, or None if no decision has been memoized.
+    """
+    cache, key = _permission_cache_and_key(user_data, entity, action)
+    if cache is None:
+        return None
+
+    response = cache.get(key)
+    increment_logging_context_counter("permission_cache_hits" if response is not None else "permission_cache_misses")
+    return response
+
+
+def cache_permission(
+    user_data: Optional[UserData], entity: Any, action: Action, response: PermissionResponse
+) -> PermissionResponse:
+    """
+    Memoize a permission decision for a user, entity and action for the remainder of the request.
+
+    Returns:
+        PermissionResponse: The memoized decision.
+    """
+    cache, key = _permission_cache_and_key(user_data, entity, action)
+    if cache is not None:
+        cache[key] = response
+
+    return response
+
+
+def clear_permission_cache(session: Session) -> None:
+    """
+    Discard all permission decisions memoized in a session.
+    """
+    session.info.pop(PERMISSION_CACHE_INFO_KEY, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _clear_permission_cache_after_flush(session: Session, _flush_context: Any) -> None:
+    clear_permission_cache(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_permission_cache_after_rollback(session: Session, _previous_transaction: Any) -> None:
+    clear_permission_cache(session)
+
+
+def prefetch_permission_relationships(db: Session, entities: Iterable[EntityType]) -> None:
+    """
+    Load the contributors and collection memberships which permission checks read for many entities at once, so that
+    checking each entity in turn does not lazy load its relationships one by one.
+
+    Args:
+        db: An active database session.
+        entities: The entities which are about to have their permissions checked. Entity types whose permission checks
+            read no relationships are ignored.
+    """
+    ids_by_type: dict[type, set[int]] = defaultdict(set)
+    for entity in entities:
+        if type(entity) in PERMISSION_RELATIONSHIP_LOADERS and entity.id is not None:
+            ids_by_type[type(entity)].add(entity.id)
+
+    for entity_type, ids in ids_by_type.items():
+        db.scalars(
+            select(entity_type).where(entity_type.id.in_(ids)).options(PERMISSION_RELATIONSHIP_LOADERS[entity_type])
+        ).all()
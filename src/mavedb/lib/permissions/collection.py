@@ -1,11 +1,14 @@
 from typing import Optional
 
+from sqlalchemy import ColumnElement, and_, or_, true
+
 from mavedb.lib.logging.context import save_to_logging_context
 from mavedb.lib.permissions.actions import Action
 from mavedb.lib.permissions.models import PermissionResponse
 from mavedb.lib.permissions.utils import deny_action_for_entity, roles_permitted
 from mavedb.lib.types.authentication import UserData
 from mavedb.models.collection import Collection
+from mavedb.models.collection_user_association import CollectionUserAssociation
 from mavedb.models.enums.contribution_role import ContributionRole
 from mavedb.models.enums.user_role import UserRole
 
@@ -88,6 +91,67 @@ def has_permission(user_data: Optional[UserData], entity: Collection, action: Ac
     )
 
 
+def permitted_filter(user_data: Optional[UserData], action: Action) -> ColumnElement[bool]:
+    """
+    Build a SQL predicate on Collection which holds for exactly those collections on which a user may perform an action.
+
+    The predicate mirrors `has_permission`, which remains the source of truth for permissions on a single collection.
+
+    Args:
+        user_data: The user's authentication data and roles. None for anonymous users.
+        action: The action to be performed (READ).
+
+    Returns:
+        ColumnElement[bool]: A predicate which may be used to filter queries on Collection.
+
+    Raises:
+        NotImplementedError: If the action is not supported for Collection filters.
+    """
+    handlers = {
+        Action.READ: _read_filter,
+    }
+
+    if action not in handlers:
+        supported_actions = ", ".join(a.value for a in handlers.keys())
+        raise NotImplementedError(
+            f"Action '{action.value}' is not supported for collection filters. Supported actions: {supported_actions}"
+        )
+
+    return handlers[action](user_data)
+
+
+def _read_filter(user_data: Optional[UserData]) -> ColumnElement[bool]:
+    """
+    Build a SQL predicate which holds for the collections a user may read. See `_handle_read_action`.
+
+    Args:
+        user_data: The user's authentication data.
+
+    Returns:
+        ColumnElement[bool]: A predicate on Collection.
+    """
+    # Any user may read a non-private collection.
+    if user_data is None:
+        return Collection.private.is_(False)
+    # Users with these specific roles may read a private collection.
+    if roles_permitted(user_data.active_roles, [UserRole.admin]):
+        return true()
+
+    # The owner or collection role holders may read a private collection.
+    return or_(
+        Collection.private.is_(False),
+        Collection.created_by_id == user_data.user.id,
+        Collection.user_associations.any(
+            and_(
+                CollectionUserAssociation.user_id == user_data.user.id,
+                CollectionUserAssociation.contribution_role.in_(
+                    [ContributionRole.admin, ContributionRole.editor, ContributionRole.viewer]
+                ),
+            )
+        ),
+    )
+
+
 def _handle_read_action(
     user_data: Optional[UserData],
     entity: Collection,
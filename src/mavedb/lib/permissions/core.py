@@ -1,7 +1,10 @@
 from typing import Any, Callable, Optional
 
+from sqlalchemy import ColumnElement
+
 from mavedb.lib.logging.context import save_to_logging_context
 from mavedb.lib.permissions.actions import Action
+from mavedb.lib.permissions.cache import cache_permission, cached_permission
 from mavedb.lib.permissions.exceptions import PermissionException
 from mavedb.lib.permissions.models import PermissionResponse
 from mavedb.lib.types.authentication import UserData
@@ -54,6 +57,7 @@ def has_permission(user_data: Optional[UserData], entity: EntityType, action: Ac
     Note:
         This is the main entry point for all permission checks in the application.
         Each entity type delegates to its own module for specific permission logic.
+        Decisions on persistent entities are memoized for the remainder of the request.
     """
     # Dictionary mapping entity types to their corresponding permission modules
     entity_handlers: dict[type, Callable[[Optional[UserData], Any, Action], PermissionResponse]] = {
@@ -74,8 +78,58 @@ def has_permission(user_data: Optional[UserData], entity: EntityType, action: Ac
             f"Supported entity types: {supported_types}"
         )
 
+    cached_response = cached_permission(user_data, entity, action)
+    if cached_response is not None:
+        return cached_response
+
+    handler = entity_handlers[entity_type]
+    return cache_permission(user_data, entity, action, handler(user_data, entity, action))
+
+
+def permitted_filter(user_data: Optional[UserData], entity_type: type, action: Action) -> ColumnElement[bool]:
+    """
+    Main dispatcher function for building SQL permission predicates across entity types.
+
+    Where `has_permission` checks a single loaded entity, this function builds a predicate on the entity's model which
+    holds for exactly those rows on which the user may perform the action. This allows listings to be filtered by the
+    database, rather than by loading every candidate entity and checking each in turn.
+
+    Args:
+        user_data: The user's authentication data and roles. None for anonymous users.
+        entity_type: The model class of the entities to filter, e.g. ScoreSet.
+        action: The action to be performed on the entities.
+
+    Returns:
+        ColumnElement[bool]: A predicate which may be used to filter queries on the entity type.
+
+    Raises:
+        NotImplementedError: If the entity type or action is not supported.
+
+    Example:
+        >>> from mavedb.lib.permissions.core import permitted_filter
+        >>> from mavedb.lib.permissions.actions import Action
+        >>> readable = select(ScoreSet).where(permitted_filter(user_data, ScoreSet, Action.READ))
+
+    Note:
+        `has_permission` remains the source of truth for permissions. Each entity module's predicate must agree with
+        its permission checks.
+    """
+    entity_handlers: dict[type, Callable[[Optional[UserData], Action], ColumnElement[bool]]] = {
+        Collection: collection.permitted_filter,
+        Experiment: experiment.permitted_filter,
+        ExperimentSet: experiment_set.permitted_filter,
+        ScoreSet: score_set.permitted_filter,
+    }
+
+    if entity_type not in entity_handlers:
+        supported_types = ", ".join(cls.__name__ for cls in entity_handlers.keys())
+        raise NotImplementedError(
+            f"Permission filters are not implemented for entity type '{entity_type.__name__}'. "
+            f"Supported entity types: {supported_types}"
+        )
+
     handler = entity_handlers[entity_type]
-    return handler(user_data, entity, action)
+    return handler(user_data, action)
 
 
 def assert_permission(user_data: Optional[UserData], entity: EntityType, action: Action) -> PermissionResponse:
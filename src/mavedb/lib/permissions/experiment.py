@@ -1,10 +1,13 @@
 from typing import Optional
 
+from sqlalchemy import ColumnElement, or_, true
+
 from mavedb.lib.logging.context import save_to_logging_context
 from mavedb.lib.permissions.actions import Action
 from mavedb.lib.permissions.models import PermissionResponse
 from mavedb.lib.permissions.utils import deny_action_for_entity, roles_permitted
 from mavedb.lib.types.authentication import UserData
+from mavedb.models.contributor import Contributor
 from mavedb.models.enums.user_role import UserRole
 from mavedb.models.experiment import Experiment
 
@@ -72,6 +75,60 @@ def has_permission(user_data: Optional[UserData], entity: Experiment, action: Ac
     )
 
 
+def permitted_filter(user_data: Optional[UserData], action: Action) -> ColumnElement[bool]:
+    """
+    Build a SQL predicate on Experiment which holds for exactly those experiments on which a user may perform an action.
+
+    The predicate mirrors `has_permission`, which remains the source of truth for permissions on a single experiment.
+
+    Args:
+        user_data: The user's authentication data and roles. None for anonymous users.
+        action: The action to be performed (READ).
+
+    Returns:
+        ColumnElement[bool]: A predicate which may be used to filter queries on Experiment.
+
+    Raises:
+        NotImplementedError: If the action is not supported for Experiment filters.
+    """
+    handlers = {
+        Action.READ: _read_filter,
+    }
+
+    if action not in handlers:
+        supported_actions = ", ".join(a.value for a in handlers.keys())
+        raise NotImplementedError(
+            f"Action '{action.value}' is not supported for experiment filters. Supported actions: {supported_actions}"
+        )
+
+    return handlers[action](user_data)
+
+
+def _read_filter(user_data: Optional[UserData]) -> ColumnElement[bool]:
+    """
+    Build a SQL predicate which holds for the experiments a user may read. See `_handle_read_action`.
+
+    Args:
+        user_data: The user's authentication data.
+
+    Returns:
+        ColumnElement[bool]: A predicate on Experiment.
+    """
+    # Any user may read a non-private experiment.
+    if user_data is None:
+        return Experiment.private.is_(False)
+    # Users with these specific roles may read a private experiment.
+    if roles_permitted(user_data.active_roles, [UserRole.admin, UserRole.mapper]):
+        return true()
+
+    # The owner or contributors may read a private experiment.
+    return or_(
+        Experiment.private.is_(False),
+        Experiment.created_by_id == user_data.user.id,
+        Experiment.contributors.any(Contributor.orcid_id == user_data.user.username),
+    )
+
+
 def _handle_read_action(
     user_data: Optional[UserData],
     entity: Experiment,
@@ -1,10 +1,13 @@
 from typing import Optional
 
+from sqlalchemy import ColumnElement, or_, true
+
 from mavedb.lib.logging.context import save_to_logging_context
 from mavedb.lib.permissions.actions import Action
 from mavedb.lib.permissions.models import PermissionResponse
 from mavedb.lib.permissions.utils import deny_action_for_entity, roles_permitted
 from mavedb.lib.types.authentication import UserData
+from mavedb.models.contributor import Contributor
 from mavedb.models.enums.user_role import UserRole
 from mavedb.models.score_set import ScoreSet
 
@@ -73,6 +76,62 @@ def has_permission(user_data: Optional[UserData], entity: ScoreSet, action: Acti
     )
 
 
+def permitted_filter(user_data: Optional[UserData], action: Action) -> ColumnElement[bool]:
+    """
+    Build a SQL predicate on ScoreSet which holds for exactly those score sets on which a user may perform an action.
+
+    This allows permissions to be checked for many score sets in a single query, rather than by loading each score set
+    and its contributors. The predicate mirrors `has_permission`, which remains the source of truth for permissions on
+    a single score set.
+
+    Args:
+        user_data: The user's authentication data and roles. None for anonymous users.
+        action: The action to be performed (READ).
+
+    Returns:
+        ColumnElement[bool]: A predicate which may be used to filter queries on ScoreSet.
+
+    Raises:
+        NotImplementedError: If the action is not supported for ScoreSet filters.
+    """
+    handlers = {
+        Action.READ: _read_filter,
+    }
+
+    if action not in handlers:
+        supported_actions = ", ".join(a.value for a in handlers.keys())
+        raise NotImplementedError(
+            f"Action '{action.value}' is not supported for score set filters. Supported actions: {supported_actions}"
+        )
+
+    return handlers[action](user_data)
+
+
+def _read_filter(user_data: Optional[UserData]) -> ColumnElement[bool]:
+    """
+    Build a SQL predicate which holds for the score sets a user may read. See `_handle_read_action`.
+
+    Args:
+        user_data: The user's authentication data.
+
+    Returns:
+        ColumnElement[bool]: A predicate on ScoreSet.
+    """
+    # Any user may read a non-private score set.
+    if user_data is None:
+        return ScoreSet.private.is_(False)
+    # Users with these specific roles may read a private score set.
+    if roles_permitted(user_data.active_roles, [UserRole.admin, UserRole.mapper]):
+        return true()
+
+    # The owner or contributors may read a private score set.
+    return or_(
+        ScoreSet.private.is_(False),
+        ScoreSet.created_by_id == user_data.user.id,
+        ScoreSet.contributors.any(Contributor.orcid_id == user_data.user.username),
+    )
+
+
 def _handle_read_action(
     user_data: Optional[UserData],
     entity: ScoreSet,
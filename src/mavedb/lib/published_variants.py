@@ -0,0 +1,94 @@
+"""
+Maintenance of the published variants table.
+
+The published variants table holds a row for each variant (and each of its mapped variants) of every published score
+set. Rather than rebuilding it from every variant in the database, its rows are replaced one score set at a time
+whenever a score set is published or its variants are mapped. Rows are removed along with their score set.
+
+Refreshes requested when score sets are published are deferred to a worker job. Requests for the same score set within
+a debounce window share a single job.
+"""
+
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from arq import ArqRedis
+from arq.jobs import Job
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from mavedb.models.published_variant import PublishedVariant, definition
+from mavedb.models.score_set import ScoreSet
+
+logger = logging.getLogger(__name__)
+
+PUBLISHED_VARIANTS_REFRESH_DEBOUNCE_SECONDS = int(os.getenv("PUBLISHED_VARIANTS_REFRESH_DEBOUNCE_SECONDS", 30))
+
+PUBLISHED_VARIANT_COLUMNS = [
+    "variant_id",
+    "variant_urn",
+    "mapped_variant_id",
+    "score_set_id",
+    "score_set_urn",
+    "published_date",
+    "current_mapped_variant",
+]
+
+
+def replace_published_variants_for_score_set(db: Session, score_set_id: int) -> int:
+    """
+    Replace the published variant rows of a score set with its current variants and mapped variants. If the score set
+    is not published, its rows are removed.
+
+    This function commits no changes; it is the caller's responsibility to commit the session if needed.
+
+    :param db: An active database session.
+    :param score_set_id: The ID of the score set whose rows should be replaced.
+    :return: The number of rows now held for the score set.
+    """
+    # Session.execute() bypasses autoflush, so flush to include any pending variants in the refreshed rows.
+    db.flush()
+
+    db.execute(delete(PublishedVariant).where(PublishedVariant.score_set_id == score_set_id))
+    result = db.execute(
+        insert(PublishedVariant).from_select(PUBLISHED_VARIANT_COLUMNS, definition.where(ScoreSet.id == score_set_id))
+    )
+
+    logger.debug(msg=f"Refreshed {result.rowcount} published variants for score set {score_set_id}.")
+    return result.rowcount
+
+
+def published_variants_refresh_job_id(score_set_id: int, now: Optional[float] = None) -> tuple[str, datetime]:
+    """
+    Identify the refresh job for a score set within the current debounce window, and the time at which the window ends
+    and the job should run.
+    """
+    now = time.time() if now is None else now
+    window = int(now // PUBLISHED_VARIANTS_REFRESH_DEBOUNCE_SECONDS)
+    window_end = (window + 1) * PUBLISHED_VARIANTS_REFRESH_DEBOUNCE_SECONDS
+
+    return (
+        f"refresh_published_variants_for_score_set:{score_set_id}:{window}",
+        datetime.fromtimestamp(window_end, tz=timezone.utc),
+    )
+
+
+async def enqueue_published_variants_refresh(
+    worker: ArqRedis, score_set_id: int, correlation_id: Optional[str]
+) -> Optional[Job]:
+    """
+    Request a refresh of the published variant rows of a score set at the end of the current debounce window.
+
+    :return: The enqueued job, or None if a refresh of this score set has already been requested within the window.
+    """
+    job_id, run_at = published_variants_refresh_job_id(score_set_id)
+    return await worker.enqueue_job(
+        "refresh_published_variants_for_score_set",
+        score_set_id,
+        correlation_id,
+        _job_id=job_id,
+        _defer_until=run_at,
+    )
@@ -8,6 +8,7 @@ from sqlalchemy import Float, and_, select
 from sqlalchemy.orm import Session
 
 from mavedb.lib.acmg import find_or_create_acmg_classification
+from mavedb.lib.annotation.store import invalidate_annotation_store
 from mavedb.lib.identifiers import find_or_create_publication_identifier
 from mavedb.lib.types.score_calibrations import ClassificationDict
 from mavedb.lib.validation.constants.general import (
@@ -261,6 +262,8 @@ async def create_score_calibration_in_score_set(
     else:
         calibration.investigator_provided = False
 
+    invalidate_annotation_store(db, containing_score_set.id)
+
     db.add(calibration)
     return calibration
 
@@ -482,6 +485,8 @@ async def modify_score_calibration(
         db.add(persisted_functional_range)
         calibration.functional_classifications.append(persisted_functional_range)
 
+    invalidate_annotation_store(db, containing_score_set.id)
+
     db.add(calibration)
     return calibration
 
@@ -519,6 +524,8 @@ def publish_score_calibration(db: Session, calibration: ScoreCalibration, user:
     calibration.private = False
     calibration.modified_by = user
 
+    invalidate_annotation_store(db, calibration.score_set_id)
+
     db.add(calibration)
     return calibration
 
@@ -592,6 +599,8 @@ def promote_score_calibration_to_primary(
     calibration.primary = True
     calibration.modified_by = user
 
+    invalidate_annotation_store(db, calibration.score_set_id)
+
     db.add(calibration)
     return calibration
 
@@ -623,6 +632,8 @@ def demote_score_calibration_from_primary(db: Session, calibration: ScoreCalibra
     calibration.primary = False
     calibration.modified_by = user
 
+    invalidate_annotation_store(db, calibration.score_set_id)
+
     db.add(calibration)
     return calibration
 
@@ -0,0 +1,236 @@
+"""
+Free text search of score sets against their maintained search documents.
+
+Each score set has a search document holding the text of the score set and of its targets, publications and external
+identifiers. Search text matches a score set if it matches the weighted full text search vector of its document, or
+if it is contained anywhere in the document's text. Matches are ranked by the full text search vector, so that score
+sets whose titles or targets match the search text are listed before those whose abstracts merely mention it. Search
+documents are joined to score sets with an outer join, so that a score set which is missing its document is not hidden
+from search; such score sets match search text contained in their URNs, titles or descriptions, and are ranked last.
+
+Each published score set also has a search projection, a denormalized row of the attributes by which published score
+sets are filtered, counted and ordered. Projections are refreshed when a score set is published or updated, and stale
+projections, such as those of score sets whose experiments have since changed, are refreshed periodically by the
+worker.
+"""
+
+import enum
+import logging
+from datetime import date
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import ColumnElement, and_, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from mavedb.models.experiment import Experiment
+from mavedb.models.score_set import ScoreSet
+from mavedb.models.score_set_search_document import ScoreSetSearchDocument
+from mavedb.models.score_set_search_projection import ScoreSetSearchProjection
+
+logger = logging.getLogger(__name__)
+
+# Search documents are built with the English configuration, so that words in titles and abstracts are stemmed.
+SEARCH_TEXT_CONFIGURATION = "english"
+
+
+def _text_values(values: Iterable[Optional[object]]) -> list[str]:
+    return [value.value if isinstance(value, enum.Enum) else str(value) for value in values if value]
+
+
+def score_set_search_text(score_set: ScoreSet) -> dict[str, list[str]]:
+    """
+    Collect the searchable text of a score set, keyed by the full text search weight of each value. Score sets are
+    ranked most highly when their identifiers, titles or target names match the search text (weight A), then when
+    their descriptions, targets or publication details do (weight B), and lastly when their abstracts do (weight C).
+    """
+    target_genes = score_set.target_genes or []
+    publications = score_set.publication_identifiers or []
+    target_sequences = [target.target_sequence for target in target_genes if target.target_sequence]
+    taxonomies = [sequence.taxonomy for sequence in target_sequences if sequence.taxonomy]
+    offsets = [
+        offset
+        for target in target_genes
+        for offset in (target.uniprot_offset, target.refseq_offset, target.ensembl_offset)
+        if offset and offset.identifier
+    ]
+
+    # TODO(#94): add LICENSE, plus TAXONOMY CODE if numeric
+    return {
+        "A": _text_values([score_set.urn, score_set.title, *(target.name for target in target_genes)]),
+        "B": _text_values(
+            [
+                score_set.short_description,
+                *(target.category for target in target_genes),
+                *(taxonomy.organism_name for taxonomy in taxonomies),
+                *(taxonomy.common_name for taxonomy in taxonomies),
+                *(target.target_accession.assembly for target in target_genes if target.target_accession),
+                *(offset.identifier.identifier for offset in offsets),
+                *(doi_identifier.identifier for doi_identifier in score_set.doi_identifiers or []),
+                *(publication.identifier for publication in publications),
+                *(publication.doi for publication in publications),
+                *(publication.title for publication in publications),
+                *(publication.publication_journal for publication in publications),
+                *(author.get("name") for publication in publications for author in publication.authors or []),
+            ]
+        ),
+        "C": _text_values([score_set.abstract_text, *(publication.abstract for publication in publications)]),
+    }
+
+
+def refresh_score_set_search_document(db: Session, score_set: ScoreSet) -> None:
+    """
+    Create or replace the search document of a score set from its current state.
+
+    The caller is responsible for committing the session.
+    """
+    # The score set may not have been flushed yet, in which case it has no ID for its search document to refer to.
+    db.flush()
+
+    weighted_text = {weight: "\n".join(values) for weight, values in score_set_search_text(score_set).items()}
+    text = "\n".join(value for value in weighted_text.values() if value)
+    document = None
+    for weight, value in weighted_text.items():
+        weighted_vector = func.setweight(func.to_tsvector(SEARCH_TEXT_CONFIGURATION, value), weight)
+        document = weighted_vector if document is None else document.op("||")(weighted_vector)
+
+    upsert = insert(ScoreSetSearchDocument).values(score_set_id=score_set.id, text=text, document=document)
+    db.execute(
+        upsert.on_conflict_do_update(
+            index_elements=[ScoreSetSearchDocument.score_set_id],
+            set_={
+                "text": upsert.excluded.text,
+                "document": upsert.excluded.document,
+                "modification_date": date.today(),
+            },
+        )
+    )
+    logger.debug(f"Refreshed the search document of score set {score_set.urn}.")
+
+
+def score_set_search_projection_values(score_set: ScoreSet) -> dict[str, Any]:
+    """Collect the values of the search projection of a published score set."""
+    target_genes = score_set.target_genes or []
+    publications = score_set.publication_identifiers or []
+    taxonomies = [
+        target.target_sequence.taxonomy
+        for target in target_genes
+        if target.target_sequence and target.target_sequence.taxonomy
+    ]
+
+    return {
+        "score_set_id": score_set.id,
+        "experiment_title": score_set.experiment.title,
+        "published_date": score_set.published_date,
+        "target_names": _text_values(target.name for target in target_genes),
+        "target_categories": _text_values(target.category for target in target_genes),
+        "target_organism_names": _text_values(taxonomy.organism_name for taxonomy in taxonomies),
+        "target_accessions": _text_values(
+            target.target_accession.accession for target in target_genes if target.target_accession
+        ),
+        "publication_identifiers": _text_values(publication.identifier for publication in publications),
+        "publication_db_names": _text_values(publication.db_name for publication in publications),
+        "publication_journals": _text_values(publication.publication_journal for publication in publications),
+        "publication_author_names": _text_values(
+            author.get("name") for publication in publications for author in publication.authors or []
+        ),
+        "keywords": _text_values(
+            keyword_association.controlled_keyword.label for keyword_association in score_set.experiment.keyword_objs
+        ),
+    }
+
+
+def refresh_score_set_search_projection(db: Session, score_set: ScoreSet) -> None:
+    """
+    Create or replace the search projection of a published score set from its current state, or remove the search
+    projection of a score set which is not published.
+
+    The caller is responsible for committing the session.
+    """
+    db.flush()
+
+    if score_set.private or score_set.published_date is None:
+        db.execute(delete(ScoreSetSearchProjection).where(ScoreSetSearchProjection.score_set_id == score_set.id))
+        return
+
+    values = score_set_search_projection_values(score_set)
+    upsert = insert(ScoreSetSearchProjection).values(**values)
+    db.execute(
+        upsert.on_conflict_do_update(
+            index_elements=[ScoreSetSearchProjection.score_set_id],
+            set_={
+                **{key: upsert.excluded[key] for key in values if key != "score_set_id"},
+                "modification_date": date.today(),
+            },
+        )
+    )
+    logger.debug(f"Refreshed the search projection of score set {score_set.urn}.")
+
+
+def refresh_stale_score_set_search_projections(db: Session) -> int:
+    """
+    Refresh the search projections of published score sets which are missing, or whose score sets or experiments have
+    been modified since their projections were last refreshed, and remove the projections of score sets which are no
+    longer published. Returns the number of projections which were refreshed or removed.
+
+    The caller is responsible for committing the session.
+    """
+    stale_score_sets = db.scalars(
+        select(ScoreSet)
+        .join(ScoreSet.experiment)
+        .outerjoin(ScoreSetSearchProjection, ScoreSetSearchProjection.score_set_id == ScoreSet.id)
+        .where(ScoreSet.private.is_(False), ScoreSet.published_date.isnot(None))
+        .where(
+            or_(
+                ScoreSetSearchProjection.score_set_id.is_(None),
+                ScoreSet.modification_date >= ScoreSetSearchProjection.modification_date,
+                Experiment.modification_date >= ScoreSetSearchProjection.modification_date,
+            )
+        )
+    ).all()
+
+    for score_set in stale_score_sets:
+        refresh_score_set_search_projection(db, score_set)
+
+    unpublished_projections = db.execute(
+        delete(ScoreSetSearchProjection).where(
+            ScoreSetSearchProjection.score_set_id.in_(
+                select(ScoreSet.id).where(or_(ScoreSet.private.is_(True), ScoreSet.published_date.is_(None)))
+            )
+        )
+    )
+
+    return len(stale_score_sets) + unpublished_projections.rowcount
+
+
+def search_text_query(search_text: str) -> ColumnElement:
+    return func.websearch_to_tsquery(SEARCH_TEXT_CONFIGURATION, search_text)
+
+
+def search_text_filter(search_text: str) -> ColumnElement[bool]:
+    """
+    A filter on score sets outer joined to their search documents, which matches the search text against each
+    document's full text search vector, or as a case insensitive substring of its text. Score sets without a search
+    document are matched by a case insensitive substring of their URN, title or descriptions instead.
+    """
+    return or_(
+        ScoreSetSearchDocument.document.op("@@")(search_text_query(search_text)),
+        ScoreSetSearchDocument.text.icontains(search_text, autoescape=True),
+        and_(
+            ScoreSetSearchDocument.score_set_id.is_(None),
+            or_(
+                ScoreSet.urn.icontains(search_text, autoescape=True),
+                ScoreSet.title.icontains(search_text, autoescape=True),
+                ScoreSet.short_description.icontains(search_text, autoescape=True),
+                ScoreSet.abstract_text.icontains(search_text, autoescape=True),
+            ),
+        ),
+    )
+
+
+def search_text_rank(search_text: str) -> ColumnElement[float]:
+    """
+    The full text search rank of each search document for the search text. Substring matches, and score sets without
+    a search document, are ranked zero.
+    """
+    return func.coalesce(func.ts_rank(ScoreSetSearchDocument.document, search_text_query(search_text)), 0)
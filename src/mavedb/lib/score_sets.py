@@ -1,15 +1,31 @@
 import csv
 import io
 import logging
+import os
 import re
-from collections import Counter
 from operator import attrgetter
-from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, List, Literal, Optional, Sequence
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Iterator, List, Literal, Optional, Sequence
 
 import numpy as np
 import pandas as pd
 from pandas.testing import assert_index_equal
-from sqlalchemy import Integer, and_, cast, func, or_, select
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Integer,
+    Select,
+    String,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    not_,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Query, Session, aliased, contains_eager, joinedload, selectinload
 
 from mavedb.lib.exceptions import ValidationError
@@ -24,14 +40,14 @@ from mavedb.lib.mave.constants import (
 )
 from mavedb.lib.mave.utils import is_csv_null
 from mavedb.lib.permissions import Action, has_permission
+from mavedb.lib.permissions import score_set as score_set_permissions
+from mavedb.lib.score_set_search import search_text_filter, search_text_rank
 from mavedb.lib.types.authentication import UserData
 from mavedb.lib.validation.constants.general import null_values_list
 from mavedb.lib.validation.utilities import is_null as validate_is_null
 from mavedb.lib.variants import get_digest_from_post_mapped, get_hgvs_from_post_mapped, is_hgvs_g, is_hgvs_p
 from mavedb.models.contributor import Contributor
 from mavedb.models.controlled_keyword import ControlledKeyword
-from mavedb.models.doi_identifier import DoiIdentifier
-from mavedb.models.ensembl_identifier import EnsemblIdentifier
 from mavedb.models.ensembl_offset import EnsemblOffset
 from mavedb.models.experiment import Experiment
 from mavedb.models.experiment_controlled_keyword import ExperimentControlledKeywordAssociation
@@ -40,17 +56,17 @@ from mavedb.models.experiment_set import ExperimentSet
 from mavedb.models.gnomad_variant import GnomADVariant
 from mavedb.models.mapped_variant import MappedVariant
 from mavedb.models.publication_identifier import PublicationIdentifier
-from mavedb.models.refseq_identifier import RefseqIdentifier
 from mavedb.models.refseq_offset import RefseqOffset
 from mavedb.models.score_set import ScoreSet
 from mavedb.models.score_set_publication_identifier import (
     ScoreSetPublicationIdentifierAssociation,
 )
+from mavedb.models.score_set_search_document import ScoreSetSearchDocument
+from mavedb.models.score_set_search_projection import ScoreSetSearchProjection
 from mavedb.models.target_accession import TargetAccession
 from mavedb.models.target_gene import TargetGene
 from mavedb.models.target_sequence import TargetSequence
 from mavedb.models.taxonomy import Taxonomy
-from mavedb.models.uniprot_identifier import UniprotIdentifier
 from mavedb.models.uniprot_offset import UniprotOffset
 from mavedb.models.user import User
 from mavedb.models.variant import Variant
@@ -61,6 +77,8 @@ if TYPE_CHECKING:
 
 VariantData = dict[str, Optional[dict[str, dict]]]
 
+MAPPED_VARIANT_STREAM_BATCH_SIZE = int(os.getenv("MAPPED_VARIANT_STREAM_BATCH_SIZE", 1000))
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,74 +117,8 @@ def build_search_score_sets_query_filter(
             query = query.filter(ScoreSet.published_date.is_(None))
 
     if search.text:
-        lower_search_text = search.text.lower().strip()
-        query = query.filter(
-            or_(
-                ScoreSet.urn.icontains(lower_search_text),
-                ScoreSet.title.icontains(lower_search_text),
-                ScoreSet.short_description.icontains(lower_search_text),
-                ScoreSet.abstract_text.icontains(lower_search_text),
-                ScoreSet.target_genes.any(func.lower(TargetGene.name).icontains(lower_search_text)),
-                ScoreSet.target_genes.any(func.lower(TargetGene.category).icontains(lower_search_text)),
-                ScoreSet.target_genes.any(
-                    TargetGene.target_sequence.has(
-                        TargetSequence.taxonomy.has(func.lower(Taxonomy.organism_name).icontains(lower_search_text))
-                    )
-                ),
-                ScoreSet.target_genes.any(
-                    TargetGene.target_sequence.has(
-                        TargetSequence.taxonomy.has(func.lower(Taxonomy.common_name).icontains(lower_search_text))
-                    )
-                ),
-                ScoreSet.target_genes.any(
-                    TargetGene.target_accession.has(func.lower(TargetAccession.assembly).icontains(lower_search_text))
-                ),
-                # TODO(#94): add LICENSE, plus TAXONOMY CODE if numeric
-                ScoreSet.publication_identifiers.any(
-                    func.lower(PublicationIdentifier.identifier).icontains(lower_search_text)
-                ),
-                ScoreSet.publication_identifiers.any(
-                    func.lower(PublicationIdentifier.doi).icontains(lower_search_text)
-                ),
-                ScoreSet.publication_identifiers.any(
-                    func.lower(PublicationIdentifier.abstract).icontains(lower_search_text)
-                ),
-                ScoreSet.publication_identifiers.any(
-                    func.lower(PublicationIdentifier.title).icontains(lower_search_text)
-                ),
-                ScoreSet.publication_identifiers.any(
-                    func.lower(PublicationIdentifier.publication_journal).icontains(lower_search_text)
-                ),
-                ScoreSet.publication_identifiers.any(
-                    func.jsonb_path_exists(
-                        PublicationIdentifier.authors,
-                        f"""$[*].name ? (@ like_regex "{lower_search_text}" flag "i")""",
-                    )
-                ),
-                ScoreSet.doi_identifiers.any(func.lower(DoiIdentifier.identifier).icontains(lower_search_text)),
-                ScoreSet.target_genes.any(
-                    TargetGene.uniprot_offset.has(
-                        UniprotOffset.identifier.has(
-                            func.lower(UniprotIdentifier.identifier).icontains(lower_search_text)
-                        )
-                    )
-                ),
-                ScoreSet.target_genes.any(
-                    TargetGene.refseq_offset.has(
-                        RefseqOffset.identifier.has(
-                            func.lower(RefseqIdentifier.identifier).icontains(lower_search_text)
-                        )
-                    )
-                ),
-                ScoreSet.target_genes.any(
-                    TargetGene.ensembl_offset.has(
-                        EnsemblOffset.identifier.has(
-                            func.lower(EnsemblIdentifier.identifier).icontains(lower_search_text)
-                        )
-                    )
-                ),
-            )
-        )
+        query = query.outerjoin(ScoreSetSearchDocument, ScoreSetSearchDocument.score_set_id == ScoreSet.id)
+        query = query.filter(search_text_filter(search.text.strip()))
 
     if search.targets:
         query = query.filter(ScoreSet.target_genes.any(TargetGene.name.in_(search.targets)))
@@ -223,55 +175,68 @@ def build_search_score_sets_query_filter(
     return query
 
 
+def score_set_search_result_options() -> list[Any]:
+    """
+    Loader options for the score sets listed in search results, which must be selected with their experiments joined.
+    """
+    return [
+        contains_eager(ScoreSet.experiment).options(
+            joinedload(Experiment.experiment_set),
+            joinedload(Experiment.keyword_objs).joinedload(ExperimentControlledKeywordAssociation.controlled_keyword),
+            joinedload(Experiment.created_by),
+            joinedload(Experiment.modified_by),
+            joinedload(Experiment.doi_identifiers),
+            joinedload(Experiment.publication_identifier_associations).joinedload(
+                ExperimentPublicationIdentifierAssociation.publication
+            ),
+            joinedload(Experiment.raw_read_identifiers),
+            selectinload(Experiment.score_sets).options(
+                joinedload(ScoreSet.doi_identifiers),
+                joinedload(ScoreSet.publication_identifier_associations).joinedload(
+                    ScoreSetPublicationIdentifierAssociation.publication
+                ),
+                joinedload(ScoreSet.target_genes).options(
+                    joinedload(TargetGene.ensembl_offset).joinedload(EnsemblOffset.identifier),
+                    joinedload(TargetGene.refseq_offset).joinedload(RefseqOffset.identifier),
+                    joinedload(TargetGene.uniprot_offset).joinedload(UniprotOffset.identifier),
+                    joinedload(TargetGene.target_sequence).joinedload(TargetSequence.taxonomy),
+                    joinedload(TargetGene.target_accession),
+                ),
+            ),
+        ),
+        joinedload(ScoreSet.license),
+        joinedload(ScoreSet.doi_identifiers),
+        joinedload(ScoreSet.publication_identifier_associations).joinedload(
+            ScoreSetPublicationIdentifierAssociation.publication
+        ),
+        joinedload(ScoreSet.target_genes).options(
+            joinedload(TargetGene.ensembl_offset).joinedload(EnsemblOffset.identifier),
+            joinedload(TargetGene.refseq_offset).joinedload(RefseqOffset.identifier),
+            joinedload(TargetGene.uniprot_offset).joinedload(UniprotOffset.identifier),
+            joinedload(TargetGene.target_sequence).joinedload(TargetSequence.taxonomy),
+            joinedload(TargetGene.target_accession),
+        ),
+    ]
+
+
 def search_score_sets(db: Session, owner_or_contributor: Optional[User], search: ScoreSetsSearch):
     save_to_logging_context({"score_set_search_criteria": search.model_dump()})
 
+    if search.published and owner_or_contributor is None:
+        return search_published_score_sets(db, search)
+
     query = db.query(ScoreSet)
     query = build_search_score_sets_query_filter(db, query, owner_or_contributor, search)
 
+    order_by: list[Any] = [Experiment.title]
+    if search.text:
+        # List the score sets which best match the search text first.
+        order_by.insert(0, search_text_rank(search.text.strip()).desc())
+
     score_sets: list[ScoreSet] = (
         query.join(ScoreSet.experiment)
-        .options(
-            contains_eager(ScoreSet.experiment).options(
-                joinedload(Experiment.experiment_set),
-                joinedload(Experiment.keyword_objs).joinedload(
-                    ExperimentControlledKeywordAssociation.controlled_keyword
-                ),
-                joinedload(Experiment.created_by),
-                joinedload(Experiment.modified_by),
-                joinedload(Experiment.doi_identifiers),
-                joinedload(Experiment.publication_identifier_associations).joinedload(
-                    ExperimentPublicationIdentifierAssociation.publication
-                ),
-                joinedload(Experiment.raw_read_identifiers),
-                selectinload(Experiment.score_sets).options(
-                    joinedload(ScoreSet.doi_identifiers),
-                    joinedload(ScoreSet.publication_identifier_associations).joinedload(
-                        ScoreSetPublicationIdentifierAssociation.publication
-                    ),
-                    joinedload(ScoreSet.target_genes).options(
-                        joinedload(TargetGene.ensembl_offset).joinedload(EnsemblOffset.identifier),
-                        joinedload(TargetGene.refseq_offset).joinedload(RefseqOffset.identifier),
-                        joinedload(TargetGene.uniprot_offset).joinedload(UniprotOffset.identifier),
-                        joinedload(TargetGene.target_sequence).joinedload(TargetSequence.taxonomy),
-                        joinedload(TargetGene.target_accession),
-                    ),
-                ),
-            ),
-            joinedload(ScoreSet.license),
-            joinedload(ScoreSet.doi_identifiers),
-            joinedload(ScoreSet.publication_identifier_associations).joinedload(
-                ScoreSetPublicationIdentifierAssociation.publication
-            ),
-            joinedload(ScoreSet.target_genes).options(
-                joinedload(TargetGene.ensembl_offset).joinedload(EnsemblOffset.identifier),
-                joinedload(TargetGene.refseq_offset).joinedload(RefseqOffset.identifier),
-                joinedload(TargetGene.uniprot_offset).joinedload(UniprotOffset.identifier),
-                joinedload(TargetGene.target_sequence).joinedload(TargetSequence.taxonomy),
-                joinedload(TargetGene.target_accession),
-            ),
-        )
-        .order_by(Experiment.title)
+        .options(*score_set_search_result_options())
+        .order_by(*order_by)
         .offset(search.offset if search.offset is not None else None)
         .limit(search.limit + 1 if search.limit is not None else None)
         .all()
@@ -295,8 +260,165 @@ def search_score_sets(db: Session, owner_or_contributor: Optional[User], search:
     return {"score_sets": score_sets, "num_score_sets": num_score_sets}
 
 
-def score_set_search_filter_options_from_counter(counter: Counter):
-    return [{"value": value, "count": count} for value, count in counter.items()]
+def build_search_score_set_projections_query_filter(query: Select, search: ScoreSetsSearch) -> Select:
+    """
+    Filter a query on the search projections of published score sets by the criteria of a search, as
+    `build_search_score_sets_query_filter` filters a query on score sets.
+    """
+    superseding_score_set = aliased(ScoreSet)
+
+    # Limit to unsuperseded score sets.
+    query = query.outerjoin(
+        superseding_score_set,
+        superseding_score_set.superseded_score_set_id == ScoreSetSearchProjection.score_set_id,
+    ).where(superseding_score_set.id.is_(None))
+
+    if search.text:
+        # Score sets without a search document are matched on their own attributes.
+        query = query.join(ScoreSet, ScoreSet.id == ScoreSetSearchProjection.score_set_id).outerjoin(
+            ScoreSetSearchDocument, ScoreSetSearchDocument.score_set_id == ScoreSetSearchProjection.score_set_id
+        )
+        query = query.where(search_text_filter(search.text.strip()))
+
+    array_filters = [
+        (ScoreSetSearchProjection.target_names, search.targets),
+        (ScoreSetSearchProjection.target_organism_names, search.target_organism_names),
+        (ScoreSetSearchProjection.target_categories, search.target_types),
+        (ScoreSetSearchProjection.publication_identifiers, search.publication_identifiers),
+        (ScoreSetSearchProjection.publication_db_names, search.databases),
+        (ScoreSetSearchProjection.publication_journals, search.journals),
+        (ScoreSetSearchProjection.publication_author_names, search.authors),
+        (ScoreSetSearchProjection.target_accessions, search.target_accessions),
+        (ScoreSetSearchProjection.keywords, search.keywords),
+    ]
+    for column, values in array_filters:
+        if values:
+            query = query.where(column.overlap(values))
+
+    return query
+
+
+def search_published_score_sets(db: Session, search: ScoreSetsSearch):
+    """
+    Search published score sets by their search projections, loading only the score sets in the requested page of
+    results.
+    """
+    query = build_search_score_set_projections_query_filter(select(ScoreSetSearchProjection.score_set_id), search)
+
+    order_by: list[Any] = [ScoreSetSearchProjection.experiment_title, ScoreSetSearchProjection.score_set_id]
+    if search.text:
+        # List the score sets which best match the search text first.
+        order_by.insert(0, search_text_rank(search.text.strip()).desc())
+
+    score_set_ids = db.scalars(
+        query.order_by(*order_by)
+        .offset(search.offset if search.offset is not None else None)
+        .limit(search.limit + 1 if search.limit is not None else None)
+    ).all()
+
+    offset = search.offset if search.offset is not None else 0
+    num_score_sets = offset + len(score_set_ids)
+    if search.limit is not None and num_score_sets > offset + search.limit:
+        # As in `search_score_sets`, the extra result tells us whether we need to run a count query.
+        score_set_ids = score_set_ids[: search.limit]
+        num_score_sets = db.scalar(select(func.count()).select_from(query.subquery()))
+
+    score_sets_by_id = {
+        score_set.id: score_set
+        for score_set in db.scalars(
+            select(ScoreSet)
+            .join(ScoreSet.experiment)
+            .where(ScoreSet.id.in_(score_set_ids))
+            .options(*score_set_search_result_options())
+        ).unique()
+    }
+    score_sets = [score_sets_by_id[score_set_id] for score_set_id in score_set_ids]
+
+    save_to_logging_context({"matching_resources": num_score_sets})
+    logger.debug(msg=f"Score set search yielded {len(score_sets)} matching resources.", extra=logging_context())
+
+    return {"score_sets": score_sets, "num_score_sets": num_score_sets}
+
+
+def score_set_search_filter_option_facets(matching_score_sets: CTE) -> list[Select]:
+    """
+    Build queries counting the values of each search filter option among the matching score sets, given by a CTE of
+    their IDs. Each query yields rows holding the name of its filter option, a value and the number of occurrences of
+    that value. Values are counted once for each target or publication on which they appear, and empty values are
+    ignored.
+    """
+    author = func.jsonb_array_elements(PublicationIdentifier.authors, type_=JSONB).column_valued("author")
+
+    targets = select(TargetGene).join(matching_score_sets, matching_score_sets.c.id == TargetGene.score_set_id)
+    publications = (
+        select(PublicationIdentifier)
+        .join(
+            ScoreSetPublicationIdentifierAssociation,
+            ScoreSetPublicationIdentifierAssociation.publication_identifier_id == PublicationIdentifier.id,
+        )
+        .join(matching_score_sets, matching_score_sets.c.id == ScoreSetPublicationIdentifierAssociation.score_set_id)
+    )
+
+    def facet(option: str, query: Select, value: ColumnElement) -> Select:
+        value = cast(value, String)
+        return (
+            query.with_only_columns(
+                literal(option).label("option"),
+                value.label("value"),
+                func.count().label("count"),
+                maintain_column_froms=True,
+            )
+            .where(func.coalesce(value, "") != "")
+            .group_by(value)
+        )
+
+    return [
+        facet("target_gene_categories", targets, TargetGene.category),
+        facet("target_gene_names", targets, TargetGene.name),
+        facet(
+            "target_organism_names",
+            targets.join(TargetSequence, TargetSequence.id == TargetGene.target_sequence_id).join(
+                Taxonomy, Taxonomy.id == TargetSequence.taxonomy_id
+            ),
+            Taxonomy.organism_name,
+        ),
+        facet(
+            "target_accessions",
+            targets.join(TargetAccession, TargetAccession.id == TargetGene.accession_id),
+            TargetAccession.accession,
+        ),
+        facet("publication_author_names", publications.add_columns(author), author["name"].astext),
+        facet("publication_db_names", publications, PublicationIdentifier.db_name),
+        facet("publication_journals", publications, PublicationIdentifier.publication_journal),
+    ]
+
+
+def score_set_search_projection_filter_option_facets(matching_projections: CTE) -> list[Select]:
+    """
+    Build queries counting the values of each search filter option among the search projections of matching published
+    score sets, given by a CTE of their score set IDs. Each query yields rows as `score_set_search_filter_option_facets`.
+    """
+    facet_columns = {
+        "target_gene_categories": ScoreSetSearchProjection.target_categories,
+        "target_gene_names": ScoreSetSearchProjection.target_names,
+        "target_organism_names": ScoreSetSearchProjection.target_organism_names,
+        "target_accessions": ScoreSetSearchProjection.target_accessions,
+        "publication_author_names": ScoreSetSearchProjection.publication_author_names,
+        "publication_db_names": ScoreSetSearchProjection.publication_db_names,
+        "publication_journals": ScoreSetSearchProjection.publication_journals,
+    }
+
+    facets = []
+    for option, column in facet_columns.items():
+        value = func.unnest(column, type_=String).column_valued("value")
+        facets.append(
+            select(literal(option).label("option"), value.label("value"), func.count().label("count"))
+            .select_from(ScoreSetSearchProjection)
+            .join(matching_projections, matching_projections.c.score_set_id == ScoreSetSearchProjection.score_set_id)
+            .group_by(value)
+        )
+
+    return facets
 
 
 def fetch_score_set_search_filter_options(
@@ -304,113 +426,54 @@ def fetch_score_set_search_filter_options(
 ):
     save_to_logging_context({"score_set_search_criteria": search.model_dump()})
 
-    query = db.query(ScoreSet)
-    query = build_search_score_sets_query_filter(db, query, owner_or_contributor, search)
-    score_sets: list[ScoreSet] = query.all()
-    if not score_sets:
-        score_sets = []
-
-    # Target related counters
-    target_category_counter: Counter[str] = Counter()
-    target_name_counter: Counter[str] = Counter()
-    target_organism_name_counter: Counter[str] = Counter()
-    target_accession_counter: Counter[str] = Counter()
-    # Publication related counters
-    publication_author_name_counter: Counter[str] = Counter()
-    publication_db_name_counter: Counter[str] = Counter()
-    publication_journal_counter: Counter[str] = Counter()
-
-    # --- PERFORMANCE NOTE ---
-    # The following counter construction loop is a bottleneck for large score set queries.
-    # Practical future optimizations might include:
-    #   - Batch permission checks and attribute access outside the loop if possible
-    #   - Use parallelization (e.g., multiprocessing or concurrent.futures) for large datasets
-    #   - Pre-fetch or denormalize target/publication data in the DB query
-    #   - Profile and refactor nested attribute lookups to minimize Python overhead
-    for score_set in score_sets:
-        # Check read permission for each score set, skip if no permission
-        if not has_permission(requester, score_set, Action.READ).permitted:
-            continue
-
-        # Target related options
-        for target in getattr(score_set, "target_genes", []):
-            category = getattr(target, "category", None)
-            if category:
-                target_category_counter[category] += 1
-
-            name = getattr(target, "name", None)
-            if name:
-                target_name_counter[name] += 1
-
-            target_sequence = getattr(target, "target_sequence", None)
-            taxonomy = getattr(target_sequence, "taxonomy", None)
-            organism_name = getattr(taxonomy, "organism_name", None)
-
-            if organism_name:
-                target_organism_name_counter[organism_name] += 1
-
-            target_accession = getattr(target, "target_accession", None)
-            accession = getattr(target_accession, "accession", None)
-
-            if accession:
-                target_accession_counter[accession] += 1
-
-        # Publication related options
-        for publication_association in getattr(score_set, "publication_identifier_associations", []):
-            publication = getattr(publication_association, "publication", None)
-
-            authors = getattr(publication, "authors", [])
-            for author in authors:
-                name = author.get("name")
-                if name:
-                    publication_author_name_counter[name] += 1
-
-            db_name = getattr(publication, "db_name", None)
-            if db_name:
-                publication_db_name_counter[db_name] += 1
-
-            journal = getattr(publication, "publication_journal", None)
-            if journal:
-                publication_journal_counter[journal] += 1
+    if search.published and owner_or_contributor is None:
+        # Published score sets may be read by anyone, so filter options are counted over their search projections.
+        projection_query = build_search_score_set_projections_query_filter(
+            select(ScoreSetSearchProjection.score_set_id), search
+        )
+        facet_queries = score_set_search_projection_filter_option_facets(projection_query.cte("matching_projections"))
+    else:
+        # Count filter options over the IDs of matching score sets which the requester may read, so that no score sets
+        # need be loaded.
+        query = db.query(ScoreSet.id)
+        query = build_search_score_sets_query_filter(db, query, owner_or_contributor, search)
+        query = query.filter(score_set_permissions.permitted_filter(requester, Action.READ))
+        facet_queries = score_set_search_filter_option_facets(query.cte("matching_score_sets"))
+
+    filter_options: dict[str, list[dict[str, Any]]] = {
+        "target_gene_categories": [],
+        "target_gene_names": [],
+        "target_organism_names": [],
+        "target_accessions": [],
+        "publication_author_names": [],
+        "publication_db_names": [],
+        "publication_journals": [],
+    }
+    facets = union_all(*facet_queries).subquery()
+    for option, value, count in db.execute(select(facets).order_by(facets.c.option, facets.c.value)):
+        filter_options[option].append({"value": value, "count": count})
 
     logger.debug(msg="Score set search filter options were fetched.", extra=logging_context())
 
-    return {
-        "target_gene_categories": score_set_search_filter_options_from_counter(target_category_counter),
-        "target_gene_names": score_set_search_filter_options_from_counter(target_name_counter),
-        "target_organism_names": score_set_search_filter_options_from_counter(target_organism_name_counter),
-        "target_accessions": score_set_search_filter_options_from_counter(target_accession_counter),
-        "publication_author_names": score_set_search_filter_options_from_counter(publication_author_name_counter),
-        "publication_db_names": score_set_search_filter_options_from_counter(publication_db_name_counter),
-        "publication_journals": score_set_search_filter_options_from_counter(publication_journal_counter),
-    }
+    return filter_options
 
 
 def fetch_superseding_score_set_in_search_result(
-    score_sets: list[ScoreSet], requesting_user: Optional["UserData"], search: ScoreSetsSearch
+    db: Session, score_sets: list[ScoreSet], requesting_user: Optional["UserData"], search: ScoreSetsSearch
 ) -> list[ScoreSet]:
     """
     Remove superseded score set from search results.
     Check whether all of the score set are correct versions.
     """
-    from mavedb.lib.permissions import Action
-
-    if search.published:
-        filtered_score_sets_tail = [
-            find_publish_or_private_superseded_score_set_tail(score_set, Action.READ, requesting_user, search.published)
-            for score_set in score_sets
-        ]
-    else:
-        filtered_score_sets_tail = [
-            find_superseded_score_set_tail(score_set, Action.READ, requesting_user) for score_set in score_sets
-        ]
+    tail_ids = find_superseded_score_set_tails(
+        db, [score_set.id for score_set in score_sets], requesting_user, published=bool(search.published)
+    )
     # Remove None item.
-    filtered_score_sets = [score_set for score_set in filtered_score_sets_tail if score_set is not None]
-    if filtered_score_sets:
-        final_score_sets = sorted(set(filtered_score_sets), key=attrgetter("urn"))
-    else:
-        final_score_sets = []
-    return final_score_sets
+    filtered_tail_ids = {tail_id for tail_id in tail_ids.values() if tail_id is not None}
+    if not filtered_tail_ids:
+        return []
+
+    return sorted(db.scalars(select(ScoreSet).where(ScoreSet.id.in_(filtered_tail_ids))), key=attrgetter("urn"))
 
 
 def find_meta_analyses_for_experiment_sets(db: Session, urns: list[str]) -> list[ScoreSet]:
@@ -514,6 +577,99 @@ def find_publish_or_private_superseded_score_set_tail(
     return score_set
 
 
+def superseded_score_set_tails_query(
+    score_set_ids: Iterable[int] | Select, user_data: Optional[UserData], published: bool = False
+) -> Select:
+    """
+    Build a query resolving the tails of the superseding chains of many score sets at once, yielding rows of each
+    score set's ID and the ID of its tail, if any.
+
+    By default, tails are resolved as `find_superseded_score_set_tail` resolves them for `Action.READ`. If `published`
+    is set, they are instead resolved as `find_publish_or_private_superseded_score_set_tail` resolves them for published
+    searches. Each chain is walked by a recursive CTE, with the requester's permissions checked in SQL.
+    """
+    readable = score_set_permissions.permitted_filter(user_data, Action.READ)
+
+    chain = (
+        select(
+            ScoreSet.id.label("start_id"),
+            ScoreSet.id.label("id"),
+            literal(0).label("depth"),
+            readable.label("readable"),
+        )
+        .where(ScoreSet.id.in_(score_set_ids))
+        .cte("superseding_chain", recursive=True)
+    )
+    if published:
+        # Continue to the next score set unless the current score set is readable and the next is unpublished.
+        continue_chain = not_(and_(chain.c.readable, ScoreSet.published_date.is_(None)))
+    else:
+        # Continue to the next score set if it is readable.
+        continue_chain = readable
+    chain = chain.union_all(
+        select(chain.c.start_id, ScoreSet.id, chain.c.depth + 1, readable)
+        .join(ScoreSet, ScoreSet.superseded_score_set_id == chain.c.id)
+        .where(continue_chain)
+    )
+
+    # A tail which may not be read is only resolved to its nearest readable predecessor if it ends its chain, rather than
+    # being followed by a score set which may not be read.
+    successor = aliased(ScoreSet)
+    ends_chain = ~select(successor.id).where(successor.superseded_score_set_id == chain.c.id).exists()
+    tails = (
+        select(
+            chain.c.start_id,
+            chain.c.id.label("tail_id"),
+            or_(chain.c.readable, not_(ends_chain)).label("resolved"),
+        )
+        .distinct(chain.c.start_id)
+        .order_by(chain.c.start_id, chain.c.depth.desc())
+        .cte("superseding_chain_tails")
+    )
+    if published:
+        return select(tails.c.start_id.label("score_set_id"), tails.c.tail_id)
+
+    predecessors = (
+        select(tails.c.start_id, ScoreSet.superseded_score_set_id.label("id"), literal(1).label("depth"))
+        .join(ScoreSet, ScoreSet.id == tails.c.tail_id)
+        .where(not_(tails.c.resolved), ScoreSet.superseded_score_set_id.isnot(None))
+        .cte("superseded_chain", recursive=True)
+    )
+    predecessors = predecessors.union_all(
+        select(predecessors.c.start_id, ScoreSet.superseded_score_set_id, predecessors.c.depth + 1)
+        .join(ScoreSet, ScoreSet.id == predecessors.c.id)
+        .where(not_(readable), ScoreSet.superseded_score_set_id.isnot(None))
+    )
+    readable_predecessors = (
+        select(predecessors.c.start_id, predecessors.c.id)
+        .join(ScoreSet, ScoreSet.id == predecessors.c.id)
+        .where(readable)
+        .distinct(predecessors.c.start_id)
+        .order_by(predecessors.c.start_id, predecessors.c.depth)
+        .subquery()
+    )
+
+    return select(
+        tails.c.start_id.label("score_set_id"),
+        case((tails.c.resolved, tails.c.tail_id), else_=readable_predecessors.c.id).label("tail_id"),
+    ).outerjoin(readable_predecessors, readable_predecessors.c.start_id == tails.c.start_id)
+
+
+def find_superseded_score_set_tails(
+    db: Session, score_set_ids: Iterable[int] | Select, user_data: Optional[UserData], published: bool = False
+) -> dict[int, Optional[int]]:
+    """
+    Resolve the tails of the superseding chains of many score sets in a single query. See
+    `superseded_score_set_tails_query`.
+
+    :return: A dictionary mapping the ID of each score set to the ID of its tail, or None if it has no tail.
+    """
+    return {
+        score_set_id: tail_id
+        for score_set_id, tail_id in db.execute(superseded_score_set_tails_query(score_set_ids, user_data, published))
+    }
+
+
 def get_score_set_variants_as_csv(
     db: Session,
     score_set: ScoreSet,
@@ -922,6 +1078,56 @@ def variants_to_csv_rows(
     return map(lambda v: variant_to_csv_row(v, columns, namespaced=namespaced, na_rep=na_rep), variants)
 
 
+def count_current_mapped_variants(db: Session, score_set: ScoreSet) -> int:
+    return (
+        db.scalar(
+            select(func.count(MappedVariant.id))
+            .join(MappedVariant.variant)
+            .where(Variant.score_set_id == score_set.id, MappedVariant.current.is_(True))
+        )
+        or 0
+    )
+
+
+def current_mapped_variant_batches(
+    db: Session, score_set: ScoreSet, batch_size: int = MAPPED_VARIANT_STREAM_BATCH_SIZE
+) -> Iterator[list[MappedVariant]]:
+    """
+    Yield the current mapped variants of a score set, and their variants, in batches ordered by mapped variant ID.
+
+    Each batch is fetched in full with its own keyset query, which picks up after the last mapped variant of the
+    previous batch, so no cursor is held open while a batch is processed and callers may write to (or commit) the
+    session between batches. Only one batch is held in memory at a time, regardless of the size of the score set. The score set of each variant is not loaded with the batch; it is resolved from the session's
+    identity map, so callers should load the score set (and any of its relationships they need) from the same session.
+    """
+    last_mapped_variant_id = 0
+    while True:
+        batch = list(
+            db.scalars(
+                select(MappedVariant)
+                .join(MappedVariant.variant)
+                .where(
+                    Variant.score_set_id == score_set.id,
+                    MappedVariant.current.is_(True),
+                    MappedVariant.id > last_mapped_variant_id,
+                )
+                .options(contains_eager(MappedVariant.variant))
+                .order_by(MappedVariant.id)
+                .limit(batch_size)
+            )
+        )
+
+        if not batch:
+            return
+
+        yield batch
+
+        if len(batch) < batch_size:
+            return
+
+        last_mapped_variant_id = batch[-1].id
+
+
 def find_meta_analyses_for_score_sets(db: Session, urns: list[str]) -> list[ScoreSet]:
     """
     Find all score sets that are meta-analyses for a specified collection of other score sets.
@@ -6,18 +6,138 @@ See: https://github.com/biocommons/seqrepo-rest-service/blob/main/src/seqrepo_re
 
 import os
 import re
+import threading
+import weakref
 from base64 import urlsafe_b64encode, urlsafe_b64decode
 from binascii import unhexlify, hexlify
+from collections import OrderedDict
 
 # TODO (https://github.com/VariantEffect/mavedb-api/issues/354). We need pydantic upgraded to use this package.
 # from ga4gh.core.identifiers import is_ga4gh_identifier, CURIE_NAMESPACE as ga4gh_namespace
-from typing import Generator, Optional, Union
+from typing import Any, Callable, Generator, Generic, Hashable, Optional, TypeVar, Union
 
 from biocommons.seqrepo import SeqRepo, __version__ as seqrepo_dep_version
 from bioutils.accessions import infer_namespaces
 
 
 DEFAULT_CHUNK_SIZE = 8192
+# Adaptive chunks grow with the length of a request so that long requests are served in at most about this many chunks.
+ADAPTIVE_CHUNK_TARGET_COUNT = 64
+MAX_CHUNK_SIZE = 1024 * 1024
+
+# Sequences are cached in blocks of this many bases, up to a total budget of bases (and so bytes) per SeqRepo instance.
+SEQUENCE_CACHE_BLOCK_SIZE = 65536
+SEQUENCE_CACHE_MAX_BYTES = int(os.getenv("SEQREPO_SEQUENCE_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+# The number of alias resolutions, sequence infos and alias lists cached per SeqRepo instance.
+SEQREPO_LOOKUP_CACHE_SIZE = int(os.getenv("SEQREPO_LOOKUP_CACHE_SIZE", 4096))
+
+T = TypeVar("T")
+
+
+class LRUCache(Generic[T]):
+    """
+    A thread-safe least-recently-used cache which evicts entries once the total weight of its entries exceeds a budget.
+    By default each entry weighs one, so the budget is a number of entries.
+    """
+
+    def __init__(self, max_weight: int, weigh: Callable[[T], int] = lambda _: 1):
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self.weight = 0
+        self._entries: OrderedDict[Hashable, T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: T) -> None:
+        weight = self.weigh(value)
+        if weight > self.max_weight:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.weight -= self.weigh(self._entries.pop(key))
+
+            self._entries[key] = value
+            self.weight += weight
+
+            while self.weight > self.max_weight:
+                _, evicted = self._entries.popitem(last=False)
+                self.weight -= self.weigh(evicted)
+
+
+class SeqRepoCache:
+    """
+    Caches of the lookups made against a single SeqRepo instance. SeqRepo reads from SQLite and bgzipped FASTA files
+    whose handles may not be used concurrently, so every read made on a cache miss is serialized by a lock.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.sequence_ids: LRUCache[list[str]] = LRUCache(SEQREPO_LOOKUP_CACHE_SIZE)
+        self.sequence_infos: LRUCache[dict[str, Any]] = LRUCache(SEQREPO_LOOKUP_CACHE_SIZE)
+        self.sequence_aliases: LRUCache[list[dict[str, Any]]] = LRUCache(SEQREPO_LOOKUP_CACHE_SIZE)
+        self.sequence_blocks: LRUCache[str] = LRUCache(SEQUENCE_CACHE_MAX_BYTES, weigh=len)
+
+
+_seqrepo_caches: "weakref.WeakKeyDictionary[SeqRepo, SeqRepoCache]" = weakref.WeakKeyDictionary()
+_seqrepo_caches_lock = threading.Lock()
+
+_shared_seqrepo: Optional[SeqRepo] = None
+_shared_seqrepo_dir: Optional[str] = None
+_shared_seqrepo_lock = threading.Lock()
+
+
+def seqrepo_cache(sr: SeqRepo) -> SeqRepoCache:
+    """
+    Fetch the lookup caches of a SeqRepo instance, creating them if it has none.
+    """
+    with _seqrepo_caches_lock:
+        cache = _seqrepo_caches.get(sr)
+        if cache is None:
+            cache = _seqrepo_caches[sr] = SeqRepoCache()
+
+    return cache
+
+
+def shared_seqrepo(seqrepo_dir: str) -> SeqRepo:
+    """
+    Fetch the read-only SeqRepo instance shared by this process, opening it on first use.
+
+    Opening SeqRepo connects to its SQLite databases and reads its sequence index, so the instance is opened once per
+    process rather than once per request. A child process opens its own instance rather than inheriting the handles of
+    its parent.
+    """
+    global _shared_seqrepo, _shared_seqrepo_dir
+
+    with _shared_seqrepo_lock:
+        if _shared_seqrepo is None or _shared_seqrepo_dir != seqrepo_dir:
+            # The instance is shared between request threads. Reads on it are serialized by its SeqRepoCache lock.
+            _shared_seqrepo = SeqRepo(seqrepo_dir, check_same_thread=False)
+            _shared_seqrepo_dir = seqrepo_dir
+
+        return _shared_seqrepo
+
+
+def _reset_shared_seqrepo() -> None:
+    global _shared_seqrepo, _shared_seqrepo_dir, _shared_seqrepo_lock, _seqrepo_caches_lock
+
+    _shared_seqrepo = None
+    _shared_seqrepo_dir = None
+    _shared_seqrepo_lock = threading.Lock()
+    _seqrepo_caches_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_shared_seqrepo)
 
 
 def base64url_to_hex(s: str) -> str:
@@ -36,17 +156,93 @@ def get_sequence_ids(sr: SeqRepo, query: str) -> list[str]:
       * A digest or digest prefix from VMC, TRUNC512, or MD5
       * A sequence accession (without namespace)
 
-    The first match will be returned.
+    The first match will be returned. Resolutions are cached per SeqRepo instance.
     """
+    cache = seqrepo_cache(sr)
+    cached_seq_ids = cache.sequence_ids.get(query)
+    if cached_seq_ids is not None:
+        return list(cached_seq_ids)
 
     nsa_options = _generate_nsa_options(query)
-    for ns, a in nsa_options:
-        aliases = list(sr.aliases.find_aliases(namespace=ns, alias=a))
-        if aliases:
-            break
+    with cache.lock:
+        for ns, a in nsa_options:
+            aliases = list(sr.aliases.find_aliases(namespace=ns, alias=a))
+            if aliases:
+                break
 
     seq_ids = list(set(a["seq_id"] for a in aliases))
-    return seq_ids
+    cache.sequence_ids.put(query, seq_ids)
+    return list(seq_ids)
+
+
+def get_sequence_info(sr: SeqRepo, seq_id: str) -> dict[str, Any]:
+    """
+    Fetch the SeqRepo sequence info (length, alphabet and date added) of a sequence, cached per SeqRepo instance.
+    """
+    cache = seqrepo_cache(sr)
+    seqinfo = cache.sequence_infos.get(seq_id)
+    if seqinfo is None:
+        with cache.lock:
+            seqinfo = dict(sr.sequences.fetch_seqinfo(seq_id))
+        cache.sequence_infos.put(seq_id, seqinfo)
+
+    return seqinfo
+
+
+def get_sequence_aliases(sr: SeqRepo, seq_id: str) -> list[dict[str, Any]]:
+    """
+    Fetch the aliases of a sequence, cached per SeqRepo instance.
+    """
+    cache = seqrepo_cache(sr)
+    aliases = cache.sequence_aliases.get(seq_id)
+    if aliases is None:
+        with cache.lock:
+            aliases = [dict(a) for a in sr.aliases.find_aliases(seq_id=seq_id)]
+        cache.sequence_aliases.put(seq_id, aliases)
+
+    return aliases
+
+
+def sequence_etag(seq_id: str) -> str:
+    """
+    Build a strong entity tag for a sequence. SeqRepo sequence IDs are digests of their sequence, so the tag of a
+    sequence never changes.
+    """
+    return f'"{seq_id}"'
+
+
+def fetch_sequence(sr: SeqRepo, seq_id: str, start: int, end: int, seq_len: int) -> str:
+    """
+    Fetch a subsequence of a sequence, assembling it from cached blocks of SEQUENCE_CACHE_BLOCK_SIZE bases. Fetches
+    spanning more than a cache block are read directly, so that long requests neither pay for many small reads nor
+    evict the blocks of frequently requested sequences.
+
+    Args:
+        sr (SeqRepo): The SeqRepo instance to fetch sequences from.
+        seq_id (str): The identifier of the sequence to retrieve.
+        start (int): The starting position (0-based, inclusive) of the subsequence.
+        end (int): The ending position (0-based, exclusive) of the subsequence.
+        seq_len (int): The length of the sequence.
+    """
+    cache = seqrepo_cache(sr)
+    end = min(end, seq_len)
+
+    if end - start > SEQUENCE_CACHE_BLOCK_SIZE:
+        with cache.lock:
+            return sr.sequences.fetch(seq_id, start, end)
+
+    pieces = []
+    for block in range(start // SEQUENCE_CACHE_BLOCK_SIZE, (end - 1) // SEQUENCE_CACHE_BLOCK_SIZE + 1):
+        block_start = block * SEQUENCE_CACHE_BLOCK_SIZE
+        data = cache.sequence_blocks.get((seq_id, block))
+        if data is None:
+            with cache.lock:
+                data = sr.sequences.fetch(seq_id, block_start, min(block_start + SEQUENCE_CACHE_BLOCK_SIZE, seq_len))
+            cache.sequence_blocks.put((seq_id, block), data)
+
+        pieces.append(data[max(start - block_start, 0) : end - block_start])
+
+    return "".join(pieces)
 
 
 def _generate_nsa_options(query: str) -> Union[list[tuple[str, ...]], list[tuple[None, str]]]:
@@ -96,18 +292,39 @@ def _generate_nsa_options(query: str) -> Union[list[tuple[str, ...]], list[tuple
     return [(None, query)]
 
 
+def adaptive_chunk_size(length: int) -> int:
+    """
+    Choose a chunk size for streaming a subsequence of the given length: DEFAULT_CHUNK_SIZE for short subsequences,
+    growing in powers of two for longer ones up to MAX_CHUNK_SIZE.
+
+    >>> adaptive_chunk_size(100)
+    8192
+
+    >>> adaptive_chunk_size(10_000_000)
+    262144
+
+    >>> adaptive_chunk_size(250_000_000)
+    1048576
+    """
+    chunk_size = DEFAULT_CHUNK_SIZE
+    while chunk_size < MAX_CHUNK_SIZE and chunk_size * ADAPTIVE_CHUNK_TARGET_COUNT < length:
+        chunk_size *= 2
+
+    return chunk_size
+
+
 def sequence_generator(
-    sr: SeqRepo, seq_id: str, start: Optional[int], end: Optional[int], chunk_size: int = DEFAULT_CHUNK_SIZE
+    sr: SeqRepo, seq_id: str, start: Optional[int], end: Optional[int], chunk_size: Optional[int] = None
 ) -> Generator[str, None, None]:
     """
-    Generates sequence chunks from a SeqRepo sequence.
+    Generates sequence chunks from a SeqRepo sequence. Chunks are assembled from cached blocks of the sequence.
 
     Args:
         sr (SeqRepo): The SeqRepo instance to fetch sequences from.
         seq_id (str): The identifier of the sequence to retrieve.
         start (Optional[int]): The starting position (0-based, inclusive) of the sequence to fetch. If None, starts from 0.
         end (Optional[int]): The ending position (0-based, exclusive) of the sequence to fetch. If None, goes to the end of the sequence.
-        chunk_size (int, optional): The size of each chunk to yield. Defaults to DEFAULT_CHUNK_SIZE.
+        chunk_size (int, optional): The size of each chunk to yield. Defaults to a size chosen by adaptive_chunk_size.
 
     Yields:
         str: A chunk of the sequence as a string.
@@ -119,12 +336,13 @@ def sequence_generator(
         for chunk in sequence_generator(sr, "seq1", 0, 1000, 100):
             process(chunk)
     """
-    seq_len = sr.sequences.fetch_seqinfo(seq_id)["len"]
+    seq_len = get_sequence_info(sr, seq_id)["len"]
     seq_start = start if start is not None else 0
     seq_end = end if end is not None else seq_len
+    chunk_size = chunk_size if chunk_size is not None else adaptive_chunk_size(seq_end - seq_start)
 
     for pos in range(seq_start, seq_end, chunk_size):
-        chunk = sr.sequences.fetch(seq_id, pos, min(pos + chunk_size, seq_end))
+        chunk = fetch_sequence(sr, seq_id, pos, min(pos + chunk_size, seq_end), seq_len)
         if not chunk:
             break
         yield chunk
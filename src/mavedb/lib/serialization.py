@@ -0,0 +1,107 @@
+"""
+Fast JSON serialization for large and streamed responses.
+
+FastAPI serializes a response model by dumping it to Python objects and then encoding those objects with the standard
+library, which dominates the time taken to render large responses. Responses which render many records, such as the
+NDJSON annotation streams and mapped variant listings, instead render their records directly to JSON bytes with the
+serializer selected by the ``JSON_SERIALIZER`` environment variable:
+
+- ``json``: Dumps models to Python objects and encodes them with the standard library.
+- ``orjson``: Dumps models to Python objects and encodes them with orjson, which renders the same values as ``json``
+  considerably faster. orjson is installed with the ``server`` extra, and this is the default when it is installed.
+- ``pydantic``: Renders models directly to JSON with pydantic's serializer, without building intermediate Python
+  objects. Datetimes are rendered in ISO 8601 format, rather than in the format of ``str``.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import SchemaSerializer
+
+logger = logging.getLogger(__name__)
+
+ORJSON_IMPORTED = False
+try:
+    import orjson
+
+    ORJSON_IMPORTED = True
+except ModuleNotFoundError:
+    pass
+
+
+@dataclass(frozen=True)
+class JsonSerializer:
+    name: str
+    # Renders a value to JSON bytes with the given schema serializer and dump options.
+    render: Callable[..., bytes]
+
+
+def _render_with_json(schema_serializer: SchemaSerializer, value: Any, **dump_options: Any) -> bytes:
+    return json.dumps(schema_serializer.to_python(value, **dump_options), default=str).encode()
+
+
+def _render_with_orjson(schema_serializer: SchemaSerializer, value: Any, **dump_options: Any) -> bytes:
+    # Pass dates through to `str`, so that they are rendered exactly as the standard library serializer renders them.
+    return orjson.dumps(
+        schema_serializer.to_python(value, **dump_options),
+        default=str,
+        option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def _render_with_pydantic(schema_serializer: SchemaSerializer, value: Any, **dump_options: Any) -> bytes:
+    return schema_serializer.to_json(value, **dump_options)
+
+
+JSON_SERIALIZERS: dict[str, JsonSerializer] = {
+    "json": JsonSerializer("json", _render_with_json),
+    "pydantic": JsonSerializer("pydantic", _render_with_pydantic),
+}
+if ORJSON_IMPORTED:
+    JSON_SERIALIZERS["orjson"] = JsonSerializer("orjson", _render_with_orjson)
+
+
+def get_json_serializer(name: Optional[str] = None) -> JsonSerializer:
+    """
+    Return the named JSON serializer, or the configured serializer if no name is given. Falls back to the standard
+    library serializer if the named serializer is unavailable.
+    """
+    name = name or os.getenv("JSON_SERIALIZER", "orjson" if ORJSON_IMPORTED else "json")
+    if name not in JSON_SERIALIZERS:
+        logger.warning(f"JSON serializer {name} is not available. Falling back to the standard library serializer.")
+        return JSON_SERIALIZERS["json"]
+
+    return JSON_SERIALIZERS[name]
+
+
+JSON_SERIALIZER = get_json_serializer()
+
+_ANY_ADAPTER: TypeAdapter = TypeAdapter(Any)
+
+
+def model_to_json_bytes(model: BaseModel, serializer: Optional[JsonSerializer] = None, **dump_options: Any) -> bytes:
+    """
+    Render a pydantic model to JSON bytes with the given serializer, or the configured serializer if none is given.
+    Dump options are those accepted by `BaseModel.model_dump`.
+    """
+    return (serializer or JSON_SERIALIZER).render(model.__pydantic_serializer__, model, **dump_options)
+
+
+def adapted_to_json_bytes(
+    adapter: TypeAdapter, value: Any, serializer: Optional[JsonSerializer] = None, **dump_options: Any
+) -> bytes:
+    """
+    Render a value of the type of a pydantic type adapter, such as a list of models, to JSON bytes with the given
+    serializer, or the configured serializer if none is given. Dump options are those accepted by
+    `TypeAdapter.dump_python`.
+    """
+    return (serializer or JSON_SERIALIZER).render(adapter.serializer, value, **dump_options)
+
+
+def value_to_json_bytes(value: Any, serializer: Optional[JsonSerializer] = None) -> bytes:
+    """Render a plain JSON compatible value, such as a string or a dictionary of strings, to JSON bytes."""
+    return adapted_to_json_bytes(_ANY_ADAPTER, value, serializer)
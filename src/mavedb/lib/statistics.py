@@ -0,0 +1,557 @@
+"""
+Statistics on published MaveDB records.
+
+Statistics are computed over every published record, so they are precomputed by a scheduled worker job and stored as
+snapshots, one row for each statistic. Each statistic is identified by a key of the form of its route, e.g.
+`target/accession/gene`, followed by the values of any query parameters, e.g. `variant/count/month`. The statistics
+routes serve snapshots when they exist, and otherwise compute the statistic from the live tables.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+from collections import Counter, OrderedDict
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Optional, Union
+
+from sqlalchemy import Select, Table, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from mavedb.models.controlled_keyword import ControlledKeyword
+from mavedb.models.doi_identifier import DoiIdentifier
+from mavedb.models.ensembl_identifier import EnsemblIdentifier
+from mavedb.models.ensembl_offset import EnsemblOffset
+from mavedb.models.experiment import (
+    Experiment,
+    experiments_doi_identifiers_association_table,
+    experiments_raw_read_identifiers_association_table,
+)
+from mavedb.models.experiment_controlled_keyword import ExperimentControlledKeywordAssociation
+from mavedb.models.experiment_publication_identifier import ExperimentPublicationIdentifierAssociation
+from mavedb.models.publication_identifier import PublicationIdentifier
+from mavedb.models.published_variant import PublishedVariant
+from mavedb.models.raw_read_identifier import RawReadIdentifier
+from mavedb.models.refseq_identifier import RefseqIdentifier
+from mavedb.models.refseq_offset import RefseqOffset
+from mavedb.models.score_set import (
+    ScoreSet,
+    score_sets_doi_identifiers_association_table,
+    score_sets_raw_read_identifiers_association_table,
+)
+from mavedb.models.score_set_publication_identifier import ScoreSetPublicationIdentifierAssociation
+from mavedb.models.statistics_snapshot import StatisticsSnapshot
+from mavedb.models.target_accession import TargetAccession
+from mavedb.models.target_gene import TargetGene
+from mavedb.models.target_sequence import TargetSequence
+from mavedb.models.taxonomy import Taxonomy
+from mavedb.models.uniprot_identifier import UniprotIdentifier
+from mavedb.models.uniprot_offset import UniprotOffset
+from mavedb.models.user import User
+
+logger = logging.getLogger(__name__)
+
+TARGET_ACCESSION_TAXONOMY = "Homo sapiens"
+
+## Union types
+
+RecordModels = Union[type[Experiment], type[ScoreSet]]
+RecordAssociationTables = Union[
+    Table,
+    type[ExperimentControlledKeywordAssociation],
+    type[ExperimentPublicationIdentifierAssociation],
+    type[ScoreSetPublicationIdentifierAssociation],
+]
+
+
+## Enum classes hold valid endpoints for different statistics routes.
+
+
+class RecordNames(str, Enum):
+    experiment = "experiment"
+    scoreSet = "score-set"
+
+
+class RecordFields(str, Enum):
+    publicationIdentifiers = "publication-identifiers"
+    keywords = "keywords"
+    doiIdentifiers = "doi-identifiers"
+    rawReadIdentifiers = "raw-read-identifiers"
+    createdBy = "created-by"
+
+
+class GroupBy(str, Enum):
+    month = "month"
+    year = "year"
+
+
+def model_and_association_from_record_field(
+    record: RecordNames, field: Optional[RecordFields]
+) -> tuple[RecordModels, Optional[RecordAssociationTables]]:
+    """
+    Given a member of the RecordNames and RecordFields Enums, generate the model and association table that can be used
+    to generate statistics for those fields.
+
+    This function should be used for generating statistics for fields shared between Experiments and Score Sets.
+    If necessary, Experiment Sets can be handled in a similar manner in the future.
+    """
+    record_to_model_map: dict[RecordNames, RecordModels] = {
+        RecordNames.experiment: Experiment,
+        RecordNames.scoreSet: ScoreSet,
+    }
+    record_to_assc_map: dict[RecordNames, dict[RecordFields, RecordAssociationTables]] = {
+        RecordNames.experiment: {
+            RecordFields.doiIdentifiers: experiments_doi_identifiers_association_table,
+            RecordFields.publicationIdentifiers: ExperimentPublicationIdentifierAssociation,
+            RecordFields.rawReadIdentifiers: experiments_raw_read_identifiers_association_table,
+            RecordFields.keywords: ExperimentControlledKeywordAssociation,
+        },
+        RecordNames.scoreSet: {
+            RecordFields.doiIdentifiers: score_sets_doi_identifiers_association_table,
+            RecordFields.publicationIdentifiers: ScoreSetPublicationIdentifierAssociation,
+            RecordFields.rawReadIdentifiers: score_sets_raw_read_identifiers_association_table,
+        },
+    }
+
+    queried_model = record_to_model_map[record]
+    queried_model_assc = record_to_assc_map[record]
+
+    if field is None or field not in queried_model_assc:
+        return queried_model, None
+
+    return queried_model, queried_model_assc[field]
+
+
+def _join_model_and_filter_unpublished(query: Select, model: RecordModels) -> Select:
+    return query.join(model).where(model.published_date.is_not(None))
+
+
+def _count_for_identifier_in_query(db: Session, query: Select[tuple[Any, int]]) -> dict[Any, int]:
+    return {value: count for value, count in db.execute(query).all() if value is not None}
+
+
+def _required_association(record: RecordNames, field: RecordFields) -> tuple[RecordModels, RecordAssociationTables]:
+    queried_model, queried_assc = model_and_association_from_record_field(record, field)
+
+    if queried_assc is None:
+        raise ValueError(f"No association table associated with the {field.value} field when one was expected.")
+
+    return queried_model, queried_assc
+
+
+def _group_counts_by_date(per_date: list[Any], group: GroupBy) -> dict[str, int]:
+    date_format = "%Y-%m" if group == GroupBy.month else "%Y"
+    grouped = {k: sum(c for _, c in g) for k, g in itertools.groupby(per_date, lambda t: t[0].strftime(date_format))}
+    return OrderedDict(sorted(grouped.items()))
+
+
+########################################################################################
+#  Record statistics
+########################################################################################
+
+
+def record_keyword_statistics(db: Session, record: RecordNames) -> dict[str, int]:
+    """
+    Count the distinct values of the `value` field (member of the `controlled_keywords` table) of published records.
+    """
+    queried_model, queried_assc = _required_association(record, RecordFields.keywords)
+
+    query = _join_model_and_filter_unpublished(
+        select(ControlledKeyword.label, func.count(ControlledKeyword.label)).join(queried_assc), queried_model
+    ).group_by(ControlledKeyword.label)
+
+    return _count_for_identifier_in_query(db, query)
+
+
+def record_publication_identifier_statistics(db: Session, record: RecordNames) -> dict[str, dict[str, int]]:
+    """
+    Count the distinct values of the `identifier` field (member of the `publication_identifiers` table) of published
+    records, grouped by publication database.
+    """
+    queried_model, queried_assc = _required_association(record, RecordFields.publicationIdentifiers)
+
+    query = _join_model_and_filter_unpublished(
+        select(
+            PublicationIdentifier.identifier,
+            PublicationIdentifier.db_name,
+            func.count(PublicationIdentifier.identifier),
+        ).join(queried_assc),
+        queried_model,
+    ).group_by(PublicationIdentifier.identifier, PublicationIdentifier.db_name)
+
+    publication_identifiers: dict[str, dict[str, int]] = {}
+
+    for identifier, db_name, count in db.execute(query).all():
+        # We don't need to worry about overwriting existing identifiers within these internal dictionaries because
+        # of the SQL group by clause.
+        if db_name in publication_identifiers:
+            publication_identifiers[db_name][identifier] = count
+        else:
+            publication_identifiers[db_name] = {identifier: count}
+
+    return publication_identifiers
+
+
+def record_raw_read_identifier_statistics(db: Session, record: RecordNames) -> dict[str, int]:
+    """
+    Count the distinct values of the `identifier` field (member of the `raw_read_identifiers` table) of published
+    records.
+    """
+    queried_model, queried_assc = _required_association(record, RecordFields.rawReadIdentifiers)
+
+    query = _join_model_and_filter_unpublished(
+        select(RawReadIdentifier.identifier, func.count(RawReadIdentifier.identifier)).join(queried_assc), queried_model
+    ).group_by(RawReadIdentifier.identifier)
+
+    return _count_for_identifier_in_query(db, query)
+
+
+def record_doi_identifier_statistics(db: Session, record: RecordNames) -> dict[str, int]:
+    """
+    Count the distinct values of the `identifier` field (member of the `doi_identifiers` table) of published records.
+    """
+    queried_model, queried_assc = _required_association(record, RecordFields.doiIdentifiers)
+
+    query = _join_model_and_filter_unpublished(
+        select(DoiIdentifier.identifier, func.count(DoiIdentifier.identifier)).join(queried_assc), queried_model
+    ).group_by(DoiIdentifier.identifier)
+
+    return _count_for_identifier_in_query(db, query)
+
+
+def record_created_by_statistics(db: Session, record: RecordNames) -> dict[str, int]:
+    """
+    Count the distinct values of the `username` field (member of the `users` table) of the creators of published
+    records.
+    """
+    queried_model, _ = model_and_association_from_record_field(record, RecordFields.createdBy)
+
+    query = (
+        select(User.username, func.count(User.id))
+        .join(queried_model, queried_model.created_by_id == User.id)
+        .filter(queried_model.published_date.is_not(None))
+        .group_by(User.id)
+    )
+
+    return _count_for_identifier_in_query(db, query)
+
+
+def record_counts(db: Session, record: RecordNames, group: Optional[GroupBy] = None) -> dict[str, int]:
+    """
+    Count the published records of a model, optionally grouped by the published month or year.
+    """
+    queried_model, _ = model_and_association_from_record_field(record, None)
+
+    # Protect against Nonetype publication dates with where clause.
+    # We can safely ignore Mypy Nonetype errors in the following dictcomps.
+    objs = db.scalars(
+        select(queried_model.published_date)
+        .where(queried_model.published_date.isnot(None))
+        .order_by(queried_model.published_date)
+    ).all()
+
+    if group == GroupBy.month:
+        grouped = {k: len(list(g)) for k, g in itertools.groupby(objs, lambda t: t.strftime("%Y-%m"))}  # type: ignore
+    elif group == GroupBy.year:
+        grouped = {k: len(list(g)) for k, g in itertools.groupby(objs, lambda t: t.strftime("%Y"))}  # type: ignore
+    else:
+        grouped = {"count": len(objs)}
+
+    return OrderedDict(sorted(grouped.items()))
+
+
+def record_variant_counts(db: Session) -> dict[str, int]:
+    """
+    Count the published variants of each score set.
+    """
+    variants = db.execute(
+        select(PublishedVariant.score_set_urn, func.count(PublishedVariant.variant_id))
+        .group_by(PublishedVariant.score_set_urn)
+        .order_by(PublishedVariant.score_set_urn)
+    ).all()
+
+    grouped = {urn: sum(c for _, c in g) for urn, g in itertools.groupby(variants, lambda t: t[0])}
+    return OrderedDict(sorted(filter(lambda item: item[1] > 0, grouped.items())))
+
+
+def record_mapped_variant_counts(db: Session) -> dict[str, int]:
+    """
+    Count the published mapped variants of each score set.
+    """
+    variants = db.execute(
+        select(PublishedVariant.score_set_urn, func.count(PublishedVariant.mapped_variant_id))
+        .group_by(PublishedVariant.score_set_urn)
+        .order_by(PublishedVariant.score_set_urn)
+    ).all()
+
+    grouped = {urn: sum(c for _, c in g) for urn, g in itertools.groupby(variants, lambda t: t[0])}
+    return OrderedDict(sorted(filter(lambda item: item[1] > 0, grouped.items())))
+
+
+########################################################################################
+# Target statistics
+########################################################################################
+
+
+def target_accession_counts(db: Session, column: Any) -> dict[str, int]:
+    """
+    Count the distinct values of a `target_accessions` column of published score sets.
+    """
+    query = _join_model_and_filter_unpublished(select(column, func.count(column)).join(TargetGene), ScoreSet).group_by(
+        column
+    )
+
+    return _count_for_identifier_in_query(db, query)
+
+
+def target_sequence_counts(db: Session, column: Any) -> dict[str, int]:
+    """
+    Count the distinct values of a `target_sequences` column of published score sets.
+    """
+    query = _join_model_and_filter_unpublished(select(column, func.count(column)).join(TargetGene), ScoreSet).group_by(
+        column
+    )
+
+    return _count_for_identifier_in_query(db, query)
+
+
+def target_gene_category_counts(db: Session) -> dict[str, int]:
+    """
+    Count the distinct values of the `category` field (member of the `target_genes` table) of published score sets.
+    """
+    query = _join_model_and_filter_unpublished(
+        select(TargetGene.category, func.count(TargetGene.category)), ScoreSet
+    ).group_by(TargetGene.category)
+
+    return _count_for_identifier_in_query(db, query)
+
+
+def target_gene_organism_counts(db: Session) -> dict[str, int]:
+    """
+    Count the distinct values of the `organism` field (member of the `taxonomies` table) of published score sets.
+
+    NOTE: For now (and perhaps forever), all accession based targets are human genomic sequences (ie: of taxonomy `Homo sapiens`).
+          It is possible this assumption changes if we add mouse (or other non-human) genomes to MaveDB.
+    """
+    target_sequence_query = _join_model_and_filter_unpublished(
+        select(Taxonomy.organism_name, func.count(Taxonomy.organism_name)).join(TargetSequence).join(TargetGene),
+        ScoreSet,
+    ).group_by(Taxonomy.organism_name)
+    target_accession_query = _join_model_and_filter_unpublished(
+        select(func.count(TargetAccession.id)).join(TargetGene), ScoreSet
+    )
+
+    # Ensure the `Homo sapiens` key exists in the organisms counts dictionary.
+    organisms = _count_for_identifier_in_query(db, target_sequence_query)
+    organisms.setdefault(TARGET_ACCESSION_TAXONOMY, 0)
+
+    count_accession_based_targets = db.execute(target_accession_query).scalar_one_or_none()
+    if count_accession_based_targets:
+        organisms[TARGET_ACCESSION_TAXONOMY] += count_accession_based_targets
+    else:
+        organisms.pop(TARGET_ACCESSION_TAXONOMY)
+
+    return organisms
+
+
+def target_gene_identifier_counts(db: Session, identifier_model: Any, offset_model: Any) -> dict[str, int]:
+    """
+    Count the distinct values of the `identifier` field of an external identifier model of published score sets.
+    """
+    query = _join_model_and_filter_unpublished(
+        select(identifier_model.identifier, func.count(identifier_model.identifier))
+        .join(offset_model)
+        .join(TargetGene),
+        ScoreSet,
+    ).group_by(identifier_model.identifier)
+
+    return _count_for_identifier_in_query(db, query)
+
+
+def mapped_target_gene_counts(db: Session) -> dict[str, int]:
+    """
+    Count the distinct values of the `gene` property within the `post_mapped_metadata` field (member of the
+    `target_genes` table) of published score sets.
+    """
+    query = _join_model_and_filter_unpublished(
+        select(TargetGene.post_mapped_metadata),
+        ScoreSet,
+    ).where(TargetGene.post_mapped_metadata.isnot(None))
+
+    mapping_metadata = db.scalars(query).all()
+    gene_counts = Counter(
+        gene
+        for metadata in mapping_metadata
+        for key in ("genomic", "protein")
+        if key in metadata
+        for gene in metadata[key].get("sequence_genes", [])
+    )
+
+    # The gene will always be a string
+    return dict(gene_counts)  # type: ignore
+
+
+########################################################################################
+# Variant (and mapped variant) statistics
+########################################################################################
+
+
+def variant_counts(db: Session, group: Optional[GroupBy] = None) -> dict[str, int]:
+    """
+    Count the published and distinct variants, optionally grouped by the month or year in which their score set was
+    published.
+    """
+    # Fast path: total distinct variants without per-date aggregation.
+    if group is None:
+        total = db.execute(select(func.count(func.distinct(PublishedVariant.variant_id)))).scalar_one()  # type: ignore
+        return OrderedDict([("count", total)])
+
+    # Grouped path: materialize distinct counts per published_date, then roll up.
+    per_date = db.execute(
+        select(PublishedVariant.published_date, func.count(func.distinct(PublishedVariant.variant_id)))
+        .group_by(PublishedVariant.published_date)
+        .order_by(PublishedVariant.published_date)
+    ).all()
+
+    return _group_counts_by_date(list(per_date), group)
+
+
+def mapped_variant_counts(db: Session, group: Optional[GroupBy] = None, only_current: bool = True) -> dict[str, int]:
+    """
+    Count the published and distinct mapped variants, optionally only those which are current, and optionally grouped
+    by the month or year in which their score set was published.
+    """
+    # Fast path: total distinct mapped variants (optionally only current) without per-date aggregation.
+    if group is None:
+        total_stmt = select(func.count(func.distinct(PublishedVariant.mapped_variant_id)))
+
+        if only_current:
+            total_stmt = total_stmt.where(PublishedVariant.current_mapped_variant.is_(True))
+
+        total = db.execute(total_stmt).scalar_one()  # type: ignore
+        return OrderedDict([("count", total)])
+
+    # Grouped path: materialize distinct counts per published_date, then roll up.
+    per_date_stmt = select(
+        PublishedVariant.published_date,
+        func.count(func.distinct(PublishedVariant.mapped_variant_id)),
+    )
+
+    if only_current:
+        per_date_stmt = per_date_stmt.where(PublishedVariant.current_mapped_variant.is_(True))
+
+    per_date = db.execute(
+        per_date_stmt.group_by(PublishedVariant.published_date).order_by(PublishedVariant.published_date)
+    ).all()
+
+    return _group_counts_by_date(list(per_date), group)
+
+
+########################################################################################
+# Snapshots
+########################################################################################
+
+
+def statistics_snapshot_key(*parts: Union[str, Enum, None]) -> str:
+    """
+    Build the key of a statistic from its route and query parameter values. Parameters which are not set are omitted.
+    """
+    return "/".join(part.value if isinstance(part, Enum) else part for part in parts if part is not None)
+
+
+def statistics_etag(data: Any) -> str:
+    """
+    Compute a strong entity tag for the serialized value of a statistic.
+    """
+    serialized = json.dumps(data, separators=(",", ":"), default=str)
+    return f'"{hashlib.sha256(serialized.encode()).hexdigest()}"'
+
+
+def statistics_snapshot_computations() -> dict[str, Callable[[Session], Any]]:
+    """
+    Map the key of every statistic which is served from a snapshot to a function computing it.
+    """
+    computations: dict[str, Callable[[Session], Any]] = {}
+
+    for record in RecordNames:
+        computations[statistics_snapshot_key("record", record, RecordFields.publicationIdentifiers)] = (
+            lambda db, record=record: record_publication_identifier_statistics(db, record)
+        )
+        computations[statistics_snapshot_key("record", record, RecordFields.rawReadIdentifiers)] = (
+            lambda db, record=record: record_raw_read_identifier_statistics(db, record)
+        )
+        computations[statistics_snapshot_key("record", record, RecordFields.doiIdentifiers)] = (
+            lambda db, record=record: record_doi_identifier_statistics(db, record)
+        )
+        computations[statistics_snapshot_key("record", record, RecordFields.createdBy)] = (
+            lambda db, record=record: record_created_by_statistics(db, record)
+        )
+        for group in (None, *GroupBy):
+            computations[statistics_snapshot_key("record", record, "published/count", group)] = (
+                lambda db, record=record, group=group: record_counts(db, record, group)
+            )
+
+    computations[statistics_snapshot_key("record", RecordNames.experiment, RecordFields.keywords)] = (
+        lambda db: record_keyword_statistics(db, RecordNames.experiment)
+    )
+    computations["record/score-set/variant/count"] = record_variant_counts
+    computations["record/score-set/mapped-variant/count"] = record_mapped_variant_counts
+
+    computations["target/accession/accession"] = lambda db: target_accession_counts(db, TargetAccession.accession)
+    computations["target/accession/assembly"] = lambda db: target_accession_counts(db, TargetAccession.assembly)
+    computations["target/accession/gene"] = lambda db: target_accession_counts(db, TargetAccession.gene)
+    computations["target/sequence/sequence"] = lambda db: target_sequence_counts(db, TargetSequence.sequence)
+    computations["target/sequence/sequence-type"] = lambda db: target_sequence_counts(db, TargetSequence.sequence_type)
+    computations["target/gene/category"] = target_gene_category_counts
+    computations["target/gene/organism"] = target_gene_organism_counts
+    computations["target/gene/ensembl-identifier"] = lambda db: target_gene_identifier_counts(
+        db, EnsemblIdentifier, EnsemblOffset
+    )
+    computations["target/gene/refseq-identifier"] = lambda db: target_gene_identifier_counts(
+        db, RefseqIdentifier, RefseqOffset
+    )
+    computations["target/gene/uniprot-identifier"] = lambda db: target_gene_identifier_counts(
+        db, UniprotIdentifier, UniprotOffset
+    )
+    computations["target/mapped/gene"] = mapped_target_gene_counts
+
+    for group in (None, *GroupBy):
+        computations[statistics_snapshot_key("variant/count", group)] = lambda db, group=group: variant_counts(
+            db, group
+        )
+        for only_current in (True, False):
+            computations[statistics_snapshot_key("mapped-variant/count", group, str(only_current).lower())] = (
+                lambda db, group=group, only_current=only_current: mapped_variant_counts(db, group, only_current)
+            )
+
+    return computations
+
+
+def refresh_all_statistics_snapshots(db: Session) -> int:
+    """
+    Compute every statistic and store it as a snapshot, replacing any existing snapshots.
+
+    :return: The number of refreshed snapshots.
+    """
+    computations = statistics_snapshot_computations()
+    refreshed_at = datetime.now()
+
+    for key, compute in computations.items():
+        data = compute(db)
+        upsert = insert(StatisticsSnapshot).values(
+            key=key, data=data, etag=statistics_etag(data), refreshed_at=refreshed_at
+        )
+        db.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[StatisticsSnapshot.key],
+                set_={"data": upsert.excluded.data, "etag": upsert.excluded.etag, "refreshed_at": refreshed_at},
+            )
+        )
+
+    # Drop snapshots of statistics which are no longer computed.
+    db.execute(delete(StatisticsSnapshot).where(StatisticsSnapshot.key.not_in(computations.keys())))
+
+    logger.debug(msg=f"Refreshed {len(computations)} statistics snapshots.")
+    return len(computations)
@@ -1,13 +1,18 @@
 import requests
 import time
 import logging
+from datetime import date
 
 from requests.adapters import HTTPAdapter, Retry
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 
 from mavedb.lib.logging.context import logging_context, save_to_logging_context
 from mavedb.lib.uniprot.constants import UNIPROT_ID_MAPPING_API_URL, SWISS_PROT_ENTRY_TYPE
 from mavedb.lib.types import uniprot
+from mavedb.models.uniprot_accession_mapping import UniProtAccessionMapping
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +72,42 @@ class UniProtIDMappingAPI:
         logger.debug(msg="Submitted new Uniprot ID mapping job.", extra=logging_context())
         return resp.json()["jobId"]
 
+    def check_id_mapping_status(self, job_id: str) -> bool:
+        """
+        Checks once, without waiting, whether the ID mapping job with the given job_id has finished processing.
+
+        Callers which must not block, such as worker jobs, should use this method and schedule any later checks
+        themselves rather than calling `check_id_mapping_results_ready`.
+
+        Args:
+            job_id (str): The identifier of the ID mapping job to check.
+
+        Returns:
+            bool: True if the job status is "FINISHED" or the response already contains results, False otherwise.
+
+        Raises:
+            requests.HTTPError: If the API request fails or returns an error status code.
+        """
+        save_to_logging_context({"uniprot_job_id": job_id})
+        logger.debug(msg="Polling status for Uniprot mapping job.", extra=logging_context())
+
+        resp = self.session.get(f"{self.API_URL}/idmapping/status/{job_id}")
+        resp.raise_for_status()
+        status_response = resp.json()
+
+        if "jobStatus" in status_response:
+            save_to_logging_context({"uniprot_job_status": status_response["jobStatus"]})
+
+            if status_response["jobStatus"] == "FINISHED":
+                logger.info(msg=f"UniProt ID mapping job {job_id} finished successfully.", extra=logging_context())
+                return True
+
+            logger.info(msg="UniProt ID mapping job has not finished yet.", extra=logging_context())
+            return False
+
+        # If the response already contains results or failed IDs, we can consider it as finished.
+        return bool(status_response.get("results") or status_response.get("failedIds"))
+
     def check_id_mapping_results_ready(self, job_id: str) -> bool:
         """
         Checks if the ID mapping job with the given job_id has finished processing.
@@ -75,6 +116,9 @@ class UniProtIDMappingAPI:
         If the job status becomes "FINISHED" within the allowed polling attempts, the method returns True.
         Otherwise, it waits for a specified interval between each poll and returns False if the job does not finish in time.
 
+        Because this method sleeps between polls, it should not be called from the event loop of a worker. See
+        `check_id_mapping_status` for a non-blocking alternative.
+
         Args:
             job_id (str): The identifier of the ID mapping job to check.
 
@@ -92,28 +136,12 @@ class UniProtIDMappingAPI:
 
         for attempt in range(self.polling_tries):
             save_to_logging_context({"polling_attempt": attempt + 1})
-            logger.debug(msg="Polling status for Uniprot mapping job.", extra=logging_context())
-
-            resp = self.session.get(f"{self.API_URL}/idmapping/status/{job_id}")
-            resp.raise_for_status()
-            status_response = resp.json()
-
-            if "jobStatus" in status_response:
-                save_to_logging_context({"uniprot_job_status": status_response["jobStatus"]})
-
-                if status_response["jobStatus"] == "FINISHED":
-                    logger.info(msg=f"UniProt ID mapping job {job_id} finished successfully.", extra=logging_context())
-                    return True
-                else:
-                    logger.info(
-                        msg="UniProt ID mapping job has not finished successfully. Retrying after polling interval.",
-                        extra=logging_context(),
-                    )
-                    time.sleep(self.polling_interval)
-
-            # If the response already contains results or failed IDs, we can consider it as finished.
-            else:
-                return bool(status_response.get("results") or status_response.get("failedIds"))
+
+            if self.check_id_mapping_status(job_id):
+                return True
+
+            logger.info(msg="Retrying UniProt ID mapping status check after polling interval.", extra=logging_context())
+            time.sleep(self.polling_interval)
 
         logger.warning(
             msg="UniProt ID mapping job did not finish within the allowed attempts.", extra=logging_context()
@@ -212,3 +240,43 @@ class UniProtIDMappingAPI:
 
         logger.debug(msg="Returning Swiss-Prot mappings.", extra=logging_context())
         return swiss_prot_mappings
+
+
+def get_cached_uniprot_mappings(db: Session, accessions: List[str]) -> Dict[str, str]:
+    """
+    Retrieve the UniProt accessions of any sequence accessions which have previously been mapped with the UniProt ID
+    mapping API. Accessions which have not been mapped are omitted from the result.
+    """
+    cached_mappings = dict(
+        db.execute(
+            select(UniProtAccessionMapping.accession, UniProtAccessionMapping.uniprot_id).where(
+                UniProtAccessionMapping.accession.in_(set(accessions))
+            )
+        )
+        .tuples()
+        .all()
+    )
+
+    logger.debug(f"Found {len(cached_mappings)} of {len(accessions)} accessions in the UniProt mapping cache.")
+    return cached_mappings
+
+
+def cache_uniprot_mappings(db: Session, mappings: Dict[str, str]) -> None:
+    """
+    Merge a mapping of sequence accessions to UniProt accessions into the UniProt mapping cache, replacing the UniProt
+    accession of any sequence accession which is already cached. The caller is responsible for committing the session.
+    """
+    if not mappings:
+        return
+
+    statement = insert(UniProtAccessionMapping).values(
+        [{"accession": accession, "uniprot_id": uniprot_id} for accession, uniprot_id in mappings.items()]
+    )
+    db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[UniProtAccessionMapping.accession],
+            set_={"uniprot_id": statement.excluded.uniprot_id, "modification_date": date.today()},
+        )
+    )
+
+    logger.debug(f"Cached {len(mappings)} UniProt mappings.")
@@ -3,6 +3,7 @@ __all__ = [
     "acmg_classification",
     "collection",
     "clinical_control",
+    "clingen_allele_registration",
     "controlled_keyword",
     "doi_identifier",
     "ensembl_identifier",
@@ -10,10 +11,12 @@ __all__ = [
     "experiment",
     "experiment_set",
     "genome_identifier",
+    "gnomad_caid_lookup",
     "gnomad_variant",
     "legacy_keyword",
     "license",
     "mapped_variant",
+    "mapped_variant_annotation",
     "publication_identifier",
     "published_variant",
     "raw_read_identifier",
@@ -25,9 +28,13 @@ __all__ = [
     "score_calibration_publication_identifier",
     "score_calibration",
     "score_set",
+    "score_set_search_document",
+    "score_set_search_projection",
+    "statistics_snapshot",
     "target_gene",
     "target_sequence",
     "taxonomy",
+    "uniprot_accession_mapping",
     "uniprot_identifier",
     "uniprot_offset",
     "user",
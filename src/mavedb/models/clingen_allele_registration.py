@@ -0,0 +1,23 @@
+from datetime import date
+
+from sqlalchemy import Column, Date, Integer, String
+
+from mavedb.db.base import Base
+
+
+class ClinGenAlleleRegistration(Base):
+    """
+    A local record of an HGVS string which has been registered with the ClinGen Allele Registry, and the canonical
+    allele ID (CAID) the registry assigned to it. Consulted before submitting HGVS strings to the registry, so that
+    alleles shared between score sets are only ever registered once.
+    """
+
+    __tablename__ = "clingen_allele_registrations"
+
+    id = Column(Integer, primary_key=True)
+
+    hgvs = Column(String, nullable=False, unique=True, index=True)
+    clingen_allele_id = Column(String, nullable=False, index=True)
+
+    creation_date = Column(Date, nullable=False, default=date.today)
+    modification_date = Column(Date, nullable=False, default=date.today, onupdate=date.today)
@@ -0,0 +1,7 @@
+import enum
+
+
+class AnnotationType(enum.Enum):
+    pathogenicity_evidence_line = "pathogenicity-evidence-line"
+    functional_impact_statement = "functional-impact-statement"
+    functional_study_result = "functional-study-result"
@@ -0,0 +1,29 @@
+from datetime import date
+
+from sqlalchemy import Column, Date, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+
+from mavedb.db.base import Base
+
+GNOMAD_CAID_LOOKUP_UNIQUE_CONSTRAINT = "uq_gnomad_caid_lookups_caid_db_version"
+
+
+class GnomADCaidLookup(Base):
+    """
+    The result of looking up a CAID in the gnomAD table of a particular gnomAD data version. The gnomAD variant rows
+    found for the CAID are stored as a list of objects keyed by gnomAD column name; an empty list records that the CAID
+    has no gnomAD variant, so that it need not be looked up again.
+    """
+
+    __tablename__ = "gnomad_caid_lookups"
+
+    id = Column(Integer, primary_key=True)
+
+    caid = Column(String, nullable=False)
+    db_version = Column(String, nullable=False)
+    rows = Column(JSONB, nullable=False)
+
+    creation_date = Column(Date, nullable=False, default=date.today)
+    modification_date = Column(Date, nullable=False, default=date.today, onupdate=date.today)
+
+    __table_args__ = (UniqueConstraint("caid", "db_version", name=GNOMAD_CAID_LOOKUP_UNIQUE_CONSTRAINT),)
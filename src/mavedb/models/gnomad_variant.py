@@ -1,7 +1,7 @@
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, Date, Integer, Float, String
+from sqlalchemy import Column, Date, Integer, Float, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, relationship
 
 from mavedb.db.base import Base
@@ -10,6 +10,8 @@ from mavedb.models.gnomad_variant_mapped_variant import gnomad_variants_mapped_v
 if TYPE_CHECKING:
     from mavedb.models.mapped_variant import MappedVariant
 
+GNOMAD_VARIANT_UNIQUE_CONSTRAINT = "uq_gnomad_variants_db_name_db_identifier_db_version"
+
 
 class GnomADVariant(Base):
     __tablename__ = "gnomad_variants"
@@ -35,3 +37,7 @@ class GnomADVariant(Base):
         secondary=gnomad_variants_mapped_variants_association_table,
         back_populates="gnomad_variants",
     )
+
+    __table_args__ = (
+        UniqueConstraint("db_name", "db_identifier", "db_version", name=GNOMAD_VARIANT_UNIQUE_CONSTRAINT),
+    )
@@ -0,0 +1,49 @@
+from datetime import date
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Column, Date, Enum, ForeignKey, Integer, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, relationship
+
+from mavedb.db.base import Base
+from mavedb.models.enums.annotation_type import AnnotationType
+
+if TYPE_CHECKING:
+    from .mapped_variant import MappedVariant
+
+MAPPED_VARIANT_ANNOTATION_UNIQUE_CONSTRAINT = "uq_mapped_variant_annotations_mapped_variant_id_annotation_type"
+
+
+class MappedVariantAnnotation(Base):
+    """
+    A precomputed VA-Spec annotation of a mapped variant. The annotation is stored as the serialized JSON which the
+    annotated variant endpoints emit, or as null if the variant could not be annotated, so that it may be streamed
+    without being rebuilt. Rows are written by the annotation store worker job and deleted whenever the calibrations
+    they depend on change.
+    """
+
+    __tablename__ = "mapped_variant_annotations"
+
+    id = Column(Integer, primary_key=True)
+
+    mapped_variant_id = Column(
+        Integer, ForeignKey("mapped_variants.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    mapped_variant: Mapped["MappedVariant"] = relationship("MappedVariant")
+
+    annotation_type = Column(
+        Enum(
+            AnnotationType,
+            create_constraint=True,
+            length=32,
+            native_enum=False,
+            validate_strings=True,
+        ),
+        nullable=False,
+    )
+    annotation = Column(Text, nullable=True)
+
+    creation_date = Column(Date, nullable=False, default=date.today)
+
+    __table_args__ = (
+        UniqueConstraint("mapped_variant_id", "annotation_type", name=MAPPED_VARIANT_ANNOTATION_UNIQUE_CONSTRAINT),
+    )
@@ -1,13 +1,14 @@
-from sqlalchemy import select, join
-
-from mavedb.db.view import MaterializedView, view
+from sqlalchemy import Boolean, Column, Date, ForeignKey, Integer, String, select, join
 
+from mavedb.db.base import Base
 from mavedb.models.score_set import ScoreSet
 from mavedb.models.variant import Variant
 from mavedb.models.mapped_variant import MappedVariant
 
 
+# The name of the materialized view the published variants table replaced, which is referred to by its migrations.
 signature = "published_variants_materialized_view"
+# The published variants of every score set, from which the rows of the published variants table are built.
 definition = (
     select(
         Variant.id.label("variant_id"),
@@ -29,17 +30,20 @@ definition = (
 )
 
 
-class PublishedVariantsMV(MaterializedView):
-    __table__ = view(
-        signature,
-        definition,
-        materialized=True,
-    )
+class PublishedVariant(Base):
+    """
+    The variants, and mapped variants, of published score sets. Rows are replaced one score set at a time when a score
+    set is published or mapped, and are deleted along with their score set, so keeping the table current does not
+    require rescanning every variant in the database.
+    """
+
+    __tablename__ = "published_variants"
 
-    variant_id = __table__.c.variant_id
-    variant_urn = __table__.c.variant_urn
-    mapped_variant_id = __table__.c.mapped_variant_id
-    score_set_id = __table__.c.score_set_id
-    score_set_urn = __table__.c.score_set_urn
-    published_date = __table__.c.published_date
-    current_mapped_variant = __table__.c.current_mapped_variant
+    id = Column(Integer, primary_key=True)
+    variant_id = Column(Integer, nullable=False)
+    variant_urn = Column(String, nullable=True)
+    mapped_variant_id = Column(Integer, nullable=True)
+    score_set_id = Column(Integer, ForeignKey("scoresets.id", ondelete="CASCADE"), nullable=False, index=True)
+    score_set_urn = Column(String, nullable=True)
+    published_date = Column(Date, nullable=False, index=True)
+    current_mapped_variant = Column(Boolean, nullable=True)
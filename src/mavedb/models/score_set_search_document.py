@@ -0,0 +1,34 @@
+from datetime import date
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, relationship
+
+from mavedb.db.base import Base
+
+if TYPE_CHECKING:
+    from .score_set import ScoreSet
+
+
+class ScoreSetSearchDocument(Base):
+    """
+    The searchable text of a score set and its targets, publications and identifiers, maintained whenever the score set
+    is created, updated or published so that free text search need not join each of these on every query.
+
+    The text is stored both as a weighted `tsvector` for ranked full text search, and as plain text for partial matches.
+    In deployed databases, partial matches are served by a trigram index on the plain text which is created by
+    migration rather than declared here, since it depends on the pg_trgm extension.
+    """
+
+    __tablename__ = "score_set_search_documents"
+
+    score_set_id = Column(Integer, ForeignKey("scoresets.id", ondelete="CASCADE"), primary_key=True)
+    score_set: Mapped["ScoreSet"] = relationship("ScoreSet")
+
+    text = Column(Text, nullable=False)
+    document = Column(TSVECTOR, nullable=False)
+
+    modification_date = Column(Date, nullable=False, default=date.today, onupdate=date.today)
+
+    __table_args__ = (Index("ix_score_set_search_documents_document", "document", postgresql_using="gin"),)
@@ -0,0 +1,62 @@
+from datetime import date
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, relationship
+
+from mavedb.db.base import Base
+
+if TYPE_CHECKING:
+    from .score_set import ScoreSet
+
+
+class ScoreSetSearchProjection(Base):
+    """
+    A denormalized row for each published score set, holding the attributes by which published score sets are searched,
+    filtered and ordered, so that searches of published score sets need not join score sets with their experiments,
+    targets and publications.
+
+    Array columns hold one element for each target, publication or author on which a value appears, so that filter
+    options may be counted by unnesting them.
+    """
+
+    __tablename__ = "score_set_search_projections"
+
+    score_set_id = Column(Integer, ForeignKey("scoresets.id", ondelete="CASCADE"), primary_key=True)
+    score_set: Mapped["ScoreSet"] = relationship("ScoreSet")
+
+    experiment_title = Column(String, nullable=False)
+    published_date = Column(Date, nullable=False)
+
+    target_names = Column(ARRAY(String), nullable=False)
+    target_categories = Column(ARRAY(String), nullable=False)
+    target_organism_names = Column(ARRAY(String), nullable=False)
+    target_accessions = Column(ARRAY(String), nullable=False)
+    publication_identifiers = Column(ARRAY(String), nullable=False)
+    publication_db_names = Column(ARRAY(String), nullable=False)
+    publication_journals = Column(ARRAY(String), nullable=False)
+    publication_author_names = Column(ARRAY(String), nullable=False)
+    keywords = Column(ARRAY(String), nullable=False)
+
+    modification_date = Column(Date, nullable=False, default=date.today, onupdate=date.today)
+
+    __table_args__ = (
+        Index("ix_score_set_search_projections_target_names", "target_names", postgresql_using="gin"),
+        Index("ix_score_set_search_projections_target_categories", "target_categories", postgresql_using="gin"),
+        Index("ix_score_set_search_projections_target_organism_names", "target_organism_names", postgresql_using="gin"),
+        Index("ix_score_set_search_projections_target_accessions", "target_accessions", postgresql_using="gin"),
+        Index(
+            "ix_score_set_search_projections_publication_identifiers",
+            "publication_identifiers",
+            postgresql_using="gin",
+        ),
+        Index("ix_score_set_search_projections_publication_db_names", "publication_db_names", postgresql_using="gin"),
+        Index("ix_score_set_search_projections_publication_journals", "publication_journals", postgresql_using="gin"),
+        Index(
+            "ix_score_set_search_projections_publication_author_names",
+            "publication_author_names",
+            postgresql_using="gin",
+        ),
+        Index("ix_score_set_search_projections_keywords", "keywords", postgresql_using="gin"),
+    )
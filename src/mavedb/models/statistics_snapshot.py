@@ -0,0 +1,20 @@
+from sqlalchemy import JSON, Column, DateTime, String
+
+from mavedb.db.base import Base
+
+
+class StatisticsSnapshot(Base):
+    """
+    The precomputed value of a statistic on published records, identified by the key of the statistic. Snapshots are
+    refreshed together by a scheduled worker job, and each holds the entity tag of its value so that statistics routes
+    may answer conditional requests without serializing it.
+
+    Values are stored as JSON rather than JSONB so that the order of their keys is preserved.
+    """
+
+    __tablename__ = "statistics_snapshots"
+
+    key = Column(String, primary_key=True)
+    data = Column(JSON, nullable=False)
+    etag = Column(String, nullable=False)
+    refreshed_at = Column(DateTime, nullable=False)
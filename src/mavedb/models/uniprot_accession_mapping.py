@@ -0,0 +1,23 @@
+from datetime import date
+
+from sqlalchemy import Column, Date, Integer, String
+
+from mavedb.db.base import Base
+
+
+class UniProtAccessionMapping(Base):
+    """
+    A local record of a sequence accession which has been mapped to a UniProt accession with the UniProt ID mapping
+    API. Consulted before submitting ID mapping jobs, so that accessions shared between score sets are only ever mapped
+    once.
+    """
+
+    __tablename__ = "uniprot_accession_mappings"
+
+    id = Column(Integer, primary_key=True)
+
+    accession = Column(String, nullable=False, unique=True, index=True)
+    uniprot_id = Column(String, nullable=False)
+
+    creation_date = Column(Date, nullable=False, default=date.today)
+    modification_date = Column(Date, nullable=False, default=date.today, onupdate=date.today)
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 
 from mavedb import deps
 from mavedb.lib.authorization import require_current_user
+from mavedb.lib.concurrency import run_coroutine_in_thread
 from mavedb.lib.logging import LoggedRoute
 from mavedb.lib.logging.context import logging_context, save_to_logging_context
 from mavedb.lib.types.authentication import UserData
@@ -106,7 +107,7 @@ def create_my_access_key(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Create a new access key for myself with a specified role",
 )
-async def create_my_access_key_with_role(
+def create_my_access_key_with_role(
     *,
     role: UserRole,
     db: Session = Depends(deps.get_db),
@@ -131,7 +132,7 @@ async def create_my_access_key_with_role(
     private_key, public_key = generate_key_pair()
 
     item = AccessKey(user=user_data.user, key_id=secrets.token_urlsafe(32), public_key=public_key)
-    await item.set_role(db, role)
+    run_coroutine_in_thread(item.set_role, db, role)
     db.add(item)
     db.commit()
     db.refresh(item)
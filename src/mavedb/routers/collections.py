@@ -17,7 +17,7 @@ from mavedb.lib.logging.context import (
     logging_context,
     save_to_logging_context,
 )
-from mavedb.lib.permissions import Action, assert_permission, has_permission
+from mavedb.lib.permissions import Action, assert_permission, has_permission, prefetch_permission_relationships
 from mavedb.lib.types.authentication import UserData
 from mavedb.models.collection import Collection
 from mavedb.models.collection_user_association import CollectionUserAssociation
@@ -83,6 +83,7 @@ def list_my_collections(
 
         for item in collection_bundle[role.value]:
             # filter score sets and experiments based on user permissions
+            prefetch_permission_relationships(db, [*item.score_sets, *item.experiments])
             item.score_sets = [
                 score_set for score_set in item.score_sets if has_permission(user_data, score_set, Action.READ)
             ]
@@ -131,6 +132,7 @@ def fetch_collection(
 
     assert_permission(user_data, item, Action.READ)
     # filter score sets and experiments based on user permissions
+    prefetch_permission_relationships(db, [*item.score_sets, *item.experiments])
     item.score_sets = [score_set for score_set in item.score_sets if has_permission(user_data, score_set, Action.READ)]
     item.experiments = [
         experiment for experiment in item.experiments if has_permission(user_data, experiment, Action.READ)
@@ -159,7 +161,7 @@ def fetch_collection(
     response_model_exclude_none=True,
     summary="Create a collection",
 )
-async def create_collection(
+def create_collection(
     *,
     item_create: collection.CollectionCreate,
     db: Session = Depends(deps.get_db),
@@ -276,7 +278,7 @@ async def create_collection(
     response_model_exclude_none=True,
     summary="Update a collection",
 )
-async def update_collection(
+def update_collection(
     *,
     item_update: collection.CollectionModify,
     urn: str,
@@ -324,6 +326,7 @@ async def update_collection(
     save_to_logging_context({"updated_resource": item.urn})
     # filter score sets and experiments based on user permissions
     # note that this filtering occurs after saving changes to db; the filtering is only for the returned view model
+    prefetch_permission_relationships(db, [*item.score_sets, *item.experiments])
     item.score_sets = [score_set for score_set in item.score_sets if has_permission(user_data, score_set, Action.READ)]
     item.experiments = [
         experiment for experiment in item.experiments if has_permission(user_data, experiment, Action.READ)
@@ -354,7 +357,7 @@ async def update_collection(
     },
     summary="Add a score set to a collection",
 )
-async def add_score_set_to_collection(
+def add_score_set_to_collection(
     *,
     body: collection.AddScoreSetToCollectionRequest,
     collection_urn: str,
@@ -399,6 +402,7 @@ async def add_score_set_to_collection(
 
     # filter score sets and experiments based on user permissions
     # note that this filtering occurs after saving changes to db; the filtering is only for the returned view model
+    prefetch_permission_relationships(db, [*item.score_sets, *item.experiments])
     item.score_sets = [score_set for score_set in item.score_sets if has_permission(user_data, score_set, Action.READ)]
     item.experiments = [
         experiment for experiment in item.experiments if has_permission(user_data, experiment, Action.READ)
@@ -426,7 +430,7 @@ async def add_score_set_to_collection(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES, **BASE_409_RESPONSE},
     summary="Remove a score set from a collection",
 )
-async def delete_score_set_from_collection(
+def delete_score_set_from_collection(
     *,
     collection_urn: str,
     score_set_urn: str,
@@ -480,6 +484,7 @@ async def delete_score_set_from_collection(
 
     # filter score sets and experiments based on user permissions
     # note that this filtering occurs after saving changes to db; the filtering is only for the returned view model
+    prefetch_permission_relationships(db, [*item.score_sets, *item.experiments])
     item.score_sets = [score_set for score_set in item.score_sets if has_permission(user_data, score_set, Action.READ)]
     item.experiments = [
         experiment for experiment in item.experiments if has_permission(user_data, experiment, Action.READ)
@@ -507,7 +512,7 @@ async def delete_score_set_from_collection(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Add an experiment to a collection",
 )
-async def add_experiment_to_collection(
+def add_experiment_to_collection(
     *,
     body: collection.AddExperimentToCollectionRequest,
     collection_urn: str,
@@ -552,6 +557,7 @@ async def add_experiment_to_collection(
 
     # filter score sets and experiments based on user permissions
     # note that this filtering occurs after saving changes to db; the filtering is only for the returned view model
+    prefetch_permission_relationships(db, [*item.score_sets, *item.experiments])
     item.score_sets = [score_set for score_set in item.score_sets if has_permission(user_data, score_set, Action.READ)]
     item.experiments = [
         experiment for experiment in item.experiments if has_permission(user_data, experiment, Action.READ)
@@ -579,7 +585,7 @@ async def add_experiment_to_collection(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES, **BASE_409_RESPONSE},
     summary="Remove an experiment from a collection",
 )
-async def delete_experiment_from_collection(
+def delete_experiment_from_collection(
     *,
     collection_urn: str,
     experiment_urn: str,
@@ -633,6 +639,7 @@ async def delete_experiment_from_collection(
 
     # filter score sets and experiments based on user permissions
     # note that this filtering occurs after saving changes to db; the filtering is only for the returned view model
+    prefetch_permission_relationships(db, [*item.score_sets, *item.experiments])
     item.score_sets = [score_set for score_set in item.score_sets if has_permission(user_data, score_set, Action.READ)]
     item.experiments = [
         experiment for experiment in item.experiments if has_permission(user_data, experiment, Action.READ)
@@ -660,7 +667,7 @@ async def delete_experiment_from_collection(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES, **BASE_409_RESPONSE},
     summary="Add a user to a collection role",
 )
-async def add_user_to_collection_role(
+def add_user_to_collection_role(
     *,
     body: collection.AddUserToCollectionRoleRequest,
     urn: str,
@@ -730,6 +737,7 @@ async def add_user_to_collection_role(
 
     # filter score sets and experiments based on user permissions
     # note that this filtering occurs after saving changes to db; the filtering is only for the returned view model
+    prefetch_permission_relationships(db, [*item.score_sets, *item.experiments])
     item.score_sets = [score_set for score_set in item.score_sets if has_permission(user_data, score_set, Action.READ)]
     item.experiments = [
         experiment for experiment in item.experiments if has_permission(user_data, experiment, Action.READ)
@@ -747,7 +755,7 @@ async def add_user_to_collection_role(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES, **BASE_409_RESPONSE},
     summary="Remove a user from a collection role",
 )
-async def remove_user_from_collection_role(
+def remove_user_from_collection_role(
     *,
     urn: str,
     role: ContributionRole,
@@ -815,6 +823,7 @@ async def remove_user_from_collection_role(
 
     # filter score sets and experiments based on user permissions
     # note that this filtering occurs after saving changes to db; the filtering is only for the returned view model
+    prefetch_permission_relationships(db, [*item.score_sets, *item.experiments])
     item.score_sets = [score_set for score_set in item.score_sets if has_permission(user_data, score_set, Action.READ)]
     item.experiments = [
         experiment for experiment in item.experiments if has_permission(user_data, experiment, Action.READ)
@@ -831,7 +840,7 @@ async def remove_user_from_collection_role(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Delete a collection",
 )
-async def delete_collection(
+def delete_collection(
     *,
     urn: str,
     db: Session = Depends(deps.get_db),
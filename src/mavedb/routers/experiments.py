@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 from mavedb import deps
 from mavedb.lib.authentication import get_current_user
 from mavedb.lib.authorization import require_current_user, require_current_user_with_email
+from mavedb.lib.concurrency import run_coroutine_in_thread
 from mavedb.lib.contributors import find_or_create_contributor
 from mavedb.lib.exceptions import NonexistentOrcidUserError
 from mavedb.lib.experiments import enrich_experiment_with_num_score_sets
@@ -23,7 +24,7 @@ from mavedb.lib.identifiers import (
 from mavedb.lib.keywords import search_keyword
 from mavedb.lib.logging import LoggedRoute
 from mavedb.lib.logging.context import logging_context, save_to_logging_context
-from mavedb.lib.permissions import Action, assert_permission, has_permission
+from mavedb.lib.permissions import Action, assert_permission, permitted_filter
 from mavedb.lib.score_sets import find_superseded_score_set_tail
 from mavedb.lib.types.authentication import UserData
 from mavedb.lib.validation.exceptions import ValidationError
@@ -96,8 +97,8 @@ def list_experiments(
             )
         )
 
-    items = query.order_by(Experiment.urn).all()
-    return [item for item in items if has_permission(user_data, item, Action.READ).permitted]
+    query = query.filter(permitted_filter(user_data, Experiment, Action.READ))
+    return query.order_by(Experiment.urn).all()
 
 
 @router.post(
@@ -226,7 +227,7 @@ def get_experiment_score_sets(
     },
     response_model_exclude_none=True,
 )
-async def create_experiment(
+def create_experiment(
     *,
     item_create: experiment.ExperimentCreate,
     db: Session = Depends(deps.get_db),
@@ -259,7 +260,8 @@ async def create_experiment(
     contributors: list[Contributor] = []
     try:
         contributors = [
-            await find_or_create_contributor(db, contributor.orcid_id) for contributor in item_create.contributors or []
+            run_coroutine_in_thread(find_or_create_contributor, db, contributor.orcid_id)
+            for contributor in item_create.contributors or []
         ]
     except NonexistentOrcidUserError as e:
         logger.error(msg="Could not find ORCID user with the provided user ID.", extra=logging_context())
@@ -267,19 +269,23 @@ async def create_experiment(
 
     try:
         doi_identifiers = [
-            await find_or_create_doi_identifier(db, identifier.identifier)
+            run_coroutine_in_thread(find_or_create_doi_identifier, db, identifier.identifier)
             for identifier in item_create.doi_identifiers or []
         ]
         raw_read_identifiers = [
-            await find_or_create_raw_read_identifier(db, identifier.identifier)
+            run_coroutine_in_thread(find_or_create_raw_read_identifier, db, identifier.identifier)
             for identifier in item_create.raw_read_identifiers or []
         ]
         primary_publication_identifiers = [
-            await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
+            run_coroutine_in_thread(
+                find_or_create_publication_identifier, db, identifier.identifier, identifier.db_name
+            )
             for identifier in item_create.primary_publication_identifiers or []
         ]
         publication_identifiers = [
-            await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
+            run_coroutine_in_thread(
+                find_or_create_publication_identifier, db, identifier.identifier, identifier.db_name
+            )
             for identifier in item_create.secondary_publication_identifiers or []
         ] + primary_publication_identifiers
 
@@ -369,7 +375,7 @@ async def create_experiment(
     },
     response_model_exclude_none=True,
 )
-async def update_experiment(
+def update_experiment(
     *,
     item_update: experiment.ExperimentUpdate,
     urn: str,
@@ -410,7 +416,8 @@ async def update_experiment(
 
     try:
         item.contributors = [
-            await find_or_create_contributor(db, contributor.orcid_id) for contributor in item_update.contributors or []
+            run_coroutine_in_thread(find_or_create_contributor, db, contributor.orcid_id)
+            for contributor in item_update.contributors or []
         ]
     except NonexistentOrcidUserError as e:
         logger.error(msg="Could not find ORCID user with the provided user ID.", extra=logging_context())
@@ -418,20 +425,24 @@ async def update_experiment(
 
     try:
         doi_identifiers = [
-            await find_or_create_doi_identifier(db, identifier.identifier)
+            run_coroutine_in_thread(find_or_create_doi_identifier, db, identifier.identifier)
             for identifier in item_update.doi_identifiers or []
         ]
         raw_read_identifiers = [
-            await find_or_create_raw_read_identifier(db, identifier.identifier)
+            run_coroutine_in_thread(find_or_create_raw_read_identifier, db, identifier.identifier)
             for identifier in item_update.raw_read_identifiers or []
         ]
 
         primary_publication_identifiers = [
-            await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
+            run_coroutine_in_thread(
+                find_or_create_publication_identifier, db, identifier.identifier, identifier.db_name
+            )
             for identifier in item_update.primary_publication_identifiers or []
         ]
         publication_identifiers = [
-            await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
+            run_coroutine_in_thread(
+                find_or_create_publication_identifier, db, identifier.identifier, identifier.db_name
+            )
             for identifier in item_update.secondary_publication_identifiers or []
         ] + primary_publication_identifiers
 
@@ -499,7 +510,7 @@ async def update_experiment(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Delete an experiment",
 )
-async def delete_experiment(
+def delete_experiment(
     *,
     urn: str,
     db: Session = Depends(deps.get_db),
@@ -3,12 +3,16 @@ from typing import Any
 
 import hgvs.dataproviders.uta
 from cdot.hgvs.dataproviders import RESTDataProvider
-from fastapi import APIRouter, Depends, HTTPException
-from hgvs import parser, validator
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from hgvs import validator
 from hgvs.exceptions import HGVSDataNotAvailableError, HGVSInvalidVariantError
 
 from mavedb.deps import hgvs_data_provider
-from mavedb.routers.shared import BASE_400_RESPONSE, PUBLIC_ERROR_RESPONSES, ROUTER_BASE_PREFIX
+from mavedb.lib.hgvs_validation import HGVS_VALIDATION_BATCH_LIMIT, shared_hgvs_parser, validate_hgvs_variants
+from mavedb.lib.logging.context import save_to_logging_context
+from mavedb.routers.shared import BASE_400_RESPONSE, BASE_422_RESPONSE, PUBLIC_ERROR_RESPONSES, ROUTER_BASE_PREFIX
+from mavedb.view_models.hgvs import HgvsBatchValidationRequest, HgvsValidationResult
 
 TAG_NAME = "Transcripts"
 
@@ -51,8 +55,7 @@ def hgvs_validate(variant: dict[str, str], hdp: RESTDataProvider = Depends(hgvs_
     """
     Validate the provided HGVS variant string.
     """
-    hp = parser.Parser()
-    variant_hgvs = hp.parse(variant["variant"])
+    variant_hgvs = shared_hgvs_parser().parse(variant["variant"])
 
     try:
         valid = validator.Validator(hdp=hdp).validate(variant_hgvs, strict=False)
@@ -62,6 +65,45 @@ def hgvs_validate(variant: dict[str, str], hdp: RESTDataProvider = Depends(hgvs_
         return valid
 
 
+@router.post(
+    "/validate/batch",
+    status_code=200,
+    response_model=list[HgvsValidationResult],
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "Validation results, in the order the variants were provided.",
+        },
+        **BASE_422_RESPONSE,
+    },
+    summary="Validate a batch of variants",
+)
+def hgvs_validate_batch(
+    batch: HgvsBatchValidationRequest,
+    stream: bool = Query(False, description="Stream results as newline-delimited JSON as they become available."),
+    hdp: RESTDataProvider = Depends(hgvs_data_provider),
+) -> Any:
+    """
+    Validate many HGVS variant strings in one request. Variants are validated concurrently, and a result is returned
+    for each variant in the order the variants were provided. Variants which cannot be parsed or are invalid are
+    reported in their results rather than failing the request.
+    """
+    save_to_logging_context({"hgvs_batch_size": len(batch.variants)})
+
+    if len(batch.variants) > HGVS_VALIDATION_BATCH_LIMIT:
+        raise HTTPException(
+            422, f"At most {HGVS_VALIDATION_BATCH_LIMIT} variants may be validated at once; got {len(batch.variants)}."
+        )
+
+    results = validate_hgvs_variants(batch.variants, hdp)
+    if stream:
+        return StreamingResponse(
+            (result.model_dump_json().encode() + b"\n" for result in results), media_type="application/x-ndjson"
+        )
+
+    return list(results)
+
+
 @router.get("/assemblies", status_code=200, response_model=list[str], summary="List stored assemblies")
 def list_assemblies(hdp: RESTDataProvider = Depends(hgvs_data_provider)) -> list[str]:
     """
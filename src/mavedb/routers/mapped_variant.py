@@ -8,7 +8,7 @@ from ga4gh.va_spec.acmg_2015 import VariantPathogenicityEvidenceLine
 from ga4gh.va_spec.base.core import ExperimentalVariantFunctionalImpactStudyResult, Statement
 from sqlalchemy import or_, select
 from sqlalchemy.exc import MultipleResultsFound
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from mavedb import deps
 from mavedb.lib.annotation.annotate import (
@@ -23,9 +23,10 @@ from mavedb.lib.logging.context import (
     logging_context,
     save_to_logging_context,
 )
-from mavedb.lib.permissions import Action, assert_permission, has_permission
+from mavedb.lib.permissions import Action, assert_permission, permitted_filter
 from mavedb.lib.types.authentication import UserData
 from mavedb.models.mapped_variant import MappedVariant
+from mavedb.models.score_set import ScoreSet
 from mavedb.models.variant import Variant
 from mavedb.routers.shared import ACCESS_CONTROL_ERROR_RESPONSES, PUBLIC_ERROR_RESPONSES, ROUTER_BASE_PREFIX
 from mavedb.view_models import mapped_variant
@@ -35,7 +36,7 @@ TAG_NAME = "Mapped Variants"
 logger = logging.getLogger(__name__)
 
 
-async def fetch_mapped_variant_by_variant_urn(db: Session, user: Optional[UserData], urn: str) -> MappedVariant:
+def fetch_mapped_variant_by_variant_urn(db: Session, user: Optional[UserData], urn: str) -> MappedVariant:
     """
     We may combine this function back to show_mapped_variant if none of any new function call it.
     Fetch one mapped variant by variant URN.
@@ -90,7 +91,7 @@ metadata = {
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Fetch mapped variant by URN",
 )
-async def show_mapped_variant(
+def show_mapped_variant(
     *, urn: str, db: Session = Depends(deps.get_db), user: Optional[UserData] = Depends(get_current_user)
 ) -> Any:
     """
@@ -98,7 +99,7 @@ async def show_mapped_variant(
     """
     save_to_logging_context({"requested_resource": urn})
 
-    return await fetch_mapped_variant_by_variant_urn(db, user, urn)
+    return fetch_mapped_variant_by_variant_urn(db, user, urn)
 
 
 @router.get(
@@ -108,7 +109,7 @@ async def show_mapped_variant(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Construct a VA-Spec StudyResult from a mapped variant",
 )
-async def show_mapped_variant_study_result(
+def show_mapped_variant_study_result(
     *, urn: str, db: Session = Depends(deps.get_db), user: Optional[UserData] = Depends(get_current_user)
 ) -> ExperimentalVariantFunctionalImpactStudyResult:
     """
@@ -116,7 +117,7 @@ async def show_mapped_variant_study_result(
     """
     save_to_logging_context({"requested_resource": urn})
 
-    mapped_variant = await fetch_mapped_variant_by_variant_urn(db, user, urn)
+    mapped_variant = fetch_mapped_variant_by_variant_urn(db, user, urn)
 
     try:
         return variant_study_result(mapped_variant)
@@ -136,7 +137,7 @@ async def show_mapped_variant_study_result(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Construct a VA-Spec Statement from a mapped variant",
 )
-async def show_mapped_variant_functional_impact_statement(
+def show_mapped_variant_functional_impact_statement(
     *, urn: str, db: Session = Depends(deps.get_db), user: Optional[UserData] = Depends(get_current_user)
 ) -> Statement:
     """
@@ -144,7 +145,7 @@ async def show_mapped_variant_functional_impact_statement(
     """
     save_to_logging_context({"requested_resource": urn})
 
-    mapped_variant = await fetch_mapped_variant_by_variant_urn(db, user, urn)
+    mapped_variant = fetch_mapped_variant_by_variant_urn(db, user, urn)
 
     try:
         functional_impact = variant_functional_impact_statement(mapped_variant)
@@ -178,7 +179,7 @@ async def show_mapped_variant_functional_impact_statement(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Construct a VA-Spec EvidenceLine from a mapped variant",
 )
-async def show_mapped_variant_acmg_evidence_line(
+def show_mapped_variant_acmg_evidence_line(
     *, urn: str, db: Session = Depends(deps.get_db), user: Optional[UserData] = Depends(get_current_user)
 ) -> VariantPathogenicityEvidenceLine:
     """
@@ -186,7 +187,7 @@ async def show_mapped_variant_acmg_evidence_line(
     """
     save_to_logging_context({"requested_resource": urn})
 
-    mapped_variant = await fetch_mapped_variant_by_variant_urn(db, user, urn)
+    mapped_variant = fetch_mapped_variant_by_variant_urn(db, user, urn)
 
     try:
         pathogenicity_evidence = variant_pathogenicity_evidence(mapped_variant)
@@ -219,7 +220,7 @@ async def show_mapped_variant_acmg_evidence_line(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Fetch mapped variants by VRS identifier",
 )
-async def show_mapped_variants_by_identifier(
+def show_mapped_variants_by_identifier(
     *,
     identifier: Annotated[
         str,
@@ -236,20 +237,28 @@ async def show_mapped_variants_by_identifier(
     """
     Fetch a single mapped variant by GA4GH identifier.
     """
-    query = select(MappedVariant).where(
-        or_(MappedVariant.pre_mapped["id"].astext == identifier, MappedVariant.post_mapped["id"].astext == identifier)
+    query = (
+        select(MappedVariant)
+        .join(MappedVariant.variant)
+        .join(Variant.score_set)
+        .options(contains_eager(MappedVariant.variant).contains_eager(Variant.score_set))
+        .where(
+            or_(
+                MappedVariant.pre_mapped["id"].astext == identifier,
+                MappedVariant.post_mapped["id"].astext == identifier,
+            )
+        )
+        .where(permitted_filter(user, ScoreSet, Action.READ))
     )
 
     if only_current:
         query = query.where(MappedVariant.current.is_(True))
 
-    items = db.scalars(query).all()
-
-    permitted_items = [item for item in items if has_permission(user, item.variant.score_set, Action.READ).permitted]
+    permitted_items = db.scalars(query).all()
     if not permitted_items:
         raise HTTPException(status_code=404, detail=f"No mapped variants with identifier {identifier} were found")
 
-    return permitted_items
+    return list(permitted_items)
 
 
 # for testing only
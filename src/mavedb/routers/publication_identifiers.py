@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from starlette.convertors import Convertor, register_url_convertor
 
 from mavedb import deps
+from mavedb.lib.concurrency import run_coroutine_in_thread
 from mavedb.lib.identifiers import find_generic_article
 from mavedb.lib.validation.constants.publication import valid_dbnames
 from mavedb.models.publication_identifier import PublicationIdentifier
@@ -247,7 +248,7 @@ def search_publication_identifiers(search: TextSearch, db: Session = Depends(dep
     response_model=publication_identifier.PublicationIdentifier,
     summary="Search publication identifiers by their identifier",
 )
-async def search_publications_by_identifier(*, identifier: str, db: Session = Depends(deps.get_db)) -> Any:
+def search_publications_by_identifier(*, identifier: str, db: Session = Depends(deps.get_db)) -> Any:
     """
     Search saved publication identifiers via their identifier.
     """
@@ -264,7 +265,7 @@ async def search_publications_by_identifier(*, identifier: str, db: Session = De
     response_model=list[publication_identifier.PublicationIdentifier],
     summary="Search publication identifiers by their identifier and database",
 )
-async def search_publications_by_identifier_and_db(
+def search_publications_by_identifier_and_db(
     *,
     identifier: str,
     db_name: str,
@@ -297,7 +298,7 @@ async def search_publications_by_identifier_and_db(
     },
     summary="Search external publication identifiers",
 )
-async def search_external_publication_identifiers(search: TextSearch, db: Session = Depends(deps.get_db)) -> Any:
+def search_external_publication_identifiers(search: TextSearch, db: Session = Depends(deps.get_db)) -> Any:
     """
     Search external publication identifiers via a TextSearch query. The provided text is searched against multiple external publication databases,
     and should be a valid identifier in at least one of those databases.
@@ -305,7 +306,7 @@ async def search_external_publication_identifiers(search: TextSearch, db: Sessio
 
     if search.text and len(search.text.strip()) > 0:
         lower_search_text = search.text.strip().lower()
-        items = await find_generic_article(db, lower_search_text)
+        items = run_coroutine_in_thread(find_generic_article, db, lower_search_text)
     else:
         raise HTTPException(status_code=400, detail="Search text is required")
 
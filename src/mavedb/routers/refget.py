@@ -12,13 +12,20 @@ from typing import Optional, Union
 
 from biocommons.seqrepo import SeqRepo
 from biocommons.seqrepo import __version__ as seqrepo_dep_version
-from fastapi import APIRouter, Depends, Header, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 
 from mavedb import __version__, deps
 from mavedb.lib.logging import LoggedRoute
 from mavedb.lib.logging.context import logging_context, save_to_logging_context
-from mavedb.lib.seqrepo import base64url_to_hex, get_sequence_ids, sequence_generator
+from mavedb.lib.seqrepo import (
+    base64url_to_hex,
+    get_sequence_aliases,
+    get_sequence_ids,
+    get_sequence_info,
+    sequence_etag,
+    sequence_generator,
+)
 from mavedb.routers.shared import (
     BASE_400_RESPONSE,
     BASE_416_RESPONSE,
@@ -28,7 +35,9 @@ from mavedb.routers.shared import (
 )
 from mavedb.view_models.refget import RefgetMetadataResponse, RefgetServiceInfo
 
-RANGE_HEADER_REGEX = r"^bytes=(\d+)-(\d+)$"
+RANGE_HEADER_REGEX = r"^bytes=(\d+)?-(\d+)?$"
+# Sequences are immutable, so responses may be cached indefinitely.
+SEQUENCE_CACHE_CONTROL = "public, max-age=31536000, immutable"
 TAG_NAME = "Refget"
 
 logger = logging.getLogger(__name__)
@@ -92,8 +101,8 @@ def get_metadata(alias: str, sr: SeqRepo = Depends(deps.get_seqrepo)) -> dict[st
         )
 
     seq_id = seq_ids[0]
-    seqinfo = sr.sequences.fetch_seqinfo(seq_id)
-    aliases = list(sr.aliases.find_aliases(seq_id=seq_id))  # store generator as list so it can be reused
+    seqinfo = get_sequence_info(sr, seq_id)
+    aliases = get_sequence_aliases(sr, seq_id)
 
     md5_rec = [a for a in aliases if a["namespace"] == "MD5"]
     md5_id = md5_rec[0]["alias"] if md5_rec else None
@@ -112,31 +121,40 @@ def get_metadata(alias: str, sr: SeqRepo = Depends(deps.get_seqrepo)) -> dict[st
     }
 
 
-@router.get(
+@router.api_route(
     "/sequence/{alias}",
+    methods=["GET", "HEAD"],
     summary="Get Refget sequence",
     responses={
         200: {"description": "OK: Full sequence returned", "content": {"text/plain": {}}},
         206: {"description": "Partial Content: Partial sequence returned", "content": {"text/plain": {}}},
+        304: {"description": "Not Modified: The sequence matches the entity tag in If-None-Match"},
         **BASE_400_RESPONSE,
         **BASE_416_RESPONSE,
         **BASE_501_RESPONSE,
     },
 )
 def get_sequence(
+    request: Request,
     alias: str,
     range_header: Optional[str] = Header(
         None,
         alias="Range",
         description="Specify a substring as a single HTTP Range. One byte range is permitted, "
-        "and is 0-based inclusive. For example, 'Range: bytes=0-9' corresponds to '?start=0&end=10'.",
+        "and is 0-based inclusive. For example, 'Range: bytes=0-9' corresponds to '?start=0&end=10'. "
+        "Open ended ('bytes=10-') and suffix ('bytes=-10') ranges are also accepted.",
     ),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    if_range: Optional[str] = Header(None, alias="If-Range"),
     start: Optional[int] = Query(None, description="Request a subsequence of the data (0-based)."),
     end: Optional[int] = Query(None, description="Request a subsequence of the data by specifying the end."),
     sr: SeqRepo = Depends(deps.get_seqrepo),
-) -> StreamingResponse:
+) -> Response:
     """
     Get a Refget sequence by alias.
+
+    Sequences are addressed by their digest and never change, so responses carry a strong entity tag derived from the
+    digest and may be cached indefinitely.
     """
     save_to_logging_context(
         {
@@ -152,13 +170,18 @@ def get_sequence(
         )
         raise HTTPException(status_code=400, detail="Cannot use both start/end query parameters and Range header")
 
+    suffix_length = None
     if range_header:
         m = re.match(RANGE_HEADER_REGEX, range_header)
-        if not m:
+        if not m or (m.group(1) is None and m.group(2) is None):
             logger.error(msg="Invalid range header format", extra=logging_context())
             raise HTTPException(status_code=400, detail="Invalid range header format")
 
-        start, end = int(m.group(1)), int(m.group(2)) + 1
+        if m.group(1) is None:
+            suffix_length = int(m.group(2))
+        else:
+            start = int(m.group(1))
+            end = int(m.group(2)) + 1 if m.group(2) is not None else None
 
     save_to_logging_context({"requested_refget_start": start, "requested_refget_end": end})
     if start is not None and end is not None:
@@ -183,37 +206,56 @@ def get_sequence(
         )
 
     seq_id = seq_ids[0]
-    seqinfo = sr.sequences.fetch_seqinfo(seq_id)
+    seqinfo = get_sequence_info(sr, seq_id)
+    etag = sequence_etag(seq_id)
+    headers = {"ETag": etag, "Cache-Control": SEQUENCE_CACHE_CONTROL, "Accept-Ranges": "bytes"}
 
-    if start is not None and end is not None:
-        if start >= seqinfo["len"]:
-            raise HTTPException(
-                status_code=416,
-                detail="Invalid coordinates: start > sequence length",
-                headers={"Content-Range": f"bytes */{seqinfo['len']}"},
-            )
-        if end > seqinfo["len"]:
-            raise HTTPException(
-                status_code=416,
-                detail="Invalid coordinates: end > sequence length",
-                headers={"Content-Range": f"bytes */{seqinfo['len']}"},
-            )
-        if not (0 <= start <= end <= seqinfo["len"]):
-            raise HTTPException(
-                status_code=416,
-                detail="Invalid coordinates: must obey 0 <= start <= end <= sequence_length",
-                headers={"Content-Range": f"bytes */{seqinfo['len']}"},
-            )
+    if if_none_match and etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    # A range is only honored if the client's copy, identified by If-Range, is still current. Strong comparison is
+    # required here, so weak tags never match.
+    if range_header and if_range is not None and if_range.strip() != etag:
+        range_header, start, end, suffix_length = None, None, None, None
+
+    if suffix_length is not None:
+        start, end = max(seqinfo["len"] - suffix_length, 0), seqinfo["len"]
+    elif range_header and end is None:
+        end = seqinfo["len"]
 
-    headers = {"Content-Length": str(seqinfo["len"])}
-    if start is not None and end is not None and range_header:
+    # Validate the resolved range, so that requests giving only a start or only an end are checked as well.
+    seq_start = start if start is not None else 0
+    seq_end = end if end is not None else seqinfo["len"]
+    if start is not None and seq_start >= seqinfo["len"]:
+        raise HTTPException(
+            status_code=416,
+            detail="Invalid coordinates: start > sequence length",
+            headers={"Content-Range": f"bytes */{seqinfo['len']}"},
+        )
+    if seq_end > seqinfo["len"]:
+        raise HTTPException(
+            status_code=416,
+            detail="Invalid coordinates: end > sequence length",
+            headers={"Content-Range": f"bytes */{seqinfo['len']}"},
+        )
+    if not (0 <= seq_start <= seq_end <= seqinfo["len"]):
+        raise HTTPException(
+            status_code=416,
+            detail="Invalid coordinates: must obey 0 <= start <= end <= sequence_length",
+            headers={"Content-Range": f"bytes */{seqinfo['len']}"},
+        )
+
+    headers["Content-Length"] = str(seq_end - seq_start)
+
+    if range_header:
         status = 206
-        headers["Content-Range"] = f"bytes {start}-{end - 1}/{seqinfo['len']}"
-        headers["Accept-Ranges"] = "bytes"
+        headers["Content-Range"] = f"bytes {seq_start}-{seq_end - 1}/{seqinfo['len']}"
     else:
         status = 200
-        headers["Accept-Ranges"] = "none"
+
+    if request.method == "HEAD":
+        return Response(status_code=status, headers=headers, media_type="text/plain")
 
     return StreamingResponse(
-        sequence_generator(sr, seq_ids[0], start, end), media_type="text/plain", status_code=status, headers=headers
+        sequence_generator(sr, seq_id, seq_start, seq_end), media_type="text/plain", status_code=status, headers=headers
     )
@@ -1,15 +1,19 @@
 import logging
 from typing import Optional
 
+from arq import ArqRedis
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from sqlalchemy.orm import Session, selectinload
 
 from mavedb import deps
+from mavedb.lib.annotation.store import enqueue_annotation_store_population
 from mavedb.lib.authentication import get_current_user
 from mavedb.lib.authorization import require_current_user
+from mavedb.lib.concurrency import run_coroutine_in_thread, run_on_event_loop
 from mavedb.lib.flexible_model_loader import json_or_form_loader
 from mavedb.lib.logging import LoggedRoute
 from mavedb.lib.logging.context import (
+    correlation_id_for_context,
     logging_context,
     save_to_logging_context,
 )
@@ -88,7 +92,7 @@ def get_score_calibration(
     response_model=list[score_calibration.ScoreCalibrationWithScoreSetUrn],
     responses={404: {}},
 )
-async def get_score_calibrations_for_score_set(
+def get_score_calibrations_for_score_set(
     *,
     score_set_urn: str,
     db: Session = Depends(deps.get_db),
@@ -128,7 +132,7 @@ async def get_score_calibrations_for_score_set(
     response_model=score_calibration.ScoreCalibrationWithScoreSetUrn,
     responses={404: {}},
 )
-async def get_primary_score_calibrations_for_score_set(
+def get_primary_score_calibrations_for_score_set(
     *,
     score_set_urn: str,
     db: Session = Depends(deps.get_db),
@@ -209,7 +213,7 @@ async def get_primary_score_calibrations_for_score_set(
         }
     },
 )
-async def create_score_calibration_route(
+def create_score_calibration_route(
     *,
     calibration: score_calibration.ScoreCalibrationCreate = Depends(calibration_create_loader),
     classes_file: Optional[UploadFile] = File(
@@ -218,6 +222,7 @@ async def create_score_calibration_route(
     ),
     db: Session = Depends(deps.get_db),
     user_data: UserData = Depends(require_current_user),
+    worker: ArqRedis = Depends(deps.get_worker),
 ) -> ScoreCalibration:
     """
     Create a new score calibration.
@@ -315,13 +320,21 @@ async def create_score_calibration_route(
                 detail=[{"loc": [e.custom_loc or "classesFile"], "msg": str(e), "type": "value_error"}],
             )
 
-    created_calibration = await create_score_calibration_in_score_set(
-        db, calibration, user_data.user, variant_classes if classes_file else None
+    created_calibration = run_coroutine_in_thread(
+        create_score_calibration_in_score_set,
+        db,
+        calibration,
+        user_data.user,
+        variant_classes if classes_file else None,
     )
 
     db.commit()
     db.refresh(created_calibration)
 
+    run_on_event_loop(
+        enqueue_annotation_store_population, worker, created_calibration.score_set_id, correlation_id_for_context()
+    )
+
     return created_calibration
 
 
@@ -357,7 +370,7 @@ async def create_score_calibration_route(
         }
     },
 )
-async def modify_score_calibration_route(
+def modify_score_calibration_route(
     *,
     urn: str,
     calibration_update: score_calibration.ScoreCalibrationModify = Depends(calibration_modify_loader),
@@ -367,6 +380,7 @@ async def modify_score_calibration_route(
     ),
     db: Session = Depends(deps.get_db),
     user_data: UserData = Depends(require_current_user),
+    worker: ArqRedis = Depends(deps.get_worker),
 ) -> ScoreCalibration:
     """
     Modify an existing score calibration by its URN.
@@ -484,13 +498,22 @@ async def modify_score_calibration_route(
                 detail=[{"loc": [e.custom_loc or "classesFile"], "msg": str(e), "type": "value_error"}],
             )
 
-    updated_calibration = await modify_score_calibration(
-        db, item, calibration_update, user_data.user, variant_classes if classes_file else None
+    updated_calibration = run_coroutine_in_thread(
+        modify_score_calibration,
+        db,
+        item,
+        calibration_update,
+        user_data.user,
+        variant_classes if classes_file else None,
     )
 
     db.commit()
     db.refresh(updated_calibration)
 
+    run_on_event_loop(
+        enqueue_annotation_store_population, worker, updated_calibration.score_set_id, correlation_id_for_context()
+    )
+
     return updated_calibration
 
 
@@ -500,7 +523,7 @@ async def modify_score_calibration_route(
     responses={404: {}},
     status_code=204,
 )
-async def delete_score_calibration_route(
+def delete_score_calibration_route(
     *,
     urn: str,
     db: Session = Depends(deps.get_db),
@@ -534,7 +557,7 @@ async def delete_score_calibration_route(
     response_model=score_calibration.ScoreCalibrationWithScoreSetUrn,
     responses={404: {}},
 )
-async def promote_score_calibration_to_primary_route(
+def promote_score_calibration_to_primary_route(
     *,
     urn: str,
     demote_existing_primary: bool = Query(
@@ -542,6 +565,7 @@ async def promote_score_calibration_to_primary_route(
     ),
     db: Session = Depends(deps.get_db),
     user_data: UserData = Depends(require_current_user),
+    worker: ArqRedis = Depends(deps.get_worker),
 ) -> ScoreCalibration:
     """
     Promote a score calibration to be the primary calibration for its associated score set.
@@ -595,6 +619,10 @@ async def promote_score_calibration_to_primary_route(
     db.commit()
     db.refresh(promoted_calibration)
 
+    run_on_event_loop(
+        enqueue_annotation_store_population, worker, promoted_calibration.score_set_id, correlation_id_for_context()
+    )
+
     return promoted_calibration
 
 
@@ -608,6 +636,7 @@ def demote_score_calibration_from_primary_route(
     urn: str,
     db: Session = Depends(deps.get_db),
     user_data: UserData = Depends(require_current_user),
+    worker: ArqRedis = Depends(deps.get_worker),
 ) -> ScoreCalibration:
     """
     Demote a score calibration from being the primary calibration for its associated score set.
@@ -634,6 +663,10 @@ def demote_score_calibration_from_primary_route(
     db.commit()
     db.refresh(demoted_calibration)
 
+    run_on_event_loop(
+        enqueue_annotation_store_population, worker, demoted_calibration.score_set_id, correlation_id_for_context()
+    )
+
     return demoted_calibration
 
 
@@ -647,6 +680,7 @@ def publish_score_calibration_route(
     urn: str,
     db: Session = Depends(deps.get_db),
     user_data: UserData = Depends(require_current_user),
+    worker: ArqRedis = Depends(deps.get_worker),
 ) -> ScoreCalibration:
     """
     Publish a score calibration, making it publicly visible.
@@ -683,4 +717,6 @@ def publish_score_calibration_route(
     db.commit()
     db.refresh(item)
 
+    run_on_event_loop(enqueue_annotation_store_population, worker, item.score_set_id, correlation_id_for_context())
+
     return item
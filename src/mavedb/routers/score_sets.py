@@ -2,7 +2,7 @@ import json
 import logging
 import time
 from datetime import date, datetime
-from typing import Any, List, Literal, Optional, Sequence, TypedDict, Union
+from typing import Any, Iterable, Iterator, List, Literal, Optional, Sequence, TypedDict, Union
 
 import numpy as np
 import pandas as pd
@@ -11,29 +11,34 @@ from arq import ArqRedis
 from fastapi import APIRouter, Depends, File, Query, Request, UploadFile
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import HTTPException, RequestValidationError
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from ga4gh.va_spec.acmg_2015 import VariantPathogenicityEvidenceLine
 from ga4gh.va_spec.base.core import ExperimentalVariantFunctionalImpactStudyResult, Statement
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy import or_, select
 from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.orm import Session, contains_eager
 
 from mavedb import deps
-from mavedb.lib.annotation.annotate import (
-    variant_functional_impact_statement,
-    variant_pathogenicity_evidence,
-    variant_study_result,
+from mavedb.lib.annotation.context import AnnotationContext
+from mavedb.lib.annotation.executor import annotate_batches_in_pool, annotation_process_pool
+from mavedb.lib.annotation.store import (
+    annotation_ndjson_line,
+    count_stored_annotations,
+    enqueue_annotation_store_population,
+    generate_serialized_annotations,
+    invalidate_annotation_store,
+    stored_annotation_batches,
 )
-from mavedb.lib.annotation.exceptions import MappingDataDoesntExistException
 from mavedb.lib.authorization import (
     get_current_user,
     require_current_user,
     require_current_user_with_email,
 )
+from mavedb.lib.concurrency import run_coroutine_in_thread, run_on_event_loop
 from mavedb.lib.contributors import find_or_create_contributor
 from mavedb.lib.exceptions import MixedTargetError, NonexistentOrcidUserError
-from mavedb.lib.experiments import enrich_experiment_with_num_score_sets
+from mavedb.lib.experiments import enrich_experiment_with_num_score_sets, enrich_experiments_with_num_score_sets
 from mavedb.lib.identifiers import (
     create_external_gene_identifier_offset,
     find_or_create_doi_identifier,
@@ -45,10 +50,14 @@ from mavedb.lib.logging.context import (
     logging_context,
     save_to_logging_context,
 )
-from mavedb.lib.permissions import Action, assert_permission, has_permission
+from mavedb.lib.permissions import Action, assert_permission, has_permission, permitted_filter
+from mavedb.lib.published_variants import enqueue_published_variants_refresh
 from mavedb.lib.score_calibrations import create_score_calibration
+from mavedb.lib.score_set_search import refresh_score_set_search_document, refresh_score_set_search_projection
 from mavedb.lib.score_sets import (
+    count_current_mapped_variants,
     csv_data_to_df,
+    current_mapped_variant_batches,
     fetch_score_set_search_filter_options,
     find_meta_analyses_for_experiment_sets,
     get_score_set_variants_as_csv,
@@ -59,6 +68,7 @@ from mavedb.lib.score_sets import (
     search_score_sets as _search_score_sets,
 )
 from mavedb.lib.target_genes import find_or_create_target_gene_by_accession, find_or_create_target_gene_by_sequence
+from mavedb.lib.serialization import adapted_to_json_bytes
 from mavedb.lib.taxonomies import find_or_create_taxonomy
 from mavedb.lib.types.authentication import UserData
 from mavedb.lib.urns import (
@@ -68,6 +78,7 @@ from mavedb.lib.urns import (
 )
 from mavedb.models.clinical_control import ClinicalControl
 from mavedb.models.contributor import Contributor
+from mavedb.models.enums.annotation_type import AnnotationType
 from mavedb.models.enums.processing_state import ProcessingState
 from mavedb.models.experiment import Experiment
 from mavedb.models.gnomad_variant import GnomADVariant
@@ -100,9 +111,10 @@ logger = logging.getLogger(__name__)
 
 SCORE_SET_SEARCH_MAX_LIMIT = 100
 SCORE_SET_SEARCH_MAX_PUBLICATION_IDENTIFIERS = 40
+MAPPED_VARIANT_LIST_ADAPTER = TypeAdapter(list[mapped_variant.MappedVariant])
 
 
-async def enqueue_variant_creation(
+def enqueue_variant_creation(
     *,
     item: ScoreSet,
     user_data: UserData,
@@ -138,7 +150,8 @@ async def enqueue_variant_creation(
 
     # Await the insertion of this job into the worker queue, not the job itself.
     # Uses provided score and counts dataframes and metadata files, or falls back to existing data on the score set if not provided.
-    job = await worker.enqueue_job(
+    job = run_on_event_loop(
+        worker.enqueue_job,
         "create_variants_for_score_set",
         correlation_id_for_context(),
         item.id,
@@ -162,7 +175,7 @@ class ScoreSetUpdateResult(TypedDict):
     should_create_variants: bool
 
 
-async def score_set_update(
+def score_set_update(
     *,
     db: Session,
     urn: str,
@@ -222,7 +235,8 @@ async def score_set_update(
             DoiIdentifierCreate(**identifier) for identifier in item_update_dict.get("doi_identifiers") or []
         ]
         item.doi_identifiers = [
-            await find_or_create_doi_identifier(db, identifier.identifier) for identifier in doi_identifiers_list
+            run_coroutine_in_thread(find_or_create_doi_identifier, db, identifier.identifier)
+            for identifier in doi_identifiers_list
         ]
 
     if any(key in item_update_dict for key in ["primary_publication_identifiers", "secondary_publication_identifiers"]):
@@ -233,7 +247,9 @@ async def score_set_update(
             ]
             try:
                 primary_publication_identifiers = [
-                    await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
+                    run_coroutine_in_thread(
+                        find_or_create_publication_identifier, db, identifier.identifier, identifier.db_name
+                    )
                     for identifier in primary_publication_identifiers_list
                 ]
             except requests.exceptions.ConnectTimeout:
@@ -262,7 +278,9 @@ async def score_set_update(
             ]
             try:
                 secondary_publication_identifiers = [
-                    await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
+                    run_coroutine_in_thread(
+                        find_or_create_publication_identifier, db, identifier.identifier, identifier.db_name
+                    )
                     for identifier in secondary_publication_identifiers_list
                 ]
             except requests.exceptions.ConnectTimeout:
@@ -303,7 +321,8 @@ async def score_set_update(
                 ContributorCreate(**contributor) for contributor in item_update_dict.get("contributors") or []
             ]
             item.contributors = [
-                await find_or_create_contributor(db, contributor.orcid_id) for contributor in contributors
+                run_coroutine_in_thread(find_or_create_contributor, db, contributor.orcid_id)
+                for contributor in contributors
             ]
         except NonexistentOrcidUserError as e:
             logger.error(msg="Could not find ORCID user with the provided user ID.", extra=logging_context())
@@ -334,7 +353,7 @@ async def score_set_update(
 
                     upload_taxonomy = gene.target_sequence.taxonomy
                     save_to_logging_context({"requested_taxonomy": gene.target_sequence.taxonomy.code})
-                    taxonomy = await find_or_create_taxonomy(db, upload_taxonomy)
+                    taxonomy = run_coroutine_in_thread(find_or_create_taxonomy, db, upload_taxonomy)
 
                     if not taxonomy:
                         logger.info(
@@ -403,7 +422,8 @@ async def score_set_update(
                 for external_gene_identifier_offset_create in gene.external_identifiers:
                     offset = external_gene_identifier_offset_create.offset
                     identifier_create = external_gene_identifier_offset_create.identifier
-                    await create_external_gene_identifier_offset(
+                    run_coroutine_in_thread(
+                        create_external_gene_identifier_offset,
                         db,
                         target_gene,
                         identifier_create.db_name,
@@ -426,6 +446,10 @@ async def score_set_update(
         logger.debug(msg="Skipped score range and target gene update. Score set is published.", extra=logging_context())
 
     db.add(item)
+    refresh_score_set_search_document(db, item)
+    refresh_score_set_search_projection(db, item)
+    # Stored annotations embed score set metadata. The caller is responsible for repopulating the store.
+    invalidate_annotation_store(db, item.id)
     db.commit()
     db.refresh(item)
 
@@ -438,7 +462,7 @@ class ParseScoreSetUpdate(TypedDict):
     counts_df: Optional[pd.DataFrame]
 
 
-async def parse_score_set_variants_uploads(
+def parse_score_set_variants_uploads(
     scores_file: Optional[UploadFile] = File(None),
     counts_file: Optional[UploadFile] = File(None),
 ) -> ParseScoreSetUpdate:
@@ -470,7 +494,7 @@ async def parse_score_set_variants_uploads(
     }
 
 
-async def fetch_score_set_by_urn(
+def fetch_score_set_by_urn(
     db, urn: str, user: Optional[UserData], owner_or_contributor: Optional[UserData], only_published: bool
 ) -> ScoreSet:
     """
@@ -585,8 +609,11 @@ def search_score_sets(
     score_sets, num_score_sets = _search_score_sets(db, None, search).values()
     enriched_score_sets = []
     if search.include_experiment_score_set_urns_and_count:
+        enriched_experiments = enrich_experiments_with_num_score_sets(
+            db, [ss.experiment for ss in score_sets], user_data
+        )
         for ss in score_sets:
-            enriched_experiment = enrich_experiment_with_num_score_sets(ss.experiment, user_data)
+            enriched_experiment = enriched_experiments[ss.experiment.id]
             response_item = score_set.ScoreSet.model_validate(ss).copy(update={"experiment": enriched_experiment})
             enriched_score_sets.append(response_item)
         score_sets = enriched_score_sets
@@ -619,23 +646,21 @@ def score_set_mapped_gene_mapping(
     save_to_logging_context({"requested_resource": "mapped-genes"})
 
     score_sets_with_mapping_metadata = db.execute(
-        select(ScoreSet, TargetGene.post_mapped_metadata)
+        select(ScoreSet.urn, TargetGene.post_mapped_metadata)
         .join(ScoreSet)
         .where(TargetGene.post_mapped_metadata.is_not(None))
+        .where(permitted_filter(user_data, ScoreSet, Action.READ))
     ).all()
 
     mapped_genes: dict[str, list[str]] = {}
-    for score_set_item, post_mapped_metadata in score_sets_with_mapping_metadata:
-        if not has_permission(user_data, score_set_item, Action.READ).permitted:
-            continue
-
+    for score_set_urn, post_mapped_metadata in score_sets_with_mapping_metadata:
         sequence_genes = [
             *post_mapped_metadata.get("genomic", {}).get("sequence_genes", []),
             *post_mapped_metadata.get("protein", {}).get("sequence_genes", []),
         ]
 
         if sequence_genes:
-            mapped_genes.setdefault(score_set_item.urn, []).extend(sequence_genes)
+            mapped_genes.setdefault(score_set_urn, []).extend(sequence_genes)
 
     return mapped_genes
 
@@ -657,8 +682,9 @@ def search_my_score_sets(
     """
     score_sets, num_score_sets = _search_score_sets(db, user_data.user, search).values()
     enriched_score_sets = []
+    enriched_experiments = enrich_experiments_with_num_score_sets(db, [ss.experiment for ss in score_sets], user_data)
     for ss in score_sets:
-        enriched_experiment = enrich_experiment_with_num_score_sets(ss.experiment, user_data)
+        enriched_experiment = enriched_experiments[ss.experiment.id]
         response_item = score_set.ScoreSet.model_validate(ss).copy(update={"experiment": enriched_experiment})
         enriched_score_sets.append(response_item)
 
@@ -673,7 +699,7 @@ def search_my_score_sets(
     response_model_exclude_none=True,
     summary="Fetch score set by URN",
 )
-async def show_score_set(
+def show_score_set(
     *,
     urn: str,
     db: Session = Depends(deps.get_db),
@@ -683,7 +709,7 @@ async def show_score_set(
     Fetch a single score set by URN.
     """
     save_to_logging_context({"requested_resource": urn})
-    item = await fetch_score_set_by_urn(db, urn, user_data, None, False)
+    item = fetch_score_set_by_urn(db, urn, user_data, None, False)
     enriched_experiment = enrich_experiment_with_num_score_sets(item.experiment, user_data)
     return score_set.ScoreSet.model_validate(item).copy(update={"experiment": enriched_experiment})
 
@@ -858,7 +884,7 @@ def get_score_set_scores_csv(
     },
     summary="Get score set counts in CSV format",
 )
-async def get_score_set_counts_csv(
+def get_score_set_counts_csv(
     *,
     urn: str,
     start: int = Query(default=None, description="Start index for pagination"),
@@ -914,7 +940,7 @@ def get_score_set_mapped_variants(
     urn: str,
     db: Session = Depends(deps.get_db),
     user_data: Optional[UserData] = Depends(get_current_user),
-) -> list[MappedVariant]:
+) -> Response:
     """
     Return mapped variants from a score set, identified by URN.
     """
@@ -944,13 +970,52 @@ def get_score_set_mapped_variants(
             detail=f"No mapped variant associated with score set URN {urn} was found",
         )
 
-    return mapped_variants
+    # Score sets may have many mapped variants, so render them with the fast JSON serializer rather than FastAPI's.
+    return Response(
+        content=adapted_to_json_bytes(
+            MAPPED_VARIANT_LIST_ADAPTER,
+            MAPPED_VARIANT_LIST_ADAPTER.validate_python(mapped_variants, from_attributes=True),
+            by_alias=True,
+        ),
+        media_type="application/json",
+    )
 
 
-def _stream_generated_annotations(mapped_variants, annotation_function):
+def _annotation_batches(
+    db: Session, score_set: ScoreSet, annotation_type: AnnotationType, total_variants: int
+) -> Iterator[list[tuple[Optional[str], Optional[str]]]]:
+    """
+    Yield batches of variant URNs and serialized annotations for the current mapped variants of a score set.
+
+    Annotations are read from the annotation store when it holds an annotation of the requested type for every current
+    mapped variant of the score set, and are generated otherwise, in the annotation process pool if one is configured.
+    """
+    if count_stored_annotations(db, score_set, annotation_type) == total_variants:
+        logger.debug(msg="Streaming annotations from the annotation store.", extra=logging_context())
+        yield from stored_annotation_batches(db, score_set, annotation_type)
+        return
+
+    # Build the objects shared by every annotation of the score set once, rather than once per variant.
+    context = AnnotationContext(score_set)
+
+    pool = annotation_process_pool()
+    if pool is not None:
+        logger.debug(msg="Generating annotations in the annotation process pool.", extra=logging_context())
+        yield from annotate_batches_in_pool(
+            pool, current_mapped_variant_batches(db, score_set), annotation_type, context
+        )
+        return
+
+    for batch in current_mapped_variant_batches(db, score_set):
+        yield generate_serialized_annotations(batch, annotation_type, context)
+
+
+def _stream_annotations(annotation_batches: Iterable[list[tuple[Optional[str], Optional[str]]]], total_variants: int):
     """
     Generator function to stream annotations as pure NDJSON data.
 
+    The NDJSON lines of each batch of annotations are yielded together, as soon as the batch is available.
+
     Metadata should be provided via HTTP headers:
     - X-Total-Count: Total number of variants
     - X-Processing-Started: ISO timestamp when processing began
@@ -960,37 +1025,25 @@ def _stream_generated_annotations(mapped_variants, annotation_function):
     consumed via Server-Sent Events if needed.
     """
     start_time = time.time()
-    total_variants = len(mapped_variants)
     processed_count = 0
     logger.info(f"Starting streaming processing of {total_variants} mapped variants")
 
-    for i, mv in enumerate(mapped_variants):
-        try:
-            annotation = annotation_function(mv)
-        except MappingDataDoesntExistException:
-            logger.debug(f"Mapping data does not exist for variant {mv.variant.urn}.")
-            annotation = None
-
+    for batch in annotation_batches:
         # Send pure result data (no wrapper)
-        result = {
-            "variant_urn": mv.variant.urn,
-            "annotation": annotation.model_dump(exclude_none=True) if annotation else None,
-        }
-        yield json.dumps(result, default=str) + "\n"
+        yield b"".join(annotation_ndjson_line(variant_urn, annotation) for variant_urn, annotation in batch)
 
         # Log server-side progress
-        processed_count += 1
-        if processed_count % (total_variants // 10 + 1) == 0:
-            current_time = time.time()
-            elapsed = current_time - start_time
-            rate = processed_count / elapsed if elapsed > 0 else 0
-            percentage = (processed_count / total_variants) * 100
-            eta = (total_variants - processed_count) / rate if rate > 0 else 0
-
-            logger.debug(
-                f"Streamed {processed_count}/{total_variants} variants ({rate:.1f}/sec, {percentage:.1f}% complete, ETA: {eta:.1f}s)",
-                extra=logging_context(),
-            )
+        processed_count += len(batch)
+        current_time = time.time()
+        elapsed = current_time - start_time
+        rate = processed_count / elapsed if elapsed > 0 else 0
+        percentage = (processed_count / total_variants) * 100 if total_variants > 0 else 100
+        eta = (total_variants - processed_count) / rate if rate > 0 else 0
+
+        logger.debug(
+            f"Streamed {processed_count}/{total_variants} variants ({rate:.1f}/sec, {percentage:.1f}% complete, ETA: {eta:.1f}s)",
+            extra=logging_context(),
+        )
 
     # Log final completion summary
     end_time = time.time()
@@ -1095,26 +1148,8 @@ def get_score_set_annotated_variants(
 
     assert_permission(user_data, score_set, Action.READ)
 
-    mapped_variants = (
-        db.query(MappedVariant)
-        .join(MappedVariant.variant)
-        .join(Variant.score_set)
-        .filter(ScoreSet.urn == urn)
-        .filter(MappedVariant.current.is_(True))
-        .options(
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set),
-            contains_eager(MappedVariant.variant)
-            .contains_eager(Variant.score_set)
-            .selectinload(ScoreSet.publication_identifier_associations),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.created_by),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.modified_by),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.license),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.experiment),
-        )
-        .all()
-    )
-
-    if not mapped_variants:
+    total_mapped_variants = count_current_mapped_variants(db, score_set)
+    if not total_mapped_variants:
         logger.info(msg="No mapped variants are associated with the requested score set.", extra=logging_context())
         raise HTTPException(
             status_code=404,
@@ -1122,10 +1157,13 @@ def get_score_set_annotated_variants(
         )
 
     return StreamingResponse(
-        _stream_generated_annotations(mapped_variants, variant_pathogenicity_evidence),
+        _stream_annotations(
+            _annotation_batches(db, score_set, AnnotationType.pathogenicity_evidence_line, total_mapped_variants),
+            total_mapped_variants,
+        ),
         media_type="application/x-ndjson",
         headers={
-            "X-Total-Count": str(len(mapped_variants)),
+            "X-Total-Count": str(total_mapped_variants),
             "X-Processing-Started": datetime.now().isoformat(),
             "X-Stream-Type": "pathogenicity-evidence-line",
             "Access-Control-Expose-Headers": "X-Total-Count, X-Processing-Started, X-Stream-Type",
@@ -1211,26 +1249,8 @@ def get_score_set_annotated_variants_functional_statement(
 
     assert_permission(user_data, score_set, Action.READ)
 
-    mapped_variants = (
-        db.query(MappedVariant)
-        .join(MappedVariant.variant)
-        .join(Variant.score_set)
-        .filter(ScoreSet.urn == urn)
-        .filter(MappedVariant.current.is_(True))
-        .options(
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set),
-            contains_eager(MappedVariant.variant)
-            .contains_eager(Variant.score_set)
-            .selectinload(ScoreSet.publication_identifier_associations),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.created_by),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.modified_by),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.license),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.experiment),
-        )
-        .all()
-    )
-
-    if not mapped_variants:
+    total_mapped_variants = count_current_mapped_variants(db, score_set)
+    if not total_mapped_variants:
         logger.info(msg="No mapped variants are associated with the requested score set.", extra=logging_context())
         raise HTTPException(
             status_code=404,
@@ -1238,10 +1258,13 @@ def get_score_set_annotated_variants_functional_statement(
         )
 
     return StreamingResponse(
-        _stream_generated_annotations(mapped_variants, variant_functional_impact_statement),
+        _stream_annotations(
+            _annotation_batches(db, score_set, AnnotationType.functional_impact_statement, total_mapped_variants),
+            total_mapped_variants,
+        ),
         media_type="application/x-ndjson",
         headers={
-            "X-Total-Count": str(len(mapped_variants)),
+            "X-Total-Count": str(total_mapped_variants),
             "X-Processing-Started": datetime.now().isoformat(),
             "X-Stream-Type": "functional-impact-statement",
             "Access-Control-Expose-Headers": "X-Total-Count, X-Processing-Started, X-Stream-Type",
@@ -1314,7 +1337,7 @@ def get_score_set_annotated_variants_functional_study_result(
 
     Notes:
         - Only returns current mapped variants (MappedVariant.current == True)
-        - Eagerly loads related ScoreSet data including publications, users, license, and experiment
+        - Streams mapped variants in batches, so memory use does not grow with the size of the score set
         - Logs requests and errors for monitoring and debugging purposes
     """
     save_to_logging_context(
@@ -1331,26 +1354,8 @@ def get_score_set_annotated_variants_functional_study_result(
 
     assert_permission(user_data, score_set, Action.READ)
 
-    mapped_variants = (
-        db.query(MappedVariant)
-        .join(MappedVariant.variant)
-        .join(Variant.score_set)
-        .filter(ScoreSet.urn == urn)
-        .filter(MappedVariant.current.is_(True))
-        .options(
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set),
-            contains_eager(MappedVariant.variant)
-            .contains_eager(Variant.score_set)
-            .selectinload(ScoreSet.publication_identifier_associations),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.created_by),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.modified_by),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.license),
-            contains_eager(MappedVariant.variant).contains_eager(Variant.score_set).selectinload(ScoreSet.experiment),
-        )
-        .all()
-    )
-
-    if not mapped_variants:
+    total_mapped_variants = count_current_mapped_variants(db, score_set)
+    if not total_mapped_variants:
         logger.info(msg="No mapped variants are associated with the requested score set.", extra=logging_context())
         raise HTTPException(
             status_code=404,
@@ -1358,10 +1363,13 @@ def get_score_set_annotated_variants_functional_study_result(
         )
 
     return StreamingResponse(
-        _stream_generated_annotations(mapped_variants, variant_study_result),
+        _stream_annotations(
+            _annotation_batches(db, score_set, AnnotationType.functional_study_result, total_mapped_variants),
+            total_mapped_variants,
+        ),
         media_type="application/x-ndjson",
         headers={
-            "X-Total-Count": str(len(mapped_variants)),
+            "X-Total-Count": str(total_mapped_variants),
             "X-Processing-Started": datetime.now().isoformat(),
             "X-Stream-Type": "functional-study-result",
             "Access-Control-Expose-Headers": "X-Total-Count, X-Processing-Started, X-Stream-Type",
@@ -1376,7 +1384,7 @@ def get_score_set_annotated_variants_functional_study_result(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES, **BASE_409_RESPONSE, **GATEWAY_ERROR_RESPONSES},
     summary="Create a score set",
 )
-async def create_score_set(
+def create_score_set(
     *,
     item_create: score_set.ScoreSetCreate,
     db: Session = Depends(deps.get_db),
@@ -1422,7 +1430,7 @@ async def create_score_set(
 
     save_to_logging_context({"requested_superseded_score_set": item_create.superseded_score_set_urn})
     if item_create.superseded_score_set_urn is not None:
-        superseded_score_set = await fetch_score_set_by_urn(
+        superseded_score_set = fetch_score_set_by_urn(
             db, item_create.superseded_score_set_urn, user_data, user_data, True
         )
 
@@ -1442,8 +1450,7 @@ async def create_score_set(
     meta_analyzes_score_sets = [
         ss
         for ss in [
-            await fetch_score_set_by_urn(db, urn, user_data, None, True)
-            for urn in distinct_meta_analyzes_score_set_urns
+            fetch_score_set_by_urn(db, urn, user_data, None, True) for urn in distinct_meta_analyzes_score_set_urns
         ]
         if ss is not None
     ]
@@ -1509,7 +1516,8 @@ async def create_score_set(
     contributors: list[Contributor] = []
     try:
         contributors = [
-            await find_or_create_contributor(db, contributor.orcid_id) for contributor in item_create.contributors or []
+            run_coroutine_in_thread(find_or_create_contributor, db, contributor.orcid_id)
+            for contributor in item_create.contributors or []
         ]
     except NonexistentOrcidUserError as e:
         logger.error(msg="Could not find ORCID user with the provided user ID.", extra=logging_context())
@@ -1517,15 +1525,19 @@ async def create_score_set(
 
     try:
         doi_identifiers = [
-            await find_or_create_doi_identifier(db, identifier.identifier)
+            run_coroutine_in_thread(find_or_create_doi_identifier, db, identifier.identifier)
             for identifier in item_create.doi_identifiers or []
         ]
         primary_publication_identifiers = [
-            await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
+            run_coroutine_in_thread(
+                find_or_create_publication_identifier, db, identifier.identifier, identifier.db_name
+            )
             for identifier in item_create.primary_publication_identifiers or []
         ]
         publication_identifiers = [
-            await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
+            run_coroutine_in_thread(
+                find_or_create_publication_identifier, db, identifier.identifier, identifier.db_name
+            )
             for identifier in item_create.secondary_publication_identifiers or []
         ] + primary_publication_identifiers
 
@@ -1563,8 +1575,8 @@ async def create_score_set(
                     detail="Class-based calibrations are not supported on score set creation. Please create class-based calibrations after creating the score set.",
                 )
 
-            created_calibration_item = await create_score_calibration(
-                db, calibration_create, user_data.user, variant_classes=None
+            created_calibration_item = run_coroutine_in_thread(
+                create_score_calibration, db, calibration_create, user_data.user, variant_classes=None
             )
             created_calibration_item.investigator_provided = True  # necessarily true on score set creation
             score_calibrations.append(created_calibration_item)
@@ -1583,7 +1595,7 @@ async def create_score_set(
                 )
             upload_taxonomy = gene.target_sequence.taxonomy
             save_to_logging_context({"requested_taxonomy": gene.target_sequence.taxonomy.code})
-            taxonomy = await find_or_create_taxonomy(db, upload_taxonomy)
+            taxonomy = run_coroutine_in_thread(find_or_create_taxonomy, db, upload_taxonomy)
 
             if not taxonomy:
                 logger.info(
@@ -1646,7 +1658,8 @@ async def create_score_set(
         for external_gene_identifier_offset_create in gene.external_identifiers:
             offset = external_gene_identifier_offset_create.offset
             identifier_create = external_gene_identifier_offset_create.identifier
-            await create_external_gene_identifier_offset(
+            run_coroutine_in_thread(
+                create_external_gene_identifier_offset,
                 db,
                 target_gene,
                 identifier_create.db_name,
@@ -1690,6 +1703,7 @@ async def create_score_set(
     )  # type: ignore[call-arg]
 
     db.add(item)
+    refresh_score_set_search_document(db, item)
     db.commit()
     db.refresh(item)
 
@@ -1741,7 +1755,7 @@ async def create_score_set(
         }
     },
 )
-async def upload_score_set_variant_data(
+def upload_score_set_variant_data(
     *,
     urn: str,
     data: Request,
@@ -1760,9 +1774,9 @@ async def upload_score_set_variant_data(
     save_to_logging_context({"requested_resource": urn, "resource_property": "variants"})
 
     try:
-        score_set_variants_data = await parse_score_set_variants_uploads(scores_file, counts_file)
+        score_set_variants_data = parse_score_set_variants_uploads(scores_file, counts_file)
 
-        form_data = await data.form()
+        form_data = run_on_event_loop(data.form)
         # Parse variants dataset column metadata JSON strings
         dataset_column_metadata = {
             key: json.loads(str(value))
@@ -1788,7 +1802,7 @@ async def upload_score_set_variant_data(
 
     logger.info(msg="Enqueuing variant creation job.", extra=logging_context())
 
-    await enqueue_variant_creation(
+    enqueue_variant_creation(
         item=item,
         user_data=user_data,
         new_scores_df=score_set_variants_data["scores_df"],
@@ -1848,7 +1862,7 @@ async def upload_score_set_variant_data(
         }
     },
 )
-async def update_score_set_with_variants(
+def update_score_set_with_variants(
     *,
     urn: str,
     request: Request,
@@ -1873,7 +1887,7 @@ async def update_score_set_with_variants(
     #           simplify the OpenAPI schema for this endpoint.
     try:
         # Get all form data from the request
-        form_data = await request.form()
+        form_data = run_on_event_loop(request.form)
 
         # Convert form data to dictionary, excluding file and associated column metadata fields
         form_dict = {
@@ -1885,7 +1899,7 @@ async def update_score_set_with_variants(
         item_update_partial = score_set.ScoreSetUpdateAllOptional.as_form(**form_dict)
 
         # parse uploaded CSV files
-        score_set_variants_data = await parse_score_set_variants_uploads(
+        score_set_variants_data = parse_score_set_variants_uploads(
             scores_file,
             counts_file,
         )
@@ -1916,7 +1930,7 @@ async def update_score_set_with_variants(
         logger.info(msg="Failed to update score set; The requested score set does not exist.", extra=logging_context())
         raise HTTPException(status_code=404, detail=f"score set with URN '{urn}' not found")
 
-    itemUpdateResult = await score_set_update(
+    itemUpdateResult = score_set_update(
         db=db,
         urn=urn,
         item_update=item_update_partial,
@@ -1950,7 +1964,8 @@ async def update_score_set_with_variants(
         updatedItem.processing_state = ProcessingState.processing
         logger.info(msg="Enqueuing variant creation job.", extra=logging_context())
 
-        await enqueue_variant_creation(
+        should_create_variants = True
+        enqueue_variant_creation(
             item=updatedItem,
             user_data=user_data,
             worker=worker,
@@ -1968,6 +1983,10 @@ async def update_score_set_with_variants(
     db.commit()
     db.refresh(updatedItem)
 
+    # Newly created variants are annotated once they have been mapped.
+    if not should_create_variants:
+        run_on_event_loop(enqueue_annotation_store_population, worker, updatedItem.id, correlation_id_for_context())
+
     enriched_experiment = enrich_experiment_with_num_score_sets(updatedItem.experiment, user_data)
     return score_set.ScoreSet.model_validate(updatedItem).copy(update={"experiment": enriched_experiment})
 
@@ -1979,7 +1998,7 @@ async def update_score_set_with_variants(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES, **BASE_409_RESPONSE, **GATEWAY_ERROR_RESPONSES},
     summary="Update a score set",
 )
-async def update_score_set(
+def update_score_set(
     *,
     urn: str,
     item_update: score_set.ScoreSetUpdate,
@@ -1996,7 +2015,7 @@ async def update_score_set(
     # this object will contain all required fields because item_update type is ScoreSetUpdate, but
     # is converted to instance of ScoreSetUpdateAllOptional to match expected input of score_set_update function
     score_set_update_item = score_set.ScoreSetUpdateAllOptional.model_validate(item_update.model_dump())
-    itemUpdateResult = await score_set_update(
+    itemUpdateResult = score_set_update(
         db=db, urn=urn, item_update=score_set_update_item, exclude_unset=False, user_data=user_data
     )
     updatedItem = itemUpdateResult["item"]
@@ -2009,11 +2028,13 @@ async def update_score_set(
         updatedItem.processing_state = ProcessingState.processing
 
         logger.info(msg="Enqueuing variant creation job.", extra=logging_context())
-        await enqueue_variant_creation(item=updatedItem, user_data=user_data, worker=worker)
+        enqueue_variant_creation(item=updatedItem, user_data=user_data, worker=worker)
 
         db.add(updatedItem)
         db.commit()
         db.refresh(updatedItem)
+    else:
+        run_on_event_loop(enqueue_annotation_store_population, worker, updatedItem.id, correlation_id_for_context())
 
     enriched_experiment = enrich_experiment_with_num_score_sets(updatedItem.experiment, user_data)
     return score_set.ScoreSet.model_validate(updatedItem).copy(update={"experiment": enriched_experiment})
@@ -2025,7 +2046,7 @@ async def update_score_set(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Delete a score set",
 )
-async def delete_score_set(
+def delete_score_set(
     *,
     urn: str,
     db: Session = Depends(deps.get_db),
@@ -2064,7 +2085,7 @@ async def delete_score_set(
     response_model_exclude_none=True,
     responses={**ACCESS_CONTROL_ERROR_RESPONSES, **BASE_409_RESPONSE},
 )
-async def publish_score_set(
+def publish_score_set(
     *,
     urn: str,
     db: Session = Depends(deps.get_db),
@@ -2143,18 +2164,23 @@ async def publish_score_set(
     save_to_logging_context({"score_set": item.urn})
 
     db.add(item)
+    refresh_score_set_search_document(db, item)
+    refresh_score_set_search_projection(db, item)
+    # Stored annotations embed the temporary URNs replaced above.
+    invalidate_annotation_store(db, item.id)
     db.commit()
     db.refresh(item)
 
+    run_on_event_loop(enqueue_annotation_store_population, worker, item.id, correlation_id_for_context())
+
     # await the insertion of this job into the worker queue, not the job itself.
-    job = await worker.enqueue_job("refresh_published_variants_view", correlation_id_for_context())
+    # Refreshes of the same score set within the debounce window share one job, so no job is returned for repeats.
+    job = run_on_event_loop(enqueue_published_variants_refresh, worker, item.id, correlation_id_for_context())
     if job is not None:
         save_to_logging_context({"worker_job_id": job.job_id})
-        logger.info(msg="Enqueud published variant materialized view refresh job.", extra=logging_context())
+        logger.info(msg="Enqueued published variants refresh job.", extra=logging_context())
     else:
-        logger.warning(
-            msg="Failed to enqueue published variant materialized view refresh job.", extra=logging_context()
-        )
+        logger.info(msg="A published variants refresh job is already enqueued.", extra=logging_context())
 
     enriched_experiment = enrich_experiment_with_num_score_sets(item.experiment, user_data)
     return score_set.ScoreSet.model_validate(item).copy(update={"experiment": enriched_experiment})
@@ -2168,7 +2194,7 @@ async def publish_score_set(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Get clinical controls for a score set",
 )
-async def get_clinical_controls_for_score_set(
+def get_clinical_controls_for_score_set(
     *,
     urn: str,
     # We'd prefer to reserve `db` as a query parameter.
@@ -2238,7 +2264,7 @@ async def get_clinical_controls_for_score_set(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Get clinical control options for a score set",
 )
-async def get_clinical_controls_options_for_score_set(
+def get_clinical_controls_options_for_score_set(
     *,
     urn: str,
     # We'd prefer to reserve `db` as a query parameter.
@@ -2299,7 +2325,7 @@ async def get_clinical_controls_options_for_score_set(
     responses={**ACCESS_CONTROL_ERROR_RESPONSES},
     summary="Get gnomad variants for a score set",
 )
-async def get_gnomad_variants_for_score_set(
+def get_gnomad_variants_for_score_set(
     *,
     urn: str,
     db: Session = Depends(deps.get_db),
@@ -11,7 +11,13 @@ from mavedb.lib.logging.context import (
     logging_context,
     save_to_logging_context,
 )
-from mavedb.lib.seqrepo import get_sequence_ids, seqrepo_versions, sequence_generator
+from mavedb.lib.seqrepo import (
+    get_sequence_aliases,
+    get_sequence_ids,
+    get_sequence_info,
+    seqrepo_versions,
+    sequence_generator,
+)
 from mavedb.routers.shared import PUBLIC_ERROR_RESPONSES, ROUTER_BASE_PREFIX
 from mavedb.view_models.seqrepo import SeqRepoMetadata, SeqRepoVersions
 
@@ -90,8 +96,8 @@ def get_metadata(alias: str, sr: SeqRepo = Depends(deps.get_seqrepo)) -> dict[st
         )
 
     seq_id = seq_ids[0]
-    seq_info = sr.sequences.fetch_seqinfo(seq_id)
-    aliases = sr.aliases.find_aliases(seq_id=seq_id)
+    seq_info = get_sequence_info(sr, seq_id)
+    aliases = get_sequence_aliases(sr, seq_id)
 
     return {
         "added": seq_info["added"],
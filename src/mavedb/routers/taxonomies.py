@@ -5,6 +5,7 @@ from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 from mavedb import deps
+from mavedb.lib.concurrency import run_coroutine_in_thread
 from mavedb.lib.taxonomies import search_NCBI_taxonomy
 from mavedb.models.taxonomy import Taxonomy
 from mavedb.routers.shared import PUBLIC_ERROR_RESPONSES, ROUTER_BASE_PREFIX
@@ -96,7 +97,7 @@ def fetch_taxonomy_by_code(
 
 
 @router.post("/search", status_code=200, response_model=List[taxonomy.Taxonomy], summary="Search taxonomies")
-async def search_taxonomies(search: TextSearch, db: Session = Depends(deps.get_db)) -> Any:
+def search_taxonomies(search: TextSearch, db: Session = Depends(deps.get_db)) -> Any:
     """
     Search Taxonomy.
     If no search text, return the whole taxonomy list so that front end Taxonomy component can get data to show in dropdown button.
@@ -117,7 +118,7 @@ async def search_taxonomies(search: TextSearch, db: Session = Depends(deps.get_d
     items = query.order_by(Taxonomy.organism_name).all()
 
     if not items and search.text:
-        search_taxonomy = await search_NCBI_taxonomy(db, search.text)
+        search_taxonomy = run_coroutine_in_thread(search_NCBI_taxonomy, db, search.text)
         if search_taxonomy:
             items = [search_taxonomy]
         else:
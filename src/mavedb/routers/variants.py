@@ -1,19 +1,20 @@
 import itertools
 import logging
 import re
+from typing import Optional, Sequence
 
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.exc import MultipleResultsFound
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, contains_eager
 from sqlalchemy.sql import or_
 
 from mavedb import deps
 from mavedb.lib.authentication import get_current_user
 from mavedb.lib.logging import LoggedRoute
 from mavedb.lib.logging.context import logging_context, save_to_logging_context
-from mavedb.lib.permissions import Action, assert_permission, has_permission
+from mavedb.lib.permissions import Action, assert_permission, permitted_filter
 from mavedb.lib.types.authentication import UserData
 from mavedb.models.mapped_variant import MappedVariant
 from mavedb.models.score_set import ScoreSet
@@ -48,6 +49,33 @@ metadata = {
 }
 
 
+def _permitted_current_variants_with_clingen_allele_ids(
+    db: Session,
+    user_data: Optional[UserData],
+    clingen_allele_ids: list[str],
+    exclude_clingen_allele_id: Optional[str] = None,
+) -> Sequence[Row[tuple[Variant, str]]]:
+    """
+    Fetch the variants, and the ClinGen allele IDs of their current mapped variants, whose current mapped variants have
+    any of the given ClinGen allele IDs and whose score sets the user may read.
+    """
+    query = (
+        select(Variant, MappedVariant.clingen_allele_id)
+        .join(MappedVariant)
+        .join(Variant.score_set)
+        # Populate each variant's score set from the join the permission filter needs, rather than joining it again.
+        .options(contains_eager(Variant.score_set).joinedload(ScoreSet.experiment))
+        .where(MappedVariant.clingen_allele_id.in_(clingen_allele_ids))
+        .where(MappedVariant.current == True)  # noqa: E712
+        .where(permitted_filter(user_data, ScoreSet, Action.READ))
+    )
+
+    if exclude_clingen_allele_id is not None:
+        query = query.where(MappedVariant.clingen_allele_id != exclude_clingen_allele_id)
+
+    return db.execute(query).all()
+
+
 @router.post(
     "/variants/clingen-allele-id-lookups",
     status_code=200,
@@ -73,13 +101,9 @@ def lookup_variants(
 
     # sort multi-variant components lexicographically, as they are in the database
     request.clingen_allele_ids = [",".join(sorted(allele_id.split(","))) for allele_id in request.clingen_allele_ids]
-    exact_match_variants = db.execute(
-        select(Variant, MappedVariant.clingen_allele_id)
-        .join(MappedVariant)
-        .options(joinedload(Variant.score_set).joinedload(ScoreSet.experiment))
-        .where(MappedVariant.clingen_allele_id.in_(request.clingen_allele_ids))
-        .where(MappedVariant.current == True)  # noqa: E712
-    ).all()
+    exact_match_variants = _permitted_current_variants_with_clingen_allele_ids(
+        db, user_data, request.clingen_allele_ids
+    )
 
     save_to_logging_context({"num_variants_matching_clingen_allele_ids": len(exact_match_variants)})
     logger.debug(msg="Found variants with exactly matching ClinGen Allele IDs", extra=logging_context())
@@ -96,9 +120,8 @@ def lookup_variants(
         for allele_id in request.clingen_allele_ids
     }
     for variant, allele_id in exact_match_variants:
-        if has_permission(user_data, variant.score_set, Action.READ).permitted:
-            num_variants_matching_clingen_allele_ids_and_permitted += 1
-            variants_by_allele_id[allele_id]["exact_match"]["variant_effect_measurements"].append(variant)
+        num_variants_matching_clingen_allele_ids_and_permitted += 1
+        variants_by_allele_id[allele_id]["exact_match"]["variant_effect_measurements"].append(variant)
 
     save_to_logging_context(
         {"clingen_allele_ids_with_permitted_variants": num_variants_matching_clingen_allele_ids_and_permitted}
@@ -148,21 +171,13 @@ def lookup_variants(
                     for var_translation in related_clingen_ids
                     if var_translation.aa_clingen_id != allele_id
                 ]
-                related_aa_variants = db.execute(
-                    select(Variant, MappedVariant.clingen_allele_id)
-                    .join(MappedVariant)
-                    .options(joinedload(Variant.score_set).joinedload(ScoreSet.experiment))
-                    .where(MappedVariant.clingen_allele_id.in_(related_aa_clingen_ids))
-                    .where(MappedVariant.current == True)  # noqa: E712
-                ).all()
+                related_aa_variants = _permitted_current_variants_with_clingen_allele_ids(
+                    db, user_data, related_aa_clingen_ids
+                )
                 related_nt_clingen_ids = [var_translation.nt_clingen_id for var_translation in related_clingen_ids]
-                related_nt_variants = db.execute(
-                    select(Variant, MappedVariant.clingen_allele_id)
-                    .join(MappedVariant)
-                    .options(joinedload(Variant.score_set).joinedload(ScoreSet.experiment))
-                    .where(MappedVariant.clingen_allele_id.in_(related_nt_clingen_ids))
-                    .where(MappedVariant.current == True)  # noqa: E712
-                ).all()
+                related_nt_variants = _permitted_current_variants_with_clingen_allele_ids(
+                    db, user_data, related_nt_clingen_ids
+                )
             elif allele_id.startswith("CA"):
                 subquery = (
                     db.execute(
@@ -184,37 +199,28 @@ def lookup_variants(
                     .all()
                 )
                 related_aa_clingen_ids = [var_translation.aa_clingen_id for var_translation in related_clingen_ids]
-                related_aa_variants = db.execute(
-                    select(Variant, MappedVariant.clingen_allele_id)
-                    .join(MappedVariant)
-                    .options(joinedload(Variant.score_set).joinedload(ScoreSet.experiment))
-                    .where(MappedVariant.clingen_allele_id.in_(related_aa_clingen_ids))
-                    .where(MappedVariant.current == True)  # noqa: E712
-                ).all()
+                related_aa_variants = _permitted_current_variants_with_clingen_allele_ids(
+                    db, user_data, related_aa_clingen_ids
+                )
                 # exclude requested clingen allele id from "related_clingen_ids" to avoid duplicates
                 related_nt_clingen_ids = [
                     var_translation.nt_clingen_id
                     for var_translation in related_clingen_ids
                     if var_translation.nt_clingen_id != allele_id
                 ]
-                related_nt_variants = db.execute(
-                    select(Variant, MappedVariant.clingen_allele_id)
-                    .join(MappedVariant)
-                    .options(joinedload(Variant.score_set).joinedload(ScoreSet.experiment))
-                    .where(MappedVariant.clingen_allele_id.in_(related_nt_clingen_ids))
-                    .where(MappedVariant.current == True)  # noqa: E712
-                ).all()
+                related_nt_variants = _permitted_current_variants_with_clingen_allele_ids(
+                    db, user_data, related_nt_clingen_ids
+                )
 
             num_variants_matching_clingen_allele_ids_and_permitted = 0
             equivalent_aa_variants = {}
             for variant, related_allele_id in related_aa_variants:
-                if has_permission(user_data, variant.score_set, Action.READ).permitted:
-                    if related_allele_id not in equivalent_aa_variants:
-                        equivalent_aa_variants[related_allele_id] = {
-                            "clingen_allele_id": related_allele_id,
-                            "variant_effect_measurements": [],
-                        }
-                    equivalent_aa_variants[related_allele_id]["variant_effect_measurements"].append(variant)
+                if related_allele_id not in equivalent_aa_variants:
+                    equivalent_aa_variants[related_allele_id] = {
+                        "clingen_allele_id": related_allele_id,
+                        "variant_effect_measurements": [],
+                    }
+                equivalent_aa_variants[related_allele_id]["variant_effect_measurements"].append(variant)
 
             variants_by_allele_id[allele_id]["equivalent_aa"] = [
                 equivalent_aa_variants[related_allele_id] for related_allele_id in equivalent_aa_variants
@@ -222,13 +228,12 @@ def lookup_variants(
 
             equivalent_nt_variants = {}
             for variant, related_allele_id in related_nt_variants:
-                if has_permission(user_data, variant.score_set, Action.READ).permitted:
-                    if related_allele_id not in equivalent_nt_variants:
-                        equivalent_nt_variants[related_allele_id] = {
-                            "clingen_allele_id": related_allele_id,
-                            "variant_effect_measurements": [],
-                        }
-                    equivalent_nt_variants[related_allele_id]["variant_effect_measurements"].append(variant)
+                if related_allele_id not in equivalent_nt_variants:
+                    equivalent_nt_variants[related_allele_id] = {
+                        "clingen_allele_id": related_allele_id,
+                        "variant_effect_measurements": [],
+                    }
+                equivalent_nt_variants[related_allele_id]["variant_effect_measurements"].append(variant)
 
             variants_by_allele_id[allele_id]["equivalent_nt"] = [
                 equivalent_nt_variants[related_allele_id] for related_allele_id in equivalent_nt_variants
@@ -304,21 +309,12 @@ def lookup_variants(
                 ]
 
                 # query the db for variants with these combinations
-                related_aa_variants = db.execute(
-                    select(Variant, MappedVariant.clingen_allele_id)
-                    .join(MappedVariant)
-                    .options(joinedload(Variant.score_set).joinedload(ScoreSet.experiment))
-                    .where(MappedVariant.clingen_allele_id.in_(joined_related_aa_clingen_id_combinations))
-                    .where(MappedVariant.clingen_allele_id != allele_id)
-                    .where(MappedVariant.current == True)  # noqa: E712
-                ).all()
-                related_nt_variants = db.execute(
-                    select(Variant, MappedVariant.clingen_allele_id)
-                    .join(MappedVariant)
-                    .options(joinedload(Variant.score_set).joinedload(ScoreSet.experiment))
-                    .where(MappedVariant.clingen_allele_id.in_(joined_related_nt_clingen_id_combinations))
-                    .where(MappedVariant.current == True)  # noqa: E712
-                ).all()
+                related_aa_variants = _permitted_current_variants_with_clingen_allele_ids(
+                    db, user_data, joined_related_aa_clingen_id_combinations, exclude_clingen_allele_id=allele_id
+                )
+                related_nt_variants = _permitted_current_variants_with_clingen_allele_ids(
+                    db, user_data, joined_related_nt_clingen_id_combinations
+                )
 
             elif all(component.startswith("CA") for component in allele_id_components):
                 related_clingen_id_components = []  # list of lists, one list for each component
@@ -381,21 +377,12 @@ def lookup_variants(
                     for combination in related_nt_clingen_id_combinations
                 ]
                 # query the db for variants with these combinations
-                related_aa_variants = db.execute(
-                    select(Variant, MappedVariant.clingen_allele_id)
-                    .join(MappedVariant)
-                    .options(joinedload(Variant.score_set).joinedload(ScoreSet.experiment))
-                    .where(MappedVariant.clingen_allele_id.in_(joined_related_aa_clingen_id_combinations))
-                    .where(MappedVariant.current == True)  # noqa: E712
-                ).all()
-                related_nt_variants = db.execute(
-                    select(Variant, MappedVariant.clingen_allele_id)
-                    .join(MappedVariant)
-                    .options(joinedload(Variant.score_set).joinedload(ScoreSet.experiment))
-                    .where(MappedVariant.clingen_allele_id.in_(joined_related_nt_clingen_id_combinations))
-                    .where(MappedVariant.clingen_allele_id != allele_id)
-                    .where(MappedVariant.current == True)  # noqa: E712
-                ).all()
+                related_aa_variants = _permitted_current_variants_with_clingen_allele_ids(
+                    db, user_data, joined_related_aa_clingen_id_combinations
+                )
+                related_nt_variants = _permitted_current_variants_with_clingen_allele_ids(
+                    db, user_data, joined_related_nt_clingen_id_combinations, exclude_clingen_allele_id=allele_id
+                )
 
             else:
                 raise HTTPException(
@@ -405,13 +392,12 @@ def lookup_variants(
 
             equivalent_aa_variants = {}
             for variant, related_allele_id in related_aa_variants:
-                if has_permission(user_data, variant.score_set, Action.READ).permitted:
-                    if related_allele_id not in equivalent_aa_variants:
-                        equivalent_aa_variants[related_allele_id] = {
-                            "clingen_allele_id": related_allele_id,
-                            "variant_effect_measurements": [],
-                        }
-                    equivalent_aa_variants[related_allele_id]["variant_effect_measurements"].append(variant)
+                if related_allele_id not in equivalent_aa_variants:
+                    equivalent_aa_variants[related_allele_id] = {
+                        "clingen_allele_id": related_allele_id,
+                        "variant_effect_measurements": [],
+                    }
+                equivalent_aa_variants[related_allele_id]["variant_effect_measurements"].append(variant)
 
             variants_by_allele_id[allele_id]["equivalent_aa"] = [
                 equivalent_aa_variants[related_allele_id] for related_allele_id in equivalent_aa_variants
@@ -419,13 +405,12 @@ def lookup_variants(
 
             equivalent_nt_variants = {}
             for variant, related_allele_id in related_nt_variants:
-                if has_permission(user_data, variant.score_set, Action.READ).permitted:
-                    if related_allele_id not in equivalent_nt_variants:
-                        equivalent_nt_variants[related_allele_id] = {
-                            "clingen_allele_id": related_allele_id,
-                            "variant_effect_measurements": [],
-                        }
-                    equivalent_nt_variants[related_allele_id]["variant_effect_measurements"].append(variant)
+                if related_allele_id not in equivalent_nt_variants:
+                    equivalent_nt_variants[related_allele_id] = {
+                        "clingen_allele_id": related_allele_id,
+                        "variant_effect_measurements": [],
+                    }
+                equivalent_nt_variants[related_allele_id]["variant_effect_measurements"].append(variant)
 
             variants_by_allele_id[allele_id]["equivalent_nt"] = [
                 equivalent_nt_variants[related_allele_id] for related_allele_id in equivalent_nt_variants
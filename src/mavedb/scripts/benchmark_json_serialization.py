@@ -0,0 +1,113 @@
+"""
+Compare the throughput of each available JSON serializer when rendering the responses of the annotated variant and
+mapped variant endpoints for a score set.
+
+Annotations and mapped variant view models are built once, before any timing, so that only rendering is measured. The
+FastAPI baseline renders mapped variants the way FastAPI renders a response model, by encoding them with
+`jsonable_encoder` and the standard library.
+"""
+
+import json
+import logging
+import time
+from typing import Callable, Sequence
+
+import click
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from mavedb.lib.annotation.context import AnnotationContext
+from mavedb.lib.annotation.exceptions import MappingDataDoesntExistException
+from mavedb.lib.annotation.store import ANNOTATION_FUNCTIONS, annotation_ndjson_line
+from mavedb.lib.score_sets import current_mapped_variant_batches
+from mavedb.lib.serialization import JSON_SERIALIZERS, JsonSerializer, adapted_to_json_bytes, model_to_json_bytes
+from mavedb.models.score_set import ScoreSet
+from mavedb.routers.score_sets import MAPPED_VARIANT_LIST_ADAPTER
+from mavedb.scripts.environment import script_environment, with_database_session
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def records_per_second(render: Callable[[], object], num_records: int, repeat: int) -> float:
+    # Report the best of several runs, which is the least affected by other work on the machine.
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        best = min(best, time.perf_counter() - start)
+
+    return num_records / best if best > 0 else float("inf")
+
+
+@script_environment.command()
+@with_database_session
+@click.argument("urn")
+@click.option("--repeat", default=5, show_default=True, help="Number of times to render each response.")
+@click.option(
+    "--serializer",
+    "serializers",
+    multiple=True,
+    type=click.Choice(list(JSON_SERIALIZERS)),
+    help="Serializers to benchmark. Defaults to every available serializer.",
+)
+def benchmark_json_serialization(db: Session, urn: str, repeat: int, serializers: Sequence[str]):
+    score_set = db.scalars(select(ScoreSet).where(ScoreSet.urn == urn)).one_or_none()
+    if not score_set:
+        logger.error(f"Score set {urn} does not exist.")
+        return
+
+    mapped_variants = [mv for batch in current_mapped_variant_batches(db, score_set) for mv in batch]
+    if not mapped_variants:
+        logger.error(f"Score set {urn} does not have any current mapped variants.")
+        return
+
+    logger.info(f"Building annotations and view models for {len(mapped_variants)} mapped variants of {urn}.")
+    context = AnnotationContext(score_set)
+    annotations = {}
+    for annotation_type, annotation_function in ANNOTATION_FUNCTIONS.items():
+        annotations[annotation_type] = []
+        for mv in mapped_variants:
+            try:
+                annotations[annotation_type].append((mv.variant.urn, annotation_function(mv, context)))
+            except MappingDataDoesntExistException:
+                annotations[annotation_type].append((mv.variant.urn, None))
+
+    view_models = MAPPED_VARIANT_LIST_ADAPTER.validate_python(mapped_variants, from_attributes=True)
+
+    def render_annotations(annotated: list, serializer: JsonSerializer) -> Callable[[], bytes]:
+        return lambda: b"".join(
+            annotation_ndjson_line(
+                variant_urn,
+                model_to_json_bytes(annotation, serializer, exclude_none=True).decode() if annotation else None,
+            )
+            for variant_urn, annotation in annotated
+        )
+
+    def render_mapped_variants(serializer: JsonSerializer) -> Callable[[], bytes]:
+        return lambda: adapted_to_json_bytes(MAPPED_VARIANT_LIST_ADAPTER, view_models, serializer, by_alias=True)
+
+    results = {
+        ("mapped-variants", "fastapi"): records_per_second(
+            lambda: json.dumps(jsonable_encoder(view_models, by_alias=True)).encode(), len(view_models), repeat
+        )
+    }
+    for name in serializers or JSON_SERIALIZERS:
+        serializer = JSON_SERIALIZERS[name]
+        for annotation_type, annotated in annotations.items():
+            results[(annotation_type.value, name)] = records_per_second(
+                render_annotations(annotated, serializer), len(annotated), repeat
+            )
+
+        results[("mapped-variants", name)] = records_per_second(
+            render_mapped_variants(serializer), len(view_models), repeat
+        )
+
+    click.echo(f"{'Endpoint':<32}{'Serializer':<12}{'Records/sec':>14}")
+    for (endpoint, name), throughput in sorted(results.items()):
+        click.echo(f"{endpoint:<32}{name:<12}{throughput:>14,.0f}")
+
+
+if __name__ == "__main__":
+    benchmark_json_serialization()
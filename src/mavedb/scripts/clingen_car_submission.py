@@ -5,6 +5,7 @@ import click
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from mavedb.lib.clingen.allele_registry import cache_allele_registrations, get_cached_allele_registrations
 from mavedb.lib.clingen.constants import CAR_SUBMISSION_ENDPOINT
 from mavedb.lib.clingen.services import ClinGenAlleleRegistryService, get_allele_registry_associations
 from mavedb.lib.variants import get_hgvs_from_post_mapped
@@ -69,16 +70,22 @@ def submit_urns_to_car(db: Session, urns: Sequence[str], debug: bool) -> list[st
                 logger.warning(f"No HGVS strings to submit for URN: {urn}")
                 continue
 
-            logger.info(f"Submitting {len(hgvs_to_mapped_variant)} HGVS strings to CAR service for URN: {urn}")
-            response = car_service.dispatch_submissions(list(hgvs_to_mapped_variant.keys()))
+            cached_associations = get_cached_allele_registrations(db, list(hgvs_to_mapped_variant.keys()))
+            unregistered_hgvs = [hgvs for hgvs in hgvs_to_mapped_variant if hgvs not in cached_associations]
+            logger.info(
+                f"Found {len(cached_associations)} previously registered HGVS strings. Submitting "
+                f"{len(unregistered_hgvs)} HGVS strings to CAR service for URN: {urn}"
+            )
+            response = car_service.dispatch_submissions(unregistered_hgvs) if unregistered_hgvs else []
 
-            if not response:
+            if unregistered_hgvs and not response:
                 logger.error(f"CAR submission failed for URN: {urn}")
             else:
                 logger.info(f"Successfully submitted to CAR for URN: {urn}")
                 # Associate CAIDs with mapped variants
-                associations = get_allele_registry_associations(list(hgvs_to_mapped_variant.keys()), response)
-                for hgvs, caid in associations.items():
+                associations = get_allele_registry_associations(unregistered_hgvs, response) if response else {}
+                cache_allele_registrations(db, associations)
+                for hgvs, caid in {**cached_associations, **associations}.items():
                     mapped_variant_ids = hgvs_to_mapped_variant.get(hgvs, [])
                     for mv_id in mapped_variant_ids:
                         mapped_variant = db.scalar(select(MappedVariant).where(MappedVariant.id == mv_id))
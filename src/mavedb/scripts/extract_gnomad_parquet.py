@@ -0,0 +1,53 @@
+"""
+Script that builds the local Parquet extract of the gnomAD table used by the Parquet gnomAD data backend.
+
+Usage:
+```
+python3 -m mavedb.scripts.extract_gnomad_parquet SOURCE [SOURCE ...]
+```
+
+Each SOURCE is a Parquet file or directory of Parquet files containing the gnomAD table for the current
+`GNOMAD_DATA_VERSION` (i.e. the data backing the Athena gnomAD table). Only the columns queried by MaveDB are retained,
+rows without a CAID are dropped, and the remaining rows are sorted by CAID so that lookups may binary search the
+extract. Unless `--output` is provided, the extract is written to the path read by the Parquet backend
+(`$GNOMAD_PARQUET_DIRECTORY/<gnomAD table name>.parquet`).
+"""
+
+import logging
+from typing import Optional, Sequence
+
+import click
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from mavedb.lib.gnomad import GNOMAD_VARIANT_COLUMNS, gnomad_parquet_extract_path
+
+logger = logging.getLogger(__name__)
+
+# Smaller row groups allow lookups to skip more of the extract, at the cost of a larger file footer.
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+
+@click.command()
+@click.argument("sources", nargs=-1, required=True)
+@click.option("--output", type=str, help="Path of the extract. Defaults to the path read by the Parquet backend.")
+@click.option("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE, help="Number of rows per row group.")
+def extract_gnomad_parquet(sources: Sequence[str], output: Optional[str], row_group_size: int) -> None:
+    """
+    Build a CAID sorted Parquet extract of the gnomAD table from one or more Parquet sources.
+    """
+    output = output or gnomad_parquet_extract_path()
+
+    dataset = ds.dataset(list(sources), format="parquet")
+    table = dataset.to_table(columns=list(GNOMAD_VARIANT_COLUMNS), filter=pc.field("caid").is_valid())
+    logger.info(f"Read {table.num_rows} gnomAD variants with CAIDs from {len(sources)} source(s).")
+
+    table = table.sort_by("caid")
+    pq.write_table(table, output, row_group_size=row_group_size, write_statistics=True)
+
+    logger.info(f"Wrote CAID sorted gnomAD extract to {output}.")
+
+
+if __name__ == "__main__":
+    extract_gnomad_parquet()
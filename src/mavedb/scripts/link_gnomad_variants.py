@@ -61,8 +61,8 @@ def link_gnomad_variants(db: Session, score_set_urn: list[str], all_score_sets:
 
     logger.info(f"Found {len(caids)} CAIDs for the selected score sets to link to gnomAD variants.")
 
-    # 2. Query Athena for gnomAD variants matching the CAIDs
-    gnomad_variant_data = gnomad_variant_data_for_caids(caids)
+    # 2. Query gnomAD variants matching the CAIDs, consulting the lookup cache first
+    gnomad_variant_data = gnomad_variant_data_for_caids(caids, db)
 
     if not gnomad_variant_data:
         logger.error("No gnomAD records found for the provided CAIDs.")
@@ -0,0 +1,13 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class HgvsBatchValidationRequest(BaseModel):
+    variants: List[str] = Field(..., description="HGVS variant strings to validate")
+
+
+class HgvsValidationResult(BaseModel):
+    variant: str = Field(..., description="The HGVS variant string which was validated")
+    valid: bool = Field(..., description="Whether the variant is valid")
+    error: Optional[str] = Field(None, description="The reason the variant could not be parsed or is invalid")
@@ -3,7 +3,7 @@ import functools
 import logging
 from contextlib import asynccontextmanager
 from datetime import date, timedelta
-from typing import Any, Optional, Sequence
+from typing import Any, Optional, Sequence, Union
 
 import pandas as pd
 from arq import ArqRedis
@@ -14,7 +14,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
 from mavedb.data_providers.services import vrs_mapper
-from mavedb.db.view import refresh_all_mat_views
+from mavedb.lib.clingen.allele_registry import cache_allele_registrations, get_cached_allele_registrations
 from mavedb.lib.clingen.constants import (
     CAR_SUBMISSION_ENDPOINT,
     CLIN_GEN_SUBMISSION_ENABLED,
@@ -30,6 +30,13 @@ from mavedb.lib.clingen.services import (
     get_allele_registry_associations,
     get_clingen_variation,
 )
+from mavedb.lib.annotation.store import (
+    ANNOTATION_STORE_ENABLED,
+    enqueue_annotation_store_population,
+    invalidate_annotation_store,
+    populate_annotation_store,
+)
+from mavedb.lib.concurrency import run_in_worker_thread
 from mavedb.lib.exceptions import (
     LinkingEnqueueError,
     MappingEnqueueError,
@@ -42,14 +49,18 @@ from mavedb.lib.exceptions import (
 from mavedb.lib.gnomad import gnomad_variant_data_for_caids, link_gnomad_variants_to_mapped_variants
 from mavedb.lib.logging.context import format_raised_exception_info_as_dict
 from mavedb.lib.mapping import ANNOTATION_LAYERS, extract_ids_from_post_mapped_metadata
+from mavedb.lib.published_variants import replace_published_variants_for_score_set
+from mavedb.lib.score_set_search import refresh_stale_score_set_search_projections
+from mavedb.lib.statistics import refresh_all_statistics_snapshots
 from mavedb.lib.score_sets import (
     columns_for_dataset,
     create_variants,
     create_variants_data,
 )
 from mavedb.lib.slack import log_and_send_slack_message, send_slack_error, send_slack_message
+from mavedb.lib.types.clingen import ClinGenAllele, ClinGenSubmissionError
 from mavedb.lib.uniprot.constants import UNIPROT_ID_MAPPING_ENABLED
-from mavedb.lib.uniprot.id_mapping import UniProtIDMappingAPI
+from mavedb.lib.uniprot.id_mapping import UniProtIDMappingAPI, cache_uniprot_mappings, get_cached_uniprot_mappings
 from mavedb.lib.uniprot.utils import infer_db_name_from_sequence_accession
 from mavedb.lib.validation.dataframe.dataframe import (
     validate_and_standardize_dataframe_pair,
@@ -59,7 +70,6 @@ from mavedb.lib.variants import get_hgvs_from_post_mapped
 from mavedb.models.enums.mapping_state import MappingState
 from mavedb.models.enums.processing_state import ProcessingState
 from mavedb.models.mapped_variant import MappedVariant
-from mavedb.models.published_variant import PublishedVariantsMV
 from mavedb.models.score_set import ScoreSet
 from mavedb.models.user import User
 from mavedb.models.variant import Variant
@@ -531,6 +541,8 @@ async def map_variants_for_score_set(
                 raise NonexistentMappingResultsError()
 
             db.add(score_set)
+            if score_set.published_date is not None:
+                replace_published_variants_for_score_set(db, score_set.id)
             db.commit()
 
         except Exception as e:
@@ -678,11 +690,22 @@ async def map_variants_for_score_set(
             "enqueued_jobs": [job for job in [new_uniprot_job_id, new_clingen_job_id] if job],
         }
 
+    # Annotations embed the ClinGen allele IDs of mapped variants, so when mapped variants are submitted to CAR the
+    # annotation store is populated once the submission job has linked them.
+    new_annotation_store_job_id = None
+    if not CLIN_GEN_SUBMISSION_ENABLED:
+        new_annotation_store_job_id = await enqueue_annotation_store_population(redis, score_set.id, correlation_id)
+    elif ANNOTATION_STORE_ENABLED:
+        logger.debug(
+            msg="Deferred population of the annotation store until mapped variants are submitted to CAR.",
+            extra=logging_context,
+        )
+
     ctx["state"][ctx["job_id"]] = logging_context.copy()
     return {
         "success": True,
         "retried": False,
-        "enqueued_jobs": [job for job in [new_uniprot_job_id, new_clingen_job_id] if job],
+        "enqueued_jobs": [job for job in [new_uniprot_job_id, new_clingen_job_id, new_annotation_store_job_id] if job],
     }
 
 
@@ -817,27 +840,49 @@ async def variant_mapper_manager(ctx: dict, correlation_id: str, updater_id: int
 
 
 ####################################################################################################
-#  Materialized Views
+#  Published variants
 ####################################################################################################
 
 
-# TODO#405: Refresh materialized views within an executor.
-async def refresh_materialized_views(ctx: dict):
+async def refresh_published_variants_for_score_set(ctx: dict, score_set_id: int, correlation_id: Optional[str]):
+    logging_context = setup_job_state(ctx, None, None, correlation_id)
+    logging_context["score_set_id"] = score_set_id
+    logger.debug(msg="Began refresh of published variants for score set.", extra=logging_context)
+    num_refreshed = replace_published_variants_for_score_set(ctx["db"], score_set_id)
+    ctx["db"].commit()
+    logging_context["refreshed_published_variants"] = num_refreshed
+    logger.debug(msg="Done refreshing published variants for score set.", extra=logging_context)
+    return {"success": True, "refreshed": num_refreshed}
+
+
+####################################################################################################
+#  Statistics snapshots
+####################################################################################################
+
+
+async def refresh_statistics_snapshots(ctx: dict):
     logging_context = setup_job_state(ctx, None, None, None)
-    logger.debug(msg="Began refresh materialized views.", extra=logging_context)
-    refresh_all_mat_views(ctx["db"])
+    logger.debug(msg="Began refresh of statistics snapshots.", extra=logging_context)
+    num_refreshed = refresh_all_statistics_snapshots(ctx["db"])
     ctx["db"].commit()
-    logger.debug(msg="Done refreshing materialized views.", extra=logging_context)
-    return {"success": True}
+    logging_context["refreshed_statistics_snapshots"] = num_refreshed
+    logger.debug(msg="Done refreshing statistics snapshots.", extra=logging_context)
+    return {"success": True, "refreshed": num_refreshed}
 
 
-async def refresh_published_variants_view(ctx: dict, correlation_id: str):
-    logging_context = setup_job_state(ctx, None, None, correlation_id)
-    logger.debug(msg="Began refresh of published variants materialized view.", extra=logging_context)
-    PublishedVariantsMV.refresh(ctx["db"])
+####################################################################################################
+#  Search projections
+####################################################################################################
+
+
+async def refresh_score_set_search_projections(ctx: dict):
+    logging_context = setup_job_state(ctx, None, None, None)
+    logger.debug(msg="Began refresh of stale score set search projections.", extra=logging_context)
+    num_refreshed = refresh_stale_score_set_search_projections(ctx["db"])
     ctx["db"].commit()
-    logger.debug(msg="Done refreshing published variants materialized view.", extra=logging_context)
-    return {"success": True}
+    logging_context["refreshed_search_projections"] = num_refreshed
+    logger.debug(msg="Done refreshing stale score set search projections.", extra=logging_context)
+    return {"success": True, "refreshed": num_refreshed}
 
 
 ####################################################################################################
@@ -893,6 +938,7 @@ async def submit_score_set_mappings_to_car(ctx: dict, correlation_id: str, score
                 msg="No current mapped variants with post mapped metadata were found for this score set. Skipping CAR submission.",
                 extra=logging_context,
             )
+            await enqueue_annotation_store_population(redis, score_set.id, correlation_id)
             return {"success": True, "retried": False, "enqueued_job": None}
 
         variant_post_mapped_hgvs: dict[str, list[int]] = {}
@@ -928,10 +974,23 @@ async def submit_score_set_mappings_to_car(ctx: dict, correlation_id: str, score
                 msg="ClinGen Allele Registry submission is disabled (no submission endpoint), skipping submission of mapped variants to CAR.",
                 extra=logging_context,
             )
+            await enqueue_annotation_store_population(redis, score_set.id, correlation_id)
             return {"success": False, "retried": False, "enqueued_job": None}
 
-        car_service = ClinGenAlleleRegistryService(url=CAR_SUBMISSION_ENDPOINT)
-        registered_alleles = car_service.dispatch_submissions(list(variant_post_mapped_hgvs.keys()))
+        # Alleles registered during a previous submission (for this or any other score set) need not be resubmitted.
+        cached_alleles = get_cached_allele_registrations(db, list(variant_post_mapped_hgvs.keys()))
+        unregistered_hgvs = [hgvs for hgvs in variant_post_mapped_hgvs if hgvs not in cached_alleles]
+
+        logging_context["car_cached_allele_count"] = len(cached_alleles)
+        logging_context["car_unregistered_allele_count"] = len(unregistered_hgvs)
+        logger.info(msg="Fetched cached allele registrations for CAR submission.", extra=logging_context)
+
+        registered_alleles: list[Union[ClinGenAllele, ClinGenSubmissionError]] = []
+        if unregistered_hgvs:
+            car_service = ClinGenAlleleRegistryService(url=CAR_SUBMISSION_ENDPOINT)
+            # Submission chunks are retried with a backoff, so dispatch them off the event loop to avoid stalling
+            # other jobs on this worker.
+            registered_alleles = await run_in_worker_thread(car_service.dispatch_submissions, unregistered_hgvs)
     except Exception as e:
         send_slack_error(e)
         send_slack_message(text=text % score_set.urn)
@@ -944,15 +1003,26 @@ async def submit_score_set_mappings_to_car(ctx: dict, correlation_id: str, score
         return {"success": False, "retried": False, "enqueued_job": None}
 
     try:
-        linked_alleles = get_allele_registry_associations(list(variant_post_mapped_hgvs.keys()), registered_alleles)
-        for hgvs_string, caid in linked_alleles.items():
-            mapped_variant_ids = variant_post_mapped_hgvs[hgvs_string]
-            mapped_variants = db.scalars(select(MappedVariant).where(MappedVariant.id.in_(mapped_variant_ids))).all()
+        linked_alleles: dict[str, str] = {}
+        if unregistered_hgvs:
+            linked_alleles = get_allele_registry_associations(unregistered_hgvs, registered_alleles)
+            cache_allele_registrations(db, linked_alleles)
+
+        mapped_variant_caids = {
+            mapped_variant_id: caid
+            for hgvs_string, caid in {**cached_alleles, **linked_alleles}.items()
+            for mapped_variant_id in variant_post_mapped_hgvs[hgvs_string]
+        }
+        mapped_variants = db.scalars(
+            select(MappedVariant).where(MappedVariant.id.in_(list(mapped_variant_caids.keys())))
+        ).all()
 
-            for mapped_variant in mapped_variants:
-                mapped_variant.clingen_allele_id = caid
-                db.add(mapped_variant)
+        for mapped_variant in mapped_variants:
+            mapped_variant.clingen_allele_id = mapped_variant_caids[mapped_variant.id]
+            db.add(mapped_variant)
 
+        # Stored annotations embed the ClinGen allele IDs of mapped variants.
+        invalidate_annotation_store(db, score_set.id)
         db.commit()
 
     except Exception as e:
@@ -966,6 +1036,8 @@ async def submit_score_set_mappings_to_car(ctx: dict, correlation_id: str, score
 
         return {"success": False, "retried": False, "enqueued_job": None}
 
+    await enqueue_annotation_store_population(redis, score_set.id, correlation_id)
+
     new_job_id = None
     try:
         new_job = await redis.enqueue_job(
@@ -1290,6 +1362,8 @@ async def link_clingen_variants(ctx: dict, correlation_id: str, score_set_id: in
             mapped_variant.clingen_allele_id = ldh_variation
             db.add(mapped_variant)
 
+        # Stored annotations embed the ClinGen allele IDs of mapped variants.
+        invalidate_annotation_store(db, score_set.id)
         db.commit()
 
     except Exception as e:
@@ -1305,6 +1379,8 @@ async def link_clingen_variants(ctx: dict, correlation_id: str, score_set_id: in
 
         return {"success": False, "retried": False, "enqueued_job": None}
 
+    await enqueue_annotation_store_population(redis, score_set.id, correlation_id)
+
     try:
         num_linkage_failures = len(linkage_failures)
         ratio_failed_linking = round(num_linkage_failures / num_variant_urns, 3)
@@ -1473,6 +1549,7 @@ async def submit_uniprot_mapping_jobs_for_score_set(ctx, score_set_id: int, corr
 
     try:
         uniprot_api = UniProtIDMappingAPI()
+        cached_target_genes = 0
         logging_context["total_target_genes_to_map_to_uniprot"] = len(score_set.target_genes)
         for target_gene in score_set.target_genes:
             spawned_mapping_jobs[target_gene.id] = None  # type: ignore
@@ -1489,6 +1566,17 @@ async def submit_uniprot_mapping_jobs_for_score_set(ctx, score_set_id: int, corr
                 continue
 
             ac_to_map = acs[0]
+            cached_mapping = get_cached_uniprot_mappings(db, [ac_to_map])
+            if ac_to_map in cached_mapping:
+                target_gene.uniprot_id_from_mapped_metadata = cached_mapping[ac_to_map]
+                db.add(target_gene)
+                cached_target_genes += 1
+                logger.info(
+                    msg=f"Updated target gene {target_gene.id} with cached UniProt ID {cached_mapping[ac_to_map]}. Skipped submitting a mapping job for this target.",
+                    extra=logging_context,
+                )
+                continue
+
             from_db = infer_db_name_from_sequence_accession(ac_to_map)
 
             try:
@@ -1500,6 +1588,9 @@ async def submit_uniprot_mapping_jobs_for_score_set(ctx, score_set_id: int, corr
                     level=logging.WARNING,
                 )
 
+        logging_context["target_genes_mapped_from_uniprot_cache"] = cached_target_genes
+        db.commit()
+
     except Exception as e:
         send_slack_error(e)
         logging_context = {**logging_context, **format_raised_exception_info_as_dict(e)}
@@ -1516,6 +1607,13 @@ async def submit_uniprot_mapping_jobs_for_score_set(ctx, score_set_id: int, corr
         successfully_spawned_mapping_jobs = sum(1 for job in spawned_mapping_jobs.values() if job is not None)
         logging_context["successfully_spawned_mapping_jobs"] = successfully_spawned_mapping_jobs
 
+        if not successfully_spawned_mapping_jobs and cached_target_genes:
+            logger.info(
+                msg="UniProt IDs for this score set were found in the UniProt mapping cache. Skipped enqueuing polling job.",
+                extra=logging_context,
+            )
+            return {"success": True, "retried": False, "enqueued_jobs": []}
+
         if not successfully_spawned_mapping_jobs:
             msg = f"No UniProt mapping jobs were successfully spawned for score set {score_set.urn}. Skipped enqueuing polling job."
             log_and_send_slack_message(msg, logging_context, logging.WARNING)
@@ -1552,15 +1650,22 @@ async def submit_uniprot_mapping_jobs_for_score_set(ctx, score_set_id: int, corr
 
 
 async def poll_uniprot_mapping_jobs_for_score_set(
-    ctx, mapping_jobs: dict[int, Optional[str]], score_set_id: int, correlation_id: Optional[str] = None
+    ctx,
+    mapping_jobs: dict[int, Optional[str]],
+    score_set_id: int,
+    correlation_id: Optional[str] = None,
+    attempt: int = 1,
 ):
     logging_context = {}
     score_set = None
+    pending_mapping_jobs: dict[int, Optional[str]] = {}
     text = "Could not poll mapping jobs from UniProt for this Target %s. Mapping jobs for this score set should be submitted manually."
     try:
         db: Session = ctx["db"]
+        redis: ArqRedis = ctx["redis"]
         score_set = db.scalars(select(ScoreSet).where(ScoreSet.id == score_set_id)).one()
         logging_context = setup_job_state(ctx, None, score_set.urn, correlation_id)
+        logging_context["attempt"] = attempt
         logger.info(msg="Started UniProt polling job", extra=logging_context)
 
         if not score_set or not score_set.target_genes:
@@ -1584,6 +1689,17 @@ async def poll_uniprot_mapping_jobs_for_score_set(
     try:
         uniprot_api = UniProtIDMappingAPI()
         for target_gene in score_set.target_genes:
+            job_id = mapping_jobs.get(target_gene.id)  # type: ignore
+
+            # Later polling attempts are only passed the mapping jobs which were unfinished in the previous attempt, so
+            # look up the job before checking the target. Otherwise, warnings about targets which are no longer polled
+            # would be sent again by every attempt.
+            if not job_id:
+                msg = f"No job ID found for target gene {target_gene.id} in score set {score_set.urn}. Skipped polling this target."
+                # This issue has already been sent to Slack in the job submission function, so we just log it here.
+                logger.debug(msg=msg, extra=logging_context)
+                continue
+
             acs = extract_ids_from_post_mapped_metadata(target_gene.post_mapped_metadata)  # type: ignore
             if not acs:
                 msg = f"No accession IDs found in post_mapped_metadata for target gene {target_gene.id} in score set {score_set.urn}. Skipped polling this target."
@@ -1596,17 +1712,15 @@ async def poll_uniprot_mapping_jobs_for_score_set(
                 continue
 
             mapped_ac = acs[0]
-            job_id = mapping_jobs.get(target_gene.id)  # type: ignore
 
-            if not job_id:
-                msg = f"No job ID found for target gene {target_gene.id} in score set {score_set.urn}. Skipped polling this target."
-                # This issue has already been sent to Slack in the job submission function, so we just log it here.
-                logger.debug(msg=msg, extra=logging_context)
-                continue
-
-            if not uniprot_api.check_id_mapping_results_ready(job_id):
-                msg = f"Job {job_id} not ready for target gene {target_gene.id} in score set {score_set.urn}. Skipped polling this target"
-                log_and_send_slack_message(msg, logging_context, logging.WARNING)
+            # Check each mapping job only once per run. Rather than blocking the worker while the mapping job runs, this
+            # job re-enqueues itself for unfinished mapping jobs until the polling attempts are exhausted.
+            if not uniprot_api.check_id_mapping_status(job_id):
+                logger.debug(
+                    msg=f"Job {job_id} not ready for target gene {target_gene.id} in score set {score_set.urn}.",
+                    extra=logging_context,
+                )
+                pending_mapping_jobs[target_gene.id] = job_id  # type: ignore
                 continue
 
             results = uniprot_api.get_id_mapping_results(job_id)
@@ -1625,6 +1739,7 @@ async def poll_uniprot_mapping_jobs_for_score_set(
             mapped_uniprot_id = mapped_ids[0][mapped_ac]["uniprot_id"]
             target_gene.uniprot_id_from_mapped_metadata = mapped_uniprot_id
             db.add(target_gene)
+            cache_uniprot_mappings(db, {mapped_ac: mapped_uniprot_id})
             logger.info(
                 msg=f"Updated target gene {target_gene.id} with UniProt ID {mapped_uniprot_id}", extra=logging_context
             )
@@ -1641,7 +1756,50 @@ async def poll_uniprot_mapping_jobs_for_score_set(
         return {"success": False, "retried": False, "enqueued_jobs": []}
 
     db.commit()
-    return {"success": True, "retried": False, "enqueued_jobs": []}
+
+    if not pending_mapping_jobs:
+        return {"success": True, "retried": False, "enqueued_jobs": []}
+
+    logging_context["pending_uniprot_mapping_jobs"] = len(pending_mapping_jobs)
+    if attempt >= uniprot_api.polling_tries:
+        for target_gene_id, job_id in pending_mapping_jobs.items():
+            msg = f"Job {job_id} not ready for target gene {target_gene_id} in score set {score_set.urn} after {attempt} polling attempts. Skipped polling this target"
+            log_and_send_slack_message(msg, logging_context, logging.WARNING)
+
+        return {"success": True, "retried": False, "enqueued_jobs": []}
+
+    new_job_id = None
+    try:
+        new_job = await redis.enqueue_job(
+            "poll_uniprot_mapping_jobs_for_score_set",
+            pending_mapping_jobs,
+            score_set_id,
+            correlation_id,
+            attempt + 1,
+            _defer_by=timedelta(seconds=uniprot_api.polling_interval),
+        )
+
+        if new_job:
+            new_job_id = new_job.job_id
+
+            logging_context["poll_uniprot_mapping_job_id"] = new_job_id
+            logger.info(msg="Enqueued another polling job for unfinished UniProt mapping jobs.", extra=logging_context)
+
+        else:
+            raise UniProtPollingEnqueueError()
+
+    except Exception as e:
+        send_slack_error(e)
+        logging_context = {**logging_context, **format_raised_exception_info_as_dict(e)}
+        log_and_send_slack_message(
+            msg="UniProt polling job encountered an unexpected error while attempting to enqueue another polling job for unfinished mapping jobs. This job will not be retried.",
+            ctx=logging_context,
+            level=logging.ERROR,
+        )
+
+        return {"success": False, "retried": False, "enqueued_jobs": []}
+
+    return {"success": True, "retried": True, "enqueued_jobs": [new_job_id]}
 
 
 ####################################################################################################
@@ -1722,7 +1880,7 @@ async def link_gnomad_variants(ctx: dict, correlation_id: str, score_set_id: int
         return {"success": False, "retried": False, "enqueued_job": None}
 
     try:
-        gnomad_variant_data = gnomad_variant_data_for_caids(variant_caids)
+        gnomad_variant_data = gnomad_variant_data_for_caids(variant_caids, db)
         num_gnomad_variants_with_caid_match = len(gnomad_variant_data)
         logging_context["num_gnomad_variants_with_caid_match"] = num_gnomad_variants_with_caid_match
 
@@ -1764,3 +1922,42 @@ async def link_gnomad_variants(ctx: dict, correlation_id: str, score_set_id: int
 
     logger.info(msg="Done linking gnomAD variants to mapped variants.", extra=logging_context)
     return {"success": True, "retried": False, "enqueued_job": None}
+
+
+####################################################################################################
+#  Annotation store
+####################################################################################################
+
+
+async def populate_annotation_store_for_score_set(ctx: dict, correlation_id: str, score_set_id: int) -> dict:
+    logging_context = {}
+    score_set = None
+    text = "Could not populate the annotation store for score set %s. Annotations for this score set will be generated on request until the store is populated."
+    db: Session = ctx["db"]
+    try:
+        score_set = db.scalars(select(ScoreSet).where(ScoreSet.id == score_set_id)).one()
+
+        logging_context = setup_job_state(ctx, None, score_set.urn, correlation_id)
+        logger.info(msg="Started populating the annotation store.", extra=logging_context)
+
+        num_stored_annotations = populate_annotation_store(db, score_set)
+        db.commit()
+
+        logging_context["num_stored_annotations"] = num_stored_annotations
+
+    except Exception as e:
+        db.rollback()
+        send_slack_error(e)
+        send_slack_message(text=text % (score_set.urn if score_set else score_set_id))
+
+        logging_context = {**logging_context, **format_raised_exception_info_as_dict(e)}
+        logger.error(
+            msg="Annotation store population encountered an unexpected error. This job will not be retried.",
+            extra=logging_context,
+        )
+
+        return {"success": False, "retried": False, "enqueued_job": None}
+
+    ctx["state"][ctx["job_id"]] = logging_context.copy()
+    logger.info(msg="Done populating the annotation store.", extra=logging_context)
+    return {"success": True, "retried": False, "enqueued_job": None}
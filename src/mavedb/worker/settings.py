@@ -6,21 +6,24 @@ from typing import Callable
 from arq.connections import RedisSettings
 from arq.cron import CronJob, cron
 
-from mavedb.data_providers.services import cdot_rest
+from mavedb.data_providers.services import shared_cdot_rest
 from mavedb.db.session import SessionLocal
 from mavedb.lib.logging.canonical import log_job
+from mavedb.lib.logging.sql import start_sql_statistics
 from mavedb.worker.jobs import (
     create_variants_for_score_set,
     map_variants_for_score_set,
     variant_mapper_manager,
-    refresh_materialized_views,
-    refresh_published_variants_view,
+    refresh_published_variants_for_score_set,
+    refresh_score_set_search_projections,
+    refresh_statistics_snapshots,
     submit_score_set_mappings_to_ldh,
     link_clingen_variants,
     poll_uniprot_mapping_jobs_for_score_set,
     submit_uniprot_mapping_jobs_for_score_set,
     link_gnomad_variants,
     submit_score_set_mappings_to_car,
+    populate_annotation_store_for_score_set,
 )
 
 # ARQ requires at least one task on startup.
@@ -28,24 +31,32 @@ BACKGROUND_FUNCTIONS: list[Callable] = [
     create_variants_for_score_set,
     variant_mapper_manager,
     map_variants_for_score_set,
-    refresh_published_variants_view,
+    refresh_published_variants_for_score_set,
     submit_score_set_mappings_to_ldh,
     link_clingen_variants,
     poll_uniprot_mapping_jobs_for_score_set,
     submit_uniprot_mapping_jobs_for_score_set,
     link_gnomad_variants,
     submit_score_set_mappings_to_car,
+    populate_annotation_store_for_score_set,
 ]
 # In UTC time. Depending on daylight savings time, this will bounce around by an hour but should always be very early in the morning
 # for all of the USA.
 BACKGROUND_CRONJOBS: list[CronJob] = [
     cron(
-        refresh_materialized_views,
-        name="refresh_all_materialized_views",
+        refresh_statistics_snapshots,
+        name="refresh_statistics_snapshots",
         hour=20,
-        minute=0,
+        minute=30,
         keep_result=timedelta(minutes=2).total_seconds(),
-    )
+    ),
+    # Refresh the search projections of published score sets which have changed since they were last refreshed.
+    cron(
+        refresh_score_set_search_projections,
+        name="refresh_stale_score_set_search_projections",
+        minute=set(range(0, 60, 10)),
+        keep_result=timedelta(minutes=2).total_seconds(),
+    ),
 ]
 
 REDIS_IP = os.getenv("REDIS_IP") or "localhost"
@@ -68,8 +79,9 @@ async def on_job_start(ctx):
     db = SessionLocal()
     db.current_user_id = None
     ctx["db"] = db
-    ctx["hdp"] = cdot_rest()
+    ctx["hdp"] = shared_cdot_rest()
     ctx["state"] = {}
+    ctx["sql_statistics"] = start_sql_statistics()
 
 
 async def on_job_end(ctx):
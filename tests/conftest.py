@@ -11,6 +11,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
 from mavedb.db.base import Base
+from mavedb.lib.logging.sql import enforce_sql_statement_budget
 from mavedb.models import *  # noqa: F403
 from mavedb.models.experiment import Experiment
 from mavedb.models.experiment_set import ExperimentSet
@@ -57,6 +58,21 @@ assert pytest_postgresql.factories
 email_validator.TEST_ENVIRONMENT = True
 
 
+@pytest.fixture(autouse=True)
+def sql_statement_budget(request):
+    """
+    Fail any request or worker job made by a test marked with `@pytest.mark.sql_statement_budget(n)` which issues more
+    than `n` SQL statements. A budget for the whole suite may be set with the SQL_STATEMENT_BUDGET environment variable.
+    """
+    marker = request.node.get_closest_marker("sql_statement_budget")
+    if marker is None:
+        yield
+        return
+
+    with enforce_sql_statement_budget(marker.args[0]):
+        yield
+
+
 @pytest.fixture()
 def session(postgresql):
     # Un-comment this line to log all database queries:
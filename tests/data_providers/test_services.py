@@ -0,0 +1,125 @@
+# ruff: noqa: E402
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+cdot = pytest.importorskip("cdot")
+
+from mavedb.data_providers import services
+from mavedb.data_providers.services import (
+    CDOT_TIMEOUT,
+    BoundedResponseCache,
+    LazySeqFetcher,
+    PooledRESTDataProvider,
+    pooled_session,
+    shared_cdot_rest,
+)
+from tests.helpers.constants import TEST_NT_CDOT_TRANSCRIPT, VALID_GENE, VALID_NT_ACCESSION
+
+
+def test_bounded_response_cache_evicts_least_recently_used_entries():
+    cache = BoundedResponseCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = None
+    cache["a"]
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert cache["a"] == 1
+    assert cache["c"] == 3
+    assert len(cache) == 2
+
+
+def test_lazy_seqfetcher_opens_wrapped_fetcher_on_first_fetch():
+    wrapped = MagicMock()
+    wrapped.fetch_seq.return_value = "ACGT"
+    factory = MagicMock(return_value=wrapped)
+    hdp = MagicMock()
+
+    seqfetcher = LazySeqFetcher(factory, "test.fasta")
+    seqfetcher.set_data_provider(hdp)
+    factory.assert_not_called()
+
+    assert seqfetcher.fetch_seq("NC_000001.11", 0, 4) == "ACGT"
+    assert seqfetcher.fetch_seq("NC_000001.11", 0, 4) == "ACGT"
+    factory.assert_called_once()
+    wrapped.set_data_provider.assert_called_once_with(hdp)
+
+
+def json_response(data):
+    response = MagicMock(status_code=200, headers={"Content-Type": "application/json"})
+    response.json.return_value = data
+    return response
+
+
+def test_pooled_session_pools_connections():
+    session = pooled_session(pool_size=3)
+
+    for url in ("http://cdot-rest:8000", "https://cdot.cc"):
+        assert session.get_adapter(url).poolmanager.connection_pool_kw["maxsize"] == 3
+
+
+def test_pooled_rest_data_provider_sends_requests_through_its_session():
+    session = MagicMock(spec=requests.Session)
+    session.get.return_value = json_response({"results": ["NM_001637.3"]})
+    hdp = PooledRESTDataProvider(url="http://cdot-rest:8000", session=session, timeout=5, seqfetcher=MagicMock())
+
+    assert hdp.get_tx_for_gene(VALID_GENE) == ["NM_001637.3"]
+    session.get.assert_called_once_with(f"http://cdot-rest:8000/transcripts/gene/{VALID_GENE}", timeout=5)
+
+
+def test_pooled_rest_data_provider_caches_transcripts():
+    session = MagicMock(spec=requests.Session)
+    session.get.return_value = json_response(TEST_NT_CDOT_TRANSCRIPT)
+    hdp = PooledRESTDataProvider(url="http://cdot-rest:8000", session=session, seqfetcher=MagicMock())
+
+    assert hdp.get_tx_identity_info(VALID_NT_ACCESSION)["hgnc"] == VALID_GENE
+    assert hdp.get_pro_ac_for_tx_ac(VALID_NT_ACCESSION) == TEST_NT_CDOT_TRANSCRIPT["protein"]
+    session.get.assert_called_once_with(f"http://cdot-rest:8000/transcript/{VALID_NT_ACCESSION}", timeout=CDOT_TIMEOUT)
+
+
+def test_pooled_rest_data_provider_caches_missing_transcripts():
+    session = MagicMock(spec=requests.Session)
+    session.get.return_value = MagicMock(status_code=404)
+    hdp = PooledRESTDataProvider(url="http://cdot-rest:8000", session=session, seqfetcher=MagicMock())
+
+    assert hdp.get_tx_identity_info("NM_000000.0") is None
+    assert hdp.get_tx_mapping_options("NM_000000.0") == []
+    session.get.assert_called_once()
+
+
+def test_pooled_rest_data_provider_does_not_cache_service_errors():
+    unavailable = MagicMock(status_code=503)
+    unavailable.raise_for_status.side_effect = requests.HTTPError("503 Server Error: Service Unavailable")
+    session = MagicMock(spec=requests.Session)
+    session.get.side_effect = [unavailable, json_response(TEST_NT_CDOT_TRANSCRIPT)]
+    hdp = PooledRESTDataProvider(url="http://cdot-rest:8000", session=session, seqfetcher=MagicMock())
+
+    with pytest.raises(requests.HTTPError):
+        hdp.get_tx_identity_info(VALID_NT_ACCESSION)
+
+    assert hdp.get_tx_identity_info(VALID_NT_ACCESSION)["hgnc"] == VALID_GENE
+    assert session.get.call_count == 2
+
+
+def test_pooled_rest_data_provider_rejects_non_json_responses():
+    session = MagicMock(spec=requests.Session)
+    session.get.return_value = MagicMock(status_code=200, headers={"Content-Type": "text/html"})
+    hdp = PooledRESTDataProvider(url="http://cdot-rest:8000", session=session, seqfetcher=MagicMock())
+
+    with pytest.raises(ValueError, match="Non-json response"):
+        hdp.get_gene_info(VALID_GENE)
+
+
+def test_shared_cdot_rest_is_created_once_per_process(monkeypatch):
+    monkeypatch.setattr(services, "_shared_cdot_rest", None)
+
+    with patch.object(services, "cdot_rest", side_effect=lambda: object()) as cdot_rest:
+        first = shared_cdot_rest()
+        assert shared_cdot_rest() is first
+        cdot_rest.assert_called_once()
+
+        services._reset_shared_cdot_rest()
+        assert shared_cdot_rest() is not first
+        assert cdot_rest.call_count == 2
@@ -1,12 +1,20 @@
+from copy import deepcopy
+from unittest.mock import patch
+
+import numpy as np
 import pytest
 from ga4gh.va_spec.acmg_2015 import VariantPathogenicityEvidenceLine
 from ga4gh.va_spec.base.enums import StrengthOfEvidenceProvided
 
 from mavedb.lib.annotation.classification import (
+    CalibrationClassificationIndex,
     ExperimentalVariantFunctionalImpactClassification,
     functional_classification_of_variant,
     pathogenicity_classification_of_variant,
 )
+from mavedb.view_models.score_calibration import FunctionalClassification
+
+from tests.helpers.constants import TEST_SAVED_FUNCTIONAL_RANGE_ABNORMAL, TEST_SAVED_FUNCTIONAL_RANGE_NORMAL
 
 
 @pytest.mark.parametrize(
@@ -228,3 +236,174 @@ def test_pathogenicity_classification_of_variant_with_invalid_evidence_strength_
         f"Variant {mock_mapped_variant_with_pathogenicity_calibration_score_set.variant.urn} is contained in a clinical calibration range with an invalid evidence strength"
         in str(exc.value)
     )
+
+
+### Tests for CalibrationClassificationIndex ###
+
+
+def functional_range(saved_range, **overrides):
+    return FunctionalClassification.model_validate({**deepcopy(saved_range), **overrides})
+
+
+def first_containing_range_index(functional_ranges, score):
+    return next((idx for idx, r in enumerate(functional_ranges) if r.is_contained_by_range(score)), -1)
+
+
+CLASSIFICATION_INDEX_TEST_SCORES = [
+    -np.inf,
+    -10.0,
+    -5.0,
+    -3.0,
+    -1.0,
+    -0.5,
+    0.0,
+    1.0,
+    np.nextafter(1.0, -np.inf),
+    np.nextafter(5.0, -np.inf),
+    5.0,
+    10.0,
+    np.inf,
+    np.nan,
+]
+
+
+@pytest.mark.parametrize(
+    "ranges",
+    [
+        [TEST_SAVED_FUNCTIONAL_RANGE_NORMAL, TEST_SAVED_FUNCTIONAL_RANGE_ABNORMAL],
+        [
+            {**TEST_SAVED_FUNCTIONAL_RANGE_NORMAL, "range": [1.0, None], "inclusiveUpperBound": False},
+            {**TEST_SAVED_FUNCTIONAL_RANGE_ABNORMAL, "range": [None, -1.0], "inclusiveLowerBound": False},
+        ],
+        [
+            {**TEST_SAVED_FUNCTIONAL_RANGE_NORMAL, "inclusiveLowerBound": False, "inclusiveUpperBound": True},
+            {**TEST_SAVED_FUNCTIONAL_RANGE_ABNORMAL, "inclusiveLowerBound": False, "inclusiveUpperBound": True},
+        ],
+        [],
+    ],
+)
+def test_classification_index_matches_range_containment(ranges):
+    functional_ranges = [functional_range(r) for r in ranges]
+    index = CalibrationClassificationIndex(functional_ranges)
+
+    expected = [first_containing_range_index(functional_ranges, score) for score in CLASSIFICATION_INDEX_TEST_SCORES]
+    assert index.range_indices(CLASSIFICATION_INDEX_TEST_SCORES).tolist() == expected
+
+
+def test_classification_index_prefers_first_of_overlapping_ranges():
+    not_specified = functional_range(
+        TEST_SAVED_FUNCTIONAL_RANGE_NORMAL,
+        label="not specified",
+        functionalClassification="not_specified",
+        range=[0.0, 3.0],
+        acmgClassification=None,
+        oddspathsRatio=None,
+    )
+    normal = functional_range(TEST_SAVED_FUNCTIONAL_RANGE_NORMAL)
+
+    assert CalibrationClassificationIndex([not_specified, normal]).range_indices([0.5, 2.0, 4.0]).tolist() == [0, 0, 1]
+    assert CalibrationClassificationIndex([normal, not_specified]).range_indices([0.5, 2.0, 4.0]).tolist() == [1, 0, 0]
+
+
+def test_classification_index_functional_classifications():
+    index = CalibrationClassificationIndex(
+        [functional_range(TEST_SAVED_FUNCTIONAL_RANGE_NORMAL), functional_range(TEST_SAVED_FUNCTIONAL_RANGE_ABNORMAL)]
+    )
+
+    assert index.functional_classifications([2.0, -2.0, 0.0, np.nan]).tolist() == [
+        ExperimentalVariantFunctionalImpactClassification.NORMAL,
+        ExperimentalVariantFunctionalImpactClassification.ABNORMAL,
+        ExperimentalVariantFunctionalImpactClassification.INDETERMINATE,
+        ExperimentalVariantFunctionalImpactClassification.INDETERMINATE,
+    ]
+
+
+def test_classification_index_pathogenicity_classifications():
+    index = CalibrationClassificationIndex(
+        [functional_range(TEST_SAVED_FUNCTIONAL_RANGE_NORMAL), functional_range(TEST_SAVED_FUNCTIONAL_RANGE_ABNORMAL)]
+    )
+
+    criteria, strengths = index.pathogenicity_classifications([2.0, -2.0, 0.0])
+    assert criteria.tolist() == [
+        VariantPathogenicityEvidenceLine.Criterion.BS3,
+        VariantPathogenicityEvidenceLine.Criterion.PS3,
+        VariantPathogenicityEvidenceLine.Criterion.PS3,
+    ]
+    assert strengths.tolist() == [StrengthOfEvidenceProvided.STRONG, StrengthOfEvidenceProvided.STRONG, None]
+
+
+def test_classification_index_pathogenicity_classifications_with_invalid_evidence_strength():
+    invalid_range = deepcopy(TEST_SAVED_FUNCTIONAL_RANGE_NORMAL)
+    invalid_range["acmgClassification"]["evidenceStrength"] = "MODERATE_PLUS"
+    invalid_range["oddspathsRatio"] = None
+    index = CalibrationClassificationIndex([functional_range(invalid_range)])
+
+    # Scores outside of the invalid range may still be classified.
+    criteria, strengths = index.pathogenicity_classifications([0.0])
+    assert criteria.tolist() == [VariantPathogenicityEvidenceLine.Criterion.PS3]
+    assert strengths.tolist() == [None]
+
+    with pytest.raises(ValueError, match="invalid evidence strength"):
+        index.pathogenicity_classifications([0.0, 2.0])
+
+
+def test_classification_index_classifies_scores_of_a_batch_with_a_single_search():
+    index = CalibrationClassificationIndex(
+        [functional_range(TEST_SAVED_FUNCTIONAL_RANGE_NORMAL), functional_range(TEST_SAVED_FUNCTIONAL_RANGE_ABNORMAL)]
+    )
+
+    with patch.object(index, "range_indices", wraps=index.range_indices) as range_indices:
+        index.classify_batch([2.0, -2.0, 0.0])
+        functional_classifications = [index.functional_classification(score) for score in (2.0, -2.0, 0.0)]
+        pathogenicity_classification = index.pathogenicity_classification(2.0)
+
+    range_indices.assert_called_once()
+    assert functional_classifications == [
+        ExperimentalVariantFunctionalImpactClassification.NORMAL,
+        ExperimentalVariantFunctionalImpactClassification.ABNORMAL,
+        ExperimentalVariantFunctionalImpactClassification.INDETERMINATE,
+    ]
+    assert pathogenicity_classification == (
+        VariantPathogenicityEvidenceLine.Criterion.BS3,
+        StrengthOfEvidenceProvided.STRONG,
+    )
+
+
+def test_classification_index_classifies_scores_outside_of_the_batch():
+    index = CalibrationClassificationIndex(
+        [functional_range(TEST_SAVED_FUNCTIONAL_RANGE_NORMAL), functional_range(TEST_SAVED_FUNCTIONAL_RANGE_ABNORMAL)]
+    )
+
+    index.classify_batch([2.0])
+    assert index.functional_classification(-2.0) == ExperimentalVariantFunctionalImpactClassification.ABNORMAL
+    assert index.functional_classification(np.nan) == ExperimentalVariantFunctionalImpactClassification.INDETERMINATE
+
+
+def test_classification_index_pathogenicity_classification_with_invalid_evidence_strength():
+    invalid_range = deepcopy(TEST_SAVED_FUNCTIONAL_RANGE_NORMAL)
+    invalid_range["acmgClassification"]["evidenceStrength"] = "MODERATE_PLUS"
+    invalid_range["oddspathsRatio"] = None
+    index = CalibrationClassificationIndex([functional_range(invalid_range)])
+
+    index.classify_batch([0.0, 2.0])
+    assert index.pathogenicity_classification(0.0) == (VariantPathogenicityEvidenceLine.Criterion.PS3, None)
+    with pytest.raises(ValueError, match="invalid evidence strength"):
+        index.pathogenicity_classification(2.0)
+
+
+def test_classification_of_variant_uses_provided_classification_index(
+    mock_mapped_variant_with_pathogenicity_calibration_score_set,
+):
+    mock_mapped_variant_with_pathogenicity_calibration_score_set.variant.data["score_data"]["score"] = 2
+    index = CalibrationClassificationIndex([functional_range(TEST_SAVED_FUNCTIONAL_RANGE_ABNORMAL, range=[1.0, 5.0])])
+
+    assert (
+        functional_classification_of_variant(mock_mapped_variant_with_pathogenicity_calibration_score_set, index)
+        == ExperimentalVariantFunctionalImpactClassification.ABNORMAL
+    )
+    assert pathogenicity_classification_of_variant(
+        mock_mapped_variant_with_pathogenicity_calibration_score_set, index
+    ) == (
+        VariantPathogenicityEvidenceLine.Criterion.PS3,
+        StrengthOfEvidenceProvided.STRONG,
+    )
@@ -0,0 +1,97 @@
+from copy import deepcopy
+from unittest import mock
+
+from mavedb.lib.annotation.annotate import (
+    variant_functional_impact_statement,
+    variant_pathogenicity_evidence,
+    variant_study_result,
+)
+from mavedb.lib.annotation.context import AnnotationContext
+from mavedb.lib.annotation.study_result import mapped_variant_to_experimental_variant_impact_study_result
+
+
+def test_annotation_context_builds_shared_objects_once(mock_mapped_variant_with_pathogenicity_calibration_score_set):
+    score_set = mock_mapped_variant_with_pathogenicity_calibration_score_set.variant.score_set
+    context = AnnotationContext(score_set)
+
+    with mock.patch(
+        "mavedb.lib.annotation.context.score_set_to_data_set", wraps=lambda score_set: mock.sentinel.data_set
+    ) as data_set:
+        assert context.data_set is mock.sentinel.data_set
+        assert context.data_set is mock.sentinel.data_set
+
+    data_set.assert_called_once_with(score_set)
+    assert context.api_contribution is context.api_contribution
+    assert context.classification_index is context.classification_index
+
+
+def test_annotation_context_reuses_variant_contributions(mock_mapped_variant_with_pathogenicity_calibration_score_set):
+    mapped_variant = mock_mapped_variant_with_pathogenicity_calibration_score_set
+    context = AnnotationContext(mapped_variant.variant.score_set)
+
+    assert context.vrs_contribution(mapped_variant) is context.vrs_contribution(mapped_variant)
+    assert context.creator_contribution(mapped_variant.variant) is context.creator_contribution(mapped_variant.variant)
+    assert context.modifier_contribution(mapped_variant.variant) is context.modifier_contribution(
+        mapped_variant.variant
+    )
+
+
+def test_annotation_context_caches_calibration_requirements(
+    mock_mapped_variant_with_pathogenicity_calibration_score_set,
+):
+    context = AnnotationContext(mock_mapped_variant_with_pathogenicity_calibration_score_set.variant.score_set)
+
+    with mock.patch(
+        "mavedb.lib.annotation.context.score_set_has_required_calibrations_and_ranges_for_annotation",
+        return_value=True,
+    ) as required_calibrations:
+        assert context.has_required_calibrations_for_annotation("pathogenicity")
+        assert context.has_required_calibrations_for_annotation("pathogenicity")
+
+    required_calibrations.assert_called_once()
+
+
+def test_annotations_with_context_match_annotations_without_context(
+    mock_mapped_variant_with_pathogenicity_calibration_score_set,
+):
+    mapped_variant = mock_mapped_variant_with_pathogenicity_calibration_score_set
+    context = AnnotationContext(mapped_variant.variant.score_set)
+
+    for annotation_function in (
+        variant_study_result,
+        variant_functional_impact_statement,
+        variant_pathogenicity_evidence,
+    ):
+        with_context = annotation_function(mapped_variant, context)
+        without_context = annotation_function(mapped_variant)
+
+        assert with_context is not None
+        assert with_context.model_dump(exclude={"date"}) == without_context.model_dump(exclude={"date"})
+
+
+def test_annotations_with_context_share_objects_across_variants(
+    mock_mapped_variant_with_pathogenicity_calibration_score_set,
+):
+    mapped_variant = mock_mapped_variant_with_pathogenicity_calibration_score_set
+    other_mapped_variant = deepcopy(mapped_variant)
+    other_mapped_variant.variant.score_set = mapped_variant.variant.score_set
+    context = AnnotationContext(mapped_variant.variant.score_set)
+
+    result = variant_study_result(mapped_variant, context)
+    other_result = variant_study_result(other_mapped_variant, context)
+
+    assert result.sourceDataSet is other_result.sourceDataSet
+    assert result.specifiedBy is other_result.specifiedBy
+
+
+def test_variant_pathogenicity_evidence_builds_one_study_result(
+    mock_mapped_variant_with_pathogenicity_calibration_score_set,
+):
+    with mock.patch(
+        "mavedb.lib.annotation.annotate.mapped_variant_to_experimental_variant_impact_study_result",
+        wraps=mapped_variant_to_experimental_variant_impact_study_result,
+    ) as study_result:
+        result = variant_pathogenicity_evidence(mock_mapped_variant_with_pathogenicity_calibration_score_set)
+
+    assert result is not None
+    study_result.assert_called_once()
@@ -0,0 +1,134 @@
+import multiprocessing
+import pickle
+from concurrent.futures import Future, ProcessPoolExecutor
+from copy import deepcopy
+from unittest import mock
+
+import pytest
+
+from mavedb.lib.annotation.context import AnnotationContext
+from mavedb.lib.annotation.executor import (
+    annotate_batches_in_pool,
+    annotate_snapshots,
+    initialize_annotation_process,
+    mapped_variant_from_snapshot,
+    mapped_variant_snapshot,
+)
+from mavedb.lib.annotation.store import generate_serialized_annotation
+from mavedb.models.enums.annotation_type import AnnotationType
+from mavedb.models.mapped_variant import MappedVariant
+from mavedb.models.score_set import ScoreSet
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    with ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("spawn"), initializer=initialize_annotation_process
+    ) as pool:
+        yield pool
+
+
+@pytest.fixture
+def mapped_variants(mock_mapped_variant_with_pathogenicity_calibration_score_set):
+    mapped_variant = mock_mapped_variant_with_pathogenicity_calibration_score_set
+    mapped_variants = []
+    for i, score in enumerate([-5.0, 0.0, 1.0, 5.0, None], start=1):
+        other_mapped_variant = deepcopy(mapped_variant)
+        other_mapped_variant.id = i
+        other_mapped_variant.variant.score_set = mapped_variant.variant.score_set
+        other_mapped_variant.variant.urn = f"{mapped_variant.variant.urn.split('#')[0]}#{i}"
+        other_mapped_variant.variant.data = {"score_data": {"score": score}}
+        mapped_variants.append(other_mapped_variant)
+
+    return mapped_variants
+
+
+def test_mapped_variant_snapshot_round_trip(mock_mapped_variant_with_pathogenicity_calibration_score_set):
+    mapped_variant = mock_mapped_variant_with_pathogenicity_calibration_score_set
+    mapped_variant.id = 1
+
+    score_set = ScoreSet(urn=mapped_variant.variant.score_set.urn)
+    rebuilt = mapped_variant_from_snapshot(
+        pickle.loads(pickle.dumps(mapped_variant_snapshot(mapped_variant))), score_set
+    )
+
+    assert isinstance(rebuilt, MappedVariant)
+    assert rebuilt.post_mapped == mapped_variant.post_mapped
+    assert rebuilt.variant.urn == mapped_variant.variant.urn
+    assert rebuilt.variant.data == mapped_variant.variant.data
+    assert rebuilt.variant.creation_date == mapped_variant.variant.creation_date
+    assert rebuilt.variant.score_set is score_set
+
+
+def test_detached_context_does_not_refer_to_score_set(mock_mapped_variant_with_pathogenicity_calibration_score_set):
+    context = AnnotationContext(mock_mapped_variant_with_pathogenicity_calibration_score_set.variant.score_set)
+
+    detached = pickle.loads(pickle.dumps(context.detached()))
+
+    assert isinstance(detached.score_set, ScoreSet)
+    assert detached.score_set.urn == context.score_set.urn
+    assert detached.score_set.score_calibrations == []
+    assert detached.creator.username == context.creator.username
+    assert detached.data_set == context.data_set
+    assert detached.has_required_calibrations_for_annotation("pathogenicity")
+
+
+@pytest.mark.parametrize("annotation_type", list(AnnotationType))
+def test_annotate_snapshots_matches_annotations_of_mapped_variants(mapped_variants, annotation_type):
+    context = AnnotationContext(mapped_variants[0].variant.score_set)
+
+    annotated_batch = annotate_snapshots(
+        [mapped_variant_snapshot(mv) for mv in mapped_variants], annotation_type, context.detached()
+    )
+
+    assert annotated_batch == [
+        (mv.variant.urn, generate_serialized_annotation(mv, annotation_type, context)) for mv in mapped_variants
+    ]
+
+
+@pytest.mark.parametrize("max_batches_in_flight", [1, 2, 10])
+def test_annotate_batches_in_pool_preserves_batch_order(process_pool, mapped_variants, max_batches_in_flight):
+    context = AnnotationContext(mapped_variants[0].variant.score_set)
+    batches = [mapped_variants[:2], mapped_variants[2:4], mapped_variants[4:]]
+
+    annotated_batches = list(
+        annotate_batches_in_pool(
+            process_pool, batches, AnnotationType.pathogenicity_evidence_line, context, max_batches_in_flight
+        )
+    )
+
+    assert annotated_batches == [
+        [
+            (mv.variant.urn, generate_serialized_annotation(mv, AnnotationType.pathogenicity_evidence_line, context))
+            for mv in batch
+        ]
+        for batch in batches
+    ]
+
+
+def test_annotate_batches_in_pool_limits_batches_in_flight(mapped_variants):
+    context = AnnotationContext(mapped_variants[0].variant.score_set)
+    pool = mock.Mock()
+    futures = []
+
+    def submit(fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        futures.append(future)
+        return future
+
+    pool.submit.side_effect = submit
+    annotated_batches = annotate_batches_in_pool(
+        pool, [[mv] for mv in mapped_variants], AnnotationType.functional_study_result, context, 2
+    )
+
+    next(annotated_batches)
+    assert pool.submit.call_count == 2
+    next(annotated_batches)
+    assert pool.submit.call_count == 3
+
+    # Closing the stream early cancels the batches which were submitted but not yet yielded.
+    with mock.patch.object(Future, "cancel") as cancel:
+        annotated_batches.close()
+
+    cancel.assert_called_once()
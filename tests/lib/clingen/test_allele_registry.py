@@ -0,0 +1,34 @@
+from sqlalchemy import select
+
+from mavedb.lib.clingen.allele_registry import cache_allele_registrations, get_cached_allele_registrations
+from mavedb.models.clingen_allele_registration import ClinGenAlleleRegistration
+
+
+def test_get_cached_allele_registrations_empty_cache(session):
+    assert get_cached_allele_registrations(session, ["NM_0001:c.1A>G"]) == {}
+
+
+def test_cache_allele_registrations_round_trip(session):
+    cache_allele_registrations(session, {"NM_0001:c.1A>G": "CA1", "NM_0002:c.2T>C": "CA2"})
+    session.commit()
+
+    cached = get_cached_allele_registrations(session, ["NM_0001:c.1A>G", "NM_0002:c.2T>C", "NM_0003:c.3G>A"])
+    assert cached == {"NM_0001:c.1A>G": "CA1", "NM_0002:c.2T>C": "CA2"}
+
+
+def test_cache_allele_registrations_replaces_existing_registration(session):
+    cache_allele_registrations(session, {"NM_0001:c.1A>G": "CA1"})
+    session.commit()
+    cache_allele_registrations(session, {"NM_0001:c.1A>G": "CA2"})
+    session.commit()
+
+    registrations = session.scalars(select(ClinGenAlleleRegistration)).all()
+    assert len(registrations) == 1
+    assert registrations[0].clingen_allele_id == "CA2"
+
+
+def test_cache_allele_registrations_empty(session):
+    cache_allele_registrations(session, {})
+    session.commit()
+
+    assert session.scalars(select(ClinGenAlleleRegistration)).all() == []
@@ -320,9 +320,10 @@ class TestClinGenAlleleRegistryService:
         assert result[0]["@id"].endswith("CA123")
         mock_put.assert_called_once()
 
+    @patch("mavedb.lib.clingen.services.time.sleep")
     @patch("mavedb.lib.clingen.services.requests.put")
     @patch("mavedb.lib.clingen.services.ClinGenAlleleRegistryService.construct_auth_url")
-    def test_dispatch_submissions_failure(self, mock_auth_url, mock_put, car_service):
+    def test_dispatch_submissions_failure(self, mock_auth_url, mock_put, mock_sleep, car_service):
         mock_auth_url.return_value = "https://example.com/api?auth"
         mock_put.side_effect = requests.exceptions.RequestException("Failed")
 
@@ -330,6 +331,67 @@ class TestClinGenAlleleRegistryService:
         result = car_service.dispatch_submissions(content_submissions)
         assert result == []
 
+    @patch("mavedb.lib.clingen.services.requests.put")
+    @patch("mavedb.lib.clingen.services.ClinGenAlleleRegistryService.construct_auth_url")
+    def test_dispatch_submissions_in_batches(self, mock_auth_url, mock_put, car_service):
+        mock_auth_url.return_value = "https://example.com/api?auth"
+
+        def registry_response(url, data):
+            mock_response = MagicMock()
+            mock_response.json.return_value = [
+                {"@id": f"http://reg.test.genome.network/allele/CA{idx}", "genomicAlleles": [{"hgvs": [hgvs]}]}
+                for idx, hgvs in enumerate(data.split("\n"))
+            ]
+            return mock_response
+
+        mock_put.side_effect = registry_response
+
+        content_submissions = [f"NM_0001:c.{idx}A>G" for idx in range(1, 6)]
+        result = car_service.dispatch_submissions(content_submissions, batch_size=2)
+
+        assert mock_put.call_count == 3
+        assert len(result) == len(content_submissions)
+        assert sorted(hgvs for call in mock_put.call_args_list for hgvs in call.kwargs["data"].split("\n")) == sorted(
+            content_submissions
+        )
+
+    @patch("mavedb.lib.clingen.services.time.sleep")
+    @patch("mavedb.lib.clingen.services.requests.put")
+    @patch("mavedb.lib.clingen.services.ClinGenAlleleRegistryService.construct_auth_url")
+    def test_dispatch_submissions_retries_failed_batch(self, mock_auth_url, mock_put, mock_sleep, car_service):
+        mock_auth_url.return_value = "https://example.com/api?auth"
+        mock_response = MagicMock()
+        mock_response.json.return_value = [{"@id": "http://reg.test.genome.network/allele/CA123"}]
+        mock_put.side_effect = [requests.exceptions.RequestException("Failed"), mock_response]
+
+        result = car_service.dispatch_submissions(["NM_0001:c.1A>G"])
+
+        assert mock_put.call_count == 2
+        mock_sleep.assert_called_once()
+        assert result == mock_response.json.return_value
+
+    @patch("mavedb.lib.clingen.services.CAR_SUBMISSION_RETRY_LIMIT", 0)
+    @patch("mavedb.lib.clingen.services.CAR_SUBMISSION_MAX_WORKERS", 1)
+    @patch("mavedb.lib.clingen.services.requests.put")
+    @patch("mavedb.lib.clingen.services.ClinGenAlleleRegistryService.construct_auth_url")
+    def test_dispatch_submissions_partial_failure(self, mock_auth_url, mock_put, car_service):
+        mock_auth_url.return_value = "https://example.com/api?auth"
+        mock_response = MagicMock()
+        mock_response.json.return_value = [{"@id": "http://reg.test.genome.network/allele/CA123"}]
+        mock_put.side_effect = [mock_response, requests.exceptions.RequestException("Failed")]
+
+        result = car_service.dispatch_submissions(["NM_0001:c.1A>G", "NM_0002:c.2T>C"], batch_size=1)
+
+        assert mock_put.call_count == 2
+        assert result == mock_response.json.return_value
+
+    def test_dispatch_submissions_empty(self, car_service):
+        with patch("mavedb.lib.clingen.services.requests.put") as mock_put:
+            result = car_service.dispatch_submissions([])
+
+        mock_put.assert_not_called()
+        assert result == []
+
 
 def test_get_allele_registry_associations_success():
     content_submissions = ["NM_0001:c.1A>G", "NM_0002:c.2T>C", "NM_0003:c.3G>A"]
@@ -0,0 +1,89 @@
+# ruff: noqa: E402
+
+"""Tests for request-scoped memoization of permission decisions."""
+
+import pytest
+
+pytest.importorskip("fastapi", reason="Skipping permissions tests; FastAPI is required but not installed.")
+pytest.importorskip("psycopg2")
+
+from unittest.mock import Mock, patch
+
+from sqlalchemy import inspect, select
+
+from mavedb.lib.permissions import Action, has_permission, prefetch_permission_relationships
+from mavedb.lib.permissions.cache import PERMISSION_CACHE_INFO_KEY
+from mavedb.lib.types.authentication import UserData
+from mavedb.models.score_set import ScoreSet
+from mavedb.models.user import User
+from tests.helpers.constants import TEST_USER
+
+
+@pytest.fixture
+def owner_data(session, setup_lib_db):
+    owner = session.scalars(select(User).where(User.username == TEST_USER["username"])).one()
+    return UserData(user=owner, active_roles=[])
+
+
+def test_permission_decisions_are_memoized_in_the_session(session, owner_data, setup_lib_db_with_score_set):
+    score_set = setup_lib_db_with_score_set
+
+    first = has_permission(owner_data, score_set, Action.READ)
+    with patch("mavedb.lib.permissions.core.score_set.has_permission") as handler:
+        second = has_permission(owner_data, score_set, Action.READ)
+        handler.assert_not_called()
+
+    assert second is first
+    assert len(session.info[PERMISSION_CACHE_INFO_KEY]) == 1
+
+
+def test_permission_decisions_are_memoized_per_user_and_action(session, owner_data, setup_lib_db_with_score_set):
+    score_set = setup_lib_db_with_score_set
+
+    has_permission(owner_data, score_set, Action.READ)
+    has_permission(owner_data, score_set, Action.UPDATE)
+    has_permission(None, score_set, Action.READ)
+
+    assert len(session.info[PERMISSION_CACHE_INFO_KEY]) == 3
+
+
+def test_permission_cache_is_cleared_on_flush(session, owner_data, setup_lib_db_with_score_set):
+    score_set = setup_lib_db_with_score_set
+    assert has_permission(None, score_set, Action.READ).permitted is False
+
+    score_set.private = False
+    session.commit()
+
+    assert PERMISSION_CACHE_INFO_KEY not in session.info
+    assert has_permission(None, score_set, Action.READ).permitted is True
+
+
+def test_permission_decisions_on_modified_entities_are_not_memoized(session, setup_lib_db_with_score_set):
+    score_set = setup_lib_db_with_score_set
+    score_set.private = False
+
+    assert has_permission(None, score_set, Action.READ).permitted is True
+    assert not session.info.get(PERMISSION_CACHE_INFO_KEY)
+
+    score_set.private = True
+    assert has_permission(None, score_set, Action.READ).permitted is False
+
+
+def test_permission_decisions_on_unmapped_entities_are_not_memoized(session):
+    entity = Mock(spec=ScoreSet, private=False, contributors=[])
+    with patch("mavedb.lib.permissions.core.type", return_value=ScoreSet):
+        assert has_permission(None, entity, Action.READ).permitted is True
+
+    assert PERMISSION_CACHE_INFO_KEY not in session.info
+
+
+def test_prefetch_permission_relationships_loads_contributors(session, setup_lib_db_with_score_set):
+    score_set_id = setup_lib_db_with_score_set.id
+    session.expunge_all()
+
+    score_set = session.get(ScoreSet, score_set_id)
+    assert "contributors" in inspect(score_set).unloaded
+
+    prefetch_permission_relationships(session, [score_set])
+
+    assert "contributors" not in inspect(score_set).unloaded
@@ -0,0 +1,112 @@
+# ruff: noqa: E402
+
+"""Tests that SQL permission filters agree with per-entity permission checks."""
+
+import pytest
+
+pytest.importorskip("fastapi", reason="Skipping permissions tests; FastAPI is required but not installed.")
+pytest.importorskip("psycopg2")
+
+from sqlalchemy import select
+
+from mavedb.lib.permissions import Action, has_permission, permitted_filter
+from mavedb.lib.types.authentication import UserData
+from mavedb.models.collection import Collection
+from mavedb.models.collection_user_association import CollectionUserAssociation
+from mavedb.models.contributor import Contributor
+from mavedb.models.enums.contribution_role import ContributionRole
+from mavedb.models.enums.user_role import UserRole
+from mavedb.models.experiment import Experiment
+from mavedb.models.experiment_set import ExperimentSet
+from mavedb.models.license import License
+from mavedb.models.score_calibration import ScoreCalibration
+from mavedb.models.score_set import ScoreSet
+from mavedb.models.user import User
+from tests.helpers.constants import ADMIN_USER, EXTRA_USER, TEST_EXPERIMENT, TEST_USER
+
+FILTERED_ENTITY_TYPES = [Collection, Experiment, ExperimentSet, ScoreSet]
+
+
+@pytest.fixture
+def entities_with_permissions(session, setup_lib_db):
+    """
+    Private and public entities of each filtered type owned by the test user. The extra user contributes to, or holds
+    a collection role in, one of the private entities of each type but not the other.
+    """
+    owner = session.scalars(select(User).where(User.username == TEST_USER["username"])).one()
+    extra_user = session.scalars(select(User).where(User.username == EXTRA_USER["username"])).one()
+    contributor = Contributor(orcid_id=extra_user.username)
+    license = session.scalars(select(License)).first()
+    ownership = {"created_by_id": owner.id, "modified_by_id": owner.id}
+
+    for private, shared in [(False, False), (True, False), (True, True)]:
+        contributors = [contributor] if shared else []
+        experiment_set = ExperimentSet(private=private, extra_metadata={}, contributors=contributors, **ownership)
+        experiment = Experiment(
+            **TEST_EXPERIMENT, experiment_set=experiment_set, private=private, contributors=contributors, **ownership
+        )
+        score_set = ScoreSet(
+            title="Test Score Set",
+            short_description="Test score set",
+            abstract_text="Abstract",
+            method_text="Methods",
+            extra_metadata={},
+            experiment=experiment,
+            license=license,
+            private=private,
+            contributors=contributors,
+            **ownership,
+        )
+        collection = Collection(name="Test Collection", private=private, **ownership)
+        if shared:
+            collection.user_associations = [
+                CollectionUserAssociation(user=extra_user, contribution_role=ContributionRole.viewer)
+            ]
+
+        session.add_all([experiment_set, experiment, score_set, collection])
+
+    session.add(User(username="0000-0000-0000-000X", first_name="Other", last_name="User", is_active=True))
+    session.commit()
+
+
+def requesting_user_data(session, requester):
+    if requester == "anonymous":
+        return None
+
+    username, active_roles = {
+        "owner": (TEST_USER["username"], []),
+        "contributor": (EXTRA_USER["username"], []),
+        "other_user": ("0000-0000-0000-000X", []),
+        "admin": (ADMIN_USER["username"], [UserRole.admin]),
+        "mapper": ("0000-0000-0000-000X", [UserRole.mapper]),
+    }[requester]
+    user = session.scalars(select(User).where(User.username == username)).one()
+    return UserData(user=user, active_roles=active_roles)
+
+
+@pytest.mark.parametrize("entity_type", FILTERED_ENTITY_TYPES)
+@pytest.mark.parametrize("requester", ["anonymous", "owner", "contributor", "other_user", "admin", "mapper"])
+def test_permitted_filter_matches_has_permission(session, entities_with_permissions, entity_type, requester):
+    user_data = requesting_user_data(session, requester)
+
+    filtered_ids = set(
+        session.scalars(select(entity_type.id).where(permitted_filter(user_data, entity_type, Action.READ))).all()
+    )
+    permitted_ids = {
+        entity.id
+        for entity in session.scalars(select(entity_type)).all()
+        if has_permission(user_data, entity, Action.READ).permitted
+    }
+
+    assert filtered_ids == permitted_ids
+
+
+def test_permitted_filter_raises_for_unsupported_entity_type():
+    with pytest.raises(NotImplementedError, match="ScoreCalibration"):
+        permitted_filter(None, ScoreCalibration, Action.READ)
+
+
+@pytest.mark.parametrize("entity_type", FILTERED_ENTITY_TYPES)
+def test_permitted_filter_raises_for_unsupported_action(entity_type):
+    with pytest.raises(NotImplementedError, match="update"):
+        permitted_filter(None, entity_type, Action.UPDATE)
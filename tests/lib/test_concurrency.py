@@ -0,0 +1,105 @@
+# ruff: noqa: E402
+import asyncio
+import contextvars
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+
+pytest.importorskip("anyio")
+
+from anyio import to_thread
+
+from mavedb.lib.concurrency import (
+    ContextThreadPoolExecutor,
+    run_coroutine_in_thread,
+    run_in_worker_thread,
+    run_on_event_loop,
+)
+from mavedb.lib.logging.sql import current_sql_statistics, start_sql_statistics
+
+
+async def add(a, b, *, c=0):
+    await asyncio.sleep(0)
+    return a + b + c
+
+
+def test_run_coroutine_in_thread():
+    assert run_coroutine_in_thread(add, 1, 2, c=3) == 6
+
+
+@pytest.mark.asyncio
+async def test_run_coroutine_in_thread_from_threadpool_does_not_use_running_loop():
+    running_loop = asyncio.get_running_loop()
+
+    async def loop_of_coroutine():
+        return asyncio.get_running_loop()
+
+    loop = await to_thread.run_sync(run_coroutine_in_thread, loop_of_coroutine)
+    assert loop is not running_loop
+
+
+@pytest.mark.asyncio
+async def test_run_on_event_loop_from_threadpool_uses_running_loop():
+    running_loop = asyncio.get_running_loop()
+
+    async def loop_of_coroutine():
+        return asyncio.get_running_loop()
+
+    assert await to_thread.run_sync(run_on_event_loop, loop_of_coroutine) is running_loop
+    assert await to_thread.run_sync(lambda: run_on_event_loop(add, 1, 2, c=3)) == 6
+
+
+@pytest.mark.asyncio
+async def test_run_in_worker_thread_does_not_block_event_loop():
+    release = threading.Event()
+
+    def blocking(a, *, b):
+        release.wait(timeout=5)
+        return threading.get_ident(), a + b
+
+    task = asyncio.create_task(run_in_worker_thread(blocking, 1, b=2))
+
+    # The event loop stays free to run other coroutines while the blocking function waits.
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    release.set()
+    thread_id, result = await task
+    assert thread_id != threading.get_ident()
+    assert result == 3
+
+
+def execute_statement(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    return current_sql_statistics()
+
+
+def test_context_thread_pool_executor_records_sql_statistics_of_submitting_context():
+    engine = create_engine("sqlite://")
+
+    def submit_statements():
+        statistics = start_sql_statistics()
+        with ContextThreadPoolExecutor(max_workers=2) as executor:
+            thread_statistics = list(executor.map(lambda _: execute_statement(engine), range(4)))
+
+        return statistics, thread_statistics
+
+    statistics, thread_statistics = contextvars.copy_context().run(submit_statements)
+    engine.dispose()
+
+    assert all(s is statistics for s in thread_statistics)
+    assert statistics.statement_count == 4
+
+
+@pytest.mark.asyncio
+async def test_run_in_worker_thread_records_sql_statistics_of_calling_context():
+    engine = create_engine("sqlite://")
+    statistics = start_sql_statistics()
+
+    assert await run_in_worker_thread(execute_statement, engine) is statistics
+    engine.dispose()
+
+    assert statistics.statement_count == 1
@@ -2,17 +2,30 @@
 
 import pytest
 import importlib
-from unittest.mock import patch
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from sqlalchemy import select
 
 pyathena = pytest.importorskip("pyathena")
+pyarrow = pytest.importorskip("pyarrow")
 fastapi = pytest.importorskip("fastapi")
 
+import pyarrow.parquet as pq
+
 from mavedb.lib.gnomad import (
+    ParquetGnomADVariantDataSource,
     gnomad_identifier,
+    gnomad_variant_data_for_caids,
+    gnomad_variant_data_source,
     allele_list_from_list_like_string,
     link_gnomad_variants_to_mapped_variants,
+    list_like_string_from_allele_list,
 )
 from mavedb.models.mapped_variant import MappedVariant
+from mavedb.models.gnomad_caid_lookup import GnomADCaidLookup
 from mavedb.models.gnomad_variant import GnomADVariant
 
 from tests.helpers.constants import (
@@ -20,6 +33,7 @@ from tests.helpers.constants import (
     TEST_GNOMAD_VARIANT,
     TEST_MINIMAL_MAPPED_VARIANT,
     TEST_GNOMAD_DATA_VERSION,
+    TEST_MAVEDB_ATHENA_ROW,
 )
 
 ### Tests for gnomad_identifier function ###
@@ -116,12 +130,261 @@ def test_allele_list_from_list_like_string_invalid_format_not_list():
         allele_list_from_list_like_string("A, T")
 
 
+### Tests for list_like_string_from_allele_list function ###
+
+
+def test_list_like_string_from_allele_list_empty():
+    assert list_like_string_from_allele_list([]) == ""
+
+
+def test_list_like_string_from_allele_list_round_trips():
+    assert list_like_string_from_allele_list(["A", "TG"]) == "[A, TG]"
+    assert allele_list_from_list_like_string(list_like_string_from_allele_list(["A", "TG"])) == ["A", "TG"]
+
+
 ### Tests for gnomad_variant_data_for_caids function ###
-# This function is intentionally omitted from testing.
+# The Athena data source is intentionally omitted from testing.
 # It's a simple wrapper around an athena query that's more trouble than it's worth to mock.
 # If the package is working correctly, this function should work as expected.
 
 
+# Like the gnomAD table, the extract stores alleles as a list rather than in the list-like string form Athena returns.
+def parquet_extract_rows(caids):
+    return [
+        {
+            **TEST_MAVEDB_ATHENA_ROW,
+            "alleles": allele_list_from_list_like_string(TEST_MAVEDB_ATHENA_ROW["alleles"]),
+            "caid": caid,
+            "locus.position": str(idx),
+        }
+        for idx, caid in enumerate(caids)
+    ]
+
+
+@pytest.fixture
+def gnomad_parquet_extract(tmp_path):
+    path = tmp_path / f"{TEST_GNOMAD_DATA_VERSION.replace('.', '_')}.parquet"
+    caids = sorted(f"CA{idx:06}" for idx in range(100))
+    pq.write_table(pyarrow.Table.from_pylist(parquet_extract_rows(caids)), path, row_group_size=10)
+    return path
+
+
+# The gnomAD module is reloaded by earlier tests, so compare against the classes of the reloaded module.
+def test_gnomad_variant_data_source_athena():
+    import mavedb.lib.gnomad as gnomad_mod
+
+    with patch("mavedb.lib.gnomad.GNOMAD_DATA_BACKEND", "athena"):
+        assert isinstance(gnomad_variant_data_source(), gnomad_mod.AthenaGnomADVariantDataSource)
+
+
+def test_gnomad_variant_data_source_parquet(gnomad_parquet_extract):
+    import mavedb.lib.gnomad as gnomad_mod
+
+    with (
+        patch("mavedb.lib.gnomad.GNOMAD_DATA_BACKEND", "parquet"),
+        patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", TEST_GNOMAD_DATA_VERSION),
+        patch("mavedb.lib.gnomad.GNOMAD_PARQUET_DIRECTORY", str(gnomad_parquet_extract.parent)),
+    ):
+        data_source = gnomad_variant_data_source()
+        assert isinstance(data_source, gnomad_mod.ParquetGnomADVariantDataSource)
+        assert data_source.path == str(gnomad_parquet_extract)
+
+        # Parquet data sources are shared per extract.
+        assert gnomad_variant_data_source() is data_source
+
+
+def test_gnomad_variant_data_source_parquet_without_directory():
+    with (
+        patch("mavedb.lib.gnomad.GNOMAD_DATA_BACKEND", "parquet"),
+        patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", TEST_GNOMAD_DATA_VERSION),
+        patch("mavedb.lib.gnomad.GNOMAD_PARQUET_DIRECTORY", None),
+    ):
+        with pytest.raises(ValueError, match="GNOMAD_PARQUET_DIRECTORY environment variable is not set."):
+            gnomad_variant_data_source()
+
+
+def test_gnomad_variant_data_source_unsupported_backend():
+    with patch("mavedb.lib.gnomad.GNOMAD_DATA_BACKEND", "bigquery"):
+        with pytest.raises(ValueError, match="Unsupported gnomAD data backend: bigquery"):
+            gnomad_variant_data_source()
+
+
+def test_parquet_data_source_returns_rows_for_caids(gnomad_parquet_extract):
+    data_source = ParquetGnomADVariantDataSource(str(gnomad_parquet_extract))
+    rows = data_source.variant_data_for_caids(["CA000057", "CA000003", "CA000099", "CA999999"])
+
+    assert sorted(row.caid for row in rows) == ["CA000003", "CA000057", "CA000099"]
+    for row in rows:
+        for column, value in TEST_MAVEDB_ATHENA_ROW.items():
+            if column not in ("caid", "locus.position"):
+                assert getattr(row, column) == value
+
+
+def test_parquet_data_source_returns_no_rows_for_unknown_caids(gnomad_parquet_extract):
+    data_source = ParquetGnomADVariantDataSource(str(gnomad_parquet_extract))
+    assert data_source.variant_data_for_caids(["CA999999", "AA000000"]) == []
+    assert data_source.variant_data_for_caids([]) == []
+
+
+def test_parquet_data_source_only_reads_row_groups_which_may_contain_caids(gnomad_parquet_extract):
+    data_source = ParquetGnomADVariantDataSource(str(gnomad_parquet_extract))
+
+    with patch.object(
+        pq.ParquetFile, "read_row_group", autospec=True, side_effect=pq.ParquetFile.read_row_group
+    ) as mock:
+        rows = data_source.variant_data_for_caids(["CA000011", "CA000015", "CA000082"])
+
+    assert [row.caid for row in rows] == ["CA000011", "CA000015", "CA000082"]
+    assert sorted(call.args[1] for call in mock.call_args_list) == [1, 8]
+
+
+def test_parquet_data_source_returns_every_row_for_duplicated_caids(tmp_path):
+    path = tmp_path / "duplicated.parquet"
+    pq.write_table(
+        pyarrow.Table.from_pylist(parquet_extract_rows(["CA1", "CA2", "CA2", "CA3"])), path, row_group_size=2
+    )
+
+    rows = ParquetGnomADVariantDataSource(str(path)).variant_data_for_caids(["CA2"])
+    assert sorted(getattr(row, "locus.position") for row in rows) == ["1", "2"]
+
+
+def test_parquet_data_source_does_not_match_caids_longer_than_those_in_a_row_group(tmp_path):
+    path = tmp_path / "short_caids.parquet"
+    pq.write_table(pyarrow.Table.from_pylist(parquet_extract_rows(["CA1", "CA2"])), path)
+
+    assert ParquetGnomADVariantDataSource(str(path)).variant_data_for_caids(["CA10", "CA1999"]) == []
+
+
+def test_parquet_data_source_returns_alleles_as_list_like_strings(gnomad_parquet_extract):
+    assert pq.read_schema(gnomad_parquet_extract).field("alleles").type == pyarrow.list_(pyarrow.string())
+
+    rows = ParquetGnomADVariantDataSource(str(gnomad_parquet_extract)).variant_data_for_caids(["CA000042"])
+    assert [row.alleles for row in rows] == [TEST_MAVEDB_ATHENA_ROW["alleles"]]
+
+
+def test_parquet_data_source_rows_can_be_linked(session, setup_lib_db_with_mapped_variant, gnomad_parquet_extract):
+    mapped_variant = setup_lib_db_with_mapped_variant
+    mapped_variant.clingen_allele_id = "CA000042"
+    session.add(mapped_variant)
+    session.commit()
+
+    with (
+        patch("mavedb.lib.gnomad.GNOMAD_DATA_BACKEND", "parquet"),
+        patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", TEST_GNOMAD_DATA_VERSION),
+        patch("mavedb.lib.gnomad.GNOMAD_PARQUET_DIRECTORY", str(gnomad_parquet_extract.parent)),
+    ):
+        rows = gnomad_variant_data_for_caids(["CA000042"])
+        assert link_gnomad_variants_to_mapped_variants(session, rows) == 1
+        session.commit()
+
+    session.refresh(mapped_variant)
+    assert len(mapped_variant.gnomad_variants) == 1
+    assert mapped_variant.gnomad_variants[0].db_identifier == "10-42-A-G"
+
+
+def cached_lookup_data_source(caids):
+    data_source = Mock()
+    data_source.variant_data_for_caids.side_effect = lambda requested: [
+        SimpleNamespace(**{**TEST_MAVEDB_ATHENA_ROW, "caid": caid}) for caid in requested if caid in caids
+    ]
+    return data_source
+
+
+def test_gnomad_variant_data_for_caids_caches_lookups(session):
+    data_source = cached_lookup_data_source(["CA1", "CA2"])
+
+    with (
+        patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", TEST_GNOMAD_DATA_VERSION),
+        patch("mavedb.lib.gnomad.gnomad_variant_data_source", return_value=data_source),
+    ):
+        rows = gnomad_variant_data_for_caids(["CA1", "CA2", "CA3"], session)
+        session.commit()
+        cached_rows = gnomad_variant_data_for_caids(["CA1", "CA2", "CA3"], session)
+
+    data_source.variant_data_for_caids.assert_called_once_with(["CA1", "CA2", "CA3"])
+    assert sorted(row.caid for row in rows) == ["CA1", "CA2"]
+    assert sorted(row.caid for row in cached_rows) == ["CA1", "CA2"]
+    for row in cached_rows:
+        for column, value in TEST_MAVEDB_ATHENA_ROW.items():
+            if column != "caid":
+                assert getattr(row, column) == value
+
+    lookups = session.execute(select(GnomADCaidLookup.caid, GnomADCaidLookup.rows)).tuples().all()
+    assert {caid: len(rows) for caid, rows in lookups} == {"CA1": 1, "CA2": 1, "CA3": 0}
+
+
+def test_gnomad_variant_data_for_caids_caches_decimal_and_date_values(session):
+    data_source = Mock()
+    data_source.variant_data_for_caids.return_value = [
+        SimpleNamespace(
+            **{
+                **TEST_MAVEDB_ATHENA_ROW,
+                "caid": "CA1",
+                "joint.fafmax.faf95_max": Decimal("0.000125"),
+                "locus.position": date(2024, 1, 2),
+            }
+        )
+    ]
+
+    with (
+        patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", TEST_GNOMAD_DATA_VERSION),
+        patch("mavedb.lib.gnomad.gnomad_variant_data_source", return_value=data_source),
+    ):
+        gnomad_variant_data_for_caids(["CA1"], session)
+        session.commit()
+        cached_rows = gnomad_variant_data_for_caids(["CA1"], session)
+
+    assert len(cached_rows) == 1
+    assert getattr(cached_rows[0], "joint.fafmax.faf95_max") == 0.000125
+    assert getattr(cached_rows[0], "locus.position") == "2024-01-02"
+
+
+def test_gnomad_variant_data_for_caids_only_fetches_uncached_caids(session):
+    data_source = cached_lookup_data_source(["CA1", "CA2", "CA4"])
+
+    with (
+        patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", TEST_GNOMAD_DATA_VERSION),
+        patch("mavedb.lib.gnomad.gnomad_variant_data_source", return_value=data_source),
+    ):
+        gnomad_variant_data_for_caids(["CA1", "CA3"], session)
+        session.commit()
+        rows = gnomad_variant_data_for_caids(["CA1", "CA2", "CA3", "CA4", "CA4"], session)
+
+    assert data_source.variant_data_for_caids.call_args_list[-1].args == (["CA2", "CA4"],)
+    assert sorted(row.caid for row in rows) == ["CA1", "CA2", "CA4"]
+
+
+def test_gnomad_variant_data_for_caids_cache_is_keyed_by_data_version(session):
+    data_source = cached_lookup_data_source(["CA1"])
+
+    with patch("mavedb.lib.gnomad.gnomad_variant_data_source", return_value=data_source):
+        with patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", TEST_GNOMAD_DATA_VERSION):
+            gnomad_variant_data_for_caids(["CA1"], session)
+            session.commit()
+
+        with patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", "v5.0"):
+            rows = gnomad_variant_data_for_caids(["CA1"], session)
+            session.commit()
+
+    assert data_source.variant_data_for_caids.call_count == 2
+    assert [row.caid for row in rows] == ["CA1"]
+    assert sorted(session.scalars(select(GnomADCaidLookup.db_version))) == sorted([TEST_GNOMAD_DATA_VERSION, "v5.0"])
+
+
+def test_gnomad_variant_data_for_caids_without_session_does_not_cache(session):
+    data_source = cached_lookup_data_source(["CA1"])
+
+    with (
+        patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", TEST_GNOMAD_DATA_VERSION),
+        patch("mavedb.lib.gnomad.gnomad_variant_data_source", return_value=data_source),
+    ):
+        gnomad_variant_data_for_caids(["CA1"])
+        gnomad_variant_data_for_caids(["CA1"])
+
+    assert data_source.variant_data_for_caids.call_count == 2
+    assert session.scalars(select(GnomADCaidLookup)).all() == []
+
+
 ### Tests for link_gnomad_variants_to_mapped_variants function ###
 
 
@@ -313,3 +576,50 @@ def test_only_current_flag_is_false_operates_on_all_variants(
         assert len(mv.gnomad_variants) == 1
         for attr in gnomad_variant_comparator:
             assert getattr(mv.gnomad_variants[0], attr) == gnomad_variant_comparator[attr]
+
+
+def test_replaces_link_to_different_gnomad_variant_with_same_version(
+    session, mocked_gnomad_variant_row, setup_lib_db_with_mapped_variant
+):
+    mapped_variant = setup_lib_db_with_mapped_variant
+    mapped_variant.clingen_allele_id = mocked_gnomad_variant_row.caid
+    session.add(mapped_variant)
+    session.commit()
+
+    with patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", TEST_GNOMAD_DATA_VERSION):
+        link_gnomad_variants_to_mapped_variants(session, [mocked_gnomad_variant_row])
+        session.commit()
+
+    setattr(mocked_gnomad_variant_row, "locus.position", "12345")
+    with patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", TEST_GNOMAD_DATA_VERSION):
+        result = link_gnomad_variants_to_mapped_variants(session, [mocked_gnomad_variant_row])
+        assert result == 1
+        session.commit()
+
+    session.refresh(mapped_variant)
+
+    assert len(mapped_variant.gnomad_variants) == 1
+    assert mapped_variant.gnomad_variants[0].db_identifier == "10-12345-A-G"
+    assert len(session.scalars(select(GnomADVariant)).all()) == 2
+
+
+def test_preserves_links_to_gnomad_variants_with_other_versions(
+    session, mocked_gnomad_variant_row, setup_lib_db_with_mapped_variant
+):
+    mapped_variant = setup_lib_db_with_mapped_variant
+    mapped_variant.clingen_allele_id = mocked_gnomad_variant_row.caid
+    session.add(mapped_variant)
+    session.commit()
+
+    with patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", "v0.pytest"):
+        link_gnomad_variants_to_mapped_variants(session, [mocked_gnomad_variant_row])
+        session.commit()
+
+    with patch("mavedb.lib.gnomad.GNOMAD_DATA_VERSION", TEST_GNOMAD_DATA_VERSION):
+        result = link_gnomad_variants_to_mapped_variants(session, [mocked_gnomad_variant_row])
+        assert result == 1
+        session.commit()
+
+    session.refresh(mapped_variant)
+
+    assert sorted(gv.db_version for gv in mapped_variant.gnomad_variants) == ["v0.pytest", TEST_GNOMAD_DATA_VERSION]
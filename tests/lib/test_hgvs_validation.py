@@ -0,0 +1,64 @@
+# ruff: noqa: E402
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("hgvs")
+
+from mavedb.lib.hgvs_validation import validate_hgvs_variant, validate_hgvs_variants
+from tests.helpers.constants import VALID_NT_ACCESSION
+
+VALID_VARIANT = VALID_NT_ACCESSION + ":c.1G>A"
+
+
+def test_validate_hgvs_variant_records_unexpected_errors():
+    validator = MagicMock()
+    validator.validate.side_effect = ConnectionError("Connection reset by peer")
+
+    result = validate_hgvs_variant(VALID_VARIANT, validator)
+
+    assert result.variant == VALID_VARIANT
+    assert not result.valid
+    assert result.error == "Connection reset by peer"
+
+
+def test_validate_hgvs_variants_continues_past_unexpected_errors():
+    variants = [f"{VALID_NT_ACCESSION}:c.{i}G>A" for i in range(1, 4)]
+
+    with patch("mavedb.lib.hgvs_validation.Validator") as validator:
+        validator.return_value.validate.side_effect = [True, RuntimeError("Unexpected"), True]
+        results = list(validate_hgvs_variants(variants, MagicMock(), max_workers=1))
+
+    assert [result.variant for result in results] == variants
+    assert [result.valid for result in results] == [True, False, True]
+    assert [result.error for result in results] == [None, "Unexpected", None]
+
+
+def test_validate_hgvs_variants_cancels_pending_variants_when_closed():
+    variants = [f"{VALID_NT_ACCESSION}:c.{i}G>A" for i in range(1, 11)]
+    second_started = threading.Event()
+    release = threading.Event()
+    validated = []
+
+    def validate(variant, strict):
+        validated.append(variant)
+        if len(validated) > 1:
+            second_started.set()
+            release.wait(timeout=5)
+        return True
+
+    with patch("mavedb.lib.hgvs_validation.Validator") as validator:
+        validator.return_value.validate.side_effect = validate
+        results = validate_hgvs_variants(variants, MagicMock(), max_workers=1)
+
+        assert next(results).valid
+        assert second_started.wait(timeout=5)
+        results.close()
+        release.set()
+
+        for thread in threading.enumerate():
+            if thread.name.startswith("hgvs-validation"):
+                thread.join(timeout=5)
+
+    assert len(validated) == 2
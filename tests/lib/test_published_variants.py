@@ -0,0 +1,87 @@
+# ruff: noqa: E402
+
+import pytest
+
+pytest.importorskip("psycopg2")
+pytest.importorskip("arq")
+
+from datetime import date
+from unittest.mock import AsyncMock
+
+from sqlalchemy import select
+
+from mavedb.lib.published_variants import (
+    PUBLISHED_VARIANTS_REFRESH_DEBOUNCE_SECONDS,
+    enqueue_published_variants_refresh,
+    published_variants_refresh_job_id,
+    replace_published_variants_for_score_set,
+)
+from mavedb.models.published_variant import PublishedVariant
+
+
+def publish(session, score_set):
+    score_set.private = False
+    score_set.published_date = date.today()
+    session.add(score_set)
+    session.commit()
+
+
+def test_replace_published_variants_of_unpublished_score_set(session, setup_lib_db_with_mapped_variant):
+    score_set_id = setup_lib_db_with_mapped_variant.variant.score_set_id
+
+    assert replace_published_variants_for_score_set(session, score_set_id) == 0
+    assert session.scalars(select(PublishedVariant)).all() == []
+
+
+def test_replace_published_variants_of_published_score_set(session, setup_lib_db_with_mapped_variant):
+    mapped_variant = setup_lib_db_with_mapped_variant
+    publish(session, mapped_variant.variant.score_set)
+
+    # Replacing the rows of a score set twice should not duplicate them.
+    replace_published_variants_for_score_set(session, mapped_variant.variant.score_set_id)
+    assert replace_published_variants_for_score_set(session, mapped_variant.variant.score_set_id) == 1
+
+    published_variant = session.scalars(select(PublishedVariant)).one()
+    assert published_variant.variant_id == mapped_variant.variant_id
+    assert published_variant.mapped_variant_id == mapped_variant.id
+    assert published_variant.score_set_urn == mapped_variant.variant.score_set.urn
+    assert published_variant.published_date == date.today()
+
+
+def test_published_variants_are_deleted_with_their_score_set(session, setup_lib_db_with_mapped_variant):
+    score_set = setup_lib_db_with_mapped_variant.variant.score_set
+    publish(session, score_set)
+    replace_published_variants_for_score_set(session, score_set.id)
+    session.commit()
+
+    session.delete(score_set)
+    session.commit()
+
+    assert session.scalars(select(PublishedVariant)).all() == []
+
+
+def test_published_variants_refresh_job_id_is_shared_within_debounce_window():
+    window_start = 1_000 * PUBLISHED_VARIANTS_REFRESH_DEBOUNCE_SECONDS
+
+    job_id, run_at = published_variants_refresh_job_id(1, window_start)
+    assert published_variants_refresh_job_id(1, window_start + PUBLISHED_VARIANTS_REFRESH_DEBOUNCE_SECONDS - 1) == (
+        job_id,
+        run_at,
+    )
+    assert run_at.timestamp() == window_start + PUBLISHED_VARIANTS_REFRESH_DEBOUNCE_SECONDS
+
+    assert published_variants_refresh_job_id(2, window_start)[0] != job_id
+    assert published_variants_refresh_job_id(1, window_start + PUBLISHED_VARIANTS_REFRESH_DEBOUNCE_SECONDS)[0] != job_id
+
+
+@pytest.mark.asyncio
+async def test_enqueue_published_variants_refresh_defers_job_to_end_of_window():
+    worker = AsyncMock()
+
+    await enqueue_published_variants_refresh(worker, 1, "correlation-id")
+
+    worker.enqueue_job.assert_awaited_once()
+    args, kwargs = worker.enqueue_job.call_args
+    assert args == ("refresh_published_variants_for_score_set", 1, "correlation-id")
+    assert kwargs["_job_id"].startswith("refresh_published_variants_for_score_set:1:")
+    assert kwargs["_defer_until"] is not None
@@ -1,6 +1,7 @@
 # ruff: noqa: E402
 
 import io
+from datetime import date
 
 import numpy as np
 import pandas as pd
@@ -8,6 +9,7 @@ import pytest
 from sqlalchemy import select
 
 from mavedb.models.enums.target_category import TargetCategory
+from mavedb.models.enums.user_role import UserRole
 from mavedb.models.user import User
 from mavedb.view_models.search import ScoreSetsSearch
 
@@ -22,7 +24,13 @@ from mavedb.lib.score_sets import (
     create_variants_data,
     csv_data_to_df,
     fetch_score_set_search_filter_options,
+    fetch_superseding_score_set_in_search_result,
+    find_publish_or_private_superseded_score_set_tail,
+    find_superseded_score_set_tail,
+    find_superseded_score_set_tails,
 )
+from mavedb.lib.experiments import enrich_experiments_with_num_score_sets
+from mavedb.lib.permissions import Action
 from mavedb.lib.types.authentication import UserData
 from mavedb.lib.validation.constants.general import (
     hgvs_nt_column,
@@ -33,13 +41,23 @@ from mavedb.lib.validation.constants.general import (
 )
 from mavedb.models.experiment import Experiment
 from mavedb.models.license import License
+from mavedb.models.publication_identifier import PublicationIdentifier
 from mavedb.models.score_set import ScoreSet
+from mavedb.models.score_set_publication_identifier import ScoreSetPublicationIdentifierAssociation
 from mavedb.models.target_accession import TargetAccession
 from mavedb.models.target_gene import TargetGene
 from mavedb.models.target_sequence import TargetSequence
 from mavedb.models.taxonomy import Taxonomy
 from mavedb.models.variant import Variant
-from tests.helpers.constants import TEST_ACC_SCORESET, TEST_EXPERIMENT, TEST_SEQ_SCORESET, TEST_USER
+from tests.helpers.constants import (
+    ADMIN_USER,
+    EXTRA_USER,
+    TEST_ACC_SCORESET,
+    TEST_EXPERIMENT,
+    TEST_PUBMED_PUBLICATION,
+    TEST_SEQ_SCORESET,
+    TEST_USER,
+)
 from tests.helpers.util.experiment import create_experiment
 from tests.helpers.util.score_set import create_seq_score_set
 
@@ -550,3 +568,201 @@ def test_fetch_score_set_search_filter_options_with_no_permitted_score_sets(setu
         "publication_db_names": [],
         "publication_journals": [],
     }
+
+
+def test_fetch_score_set_search_filter_options_with_publications(setup_lib_db, session):
+    requesting_user = session.query(User).filter(User.username == TEST_USER["username"]).first()
+    user_data = UserData(user=requesting_user, active_roles=[])
+
+    experiment = Experiment(**TEST_EXPERIMENT)
+    session.add(experiment)
+    session.commit()
+    session.refresh(experiment)
+
+    publication = PublicationIdentifier(
+        **{
+            **TEST_PUBMED_PUBLICATION,
+            "authors": [{"name": "Author One", "primary": True}, {"name": "Author Two"}, {"name": ""}],
+        }
+    )
+    for target_name in ("TEST1", "TEST2"):
+        target_accessions = [TargetAccession(**seq["target_accession"]) for seq in TEST_ACC_SCORESET["target_genes"]]
+        target_genes = [
+            TargetGene(**{**gene, **{"name": target_name, "target_accession": target_accessions[idx]}})
+            for idx, gene in enumerate(TEST_ACC_SCORESET["target_genes"])
+        ]
+        score_set = ScoreSet(
+            **{
+                **TEST_ACC_SCORESET,
+                **{
+                    "experiment_id": experiment.id,
+                    "target_genes": target_genes,
+                    "publication_identifier_associations": [
+                        ScoreSetPublicationIdentifierAssociation(publication=publication, primary=False)
+                    ],
+                    "extra_metadata": {},
+                    "license": session.scalars(select(License)).first(),
+                },
+                "created_by_id": requesting_user.id,
+                "modified_by_id": requesting_user.id,
+            }
+        )
+        session.add(score_set)
+
+    session.commit()
+
+    score_set_search = ScoreSetsSearch()
+    filter_options = fetch_score_set_search_filter_options(session, user_data, None, score_set_search)
+
+    assert filter_options == {
+        "target_gene_categories": [{"value": TargetCategory.protein_coding, "count": 2}],
+        "target_gene_names": [{"value": "TEST1", "count": 1}, {"value": "TEST2", "count": 1}],
+        "target_organism_names": [],
+        "target_accessions": [{"value": "NM_001637.3", "count": 2}],
+        "publication_author_names": [{"value": "Author One", "count": 2}, {"value": "Author Two", "count": 2}],
+        "publication_db_names": [{"value": "PubMed", "count": 2}],
+        "publication_journals": [{"value": "test", "count": 2}],
+    }
+
+
+@pytest.mark.parametrize(
+    "requesting_username,active_roles,expected_count",
+    [(EXTRA_USER["username"], [], 0), (ADMIN_USER["username"], [UserRole.admin], 1), (TEST_USER["username"], [], 1)],
+)
+def test_fetch_score_set_search_filter_options_counts_only_readable_score_sets(
+    setup_lib_db, session, requesting_username, active_roles, expected_count
+):
+    owner = session.query(User).filter(User.username == TEST_USER["username"]).first()
+
+    experiment = Experiment(**TEST_EXPERIMENT)
+    session.add(experiment)
+    session.commit()
+    session.refresh(experiment)
+
+    target_accessions = [TargetAccession(**seq["target_accession"]) for seq in TEST_ACC_SCORESET["target_genes"]]
+    target_genes = [
+        TargetGene(**{**gene, **{"target_accession": target_accessions[idx]}})
+        for idx, gene in enumerate(TEST_ACC_SCORESET["target_genes"])
+    ]
+    score_set = ScoreSet(
+        **{
+            **TEST_ACC_SCORESET,
+            **{
+                "experiment_id": experiment.id,
+                "target_genes": target_genes,
+                "extra_metadata": {},
+                "license": session.scalars(select(License)).first(),
+            },
+            "private": True,
+            "created_by_id": owner.id,
+            "modified_by_id": owner.id,
+        }
+    )
+    session.add(score_set)
+    session.commit()
+
+    requesting_user = session.query(User).filter(User.username == requesting_username).first()
+    user_data = UserData(user=requesting_user, active_roles=active_roles)
+    filter_options = fetch_score_set_search_filter_options(session, user_data, None, ScoreSetsSearch())
+
+    assert filter_options["target_gene_names"] == (
+        [{"value": "TEST2", "count": expected_count}] if expected_count else []
+    )
+
+
+@pytest.fixture
+def superseding_score_set_chains(setup_lib_db, session):
+    """
+    Two chains of score sets owned by the test user: a published score set superseded by a published score set which is
+    superseded by a private score set, and a private score set superseded by another private score set.
+    """
+    owner = session.query(User).filter(User.username == TEST_USER["username"]).first()
+    experiment = Experiment(**TEST_EXPERIMENT, created_by=owner, modified_by=owner)
+    session.add(experiment)
+    session.commit()
+
+    score_set_scaffold = {key: value for key, value in TEST_SEQ_SCORESET.items() if key != "target_genes"}
+    chains = []
+    for published in ([True, True, False], [False, False]):
+        chain: list[ScoreSet] = []
+        for i, is_published in enumerate(published):
+            score_set = ScoreSet(
+                **score_set_scaffold,
+                urn=f"urn:mavedb:tmp:{len(chains)}-{i}",
+                experiment_id=experiment.id,
+                license=session.scalars(select(License)).first(),
+                private=not is_published,
+                published_date=date.today() if is_published else None,
+                superseded_score_set=chain[-1] if chain else None,
+                created_by_id=owner.id,
+                modified_by_id=owner.id,
+            )
+            session.add(score_set)
+            chain.append(score_set)
+        chains.append(chain)
+
+    session.commit()
+    return chains
+
+
+@pytest.mark.parametrize(
+    "requesting_username,active_roles",
+    [(None, []), (TEST_USER["username"], []), (EXTRA_USER["username"], []), (ADMIN_USER["username"], [UserRole.admin])],
+)
+@pytest.mark.parametrize("published", [False, True])
+def test_find_superseded_score_set_tails_matches_find_superseded_score_set_tail(
+    session, superseding_score_set_chains, requesting_username, active_roles, published
+):
+    user_data = None
+    if requesting_username is not None:
+        requesting_user = session.query(User).filter(User.username == requesting_username).first()
+        user_data = UserData(user=requesting_user, active_roles=active_roles)
+
+    score_sets = [score_set for chain in superseding_score_set_chains for score_set in chain]
+    tails = find_superseded_score_set_tails(session, [score_set.id for score_set in score_sets], user_data, published)
+
+    for score_set in score_sets:
+        if published:
+            expected_tail = find_publish_or_private_superseded_score_set_tail(score_set, Action.READ, user_data, True)
+        else:
+            expected_tail = find_superseded_score_set_tail(score_set, Action.READ, user_data)
+
+        assert tails[score_set.id] == (expected_tail.id if expected_tail else None)
+
+
+@pytest.mark.parametrize("published", [None, True])
+def test_fetch_superseding_score_set_in_search_result(session, superseding_score_set_chains, published):
+    requesting_user = session.query(User).filter(User.username == TEST_USER["username"]).first()
+    user_data = UserData(user=requesting_user, active_roles=[])
+    score_sets = [score_set for chain in superseding_score_set_chains for score_set in chain]
+
+    if published:
+        expected_tails = [
+            find_publish_or_private_superseded_score_set_tail(score_set, Action.READ, user_data, True)
+            for score_set in score_sets
+        ]
+    else:
+        expected_tails = [find_superseded_score_set_tail(score_set, Action.READ, user_data) for score_set in score_sets]
+
+    assert fetch_superseding_score_set_in_search_result(
+        session, score_sets, user_data, ScoreSetsSearch(published=published)
+    ) == sorted({tail for tail in expected_tails if tail is not None}, key=lambda score_set: score_set.urn)
+
+
+@pytest.mark.parametrize("requesting_username", [None, TEST_USER["username"]])
+def test_enrich_experiments_with_num_score_sets(session, superseding_score_set_chains, requesting_username):
+    user_data = None
+    if requesting_username is not None:
+        requesting_user = session.query(User).filter(User.username == requesting_username).first()
+        user_data = UserData(user=requesting_user, active_roles=[])
+
+    experiment = superseding_score_set_chains[0][0].experiment
+    expected_tails = [
+        find_superseded_score_set_tail(score_set, Action.READ, user_data) for score_set in experiment.score_sets
+    ]
+    expected_urns = sorted({tail.urn for tail in expected_tails if tail is not None})
+
+    enriched_experiments = enrich_experiments_with_num_score_sets(session, [experiment], user_data)
+
+    assert enriched_experiments[experiment.id].score_set_urns == expected_urns
+    assert enriched_experiments[experiment.id].num_score_sets == len(expected_urns)
@@ -0,0 +1,95 @@
+# ruff: noqa: E402
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from datetime import date
+
+from sqlalchemy import select
+
+from mavedb.lib.score_set_search import (
+    refresh_score_set_search_document,
+    refresh_score_set_search_projection,
+    refresh_stale_score_set_search_projections,
+    score_set_search_text,
+    search_text_filter,
+)
+from mavedb.models.score_set_search_document import ScoreSetSearchDocument
+from mavedb.models.score_set_search_projection import ScoreSetSearchProjection
+from tests.helpers.constants import TEST_EXPERIMENT, TEST_SEQ_SCORESET, VALID_SCORE_SET_URN
+
+
+def publish(session, score_set):
+    score_set.private = False
+    score_set.published_date = date.today()
+    session.add(score_set)
+    session.commit()
+
+
+def test_score_set_search_text_weights_title_above_abstract(setup_lib_db_with_score_set):
+    search_text = score_set_search_text(setup_lib_db_with_score_set)
+
+    assert search_text["A"] == [VALID_SCORE_SET_URN, TEST_SEQ_SCORESET["title"]]
+    assert TEST_SEQ_SCORESET["short_description"] in search_text["B"]
+    assert search_text["C"] == [TEST_SEQ_SCORESET["abstract_text"]]
+
+
+@pytest.mark.parametrize("search_text,matches", [("title", True), ("Score Set Tit", True), ("fnord", False)])
+def test_refresh_score_set_search_document(session, setup_lib_db_with_score_set, search_text, matches):
+    refresh_score_set_search_document(session, setup_lib_db_with_score_set)
+    session.commit()
+
+    matching_score_set_ids = session.scalars(
+        select(ScoreSetSearchDocument.score_set_id).where(search_text_filter(search_text))
+    ).all()
+
+    assert matching_score_set_ids == ([setup_lib_db_with_score_set.id] if matches else [])
+
+
+def test_refresh_score_set_search_projection_of_published_score_set(session, setup_lib_db_with_score_set):
+    score_set = setup_lib_db_with_score_set
+    publish(session, score_set)
+
+    refresh_score_set_search_projection(session, score_set)
+    session.commit()
+
+    projection = session.get(ScoreSetSearchProjection, score_set.id)
+    assert projection is not None
+    assert projection.experiment_title == TEST_EXPERIMENT["title"]
+    assert projection.published_date == score_set.published_date
+    assert projection.target_names == []
+    assert projection.publication_identifiers == []
+
+
+def test_refresh_score_set_search_projection_of_private_score_set(session, setup_lib_db_with_score_set):
+    score_set = setup_lib_db_with_score_set
+    publish(session, score_set)
+    refresh_score_set_search_projection(session, score_set)
+    session.commit()
+
+    score_set.private = True
+    score_set.published_date = None
+    refresh_score_set_search_projection(session, score_set)
+    session.commit()
+
+    assert session.get(ScoreSetSearchProjection, score_set.id) is None
+
+
+def test_refresh_stale_score_set_search_projections(session, setup_lib_db_with_score_set):
+    score_set = setup_lib_db_with_score_set
+    assert refresh_stale_score_set_search_projections(session) == 0
+
+    publish(session, score_set)
+    assert refresh_stale_score_set_search_projections(session) == 1
+    session.commit()
+    assert session.get(ScoreSetSearchProjection, score_set.id) is not None
+
+    score_set.private = True
+    score_set.published_date = None
+    session.add(score_set)
+    session.commit()
+
+    assert refresh_stale_score_set_search_projections(session) == 1
+    session.commit()
+    assert session.get(ScoreSetSearchProjection, score_set.id) is None
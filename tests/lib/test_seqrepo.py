@@ -4,7 +4,19 @@ import pytest
 pytest.importorskip("biocommons.seqrepo")
 pytest.importorskip("bioutils")
 
-from mavedb.lib.seqrepo import get_sequence_ids, _generate_nsa_options, seqrepo_versions, sequence_generator
+from unittest.mock import patch
+
+from mavedb.lib.seqrepo import (
+    LRUCache,
+    adaptive_chunk_size,
+    get_sequence_ids,
+    _generate_nsa_options,
+    fetch_sequence,
+    seqrepo_cache,
+    seqrepo_versions,
+    sequence_generator,
+    shared_seqrepo,
+)
 from mavedb.lib import seqrepo as seqrepo_lib
 
 from tests.helpers.constants import TEST_SEQREPO_INITIAL_STATE
@@ -129,3 +141,89 @@ def test_sequence_generator_chunk_size_larger_than_sequence(seqrepo):
 
     chunks = list(sequence_generator(seqrepo, "test_sequence_generator_chunk_size_larger_than_sequence", 0, 4, 10))
     assert chunks == ["ACGT"]
+
+
+def test_sequence_generator_chunks_spanning_cache_blocks(seqrepo, monkeypatch):
+    monkeypatch.setattr(seqrepo_lib, "SEQUENCE_CACHE_BLOCK_SIZE", 4)
+    seq = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    seqrepo.sequences.store("test_sequence_generator_chunks_spanning_cache_blocks", seq)
+    seqrepo.sequences.commit()
+
+    chunks = list(sequence_generator(seqrepo, "test_sequence_generator_chunks_spanning_cache_blocks", 5, 20, 7))
+    assert chunks == ["FGHIJKL", "MNOPQRS", "T"]
+
+
+def test_fetch_sequence_reads_cached_blocks(seqrepo, monkeypatch):
+    monkeypatch.setattr(seqrepo_lib, "SEQUENCE_CACHE_BLOCK_SIZE", 4)
+    seq = "ABCDEFGHIJ"
+    seqrepo.sequences.store("test_fetch_sequence_reads_cached_blocks", seq)
+    seqrepo.sequences.commit()
+
+    assert fetch_sequence(seqrepo, "test_fetch_sequence_reads_cached_blocks", 2, 6, 10) == "CDEF"
+
+    with patch.object(seqrepo.sequences, "fetch") as fetch:
+        assert fetch_sequence(seqrepo, "test_fetch_sequence_reads_cached_blocks", 3, 7, 10) == "DEFG"
+        fetch.assert_not_called()
+
+
+def test_get_sequence_ids_caches_resolutions(seqrepo):
+    alias, entry = next(iter(TEST_SEQREPO_INITIAL_STATE[0].items()))
+    assert get_sequence_ids(seqrepo, alias) == [entry["seq_id"]]
+
+    with patch.object(seqrepo.aliases, "find_aliases") as find_aliases:
+        assert get_sequence_ids(seqrepo, alias) == [entry["seq_id"]]
+        find_aliases.assert_not_called()
+
+    assert len(seqrepo_cache(seqrepo).sequence_ids) == 1
+
+
+def test_lru_cache_evicts_least_recently_used_entries_over_budget():
+    cache = LRUCache(max_weight=6, weigh=len)
+    cache.put("a", "aaa")
+    cache.put("b", "bbb")
+    cache.get("a")
+    cache.put("c", "cc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaa"
+    assert cache.get("c") == "cc"
+    assert cache.weight == 5
+
+    # Entries larger than the whole budget are never cached.
+    cache.put("d", "ddddddd")
+    assert cache.get("d") is None
+    assert cache.weight == 5
+
+
+def test_shared_seqrepo_is_opened_once_per_directory(monkeypatch):
+    monkeypatch.setattr(seqrepo_lib, "_shared_seqrepo", None)
+    monkeypatch.setattr(seqrepo_lib, "_shared_seqrepo_dir", None)
+
+    with patch.object(seqrepo_lib, "SeqRepo", side_effect=lambda *args, **kwargs: object()) as seqrepo_cls:
+        first = shared_seqrepo("/seqrepo/a")
+        assert shared_seqrepo("/seqrepo/a") is first
+        assert seqrepo_cls.call_count == 1
+
+        assert shared_seqrepo("/seqrepo/b") is not first
+        assert seqrepo_cls.call_count == 2
+
+        seqrepo_lib._reset_shared_seqrepo()
+        assert shared_seqrepo("/seqrepo/b") is not first
+        assert seqrepo_cls.call_count == 3
+
+
+def test_adaptive_chunk_size_grows_with_request_length():
+    assert adaptive_chunk_size(0) == seqrepo_lib.DEFAULT_CHUNK_SIZE
+    assert adaptive_chunk_size(seqrepo_lib.DEFAULT_CHUNK_SIZE * 64) == seqrepo_lib.DEFAULT_CHUNK_SIZE
+    assert adaptive_chunk_size(seqrepo_lib.DEFAULT_CHUNK_SIZE * 64 + 1) == seqrepo_lib.DEFAULT_CHUNK_SIZE * 2
+    assert adaptive_chunk_size(300_000_000) == seqrepo_lib.MAX_CHUNK_SIZE
+
+
+def test_fetch_sequence_reads_long_spans_directly(seqrepo, monkeypatch):
+    monkeypatch.setattr(seqrepo_lib, "SEQUENCE_CACHE_BLOCK_SIZE", 4)
+    seq = "ABCDEFGHIJ"
+    seqrepo.sequences.store("test_fetch_sequence_reads_long_spans_directly", seq)
+    seqrepo.sequences.commit()
+
+    assert fetch_sequence(seqrepo, "test_fetch_sequence_reads_long_spans_directly", 1, 9, 10) == "BCDEFGHI"
+    assert len(seqrepo_cache(seqrepo).sequence_blocks) == 0
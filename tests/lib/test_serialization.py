@@ -0,0 +1,58 @@
+import json
+from datetime import date, datetime
+from typing import Any, Optional
+
+import pytest
+from pydantic import BaseModel, TypeAdapter
+
+from mavedb.lib.serialization import (
+    JSON_SERIALIZERS,
+    adapted_to_json_bytes,
+    get_json_serializer,
+    model_to_json_bytes,
+    value_to_json_bytes,
+)
+
+
+class Record(BaseModel):
+    name: str
+    created: datetime
+    modified: date
+    note: Optional[str] = None
+    data: dict[str, Any] = {}
+
+
+RECORD = Record(name="Record ✓", created=datetime(2023, 1, 2), modified=date(2023, 1, 3), data={"score": 1.5})
+
+
+@pytest.mark.parametrize("serializer", ["json", "orjson"])
+def test_model_to_json_bytes_renders_values_of_standard_library_serializer(serializer):
+    rendered = model_to_json_bytes(RECORD, get_json_serializer(serializer), exclude_none=True)
+
+    assert isinstance(rendered, bytes)
+    assert json.loads(rendered) == json.loads(json.dumps(RECORD.model_dump(exclude_none=True), default=str))
+
+
+def test_model_to_json_bytes_with_pydantic_serializer_renders_iso_datetimes():
+    rendered = model_to_json_bytes(RECORD, get_json_serializer("pydantic"), exclude_none=True)
+
+    assert json.loads(rendered) == json.loads(RECORD.model_dump_json(exclude_none=True))
+
+
+@pytest.mark.parametrize("serializer", JSON_SERIALIZERS.values(), ids=JSON_SERIALIZERS.keys())
+def test_adapted_to_json_bytes_renders_lists_of_models(serializer):
+    adapter = TypeAdapter(list[Record])
+
+    rendered = adapted_to_json_bytes(adapter, [RECORD, RECORD], serializer, exclude={"__all__": {"created"}})
+
+    assert json.loads(rendered) == [RECORD.model_dump(mode="json", exclude={"created"})] * 2
+
+
+@pytest.mark.parametrize("serializer", JSON_SERIALIZERS.values(), ids=JSON_SERIALIZERS.keys())
+def test_value_to_json_bytes(serializer):
+    assert json.loads(value_to_json_bytes("urn:mavedb:00000001-a-1#1", serializer)) == "urn:mavedb:00000001-a-1#1"
+    assert value_to_json_bytes(None, serializer) == b"null"
+
+
+def test_get_json_serializer_falls_back_to_standard_library():
+    assert get_json_serializer("nonexistent") is JSON_SERIALIZERS["json"]
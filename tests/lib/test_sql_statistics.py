@@ -0,0 +1,111 @@
+import contextvars
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from mavedb.lib.exceptions import SqlStatementBudgetExceededError
+from mavedb.lib.logging.sql import (
+    SqlStatistics,
+    current_sql_statistics,
+    enforce_sql_statement_budget,
+    sql_statistics_summary,
+    start_sql_statistics,
+    statement_fingerprint,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def run_in_new_context(fn, *args):
+    return contextvars.copy_context().run(fn, *args)
+
+
+def execute_statements(engine, statements):
+    statistics = start_sql_statistics()
+    with engine.connect() as conn:
+        for statement in statements:
+            conn.execute(text(statement))
+
+    return statistics
+
+
+@pytest.mark.parametrize(
+    "statement,expected_fingerprint",
+    [
+        ("SELECT * FROM users WHERE id = %(id_1)s", "SELECT * FROM users WHERE id = ?"),
+        ("SELECT *\n  FROM users\n  WHERE id = 4", "SELECT * FROM users WHERE id = ?"),
+        ("SELECT * FROM users WHERE username = 'o''brien'", "SELECT * FROM users WHERE username = ?"),
+        ("SELECT * FROM users WHERE id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)", "SELECT * FROM users WHERE id IN (?)"),
+        ("SELECT * FROM variants_2024 WHERE score > 1.5", "SELECT * FROM variants_2024 WHERE score > ?"),
+    ],
+)
+def test_statement_fingerprint(statement, expected_fingerprint):
+    assert statement_fingerprint(statement) == expected_fingerprint
+
+
+def test_statement_fingerprint_is_shared_by_executions_of_the_same_query():
+    assert statement_fingerprint("SELECT * FROM users WHERE id = 1") == statement_fingerprint(
+        "SELECT * FROM users WHERE id = 2"
+    )
+
+
+def test_sql_statistics_summary():
+    statistics = SqlStatistics()
+    statistics.record("SELECT * FROM users WHERE id = 1", 10)
+    statistics.record("SELECT * FROM users WHERE id = 2", 30)
+    statistics.record("SELECT * FROM licenses", 20)
+
+    summary = statistics.summary()
+
+    assert summary["sql_statement_count"] == 3
+    assert summary["sql_duration_ns"] == 60
+    assert summary["sql_slowest_statement"] == "SELECT * FROM users WHERE id = ?"
+    assert summary["sql_slowest_statement_ns"] == 30
+
+
+def test_sql_statistics_reports_repeated_statements():
+    statistics = SqlStatistics()
+    for i in range(5):
+        statistics.record(f"SELECT * FROM users WHERE id = {i}", 1)
+    statistics.record("SELECT * FROM licenses", 1)
+
+    assert statistics.repeated_statements(threshold=5) == [
+        {"statement": "SELECT * FROM users WHERE id = ?", "count": 5}
+    ]
+    assert statistics.repeated_statements(threshold=6) == []
+
+
+def test_statements_are_not_recorded_outside_of_a_request_or_job(engine):
+    def execute():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        return current_sql_statistics(), sql_statistics_summary()
+
+    assert run_in_new_context(execute) == (None, {})
+
+
+def test_statements_are_recorded_once_started(engine):
+    statistics = run_in_new_context(execute_statements, engine, ["SELECT 1", "SELECT 2", "SELECT 'a'"])
+
+    assert statistics.statement_count == 3
+    assert statistics.duration_ns > 0
+    assert statistics.fingerprint_counts == {"SELECT ?": 3}
+
+
+def test_statement_budget_is_enforced(engine):
+    with enforce_sql_statement_budget(2), pytest.raises(SqlStatementBudgetExceededError):
+        run_in_new_context(execute_statements, engine, ["SELECT 1", "SELECT 2", "SELECT 3"])
+
+
+def test_statement_budget_is_lifted_on_exit(engine):
+    with enforce_sql_statement_budget(2):
+        pass
+
+    statistics = run_in_new_context(execute_statements, engine, ["SELECT 1", "SELECT 2", "SELECT 3"])
+    assert statistics.statement_count == 3
@@ -65,6 +65,37 @@ def test_submit_id_mapping_http_error(uniprot_id_mapping_api: UniProtIDMappingAP
             uniprot_id_mapping_api.submit_id_mapping("RefSeq", "UniProtKB", ["ID1"])
 
 
+### UniProtIDMappingAPI.check_id_mapping_status tests
+
+
+def test_check_id_mapping_status_finished(uniprot_id_mapping_api: UniProtIDMappingAPI):
+    with mock.patch.object(uniprot_id_mapping_api.session, "get") as mock_get:
+        mock_get.return_value.json.return_value = TEST_UNIPROT_FINISHED_JOB_STATUS_RESPONSE
+        mock_get.return_value.raise_for_status = mock.Mock()
+        assert uniprot_id_mapping_api.check_id_mapping_status(VALID_NT_ACCESSION) is True
+
+
+def test_check_id_mapping_status_not_finished_checks_once(uniprot_id_mapping_api: UniProtIDMappingAPI):
+    with (
+        mock.patch.object(uniprot_id_mapping_api.session, "get") as mock_get,
+        mock.patch("mavedb.lib.uniprot.id_mapping.time.sleep") as mock_sleep,
+    ):
+        mock_get.return_value.json.return_value = TEST_UNIPROT_RUNNING_JOB_STATUS_RESPONSE
+        mock_get.return_value.raise_for_status = mock.Mock()
+        assert uniprot_id_mapping_api.check_id_mapping_status(VALID_NT_ACCESSION) is False
+
+    mock_get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_check_id_mapping_status_http_error(uniprot_id_mapping_api: UniProtIDMappingAPI):
+    with mock.patch.object(uniprot_id_mapping_api.session, "get") as mock_get:
+        mock_get.return_value.raise_for_status = mock.Mock(side_effect=HTTPError("Mocked HTTP error"))
+
+        with pytest.raises(HTTPError):
+            uniprot_id_mapping_api.check_id_mapping_status(VALID_NT_ACCESSION)
+
+
 ### UniProtIDMappingAPI.check_id_mapping_results_ready tests
 
 
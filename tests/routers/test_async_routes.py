@@ -0,0 +1,57 @@
+import ast
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+PACKAGE_DIR = Path(importlib.util.find_spec("mavedb").submodule_search_locations[0])
+
+
+def _registers_routes(path: Path) -> bool:
+    """
+    Check whether a module creates an application or router, and so may register route and exception handlers on it.
+    """
+    return any(
+        isinstance(node, ast.Call) and ast.unparse(node.func).split(".")[-1] in ("APIRouter", "FastAPI")
+        for node in ast.walk(ast.parse(path.read_text()))
+    )
+
+
+ROUTE_MODULES = sorted(path for path in PACKAGE_DIR.rglob("*.py") if _registers_routes(path))
+
+
+def _coroutines_using_database_sessions(path: Path) -> list[str]:
+    """
+    Find the coroutine functions in a module which accept or use a synchronous database session. Calls made on the
+    session from a coroutine block the event loop, and with it every other request served by the process.
+    """
+    offenders = []
+    for node in ast.walk(ast.parse(path.read_text())):
+        if not isinstance(node, ast.AsyncFunctionDef):
+            continue
+
+        arguments = node.args.posonlyargs + node.args.args + node.args.kwonlyargs
+        annotations = [ast.unparse(arg.annotation) for arg in arguments if arg.annotation is not None]
+        defaults = [ast.unparse(default) for default in node.args.defaults + node.args.kw_defaults if default]
+        names = {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+
+        if (
+            any("Session" in annotation for annotation in annotations)
+            or any("get_db" in default for default in defaults)
+            or "db" in names
+        ):
+            offenders.append(f"{path.name}:{node.lineno} {node.name}")
+
+    return offenders
+
+
+def test_route_modules_are_found():
+    assert PACKAGE_DIR / "server_main.py" in ROUTE_MODULES
+    assert PACKAGE_DIR / "routers" / "score_sets.py" in ROUTE_MODULES
+
+
+@pytest.mark.parametrize("path", ROUTE_MODULES, ids=lambda path: path.relative_to(PACKAGE_DIR).as_posix())
+def test_async_routes_do_not_use_database_sessions(path):
+    # Route and exception handlers which use the database should be declared with `def`, so that FastAPI runs them in
+    # its threadpool. Coroutines they depend on can be called with the helpers in mavedb.lib.concurrency.
+    assert _coroutines_using_database_sessions(path) == []
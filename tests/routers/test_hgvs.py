@@ -1,5 +1,6 @@
 # ruff: noqa: E402
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -64,6 +65,45 @@ def test_hgvs_validate_invalid(client, setup_router_db):
         assert "does not agree" in response.json()["detail"]
 
 
+def test_hgvs_validate_batch(client, setup_router_db):
+    with patch.object(
+        cdot.hgvs.dataproviders.RESTDataProvider, "_get_transcript", return_value=TEST_NT_CDOT_TRANSCRIPT
+    ):
+        payload = {"variants": [VALID_VARIANT, INVALID_VARIANT, "not a variant", VALID_VARIANT]}
+        response = client.post("/api/v1/hgvs/validate/batch", json=payload)
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["variant"] for result in results] == payload["variants"]
+    assert [result["valid"] for result in results] == [True, False, False, True]
+    assert results[0]["error"] is None
+    assert "does not agree" in results[1]["error"]
+    assert results[2]["error"] is not None
+
+
+def test_hgvs_validate_batch_stream(client, setup_router_db):
+    with patch.object(
+        cdot.hgvs.dataproviders.RESTDataProvider, "_get_transcript", return_value=TEST_NT_CDOT_TRANSCRIPT
+    ):
+        payload = {"variants": [VALID_VARIANT, INVALID_VARIANT]}
+        response = client.post("/api/v1/hgvs/validate/batch?stream=true", json=payload)
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [(result["variant"], result["valid"]) for result in results] == [
+        (VALID_VARIANT, True),
+        (INVALID_VARIANT, False),
+    ]
+
+
+def test_hgvs_validate_batch_too_large(client, setup_router_db):
+    with patch("mavedb.routers.hgvs.HGVS_VALIDATION_BATCH_LIMIT", 1):
+        response = client.post("/api/v1/hgvs/validate/batch", json={"variants": [VALID_VARIANT, VALID_VARIANT]})
+
+    assert response.status_code == 422
+
+
 def test_hgvs_list_assemblies(client, setup_router_db):
     response = client.get("/api/v1/hgvs/assemblies")
     assert response.status_code == 200
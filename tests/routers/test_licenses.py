@@ -6,6 +6,8 @@ arq = pytest.importorskip("arq")
 cdot = pytest.importorskip("cdot")
 fastapi = pytest.importorskip("fastapi")
 
+from mavedb.lib.exceptions import SqlStatementBudgetExceededError
+from mavedb.lib.logging.sql import enforce_sql_statement_budget
 from tests.helpers.constants import TEST_LICENSE
 from tests.helpers.dependency_overrider import DependencyOverrider
 
@@ -40,6 +42,17 @@ def test_can_list_active_licenses_as_any_user_class(setup_router_db, client, use
     assert all(license_state)
 
 
+@pytest.mark.sql_statement_budget(5)
+def test_listing_licenses_stays_within_sql_statement_budget(setup_router_db, client):
+    response = client.get("/api/v1/licenses/")
+    assert response.status_code == 200
+
+
+def test_request_exceeding_sql_statement_budget_fails(setup_router_db, client):
+    with enforce_sql_statement_budget(0), pytest.raises(SqlStatementBudgetExceededError):
+        client.get("/api/v1/licenses/")
+
+
 def test_can_fetch_arbitrary_license(setup_router_db, client):
     response = client.get("/api/v1/licenses/1")
 
@@ -131,8 +131,96 @@ def test_get_sequence_invalid_query_range_coords_end_too_large(client):
     assert "Content-Range" in resp.headers
 
 
+@pytest.mark.parametrize("entry", TEST_SEQREPO_INITIAL_STATE)
+def test_get_sequence_with_start_only_range_query(client, entry):
+    alias = list(entry.keys())[0]
+    metadata = list(entry.values())[0]
+    resp = client.get(f"/api/v1/refget/sequence/{alias}", params={"start": 1})
+    assert resp.status_code == 200
+    assert resp.text == metadata["seq"][1:]
+
+
+@pytest.mark.parametrize("entry", TEST_SEQREPO_INITIAL_STATE)
+def test_get_sequence_with_end_only_range_query(client, entry):
+    alias = list(entry.keys())[0]
+    metadata = list(entry.values())[0]
+    resp = client.get(f"/api/v1/refget/sequence/{alias}", params={"end": 2})
+    assert resp.status_code == 200
+    assert resp.text == metadata["seq"][:2]
+
+
+@pytest.mark.parametrize("start", [-1, 7])
+def test_get_sequence_invalid_query_range_coords_start_only(client, start):
+    resp = client.get(f"/api/v1/refget/sequence/{VALID_ENSEMBL_IDENTIFIER}", params={"start": start})
+    assert resp.status_code == 416
+    assert "Invalid coordinates" in resp.text
+    assert "Content-Range" in resp.headers
+
+
+@pytest.mark.parametrize("end", [-1, 10])
+def test_get_sequence_invalid_query_range_coords_end_only(client, end):
+    resp = client.get(f"/api/v1/refget/sequence/{VALID_ENSEMBL_IDENTIFIER}", params={"end": end})
+    assert resp.status_code == 416
+    assert "Invalid coordinates" in resp.text
+    assert "Content-Range" in resp.headers
+
+
 def test_get_sequence_range_header_invalid(client):
     headers = {"Range": "invalid"}
     resp = client.get(f"/api/v1/refget/sequence/{VALID_ENSEMBL_IDENTIFIER}", headers=headers)
     assert resp.status_code == 400
     assert "Invalid range header format" in resp.text
+
+
+@pytest.mark.parametrize("entry", TEST_SEQREPO_INITIAL_STATE)
+def test_get_sequence_with_open_ended_range_header(client, entry):
+    alias = list(entry.keys())[0]
+    metadata = list(entry.values())[0]
+    resp = client.get(f"/api/v1/refget/sequence/{alias}", headers={"Range": "bytes=1-"})
+    assert resp.status_code == 206
+    assert resp.text == metadata["seq"][1:]
+    assert resp.headers["Content-Range"] == f"bytes 1-{len(metadata['seq']) - 1}/{len(metadata['seq'])}"
+
+
+@pytest.mark.parametrize("entry", TEST_SEQREPO_INITIAL_STATE)
+def test_get_sequence_with_suffix_range_header(client, entry):
+    alias = list(entry.keys())[0]
+    metadata = list(entry.values())[0]
+    resp = client.get(f"/api/v1/refget/sequence/{alias}", headers={"Range": "bytes=-2"})
+    assert resp.status_code == 206
+    assert resp.text == metadata["seq"][-2:]
+    assert resp.headers["Content-Length"] == "2"
+
+
+@pytest.mark.parametrize("entry", TEST_SEQREPO_INITIAL_STATE)
+def test_get_sequence_etag(client, entry):
+    alias = list(entry.keys())[0]
+    metadata = list(entry.values())[0]
+    resp = client.get(f"/api/v1/refget/sequence/{alias}")
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] == f'"{metadata["seq_id"]}"'
+    assert "immutable" in resp.headers["Cache-Control"]
+
+    resp = client.get(f"/api/v1/refget/sequence/{alias}", headers={"If-None-Match": resp.headers["ETag"]})
+    assert resp.status_code == 304
+    assert resp.text == ""
+
+
+@pytest.mark.parametrize("entry", TEST_SEQREPO_INITIAL_STATE)
+def test_get_sequence_if_range_mismatch_returns_full_sequence(client, entry):
+    alias = list(entry.keys())[0]
+    metadata = list(entry.values())[0]
+    resp = client.get(f"/api/v1/refget/sequence/{alias}", headers={"Range": "bytes=1-3", "If-Range": '"stale"'})
+    assert resp.status_code == 200
+    assert resp.text == metadata["seq"]
+
+
+@pytest.mark.parametrize("entry", TEST_SEQREPO_INITIAL_STATE)
+def test_head_sequence(client, entry):
+    alias = list(entry.keys())[0]
+    metadata = list(entry.values())[0]
+    resp = client.head(f"/api/v1/refget/sequence/{alias}", headers={"Range": "bytes=1-3"})
+    assert resp.status_code == 206
+    assert resp.text == ""
+    assert resp.headers["Content-Length"] == "3"
+    assert resp.headers["ETag"] == f'"{metadata["seq_id"]}"'
@@ -3,26 +3,34 @@
 import csv
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import date
+from functools import partial
 from io import StringIO
 from unittest.mock import patch
 
 import jsonschema
 import pytest
 from humps import camelize
-from sqlalchemy import select
+from sqlalchemy import delete, select
 
 arq = pytest.importorskip("arq")
 cdot = pytest.importorskip("cdot")
 fastapi = pytest.importorskip("fastapi")
 
+from mavedb.lib.annotation.executor import annotate_snapshots
+from mavedb.lib.annotation.store import populate_annotation_store
 from mavedb.lib.exceptions import NonexistentOrcidUserError
+from mavedb.lib.score_sets import current_mapped_variant_batches
+from mavedb.lib.serialization import JSON_SERIALIZERS
 from mavedb.lib.validation.urn_re import MAVEDB_EXPERIMENT_URN_RE, MAVEDB_SCORE_SET_URN_RE, MAVEDB_TMP_URN_RE
 from mavedb.models.enums.processing_state import ProcessingState
 from mavedb.models.enums.target_category import TargetCategory
 from mavedb.models.experiment import Experiment as ExperimentDbModel
+from mavedb.models.mapped_variant_annotation import MappedVariantAnnotation
 from mavedb.models.score_set import ScoreSet as ScoreSetDbModel
+from mavedb.models.score_set_search_document import ScoreSetSearchDocument
 from mavedb.models.variant import Variant as VariantDbModel
 from mavedb.view_models.orcid import OrcidUser
 from mavedb.view_models.score_set import ScoreSet, ScoreSetCreate
@@ -2255,6 +2263,135 @@ def test_search_public_score_sets_not_showing_private_score_set(
     assert response.json()["scoreSets"][0]["urn"] == published_score_set_1["urn"]
 
 
+def test_search_private_score_sets_ranks_title_matches_before_abstract_matches(
+    session, data_provider, client, setup_router_db, data_files
+):
+    experiment = create_experiment(client, {"title": "Experiment 1"})
+    abstract_match = create_seq_score_set(
+        client, experiment["urn"], update={"title": "Score Set 1", "abstractText": "Mentions fnords in passing."}
+    )
+    title_match = create_seq_score_set(client, experiment["urn"], update={"title": "Fnord Score Set"})
+
+    search_payload = {"text": "fnord"}
+    response = client.post("/api/v1/me/score-sets/search", json=search_payload)
+    assert response.status_code == 200
+    assert response.json()["numScoreSets"] == 2
+    assert [score_set["urn"] for score_set in response.json()["scoreSets"]] == [
+        title_match["urn"],
+        abstract_match["urn"],
+    ]
+
+
+def test_search_private_score_sets_partial_word_match(session, data_provider, client, setup_router_db, data_files):
+    experiment = create_experiment(client, {"title": "Experiment 1"})
+    score_set = create_seq_score_set(client, experiment["urn"], update={"title": "Test Fnordulator Score Set"})
+
+    search_payload = {"text": "nordul"}
+    response = client.post("/api/v1/me/score-sets/search", json=search_payload)
+    assert response.status_code == 200
+    assert response.json()["numScoreSets"] == 1
+    assert response.json()["scoreSets"][0]["urn"] == score_set["urn"]
+
+
+def test_search_private_score_sets_match_after_update(session, data_provider, client, setup_router_db, data_files):
+    experiment = create_experiment(client, {"title": "Experiment 1"})
+    score_set = create_seq_score_set(client, experiment["urn"], update={"title": "Score Set 1"})
+
+    score_set_update_payload = deepcopy(TEST_MINIMAL_SEQ_SCORESET)
+    score_set_update_payload.update({"title": "Test Fnord Score Set"})
+    response = client.put(f"/api/v1/score-sets/{score_set['urn']}", json=score_set_update_payload)
+    assert response.status_code == 200
+
+    search_payload = {"text": "fnord"}
+    response = client.post("/api/v1/me/score-sets/search", json=search_payload)
+    assert response.status_code == 200
+    assert response.json()["numScoreSets"] == 1
+    assert response.json()["scoreSets"][0]["title"] == "Test Fnord Score Set"
+
+
+def test_search_public_score_sets_published_urn_match(session, data_provider, client, setup_router_db, data_files):
+    experiment = create_experiment(client, {"title": "Experiment 1"})
+    score_set = create_seq_score_set(client, experiment["urn"], update={"title": "Score Set 1"})
+    score_set = mock_worker_variant_insertion(client, session, data_provider, score_set, data_files / "scores.csv")
+
+    with patch.object(arq.ArqRedis, "enqueue_job", return_value=None) as worker_queue:
+        published_score_set = publish_score_set(client, score_set["urn"])
+        worker_queue.assert_called_once()
+
+    search_payload = {"text": published_score_set["urn"]}
+    response = client.post("/api/v1/score-sets/search", json=search_payload)
+    assert response.status_code == 200
+    assert response.json()["numScoreSets"] == 1
+    assert response.json()["scoreSets"][0]["urn"] == published_score_set["urn"]
+
+
+def test_search_private_score_sets_without_search_document(session, data_provider, client, setup_router_db, data_files):
+    experiment = create_experiment(client, {"title": "Experiment 1"})
+    score_set = create_seq_score_set(client, experiment["urn"], update={"title": "Test Fnord Score Set"})
+    session.execute(delete(ScoreSetSearchDocument))
+    session.commit()
+
+    search_payload = {"text": "fnord"}
+    response = client.post("/api/v1/me/score-sets/search", json=search_payload)
+    assert response.status_code == 200
+    assert response.json()["numScoreSets"] == 1
+    assert response.json()["scoreSets"][0]["urn"] == score_set["urn"]
+
+
+def test_search_public_score_sets_without_search_document(session, data_provider, client, setup_router_db, data_files):
+    experiment = create_experiment(client, {"title": "Experiment 1"})
+    score_set = create_seq_score_set(client, experiment["urn"], update={"title": "Test Fnord Score Set"})
+    score_set = mock_worker_variant_insertion(client, session, data_provider, score_set, data_files / "scores.csv")
+
+    with patch.object(arq.ArqRedis, "enqueue_job", return_value=None):
+        published_score_set = publish_score_set(client, score_set["urn"])
+
+    session.execute(delete(ScoreSetSearchDocument))
+    session.commit()
+
+    search_payload = {"text": "fnord"}
+    response = client.post("/api/v1/score-sets/search", json=search_payload)
+    assert response.status_code == 200
+    assert response.json()["numScoreSets"] == 1
+    assert response.json()["scoreSets"][0]["urn"] == published_score_set["urn"]
+
+
+def test_search_filter_options_for_published_score_sets(session, data_provider, client, setup_router_db, data_files):
+    experiment = create_experiment(client, {"title": "Experiment 1"})
+    score_set_1 = create_seq_score_set(client, experiment["urn"], update={"title": "Score Set 1"})
+    score_set_1 = mock_worker_variant_insertion(client, session, data_provider, score_set_1, data_files / "scores.csv")
+    create_seq_score_set(client, experiment["urn"], update={"title": "Score Set 2"})
+
+    with patch.object(arq.ArqRedis, "enqueue_job", return_value=None) as worker_queue:
+        publish_score_set(client, score_set_1["urn"])
+        worker_queue.assert_called_once()
+
+    response = client.post("/api/v1/score-sets/search/filter-options", json={"published": True})
+    assert response.status_code == 200
+    assert response.json()["targetGeneNames"] == [{"value": "TEST1", "count": 1}]
+    assert response.json()["targetGeneCategories"] == [{"value": "protein_coding", "count": 1}]
+
+
+@pytest.mark.parametrize("overrides,expected_visible", [(None, True), ("extra_user_app_overrides", False)])
+def test_mapped_genes_of_private_score_sets_are_only_visible_to_permitted_users(
+    session, client, setup_router_db, overrides, expected_visible, request
+):
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set(client, experiment["urn"])
+
+    item = session.scalars(select(ScoreSetDbModel).where(ScoreSetDbModel.urn == score_set["urn"])).one()
+    item.target_genes[0].post_mapped_metadata = {"protein": {"sequence_genes": ["BRCA1"]}}
+    session.commit()
+
+    with DependencyOverrider(request.getfixturevalue(overrides) if overrides else {}):
+        response = client.get("/api/v1/score-sets/mapped-genes")
+
+    assert response.status_code == 200
+    assert (score_set["urn"] in response.json()) == expected_visible
+    if expected_visible:
+        assert response.json()[score_set["urn"]] == ["BRCA1"]
+
+
 ########################################################################################################################
 # Score set deletion
 ########################################################################################################################
@@ -3432,6 +3569,261 @@ def test_get_annotated_functional_study_result_for_score_set(
         assert annotated_variant.get("type") == "ExperimentalVariantFunctionalImpactStudyResult"
 
 
+@pytest.mark.parametrize("serializer", JSON_SERIALIZERS.keys())
+def test_get_score_set_mapped_variants(client, session, data_provider, data_files, setup_router_db, serializer):
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set_with_mapped_variants(
+        client,
+        session,
+        data_provider,
+        experiment["urn"],
+        data_files / "scores.csv",
+    )
+
+    with patch("mavedb.lib.serialization.JSON_SERIALIZER", JSON_SERIALIZERS[serializer]):
+        response = client.get(f"/api/v1/score-sets/{score_set['urn']}/mapped-variants")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    response_data = response.json()
+    assert len(response_data) == score_set["numVariants"]
+    assert {mapped_variant["variantUrn"] for mapped_variant in response_data} == {
+        f"{score_set['urn']}#{i}" for i in range(1, score_set["numVariants"] + 1)
+    }
+    for mapped_variant in response_data:
+        assert mapped_variant["recordType"] == "MappedVariant"
+        assert mapped_variant["mappedDate"] == date.today().isoformat()
+
+
+@pytest.mark.parametrize(
+    "mock_publication_fetch",
+    [({"dbName": "PubMed", "identifier": f"{TEST_PUBMED_IDENTIFIER}"})],
+    indirect=["mock_publication_fetch"],
+)
+def test_get_annotated_functional_study_result_for_score_set_in_batches(
+    client, session, data_provider, data_files, setup_router_db, admin_app_overrides, mock_publication_fetch
+):
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set_with_mapped_variants(
+        client,
+        session,
+        data_provider,
+        experiment["urn"],
+        data_files / "scores.csv",
+    )
+
+    with patch(
+        "mavedb.routers.score_sets.current_mapped_variant_batches",
+        wraps=partial(current_mapped_variant_batches, batch_size=2),
+    ):
+        response = client.get(f"/api/v1/score-sets/{score_set['urn']}/annotated-variants/functional-study-result")
+        response_data = parse_ndjson_response(response)
+
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == str(score_set["numVariants"])
+    assert len(response_data) == score_set["numVariants"]
+    assert len({annotation_response["variant_urn"] for annotation_response in response_data}) == len(response_data)
+
+
+@pytest.mark.parametrize(
+    "annotation_type", ["pathogenicity-evidence-line", "functional-impact-statement", "functional-study-result"]
+)
+@pytest.mark.parametrize(
+    "mock_publication_fetch",
+    [
+        [
+            {"dbName": "PubMed", "identifier": f"{TEST_PUBMED_IDENTIFIER}"},
+            {"dbName": "bioRxiv", "identifier": f"{TEST_BIORXIV_IDENTIFIER}"},
+        ]
+    ],
+    indirect=["mock_publication_fetch"],
+)
+def test_get_stored_annotated_variants_for_score_set(
+    client,
+    session,
+    data_provider,
+    data_files,
+    setup_router_db,
+    admin_app_overrides,
+    mock_publication_fetch,
+    annotation_type,
+):
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set_with_mapped_variants(
+        client,
+        session,
+        data_provider,
+        experiment["urn"],
+        data_files / "scores.csv",
+    )
+    create_publish_and_promote_score_calibration(
+        client, score_set["urn"], deepcamelize(TEST_BRNICH_SCORE_CALIBRATION_RANGE_BASED)
+    )
+
+    generated_response = client.get(f"/api/v1/score-sets/{score_set['urn']}/annotated-variants/{annotation_type}")
+    assert generated_response.status_code == 200
+
+    item = session.scalars(select(ScoreSetDbModel).where(ScoreSetDbModel.urn == score_set["urn"])).one()
+    populate_annotation_store(session, item)
+    session.commit()
+
+    with patch("mavedb.lib.annotation.store.generate_serialized_annotation") as generate_annotation:
+        stored_response = client.get(f"/api/v1/score-sets/{score_set['urn']}/annotated-variants/{annotation_type}")
+
+    generate_annotation.assert_not_called()
+    assert stored_response.status_code == 200
+    assert stored_response.headers["X-Total-Count"] == generated_response.headers["X-Total-Count"]
+    assert stored_response.text == generated_response.text
+
+
+@pytest.mark.parametrize(
+    "annotation_type", ["pathogenicity-evidence-line", "functional-impact-statement", "functional-study-result"]
+)
+@pytest.mark.parametrize(
+    "mock_publication_fetch",
+    [
+        [
+            {"dbName": "PubMed", "identifier": f"{TEST_PUBMED_IDENTIFIER}"},
+            {"dbName": "bioRxiv", "identifier": f"{TEST_BIORXIV_IDENTIFIER}"},
+        ]
+    ],
+    indirect=["mock_publication_fetch"],
+)
+def test_get_annotated_variants_for_score_set_in_annotation_pool(
+    client,
+    session,
+    data_provider,
+    data_files,
+    setup_router_db,
+    admin_app_overrides,
+    mock_publication_fetch,
+    annotation_type,
+):
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set_with_mapped_variants(
+        client,
+        session,
+        data_provider,
+        experiment["urn"],
+        data_files / "scores.csv",
+    )
+    create_publish_and_promote_score_calibration(
+        client, score_set["urn"], deepcamelize(TEST_BRNICH_SCORE_CALIBRATION_RANGE_BASED)
+    )
+
+    serial_response = client.get(f"/api/v1/score-sets/{score_set['urn']}/annotated-variants/{annotation_type}")
+    assert serial_response.status_code == 200
+
+    # Batches are annotated in a thread pool here, which exercises the same snapshots and detached context.
+    with (
+        ThreadPoolExecutor(max_workers=2) as pool,
+        patch("mavedb.routers.score_sets.annotation_process_pool", return_value=pool),
+        patch(
+            "mavedb.routers.score_sets.current_mapped_variant_batches",
+            wraps=partial(current_mapped_variant_batches, batch_size=2),
+        ),
+        patch("mavedb.lib.annotation.executor.annotate_snapshots", wraps=annotate_snapshots) as annotate_batch,
+    ):
+        pooled_response = client.get(f"/api/v1/score-sets/{score_set['urn']}/annotated-variants/{annotation_type}")
+
+    assert annotate_batch.call_count == -(-score_set["numVariants"] // 2)
+    assert pooled_response.status_code == 200
+    assert pooled_response.text == serial_response.text
+
+
+@pytest.mark.parametrize(
+    "mock_publication_fetch",
+    [
+        [
+            {"dbName": "PubMed", "identifier": f"{TEST_PUBMED_IDENTIFIER}"},
+            {"dbName": "bioRxiv", "identifier": f"{TEST_BIORXIV_IDENTIFIER}"},
+        ]
+    ],
+    indirect=["mock_publication_fetch"],
+)
+def test_score_calibration_changes_invalidate_stored_annotations(
+    client, session, data_provider, data_files, setup_router_db, admin_app_overrides, mock_publication_fetch
+):
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set_with_mapped_variants(
+        client,
+        session,
+        data_provider,
+        experiment["urn"],
+        data_files / "scores.csv",
+    )
+
+    item = session.scalars(select(ScoreSetDbModel).where(ScoreSetDbModel.urn == score_set["urn"])).one()
+    populate_annotation_store(session, item)
+    session.commit()
+    assert session.scalars(select(MappedVariantAnnotation)).all()
+
+    create_publish_and_promote_score_calibration(
+        client, score_set["urn"], deepcamelize(TEST_BRNICH_SCORE_CALIBRATION_RANGE_BASED)
+    )
+
+    assert not session.scalars(select(MappedVariantAnnotation)).all()
+
+
+def test_score_set_update_invalidates_and_repopulates_stored_annotations(
+    client, session, data_provider, data_files, setup_router_db
+):
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set_with_mapped_variants(
+        client,
+        session,
+        data_provider,
+        experiment["urn"],
+        data_files / "scores.csv",
+    )
+
+    item = session.scalars(select(ScoreSetDbModel).where(ScoreSetDbModel.urn == score_set["urn"])).one()
+    populate_annotation_store(session, item)
+    session.commit()
+    assert session.scalars(select(MappedVariantAnnotation)).all()
+
+    score_set_update_payload = deepcopy(TEST_MINIMAL_SEQ_SCORESET)
+    score_set_update_payload.update({"title": "Updated Title"})
+    with (
+        patch("mavedb.lib.annotation.store.ANNOTATION_STORE_ENABLED", True),
+        patch.object(arq.ArqRedis, "enqueue_job", return_value=None) as worker_queue,
+    ):
+        response = client.put(f"/api/v1/score-sets/{score_set['urn']}", json=score_set_update_payload)
+
+    assert response.status_code == 200
+    assert not session.scalars(select(MappedVariantAnnotation)).all()
+    worker_queue.assert_called_once()
+    assert worker_queue.call_args.args[0] == "populate_annotation_store_for_score_set"
+
+
+def test_publishing_score_set_invalidates_and_repopulates_stored_annotations(
+    client, session, data_provider, data_files, setup_router_db
+):
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set_with_mapped_variants(
+        client,
+        session,
+        data_provider,
+        experiment["urn"],
+        data_files / "scores.csv",
+    )
+
+    item = session.scalars(select(ScoreSetDbModel).where(ScoreSetDbModel.urn == score_set["urn"])).one()
+    populate_annotation_store(session, item)
+    session.commit()
+    assert session.scalars(select(MappedVariantAnnotation)).all()
+
+    with (
+        patch("mavedb.lib.annotation.store.ANNOTATION_STORE_ENABLED", True),
+        patch.object(arq.ArqRedis, "enqueue_job", return_value=None) as worker_queue,
+    ):
+        publish_score_set(client, score_set["urn"])
+
+    # Stored annotations of the unpublished score set refer to its temporary URNs.
+    assert not session.scalars(select(MappedVariantAnnotation)).all()
+    assert "populate_annotation_store_for_score_set" in [call.args[0] for call in worker_queue.call_args_list]
+
+
 @pytest.mark.parametrize(
     "mock_publication_fetch",
     [({"dbName": "PubMed", "identifier": f"{TEST_PUBMED_IDENTIFIER}"})],
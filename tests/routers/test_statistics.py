@@ -8,7 +8,11 @@ arq = pytest.importorskip("arq")
 cdot = pytest.importorskip("cdot")
 fastapi = pytest.importorskip("fastapi")
 
-from mavedb.models.published_variant import PublishedVariantsMV
+from sqlalchemy import select
+
+from mavedb.lib.published_variants import replace_published_variants_for_score_set
+from mavedb.lib.statistics import refresh_all_statistics_snapshots, statistics_snapshot_computations
+from mavedb.models.score_set import ScoreSet
 
 from tests.helpers.constants import (
     TEST_BIORXIV_IDENTIFIER,
@@ -68,12 +72,13 @@ def setup_seq_scoreset(setup_router_db, session, data_provider, client, data_fil
     create_mapped_variants_for_score_set(session, unpublished_score_set["urn"], TEST_MINIMAL_MAPPED_VARIANT)
 
     with patch.object(arq.ArqRedis, "enqueue_job", return_value=None) as worker_queue:
-        publish_score_set(client, unpublished_score_set["urn"])
+        published_score_set = publish_score_set(client, unpublished_score_set["urn"])
         worker_queue.assert_called_once()
 
-    # Note that we have not created indexes for this view when it is generated via metadata. This differs
-    # from the database created via alembic, which does create indexes.
-    PublishedVariantsMV.refresh(session, False)
+    # Publication defers the refresh of published variants to a worker job, so refresh them directly.
+    score_set = session.scalars(select(ScoreSet).where(ScoreSet.urn == published_score_set["urn"])).one()
+    replace_published_variants_for_score_set(session, score_set.id)
+    session.commit()
 
 
 def assert_statistic(desired_field_value, response):
@@ -579,3 +584,49 @@ def test_mapped_variant_counts_current_no_published_data(client, current_value,
     for key, value in response.json().items():
         assert isinstance(key, str)
         assert value == 0
+
+
+####################################################################################################
+# Test statistics snapshots
+####################################################################################################
+
+
+def test_statistics_are_served_from_snapshots(client, session, setup_router_db, setup_acc_scoreset):
+    """Test that statistics are served from their snapshots once snapshotted, rather than from the live tables."""
+    refresh_all_statistics_snapshots(session)
+    session.commit()
+
+    experiment = create_experiment(client)
+    with patch.object(
+        cdot.hgvs.dataproviders.RESTDataProvider, "_get_transcript", return_value=TEST_NT_CDOT_TRANSCRIPT
+    ):
+        create_acc_score_set(client, experiment["urn"])
+
+    response = client.get("/api/v1/statistics/record/score-set/published/count")
+    assert response.status_code == 200
+    assert response.json() == {"count": 1}
+
+
+def test_statistics_snapshots_cover_every_statistic(session, setup_router_db):
+    """Test that a snapshot is stored for every statistic."""
+    assert refresh_all_statistics_snapshots(session) == len(statistics_snapshot_computations())
+
+
+@pytest.mark.parametrize("snapshotted", [True, False])
+def test_statistics_respond_to_conditional_requests(client, session, setup_router_db, setup_acc_scoreset, snapshotted):
+    """Test that statistics carry an entity tag, and that requests which match it receive an empty response."""
+    if snapshotted:
+        refresh_all_statistics_snapshots(session)
+        session.commit()
+
+    response = client.get("/api/v1/statistics/target/accession/gene")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/v1/statistics/target/accession/gene", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+    response = client.get("/api/v1/statistics/target/accession/gene", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
@@ -11,7 +11,7 @@ import jsonschema
 import pandas as pd
 import pytest
 from requests import HTTPError
-from sqlalchemy import not_, select
+from sqlalchemy import func, not_, select, text
 
 arq = pytest.importorskip("arq")
 cdot = pytest.importorskip("cdot")
@@ -19,6 +19,11 @@ fastapi = pytest.importorskip("fastapi")
 pyathena = pytest.importorskip("pyathena")
 
 from mavedb.data_providers.services import VRSMap
+from mavedb.lib.annotation.store import (
+    ANNOTATION_STORE_LOCK_KEY,
+    enqueue_annotation_store_population,
+    populate_annotation_store,
+)
 from mavedb.lib.clingen.services import (
     ClinGenAlleleRegistryService,
     ClinGenLdhService,
@@ -28,10 +33,13 @@ from mavedb.lib.mave.constants import HGVS_NT_COLUMN
 from mavedb.lib.score_sets import csv_data_to_df
 from mavedb.lib.uniprot.id_mapping import UniProtIDMappingAPI
 from mavedb.lib.validation.exceptions import ValidationError
+from mavedb.models.clingen_allele_registration import ClinGenAlleleRegistration
 from mavedb.models.enums.mapping_state import MappingState
 from mavedb.models.enums.processing_state import ProcessingState
 from mavedb.models.mapped_variant import MappedVariant
+from mavedb.models.mapped_variant_annotation import MappedVariantAnnotation
 from mavedb.models.score_set import ScoreSet as ScoreSetDbModel
+from mavedb.models.uniprot_accession_mapping import UniProtAccessionMapping
 from mavedb.models.variant import Variant
 from mavedb.view_models.experiment import Experiment, ExperimentCreate
 from mavedb.view_models.score_set import ScoreSet, ScoreSetCreate
@@ -44,6 +52,7 @@ from mavedb.worker.jobs import (
     link_gnomad_variants,
     map_variants_for_score_set,
     poll_uniprot_mapping_jobs_for_score_set,
+    populate_annotation_store_for_score_set,
     submit_score_set_mappings_to_car,
     submit_score_set_mappings_to_ldh,
     submit_uniprot_mapping_jobs_for_score_set,
@@ -1623,7 +1632,7 @@ async def test_mapping_manager_enqueues_mapping_process_with_successful_mapping(
         patch.object(ClinGenAlleleRegistryService, "dispatch_submissions", return_value=[TEST_CLINGEN_ALLELE_OBJECT]),
         patch.object(ClinGenLdhService, "_existing_jwt", return_value="test_jwt"),
         patch.object(UniProtIDMappingAPI, "submit_id_mapping", return_value=TEST_UNIPROT_JOB_SUBMISSION_RESPONSE),
-        patch.object(UniProtIDMappingAPI, "check_id_mapping_results_ready", return_value=True),
+        patch.object(UniProtIDMappingAPI, "check_id_mapping_status", return_value=True),
         patch.object(
             UniProtIDMappingAPI, "get_id_mapping_results", return_value=TEST_UNIPROT_ID_MAPPING_SWISS_PROT_RESPONSE
         ),
@@ -1727,7 +1736,7 @@ async def test_mapping_manager_enqueues_mapping_process_with_successful_mapping_
         ),
         patch.object(ClinGenLdhService, "_existing_jwt", return_value="test_jwt"),
         patch.object(UniProtIDMappingAPI, "submit_id_mapping", return_value=TEST_UNIPROT_JOB_SUBMISSION_RESPONSE),
-        patch.object(UniProtIDMappingAPI, "check_id_mapping_results_ready", return_value=True),
+        patch.object(UniProtIDMappingAPI, "check_id_mapping_status", return_value=True),
         patch.object(
             UniProtIDMappingAPI, "get_id_mapping_results", return_value=TEST_UNIPROT_ID_MAPPING_SWISS_PROT_RESPONSE
         ),
@@ -1971,6 +1980,55 @@ async def test_submit_score_set_mappings_to_car_success(
     assert result["enqueued_job"] is not None
 
 
+@pytest.mark.asyncio
+async def test_submit_score_set_mappings_to_car_skips_submission_of_cached_alleles(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants_with_mapping(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
+
+    with (
+        patch.object(ClinGenAlleleRegistryService, "dispatch_submissions", return_value=[TEST_CLINGEN_ALLELE_OBJECT]),
+        patch("mavedb.worker.jobs.CAR_SUBMISSION_ENDPOINT", "https://reg.test.genome.network/pytest"),
+    ):
+        await submit_score_set_mappings_to_car(standalone_worker_context, uuid4().hex, score_set.id)
+
+    assert session.scalars(select(ClinGenAlleleRegistration)).all()
+
+    for mapped_variant in session.scalars(
+        select(MappedVariant).join(Variant).join(ScoreSetDbModel).filter(ScoreSetDbModel.urn == score_set.urn)
+    ):
+        mapped_variant.clingen_allele_id = None
+        session.add(mapped_variant)
+    session.commit()
+
+    with (
+        patch.object(ClinGenAlleleRegistryService, "dispatch_submissions") as dispatch_submissions,
+        patch("mavedb.worker.jobs.CAR_SUBMISSION_ENDPOINT", "https://reg.test.genome.network/pytest"),
+    ):
+        result = await submit_score_set_mappings_to_car(standalone_worker_context, uuid4().hex, score_set.id)
+
+    dispatch_submissions.assert_not_called()
+
+    mapped_variants_with_caid_for_score_set = session.scalars(
+        select(MappedVariant)
+        .join(Variant)
+        .join(ScoreSetDbModel)
+        .filter(ScoreSetDbModel.urn == score_set.urn, MappedVariant.clingen_allele_id.is_not(None))
+    ).all()
+
+    assert len(mapped_variants_with_caid_for_score_set) == score_set.num_variants
+
+    assert result["success"]
+    assert not result["retried"]
+    assert result["enqueued_job"] is not None
+
+
 @pytest.mark.asyncio
 async def test_submit_score_set_mappings_to_car_exception_in_setup(
     setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
@@ -2983,6 +3041,33 @@ async def test_submit_uniprot_id_mapping_exception_during_enqueue(
     assert not result["enqueued_jobs"]
 
 
+@pytest.mark.asyncio
+async def test_submit_uniprot_id_mapping_skips_cached_accessions(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants_with_mapping(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
+    session.add(UniProtAccessionMapping(accession=VALID_NT_ACCESSION, uniprot_id=VALID_UNIPROT_ACCESSION))
+    session.commit()
+
+    with patch.object(UniProtIDMappingAPI, "submit_id_mapping") as mock_submit:
+        result = await submit_uniprot_mapping_jobs_for_score_set(standalone_worker_context, score_set.id, uuid4().hex)
+        mock_submit.assert_not_called()
+
+    assert result["success"]
+    assert not result["retried"]
+    assert not result["enqueued_jobs"]
+
+    score_set = session.scalars(select(ScoreSetDbModel).where(ScoreSetDbModel.urn == score_set.urn)).one()
+    for target_gene in score_set.target_genes:
+        assert target_gene.uniprot_id_from_mapped_metadata == VALID_UNIPROT_ACCESSION
+
+
 ### Test Polling
 
 
@@ -2999,7 +3084,7 @@ async def test_poll_uniprot_id_mapping_success(
     )
 
     with (
-        patch.object(UniProtIDMappingAPI, "check_id_mapping_results_ready", return_value=True),
+        patch.object(UniProtIDMappingAPI, "check_id_mapping_status", return_value=True),
         patch.object(
             UniProtIDMappingAPI, "get_id_mapping_results", return_value=TEST_UNIPROT_ID_MAPPING_SWISS_PROT_RESPONSE
         ),
@@ -3112,6 +3197,34 @@ async def test_poll_uniprot_id_mapping_no_accessions(
     assert not result["enqueued_jobs"]
 
 
+@pytest.mark.asyncio
+async def test_poll_uniprot_id_mapping_does_not_warn_about_targets_which_are_not_polled(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants_with_mapping(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
+
+    # A later polling attempt is only passed the mapping jobs which were unfinished in the previous attempt. Targets
+    # without an unfinished mapping job were already reported on, so must not be reported on again.
+    with (
+        patch("mavedb.worker.jobs.extract_ids_from_post_mapped_metadata", return_value=[]),
+        patch("mavedb.worker.jobs.log_and_send_slack_message", return_value=None) as mock_slack_message,
+    ):
+        result = await poll_uniprot_mapping_jobs_for_score_set(
+            standalone_worker_context, {}, score_set.id, uuid4().hex, 2
+        )
+        mock_slack_message.assert_not_called()
+
+    assert result["success"]
+    assert not result["retried"]
+    assert not result["enqueued_jobs"]
+
+
 @pytest.mark.asyncio
 async def test_poll_uniprot_id_mapping_jobs_not_ready(
     setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
@@ -3123,9 +3236,50 @@ async def test_poll_uniprot_id_mapping_jobs_not_ready(
         TEST_MINIMAL_SEQ_SCORESET,
         standalone_worker_context,
     )
+    mapping_jobs = {tg.id: f"job_{idx}" for idx, tg in enumerate(score_set.target_genes)}
+
+    with (
+        patch.object(UniProtIDMappingAPI, "check_id_mapping_status", return_value=False) as mock_status,
+        patch("mavedb.worker.jobs.log_and_send_slack_message", return_value=None) as mock_slack_message,
+    ):
+        result = await poll_uniprot_mapping_jobs_for_score_set(
+            standalone_worker_context,
+            mapping_jobs,
+            score_set.id,
+            uuid4().hex,
+        )
+        mock_slack_message.assert_not_called()
+
+    # Each mapping job is checked only once per polling job.
+    assert mock_status.call_count == len(mapping_jobs)
+    assert result["success"]
+    assert result["retried"]
+    assert len(result["enqueued_jobs"]) == 1
+
+    queued_job = await arq.jobs.Job(result["enqueued_jobs"][0], arq_redis).info()
+    assert queued_job.function == "poll_uniprot_mapping_jobs_for_score_set"
+    assert queued_job.args[0] == mapping_jobs
+    assert queued_job.args[-1] == 2
+
+    score_set = session.scalars(select(ScoreSetDbModel).where(ScoreSetDbModel.urn == score_set.urn)).one()
+    for target_gene in score_set.target_genes:
+        assert target_gene.uniprot_id_from_mapped_metadata is None
+
+
+@pytest.mark.asyncio
+async def test_poll_uniprot_id_mapping_jobs_not_ready_after_final_attempt(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants_with_mapping(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
 
     with (
-        patch.object(UniProtIDMappingAPI, "check_id_mapping_results_ready", return_value=False),
+        patch.object(UniProtIDMappingAPI, "check_id_mapping_status", return_value=False),
         patch("mavedb.worker.jobs.log_and_send_slack_message", return_value=None) as mock_slack_message,
     ):
         result = await poll_uniprot_mapping_jobs_for_score_set(
@@ -3133,6 +3287,7 @@ async def test_poll_uniprot_id_mapping_jobs_not_ready(
             {tg.id: f"job_{idx}" for idx, tg in enumerate(score_set.target_genes)},
             score_set.id,
             uuid4().hex,
+            UniProtIDMappingAPI().polling_tries,
         )
         mock_slack_message.assert_called()
 
@@ -3145,6 +3300,68 @@ async def test_poll_uniprot_id_mapping_jobs_not_ready(
         assert target_gene.uniprot_id_from_mapped_metadata is None
 
 
+@pytest.mark.asyncio
+async def test_poll_uniprot_id_mapping_exception_while_enqueuing_next_poll(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants_with_mapping(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
+
+    with (
+        patch.object(UniProtIDMappingAPI, "check_id_mapping_status", return_value=False),
+        patch.object(arq.ArqRedis, "enqueue_job", side_effect=Exception()),
+        patch("mavedb.worker.jobs.log_and_send_slack_message", return_value=None) as mock_slack_message,
+    ):
+        result = await poll_uniprot_mapping_jobs_for_score_set(
+            standalone_worker_context,
+            {tg.id: f"job_{idx}" for idx, tg in enumerate(score_set.target_genes)},
+            score_set.id,
+            uuid4().hex,
+        )
+        mock_slack_message.assert_called()
+
+    assert not result["success"]
+    assert not result["retried"]
+    assert not result["enqueued_jobs"]
+
+
+@pytest.mark.asyncio
+async def test_poll_uniprot_id_mapping_caches_mapped_accessions(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants_with_mapping(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
+
+    with (
+        patch.object(UniProtIDMappingAPI, "check_id_mapping_status", return_value=True),
+        patch.object(
+            UniProtIDMappingAPI, "get_id_mapping_results", return_value=TEST_UNIPROT_ID_MAPPING_SWISS_PROT_RESPONSE
+        ),
+    ):
+        result = await poll_uniprot_mapping_jobs_for_score_set(
+            standalone_worker_context,
+            {tg.id: f"job_{idx}" for idx, tg in enumerate(score_set.target_genes)},
+            score_set.id,
+            uuid4().hex,
+        )
+
+    assert result["success"]
+    cached_mappings = session.execute(
+        select(UniProtAccessionMapping.accession, UniProtAccessionMapping.uniprot_id)
+    ).all()
+    assert cached_mappings == [(VALID_NT_ACCESSION, VALID_UNIPROT_ACCESSION)]
+
+
 @pytest.mark.asyncio
 async def test_poll_uniprot_id_mapping_no_jobs(
     setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
@@ -3187,7 +3404,7 @@ async def test_poll_uniprot_id_mapping_no_ids_mapped(
     )
 
     with (
-        patch.object(UniProtIDMappingAPI, "check_id_mapping_results_ready", return_value=True),
+        patch.object(UniProtIDMappingAPI, "check_id_mapping_status", return_value=True),
         patch.object(UniProtIDMappingAPI, "get_id_mapping_results", return_value={"failedIDs": [VALID_CHR_ACCESSION]}),
         patch("mavedb.worker.jobs.log_and_send_slack_message", return_value=None) as mock_slack_message,
     ):
@@ -3227,7 +3444,7 @@ async def test_poll_uniprot_id_mapping_too_many_mapped_accessions(
     )
 
     with (
-        patch.object(UniProtIDMappingAPI, "check_id_mapping_results_ready", return_value=True),
+        patch.object(UniProtIDMappingAPI, "check_id_mapping_status", return_value=True),
         patch.object(UniProtIDMappingAPI, "get_id_mapping_results", return_value=too_many_mapped_ids_response),
         patch("mavedb.worker.jobs.log_and_send_slack_message", return_value=None) as mock_slack_message,
     ):
@@ -3286,7 +3503,7 @@ async def test_poll_uniprot_id_mapping_exception_during_polling(
     )
 
     with (
-        patch.object(UniProtIDMappingAPI, "check_id_mapping_results_ready", side_effect=Exception()),
+        patch.object(UniProtIDMappingAPI, "check_id_mapping_status", side_effect=Exception()),
         patch("mavedb.worker.jobs.log_and_send_slack_message", return_value=None) as mock_slack_message,
     ):
         result = await poll_uniprot_mapping_jobs_for_score_set(
@@ -3477,3 +3694,179 @@ async def test_link_score_set_mappings_to_gnomad_variants_exception_while_linkin
         select(MappedVariant).join(Variant).join(ScoreSetDbModel).where(ScoreSetDbModel.urn == score_set.urn)
     ):
         assert not variant.gnomad_variants
+
+
+############################################################################################################################################
+# Annotation store
+############################################################################################################################################
+
+
+@pytest.mark.asyncio
+async def test_populate_annotation_store_for_score_set(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants_with_mapping(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
+
+    result = await populate_annotation_store_for_score_set(standalone_worker_context, uuid4().hex, score_set.id)
+
+    assert result["success"]
+    assert not result["retried"]
+    assert not result["enqueued_job"]
+
+    mapped_variants = session.scalars(
+        select(MappedVariant).join(Variant).join(ScoreSetDbModel).where(ScoreSetDbModel.urn == score_set.urn)
+    ).all()
+    stored_annotations = session.scalars(select(MappedVariantAnnotation)).all()
+    assert len(stored_annotations) == 3 * len(mapped_variants)
+    assert {annotation.mapped_variant_id for annotation in stored_annotations} == {mv.id for mv in mapped_variants}
+
+
+@pytest.mark.asyncio
+async def test_populate_annotation_store_for_score_set_replaces_stored_annotations(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants_with_mapping(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
+
+    await populate_annotation_store_for_score_set(standalone_worker_context, uuid4().hex, score_set.id)
+    result = await populate_annotation_store_for_score_set(standalone_worker_context, uuid4().hex, score_set.id)
+
+    assert result["success"]
+    assert len(session.scalars(select(MappedVariantAnnotation)).all()) == 3 * score_set.num_variants
+
+
+@pytest.mark.asyncio
+async def test_populate_annotation_store_for_score_set_exception_while_populating(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants_with_mapping(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
+
+    with patch("mavedb.worker.jobs.populate_annotation_store", side_effect=Exception()):
+        result = await populate_annotation_store_for_score_set(standalone_worker_context, uuid4().hex, score_set.id)
+
+    assert not result["success"]
+    assert not result["retried"]
+    assert not result["enqueued_job"]
+    assert not session.scalars(select(MappedVariantAnnotation)).all()
+
+
+@pytest.mark.asyncio
+async def test_populate_annotation_store_locks_annotation_store_until_commit(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants_with_mapping(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
+    held_store_locks = (
+        select(func.count())
+        .select_from(text("pg_locks"))
+        .where(text("locktype = 'advisory' AND pid = pg_backend_pid() AND classid = :key AND objid = :score_set_id"))
+        .params(key=ANNOTATION_STORE_LOCK_KEY, score_set_id=score_set.id)
+    )
+
+    score_set_db = session.scalars(select(ScoreSetDbModel).where(ScoreSetDbModel.id == score_set.id)).one()
+    populate_annotation_store(session, score_set_db)
+    assert session.scalar(held_store_locks) == 1
+
+    session.commit()
+    assert session.scalar(held_store_locks) == 0
+
+
+@pytest.mark.asyncio
+async def test_enqueue_annotation_store_population_reports_rather_than_raises_failures(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    with (
+        patch("mavedb.lib.annotation.store.ANNOTATION_STORE_ENABLED", True),
+        patch.object(arq.ArqRedis, "enqueue_job", side_effect=ConnectionError()),
+    ):
+        job_id = await enqueue_annotation_store_population(standalone_worker_context["redis"], 1, uuid4().hex)
+
+    assert job_id is None
+
+
+@pytest.mark.asyncio
+async def test_mapping_manager_enqueues_annotation_store_population_when_enabled(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
+
+    async def dummy_mapping_job():
+        return await setup_mapping_output(async_client, session, score_set)
+
+    with (
+        patch.object(
+            _UnixSelectorEventLoop,
+            "run_in_executor",
+            side_effect=[dummy_mapping_job()],
+        ),
+        patch("mavedb.worker.jobs.MAPPING_BACKOFF_IN_SECONDS", 0),
+        patch("mavedb.worker.jobs.UNIPROT_ID_MAPPING_ENABLED", False),
+        patch("mavedb.worker.jobs.CLIN_GEN_SUBMISSION_ENABLED", False),
+        patch("mavedb.lib.annotation.store.ANNOTATION_STORE_ENABLED", True),
+    ):
+        await arq_worker.async_run()
+        num_completed_jobs = await arq_worker.run_check()
+
+    # We should have completed the manager, mapping, and annotation store jobs.
+    assert num_completed_jobs == 3
+
+    score_set = session.scalars(select(ScoreSetDbModel).where(ScoreSetDbModel.urn == score_set.urn)).one()
+    assert score_set.mapping_state == MappingState.complete
+    assert len(session.scalars(select(MappedVariantAnnotation)).all()) == 3 * score_set.num_variants
+
+
+@pytest.mark.asyncio
+async def test_submit_score_set_mappings_to_car_invalidates_and_repopulates_annotation_store(
+    setup_worker_db, standalone_worker_context, session, async_client, data_files, arq_worker, arq_redis
+):
+    score_set = await setup_records_files_and_variants_with_mapping(
+        session,
+        async_client,
+        data_files,
+        TEST_MINIMAL_SEQ_SCORESET,
+        standalone_worker_context,
+    )
+    await populate_annotation_store_for_score_set(standalone_worker_context, uuid4().hex, score_set.id)
+    assert session.scalars(select(MappedVariantAnnotation)).all()
+
+    with (
+        patch.object(ClinGenAlleleRegistryService, "dispatch_submissions", return_value=[TEST_CLINGEN_ALLELE_OBJECT]),
+        patch("mavedb.worker.jobs.CAR_SUBMISSION_ENDPOINT", "https://reg.test.genome.network/pytest"),
+        patch("mavedb.lib.annotation.store.ANNOTATION_STORE_ENABLED", True),
+    ):
+        result = await submit_score_set_mappings_to_car(standalone_worker_context, uuid4().hex, score_set.id)
+
+    assert result["success"]
+
+    # Stored annotations without the newly linked ClinGen allele IDs are replaced once the CAIDs are linked.
+    assert not session.scalars(select(MappedVariantAnnotation)).all()
+    queued_jobs = await standalone_worker_context["redis"].queued_jobs()
+    assert "populate_annotation_store_for_score_set" in [job.function for job in queued_jobs]